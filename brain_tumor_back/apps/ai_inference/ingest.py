@@ -0,0 +1,332 @@
+"""
+AI 추론 callback 수신 처리 (ingestion)
+
+InferenceCallbackView는 요청 thread에서 아래만 처리하고 바로 응답
+- multipart 파일(M1): StagingUploadHandler가 CDSS_STORAGE/AI/.incoming에 바로 기록
+  → job 폴더로 rename (같은 파일시스템이므로 크기와 무관하게 O(1))
+- JSON 본문(MG/MM): base64 디코딩 없이 원본 그대로 job 폴더에 기록
+- 상태/결과 manifest(.ingest.json)를 job 폴더에 원자적으로 기록
+
+나머지(base64 디코딩/파일 기록, M1 결과 저장소/썸네일 생성, AIInference 갱신, WebSocket 알림)는
+background worker에서 처리
+프로세스가 중간에 종료되어 manifest가 남으면 `python manage.py ingest_ai_callbacks`로 재처리
+"""
+import base64
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, TemporaryFileUploadHandler
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from . import result_store, thumbnails
+from .models import AIInference
+
+logger = logging.getLogger(__name__)
+
+STORAGE_BASE: Path = settings.CDSS_AI_STORAGE
+# 업로드 임시 파일 위치 - job 폴더와 같은 파일시스템이어야 rename이 O(1)
+INCOMING_DIR = STORAGE_BASE / '.incoming'
+MANIFEST_NAME = '.ingest.json'
+BODY_NAME = '.ingest-body.json'
+# 이 시간이 지난 .incoming 파일은 중단된 요청의 잔여물로 보고 정리
+STALE_INCOMING_SECONDS = 3600
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'AI_CALLBACK_INGEST_WORKERS', 2),
+    thread_name_prefix='ai-ingest',
+)
+
+
+# ============================================================
+# 파일 기록
+# ============================================================
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """같은 폴더의 임시 파일에 기록 후 rename - 읽는 쪽이 부분 기록된 파일을 보지 않도록"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _file_key(filename: str) -> str:
+    """파일명에서 확장자 제거한 saved_files 키"""
+    return filename.rsplit('.', 1)[0] if '.' in filename else filename
+
+
+class StagedUploadedFile(TemporaryUploadedFile):
+    """
+    INCOMING_DIR에 기록되는 업로드 파일
+
+    delete=False로 생성해 닫은 뒤에도 rename 가능 (Windows 포함),
+    job 폴더로 옮겨지지 않은 파일은 요청 종료 시 close()에서 삭제
+    """
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        INCOMING_DIR.mkdir(parents=True, exist_ok=True)
+        file = tempfile.NamedTemporaryFile(suffix='.upload', dir=INCOMING_DIR, delete=False)
+        UploadedFile.__init__(self, file, name, content_type, size, charset, content_type_extra)
+
+    def close(self):
+        try:
+            self.file.close()
+        finally:
+            try:
+                os.unlink(self.file.name)
+            except FileNotFoundError:
+                # job 폴더로 이동됨
+                pass
+
+
+class StagingUploadHandler(TemporaryFileUploadHandler):
+    """크기와 무관하게 모든 업로드를 INCOMING_DIR에 바로 기록"""
+
+    def new_file(self, *args, **kwargs):
+        FileUploadHandler.new_file(self, *args, **kwargs)
+        self.file = StagedUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
+        )
+
+
+def place_uploaded_file(output_dir: Path, uploaded) -> str:
+    """업로드 파일을 job 폴더로 이동 - staging 파일이면 rename, 아니면 chunk 복사"""
+    # 경로 조작 방지 - 파일명만 사용
+    filename = Path(uploaded.name).name
+    target = output_dir / filename
+
+    if isinstance(uploaded, StagedUploadedFile):
+        uploaded.file.close()
+        staged_path = uploaded.temporary_file_path()
+        try:
+            os.replace(staged_path, target)
+        except OSError as e:
+            # 다른 파일시스템 등 rename 불가 - 복사 후 rename
+            logger.warning(f'Staged upload rename failed, copying instead: {filename} ({e})')
+            with open(staged_path, 'rb') as f:
+                atomic_write(target, f.read())
+        return filename
+
+    atomic_write(target, b''.join(uploaded.chunks()))
+    return filename
+
+
+def write_encoded_files(output_dir: Path, files_data: dict) -> dict:
+    """
+    JSON callback의 파일 내용을 디코딩해 저장
+
+    Args:
+        files_data: {filename: {content: base64 | JSON 문자열, type: 'json'|'npz'|'png'|...}}
+
+    Returns:
+        {key: filename}
+    """
+    saved_files = {}
+
+    for filename, file_info in files_data.items():
+        filename = Path(filename).name
+        try:
+            content = file_info.get('content')
+            if file_info.get('type', 'binary') == 'json':
+                # JSON 파일은 문자열로 전송됨
+                data = json.loads(content) if isinstance(content, str) else content
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            else:
+                # npz / png / 기타 바이너리는 base64
+                payload = base64.b64decode(content)
+
+            atomic_write(output_dir / filename, payload)
+            saved_files[_file_key(filename)] = filename
+            logger.info(f'  Saved: {filename} ({len(payload)} bytes)')
+
+        except Exception as e:
+            logger.error(f'Failed to save file {filename}: {e}')
+
+    return saved_files
+
+
+# ============================================================
+# 요청 thread
+# ============================================================
+
+def stage_callback(job_id: str, cb_status: str, result_data: dict, error_message,
+                   uploaded_files: list, raw_body: bytes = None) -> None:
+    """
+    callback을 job 폴더에 기록 (디코딩/DB 갱신 없음)
+
+    Args:
+        uploaded_files: multipart 파일 파트 (M1) - job 폴더로 rename
+        raw_body: JSON callback 원본 (MG/MM) - base64 파일은 background에서 디코딩
+    """
+    output_dir = STORAGE_BASE / job_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    saved_files = {}
+    if cb_status == 'completed':
+        for uploaded in uploaded_files:
+            try:
+                filename = place_uploaded_file(output_dir, uploaded)
+                saved_files[_file_key(filename)] = filename
+            except Exception as e:
+                logger.error(f'Failed to save file {uploaded.name}: {e}')
+        if raw_body:
+            atomic_write(output_dir / BODY_NAME, raw_body)
+
+    manifest = {
+        'job_id': job_id,
+        'status': cb_status,
+        'result_data': result_data,
+        'error_message': error_message,
+        'saved_files': saved_files,
+        'received_at': timezone.now().isoformat(),
+    }
+    atomic_write(output_dir / MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False).encode('utf-8'))
+
+
+def schedule(job_id: str) -> None:
+    """manifest 처리를 background worker에 등록"""
+    _executor.submit(_run, job_id)
+
+
+def _run(job_id: str) -> None:
+    close_old_connections()
+    try:
+        apply_manifest(job_id)
+    except Exception:
+        logger.exception(f'Callback ingestion failed: job_id={job_id}')
+    finally:
+        connection.close()
+
+
+# ============================================================
+# background
+# ============================================================
+
+def apply_manifest(job_id: str) -> bool:
+    """
+    기록된 callback을 반영: 파일 디코딩 → 결과 저장소 → AIInference 1회 update → manifest 삭제 → WebSocket 알림
+
+    Returns:
+        처리했으면 True (manifest 없음 / job 없음이면 False)
+    """
+    output_dir = STORAGE_BASE / job_id
+    manifest_path = output_dir / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return False
+
+    inference = AIInference.objects.filter(job_id=job_id).first()
+    if inference is None:
+        logger.warning(f'Callback manifest for unknown job: {job_id}')
+        return False
+
+    start = time.perf_counter()
+    body_path = output_dir / BODY_NAME
+
+    if manifest['status'] == 'completed':
+        saved_files = manifest.get('saved_files') or {}
+        if body_path.exists():
+            body = json.loads(body_path.read_bytes())
+            saved_files.update(write_encoded_files(output_dir, body.get('files') or {}))
+
+        # M1 볼륨은 mmap 가능한 .npy 저장소로 한 번 풀어 둠 (조회 시 압축 해제 없음)
+        try:
+            result_store.build_for_job(output_dir)
+        except Exception as e:
+            logger.error(f'Result store build failed for job {job_id}: {e}')
+        # M1 썸네일(axial/coronal/sagittal) + sprite 사전 렌더링
+        if (output_dir / thumbnails.SEG_FILE).exists():
+            try:
+                thumbnails.render_job(output_dir)
+            except Exception as e:
+                logger.error(f'Thumbnail rendering failed for job {job_id}: {e}')
+
+        result_data = manifest.get('result_data') or {}
+        if saved_files:
+            result_data['saved_files'] = {'job_id': job_id, **saved_files}
+            logger.info(f'Files saved for job {job_id}: {list(saved_files.keys())}')
+
+        inference.status = AIInference.Status.COMPLETED
+        inference.result_data = result_data
+        inference.completed_at = timezone.now()
+        inference.save(update_fields=['status', 'result_data', 'completed_at'])
+    else:
+        inference.status = AIInference.Status.FAILED
+        inference.error_message = manifest.get('error_message')
+        inference.save(update_fields=['status', 'error_message'])
+
+    body_path.unlink(missing_ok=True)
+    manifest_path.unlink(missing_ok=True)
+
+    # WebSocket 알림 (manual 모드만)
+    if inference.mode == AIInference.Mode.MANUAL:
+        send_websocket_notification(inference)
+
+    logger.info(
+        f'Callback 처리 완료: job_id={job_id}, status={manifest["status"]} '
+        f'({(time.perf_counter() - start) * 1000:.1f}ms)'
+    )
+    return True
+
+
+def send_websocket_notification(inference) -> None:
+    """WebSocket으로 결과 알림"""
+    try:
+        channel_layer = get_channel_layer()
+        async_to_sync(channel_layer.group_send)(
+            'ai_inference',
+            {
+                'type': 'ai_inference_result',
+                'job_id': inference.job_id,
+                'model_type': inference.model_type,
+                'status': inference.status,
+                'result': inference.result_data if inference.status == AIInference.Status.COMPLETED else None,
+                'error': inference.error_message if inference.status == AIInference.Status.FAILED else None,
+            }
+        )
+    except Exception as e:
+        logger.error(f'WebSocket 알림 실패: {str(e)}')
+
+
+# ============================================================
+# 복구
+# ============================================================
+
+def pending_job_ids() -> list:
+    """manifest가 남아있는 job (처리 중 종료된 callback)"""
+    if not STORAGE_BASE.exists():
+        return []
+    return sorted(p.parent.name for p in STORAGE_BASE.glob(f'*/{MANIFEST_NAME}'))
+
+
+def prune_incoming(max_age: int = STALE_INCOMING_SECONDS) -> int:
+    """중단된 요청이 남긴 .incoming 파일 삭제"""
+    if not INCOMING_DIR.exists():
+        return 0
+    removed = 0
+    cutoff = time.time() - max_age
+    for path in INCOMING_DIR.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
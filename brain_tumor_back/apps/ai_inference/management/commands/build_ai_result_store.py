@@ -0,0 +1,49 @@
+"""
+기존 M1 결과 폴더를 결과 저장소(.store, memory-mapped .npy)로 변환
+
+ingestion 시 자동 생성되므로 저장소 도입 전 job 폴더에만 필요
+
+사용법:
+    python manage.py build_ai_result_store
+    python manage.py build_ai_result_store --job-id <job_id>
+    python manage.py build_ai_result_store --force   # 이미 최신이어도 다시 생성
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.ai_inference import result_store
+
+
+class Command(BaseCommand):
+    help = 'M1 결과 npz를 memory-mapped .npy 저장소로 변환'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job-id', help='특정 job만 변환')
+        parser.add_argument('--force', action='store_true', help='최신 저장소도 다시 생성')
+
+    def handle(self, *args, **options):
+        storage = settings.CDSS_AI_STORAGE
+        if options['job_id']:
+            job_dirs = [storage / options['job_id']]
+        else:
+            job_dirs = sorted(p for p in storage.iterdir() if p.is_dir() and not p.name.startswith('.'))
+
+        built = skipped = failed = 0
+        for job_dir in job_dirs:
+            if not any((job_dir / name).exists() for name in result_store.M1_RESULT_FILES):
+                continue
+            try:
+                files = result_store.build_for_job(job_dir, force=options['force'])
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"  [FAIL] {job_dir.name}: {e}"))
+                continue
+            if files:
+                built += 1
+                self.stdout.write(f"  [OK] {job_dir.name}: {', '.join(files)}")
+            else:
+                skipped += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Built: {built}, up to date: {skipped}, failed: {failed}"
+        ))
@@ -0,0 +1,38 @@
+"""
+처리되지 않은 AI callback 재처리
+
+서버가 callback 수신 후 background 처리 중 종료되면 CDSS_STORAGE/AI/<job_id>/.ingest.json이 남음
+→ 남은 manifest를 반영하고 중단된 업로드 임시 파일(.incoming) 정리
+
+사용법:
+    python manage.py ingest_ai_callbacks
+    python manage.py ingest_ai_callbacks --job-id <job_id>
+"""
+from django.core.management.base import BaseCommand
+
+from apps.ai_inference import ingest
+
+
+class Command(BaseCommand):
+    help = '처리되지 않은 AI callback manifest 재처리'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job-id', help='특정 job만 처리')
+
+    def handle(self, *args, **options):
+        job_ids = [options['job_id']] if options['job_id'] else ingest.pending_job_ids()
+        self.stdout.write(f"Pending callbacks: {len(job_ids)}")
+
+        applied = 0
+        for job_id in job_ids:
+            try:
+                if ingest.apply_manifest(job_id):
+                    applied += 1
+                    self.stdout.write(f"  [OK] {job_id}")
+                else:
+                    self.stdout.write(f"  [SKIP] {job_id}")
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"  [FAIL] {job_id}: {e}"))
+
+        removed = ingest.prune_incoming()
+        self.stdout.write(self.style.SUCCESS(f"Applied: {applied}, stale uploads removed: {removed}"))
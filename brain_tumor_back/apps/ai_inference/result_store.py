@@ -0,0 +1,166 @@
+"""
+M1 결과 저장소 (압축 해제 없는 memory-mapped .npy)
+
+m1_segmentation.npz / m1_preprocessed_mri.npz는 savez_compressed 아카이브라
+요청마다 128³ 배열 전체를 압축 해제해야 함 → ingestion 시 배열별 .npy로 한 번 풀어 두고
+조회는 np.load(mmap_mode='r')로 필요한 부분만 읽음
+
+구조:
+    <job_dir>/.store/<npz stem>/index.json : 원본 npz 버전(mtime/size), 배열 shape/dtype/min/max
+    <job_dir>/.store/<npz stem>/<key>.npy
+
+- object dtype 배열(pickle)은 mmap 불가 → .npy로 풀지 않고 index의 npz_only에 기록, 원본 npz에서 읽음
+- index.json의 버전이 원본 npz와 다르면(재추론 등) 저장소를 무시하고 npz를 직접 읽음
+- 기존 job 폴더는 `python manage.py build_ai_result_store`로 변환
+"""
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+STORE_DIR = '.store'
+INDEX_NAME = 'index.json'
+# 저장소로 변환하는 M1 결과 파일
+M1_RESULT_FILES = ('m1_segmentation.npz', 'm1_preprocessed_mri.npz')
+# 이보다 작은 배열(볼륨 스칼라 등)은 mmap 없이 바로 읽음
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def _store_path(npz_path: Path) -> Path:
+    return npz_path.parent / STORE_DIR / npz_path.stem
+
+
+def _source_version(npz_path: Path) -> str:
+    stat = npz_path.stat()
+    return f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+
+
+def read_index(npz_path: Path):
+    """원본과 버전이 같은 저장소의 index (없거나 오래되었으면 None)"""
+    try:
+        index = json.loads((_store_path(npz_path) / INDEX_NAME).read_text(encoding='utf-8'))
+        if index.get('source') == _source_version(npz_path):
+            return index
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class StoredArrays:
+    """
+    저장소 배열 접근 - NpzFile과 같은 방식(in, [key], files, keys())으로 사용
+
+    저장소에 없는 키(object dtype 등)는 원본 npz를 처음 필요할 때 한 번 열어 읽음
+    """
+
+    def __init__(self, store_path: Path, index: dict, npz_path: Path):
+        self.store_path = store_path
+        self.index = index
+        self.npz_path = npz_path
+        self.files = list(index['arrays'].keys()) + list(index.get('npz_only', []))
+        self._npz = None
+
+    def _source(self):
+        if self._npz is None:
+            self._npz = np.load(self.npz_path, allow_pickle=True)
+        return self._npz
+
+    def __contains__(self, key):
+        return key in self.index['arrays'] or key in self._source().files
+
+    def __getitem__(self, key):
+        if key not in self.index['arrays']:
+            return self._source()[key]
+        info = self.index['arrays'][key]
+        mmap_mode = 'r' if info['nbytes'] >= MMAP_MIN_BYTES else None
+        return np.load(self.store_path / f'{key}.npy', mmap_mode=mmap_mode)
+
+    def keys(self):
+        return list(self.files)
+
+    def close(self):
+        if self._npz is not None:
+            self._npz.close()
+            self._npz = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load(npz_path: Path):
+    """
+    M1 결과 npz 열기 - 최신 저장소가 있으면 mmap(.npy), 없으면 np.load(npz)
+
+    반환 객체는 둘 다 `key in data`, `data[key]`, `data.files`를 지원
+    """
+    index = read_index(npz_path)
+    if index is not None:
+        return StoredArrays(_store_path(npz_path), index, npz_path)
+    return np.load(npz_path, allow_pickle=True)
+
+
+def array_info(npz_path: Path, key: str):
+    """저장소 index의 배열 정보 (shape, dtype, min, max) - 저장소가 없으면 None"""
+    index = read_index(npz_path)
+    if index is None:
+        return None
+    return index['arrays'].get(key)
+
+
+def build(npz_path: Path, force: bool = False) -> bool:
+    """
+    npz 하나를 저장소로 변환 (임시 폴더에 기록 후 rename)
+
+    Returns:
+        새로 만들었으면 True (이미 최신이면 False)
+    """
+    if not force and read_index(npz_path) is not None:
+        return False
+
+    store_path = _store_path(npz_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=store_path.parent, prefix=f'.tmp-{npz_path.stem}-'))
+    try:
+        version = _source_version(npz_path)
+        arrays = {}
+        npz_only = []
+        with np.load(npz_path, allow_pickle=True) as npz:
+            for key in npz.files:
+                arr = npz[key]
+                if arr.dtype == object:
+                    # pickle 객체는 mmap 불가 - 원본 npz에서 읽음 (StoredArrays 참조)
+                    npz_only.append(key)
+                    continue
+                np.save(tmp_dir / f'{key}.npy', arr)
+                info = {'shape': list(arr.shape), 'dtype': str(arr.dtype), 'nbytes': int(arr.nbytes)}
+                if arr.size and np.issubdtype(arr.dtype, np.number):
+                    info['min'] = float(arr.min())
+                    info['max'] = float(arr.max())
+                arrays[key] = info
+
+        (tmp_dir / INDEX_NAME).write_text(
+            json.dumps({'source': version, 'arrays': arrays, 'npz_only': npz_only}), encoding='utf-8'
+        )
+        if store_path.exists():
+            shutil.rmtree(store_path, ignore_errors=True)
+        os.replace(tmp_dir, store_path)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return True
+
+
+def build_for_job(job_dir: Path, force: bool = False) -> list:
+    """job 폴더의 M1 결과 파일을 저장소로 변환 - 변환한 파일명 목록"""
+    built = []
+    for filename in M1_RESULT_FILES:
+        npz_path = job_dir / filename
+        if npz_path.exists() and build(npz_path, force=force):
+            built.append(filename)
+    return built
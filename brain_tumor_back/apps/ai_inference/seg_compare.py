@@ -0,0 +1,269 @@
+"""
+M1 예측 vs Orthanc SEG(Ground Truth) 비교 엔진
+
+- GT 볼륨 캐시: SEG 시리즈별로 한 번만 다운로드/디코딩해 .npy로 저장
+  (Orthanc Instances 순서로 스택 - 예측 볼륨과 Z축 방향 유지,
+   Orthanc LastUpdate / 인스턴스 수가 바뀌면 재생성)
+- 메트릭: pred * K + gt 결합 라벨 히스토그램(np.bincount) 한 번으로
+  라벨별 볼륨 / confusion matrix / 영역(WT, TC, ET) Dice 계산
+- (job 결과 버전, SEG 시리즈 버전) 단위로 메트릭 결과를 job 폴더에 저장 → 재조회 시 재계산 없음
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pydicom
+import requests
+from django.conf import settings
+from pydicom.errors import InvalidDicomError
+
+from apps.orthancproxy.client import fetch_many, get_json, get_raw
+
+logger = logging.getLogger(__name__)
+
+SEG_CACHE_DIR = Path(getattr(
+    settings, 'AI_SEG_CACHE_DIR',
+    Path(settings.CDSS_STORAGE_ROOT) / '.cache' / 'seg_volumes',
+))
+COMPARE_DIR = '.compare'
+# 캐시 형식 버전 - 슬라이스 순서 등 볼륨 구성이 바뀌면 올려서 GT / 메트릭 캐시 무효화
+SEG_CACHE_FORMAT = 2
+
+# GT 사용 불가로 처리할 예외 (Orthanc 통신 / DICOM 파싱 / 픽셀 디코딩 / 슬라이스 shape 불일치)
+LOAD_ERRORS = (
+    requests.exceptions.RequestException,
+    InvalidDicomError,
+    ValueError,
+    RuntimeError,
+    NotImplementedError,
+)
+
+# BraTS 라벨: 0=배경, 1=NCR, 2=ED, 4=ET (3은 사용안함)
+LABELS = (1, 2, 4)
+LABEL_NAMES = {1: 'ncr', 2: 'ed', 4: 'et'}
+# 평가 영역: WT = 1 + 2 + 4, TC = 1 + 4, ET = 4
+REGIONS = {
+    'wt': (1, 2, 4),
+    'tc': (1, 4),
+    'et': (4,),
+}
+
+
+# ============================================================
+# 디스크 기록
+# ============================================================
+
+def _atomic_write(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# ============================================================
+# GT 볼륨 (SEG 시리즈 캐시)
+# ============================================================
+
+def find_seg_series_id(ocs):
+    """OCS worker_result에서 SEG 시리즈의 Orthanc ID"""
+    orthanc_info = (ocs.worker_result or {}).get('orthanc', {})
+    if not orthanc_info.get('orthanc_study_id'):
+        logger.info(f"OCS {ocs.id}: Orthanc study ID가 없습니다.")
+        return None
+
+    for series in orthanc_info.get('series', []):
+        if series.get('series_type', '') == 'SEG':
+            series_id = series.get('orthanc_series_id')
+            if not series_id:
+                logger.warning(f"OCS {ocs.id}: SEG 시리즈의 Orthanc ID가 없습니다.")
+            return series_id
+
+    logger.info(f"OCS {ocs.id}: SEG 시리즈가 없습니다.")
+    return None
+
+
+def _decode_instance(inst_id: str):
+    """인스턴스 픽셀 배열 - 픽셀 데이터가 없는 인스턴스는 None"""
+    content = get_raw(f"/instances/{inst_id}/file", timeout=30).content
+    ds = pydicom.dcmread(BytesIO(content))
+    if 'PixelData' not in ds:
+        return None
+    return ds.pixel_array
+
+
+def load_seg_volume(series_id: str):
+    """
+    SEG 시리즈 3D 볼륨 (캐시 우선)
+
+    Returns:
+        (volume, version) - volume은 mmap 배열, 픽셀 데이터가 없으면 (None, version)
+
+    Raises:
+        LOAD_ERRORS 중 하나 - 호출 측에서 GT 없음으로 처리
+    """
+    series_info = get_json(f"/series/{series_id}")
+    instances = series_info.get('Instances', [])
+    version = f"v{SEG_CACHE_FORMAT}-{series_info.get('LastUpdate') or ''}-{len(instances)}"
+    volume_path = SEG_CACHE_DIR / f"{series_id}.npy"
+    meta_path = SEG_CACHE_DIR / f"{series_id}.json"
+
+    try:
+        if json.loads(meta_path.read_text(encoding='utf-8')).get('version') == version:
+            return np.load(volume_path, mmap_mode='r'), version
+    except (OSError, ValueError):
+        pass
+
+    if not instances:
+        logger.warning(f"SEG 시리즈 {series_id}: 인스턴스가 없습니다.")
+        return None, version
+
+    # Orthanc Instances 순서로 병렬 다운로드 (입력 순서 유지) - 픽셀 데이터 없는 인스턴스는 건너뜀
+    slices = []
+    for inst_id, pixels, error in fetch_many(_decode_instance, instances):
+        if error is not None:
+            raise error
+        if pixels is not None:
+            slices.append(pixels)
+
+    if not slices:
+        logger.warning(f"SEG 시리즈 {series_id}: 픽셀 데이터가 없습니다.")
+        return None, version
+
+    volume = np.stack(slices, axis=-1)
+    if volume.max() <= np.iinfo(np.uint8).max:
+        volume = volume.astype(np.uint8)
+    logger.info(f"SEG 볼륨 로드 완료: {series_id}, shape={volume.shape}")
+
+    _atomic_write(volume_path, lambda f: np.save(f, volume))
+    _atomic_write(meta_path, lambda f: f.write(json.dumps({
+        'version': version, 'shape': list(volume.shape),
+    }).encode('utf-8')))
+    return volume, version
+
+
+# ============================================================
+# 메트릭
+# ============================================================
+
+def joint_histogram(pred: np.ndarray, gt: np.ndarray):
+    """
+    결합 라벨 히스토그램
+
+    Returns:
+        (joint, K) - joint[p, g] = pred == p 이고 gt == g 인 voxel 수
+    """
+    pred = np.asarray(pred)
+    gt = np.asarray(gt)
+    k = int(max(pred.max(), gt.max())) + 1
+    codes = pred.astype(np.intp).ravel() * k + gt.ravel()
+    joint = np.bincount(codes, minlength=k * k).reshape(k, k)
+    return joint, k
+
+
+def _dice(intersection: int, pred_sum: int, gt_sum: int) -> float:
+    if pred_sum + gt_sum == 0:
+        return 1.0  # 둘 다 없으면 완벽한 일치
+    return 2.0 * intersection / (pred_sum + gt_sum)
+
+
+def compute_metrics(pred: np.ndarray, gt: np.ndarray, voxel_volume_mm3: float = 1.0) -> dict:
+    """
+    히스토그램 한 번으로 GT 볼륨 / Dice / confusion 통계 계산
+
+    Returns:
+        gt_volumes, comparison_metrics (dice_wt/tc/et/mean, per_label, confusion_matrix)
+    """
+    joint, k = joint_histogram(pred, gt)
+    pred_counts = joint.sum(axis=1)
+    gt_counts = joint.sum(axis=0)
+
+    def count(counts, labels):
+        return int(sum(counts[label] for label in labels if label < k))
+
+    def overlap(labels):
+        idx = [label for label in labels if label < k]
+        return int(joint[np.ix_(idx, idx)].sum()) if idx else 0
+
+    gt_volumes = {
+        f'{LABEL_NAMES[label]}_volume': count(gt_counts, (label,)) * voxel_volume_mm3
+        for label in LABELS
+    }
+    gt_volumes['tc_volume'] = gt_volumes['et_volume'] + gt_volumes['ncr_volume']
+    gt_volumes['wt_volume'] = gt_volumes['tc_volume'] + gt_volumes['ed_volume']
+
+    metrics = {}
+    for region, labels in REGIONS.items():
+        metrics[f'dice_{region}'] = _dice(overlap(labels), count(pred_counts, labels), count(gt_counts, labels))
+    metrics['dice_mean'] = float(np.mean([metrics[f'dice_{region}'] for region in REGIONS]))
+
+    per_label = {}
+    for label in LABELS:
+        tp = overlap((label,))
+        pred_sum = count(pred_counts, (label,))
+        gt_sum = count(gt_counts, (label,))
+        per_label[LABEL_NAMES[label]] = {
+            'dice': _dice(tp, pred_sum, gt_sum),
+            'tp': tp,
+            'fp': pred_sum - tp,
+            'fn': gt_sum - tp,
+            'sensitivity': tp / gt_sum if gt_sum else None,
+            'precision': tp / pred_sum if pred_sum else None,
+        }
+    metrics['per_label'] = per_label
+
+    # 행: 예측 라벨, 열: GT 라벨 (0, 1, 2, 4)
+    axis_labels = [label for label in (0,) + LABELS if label < k]
+    metrics['confusion_matrix'] = {
+        'labels': axis_labels,
+        'matrix': joint[np.ix_(axis_labels, axis_labels)].tolist(),
+    }
+    return {'gt_volumes': gt_volumes, 'comparison_metrics': metrics}
+
+
+def resample_to(pred: np.ndarray, shape) -> np.ndarray:
+    """예측 마스크를 GT 크기에 맞게 리샘플링 (nearest neighbor)"""
+    if tuple(pred.shape) == tuple(shape):
+        return pred
+    from scipy.ndimage import zoom
+    zoom_factors = [g / p for g, p in zip(shape, pred.shape)]
+    resampled = zoom(np.asarray(pred), zoom_factors, order=0)
+    logger.info(f"예측 마스크 리샘플링: {pred.shape} -> {resampled.shape}")
+    return resampled
+
+
+# ============================================================
+# 메모이제이션
+# ============================================================
+
+def cached_comparison(job_dir: Path, pred_version: str, series_id: str, series_version: str, compute) -> dict:
+    """
+    (예측 결과 버전, SEG 시리즈 버전) 단위로 compute() 결과 저장/재사용
+
+    compute() 예외는 저장하지 않고 그대로 전달
+    """
+    key = hashlib.sha1(f"{pred_version}|{series_id}|{series_version}".encode('utf-8')).hexdigest()[:16]
+    path = job_dir / COMPARE_DIR / f"{series_id}-{key}.json"
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        pass
+
+    result = compute()
+    try:
+        _atomic_write(path, lambda f: f.write(json.dumps(result).encode('utf-8')))
+    except OSError as e:
+        logger.warning(f"비교 결과 저장 실패 {path}: {e}")
+    return result
@@ -0,0 +1,246 @@
+"""
+M1 결과 썸네일 사전 렌더링
+
+callback ingestion 시 한 번 렌더링해 <job_dir>/.thumbnails/에 저장하고
+AIInferenceM1ThumbnailView는 파일을 그대로 전송 (요청마다 npz 압축 해제 / PNG 인코딩 없음)
+
+생성 파일:
+    axial.png / coronal.png / sagittal.png : 단면 MRI + 세그멘테이션 오버레이
+                                             (기본: 중간 슬라이스, AI_THUMBNAIL_SLICE='largest_tumor'면 종양 면적 최대 슬라이스)
+    sprite_axial.png                       : axial 슬라이스 축소 이미지 격자 (스크롤 미리보기용)
+    index.json                             : 원본 버전, 단면 슬라이스 번호, sprite 배치 정보
+"""
+import io
+import json
+import math
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from . import result_store
+
+THUMB_DIR = '.thumbnails'
+INDEX_NAME = 'index.json'
+SEG_FILE = 'm1_segmentation.npz'
+MRI_FILE = 'm1_preprocessed_mri.npz'
+
+# 단면 → 슬라이스 축 (볼륨 배열 순서 X, Y, Z)
+PLANES = {'axial': 2, 'coronal': 1, 'sagittal': 0}
+SPRITE_PLANE = 'axial'
+SPRITE_TILE = 64
+SPRITE_COLS = 8
+SPRITE_MAX_TILES = 32
+
+# 단면 슬라이스 선택: 'middle' (중간 슬라이스) | 'largest_tumor' (종양 면적 최대)
+SLICE_MODES = ('middle', 'largest_tumor')
+SLICE_MODE = getattr(settings, 'AI_THUMBNAIL_SLICE', 'middle')
+
+# BraTS 레이블: 1=NCR/NET (빨강), 2=ED (노랑), 4=ET (초록)
+OVERLAY_ALPHA = 0.5
+_COLOR_LUT = np.zeros((256, 3), dtype=np.float32)
+_COLOR_LUT[1] = (255, 100, 100)
+_COLOR_LUT[2] = (255, 255, 100)
+_COLOR_LUT[4] = (100, 255, 100)
+_ALPHA_LUT = np.zeros(256, dtype=np.float32)
+_ALPHA_LUT[[1, 2, 4]] = OVERLAY_ALPHA
+
+MRI_KEYS = ('t1ce', 't1c', 'T1CE', 'T1C', 't1', 'T1')
+
+
+def thumbnail_url(inference, plane: str = 'axial') -> str:
+    """썸네일 URL - 완료 시각을 버전(v)으로 붙여 결과가 바뀌면 URL도 바뀜 (장기 캐시용)"""
+    version = int(inference.completed_at.timestamp()) if inference.completed_at else 0
+    params = f'v={version}' if plane == 'axial' else f'plane={plane}&v={version}'
+    return f'/api/ai/inferences/{inference.job_id}/thumbnail/?{params}'
+
+
+def thumb_dir(job_dir: Path) -> Path:
+    return job_dir / THUMB_DIR
+
+
+def _source_version(job_dir: Path) -> str:
+    parts = []
+    for name in (SEG_FILE, MRI_FILE):
+        path = job_dir / name
+        if path.exists():
+            stat = path.stat()
+            parts.append(f'{stat.st_mtime_ns:x}-{stat.st_size:x}')
+    return '|'.join(parts)
+
+
+def read_index(job_dir: Path, slice_mode: str = None):
+    """원본 버전 / 슬라이스 선택 방식이 같은 썸네일 index (없거나 오래되었으면 None)"""
+    slice_mode = slice_mode or SLICE_MODE
+    try:
+        index = json.loads((thumb_dir(job_dir) / INDEX_NAME).read_text(encoding='utf-8'))
+        if index.get('source') == _source_version(job_dir) and index.get('slice_mode') == slice_mode:
+            return index
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+# ============================================================
+# 렌더링
+# ============================================================
+
+def _normalize(mri_slice: np.ndarray) -> np.ndarray:
+    """MRI 단면 → 0-255 (단면별 min/max 기준)"""
+    mri_slice = np.asarray(mri_slice)
+    if mri_slice.max() > mri_slice.min():
+        return ((mri_slice - mri_slice.min()) / (mri_slice.max() - mri_slice.min()) * 255).astype(np.uint8)
+    return np.zeros(mri_slice.shape, dtype=np.uint8)
+
+
+def overlay(gray_slice: np.ndarray, seg_slice: np.ndarray) -> np.ndarray:
+    """그레이스케일 단면에 라벨 색상 블렌딩 (lookup table, 라벨별 반복 없음) → RGB uint8"""
+    labels = np.asarray(seg_slice).astype(np.uint8, copy=False)
+    alpha = _ALPHA_LUT[labels][..., None]
+    rgb = gray_slice[..., None].astype(np.float32) * (1 - alpha) + _COLOR_LUT[labels] * alpha
+    return rgb.astype(np.uint8)
+
+
+def _plane_slice(volume: np.ndarray, axis: int, index: int) -> np.ndarray:
+    """단면 추출 + 표시 방향 (axial: 상하 반전, coronal/sagittal: Z축이 위쪽)"""
+    plane = np.take(volume, index, axis=axis)
+    if axis == 2:
+        return np.flipud(plane)
+    return np.flipud(plane.T)
+
+
+def _select_slice(seg: np.ndarray, axis: int, slice_mode: str) -> int:
+    """썸네일 슬라이스 - middle: 중간, largest_tumor: 종양 면적 최대 (종양이 없으면 중간)"""
+    middle = seg.shape[axis] // 2
+    if slice_mode != 'largest_tumor':
+        return middle
+    other = tuple(a for a in range(3) if a != axis)
+    area = (seg > 0).sum(axis=other)
+    if area.max() == 0:
+        return middle
+    return int(area.argmax())
+
+
+def _render_plane(mri, seg: np.ndarray, axis: int, index: int) -> np.ndarray:
+    """단면 오버레이 RGB (MRI 없으면 검은 배경)"""
+    seg_slice = _plane_slice(seg, axis, index)
+    if mri is None:
+        gray = np.zeros(seg_slice.shape, dtype=np.uint8)
+    else:
+        gray = _normalize(_plane_slice(mri, axis, index))
+    return overlay(gray, seg_slice)
+
+
+def _png_bytes(rgb: np.ndarray) -> bytes:
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.fromarray(np.ascontiguousarray(rgb)).save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def _sprite(mri, seg: np.ndarray, axis: int):
+    """축소 슬라이스 격자 이미지 → (png bytes, 배치 정보)"""
+    from PIL import Image
+
+    depth = seg.shape[axis]
+    step = max(1, math.ceil(depth / SPRITE_MAX_TILES))
+    slices = list(range(0, depth, step))
+    cols = min(SPRITE_COLS, len(slices))
+    rows = math.ceil(len(slices) / cols)
+
+    sheet = Image.new('RGB', (cols * SPRITE_TILE, rows * SPRITE_TILE))
+    for i, index in enumerate(slices):
+        tile = Image.fromarray(_render_plane(mri, seg, axis, index))
+        tile = tile.resize((SPRITE_TILE, SPRITE_TILE), Image.BILINEAR)
+        sheet.paste(tile, ((i % cols) * SPRITE_TILE, (i // cols) * SPRITE_TILE))
+
+    buffer = io.BytesIO()
+    sheet.save(buffer, format='PNG', optimize=True)
+    layout = {
+        'plane': SPRITE_PLANE,
+        'tile_size': SPRITE_TILE,
+        'cols': cols,
+        'rows': rows,
+        'slices': slices,
+    }
+    return buffer.getvalue(), layout
+
+
+def _load_volumes(job_dir: Path):
+    seg_data = result_store.load(job_dir / SEG_FILE)
+    if 'mask' in seg_data:
+        seg = seg_data['mask']
+    elif 'segmentation_mask' in seg_data:
+        seg = seg_data['segmentation_mask']
+    else:
+        raise KeyError("세그멘테이션 데이터를 찾을 수 없습니다.")
+
+    mri = None
+    mri_file = job_dir / MRI_FILE
+    if mri_file.exists():
+        mri_npz = result_store.load(mri_file)
+        for key in MRI_KEYS:
+            if key in mri_npz:
+                mri = mri_npz[key]
+                break
+        if mri is None and len(mri_npz.files) > 0:
+            mri = mri_npz[mri_npz.files[0]]
+    # MRI 없으면 세그멘테이션에서 MRI 찾기 (legacy)
+    if mri is None and 'mri' in seg_data:
+        mri = seg_data['mri']
+    return np.asarray(seg), mri
+
+
+def _write(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def render_job(job_dir: Path, force: bool = False, slice_mode: str = None) -> dict:
+    """
+    job 폴더의 M1 결과로 썸네일 / sprite 생성 (이미 최신이면 생략)
+
+    Args:
+        slice_mode: 'middle' | 'largest_tumor' (기본 AI_THUMBNAIL_SLICE 설정)
+
+    Returns:
+        index (단면별 슬라이스 번호, sprite 배치 정보)
+    """
+    slice_mode = slice_mode or SLICE_MODE
+    if slice_mode not in SLICE_MODES:
+        raise ValueError(f'지원하지 않는 slice_mode: {slice_mode}')
+    if not force:
+        index = read_index(job_dir, slice_mode)
+        if index is not None:
+            return index
+
+    version = _source_version(job_dir)
+    seg, mri = _load_volumes(job_dir)
+
+    out_dir = thumb_dir(job_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    planes = {}
+    for plane, axis in PLANES.items():
+        index = _select_slice(seg, axis, slice_mode)
+        _write(out_dir / f'{plane}.png', _png_bytes(_render_plane(mri, seg, axis, index)))
+        planes[plane] = {'slice': index, 'file': f'{plane}.png'}
+
+    sprite_png, layout = _sprite(mri, seg, PLANES[SPRITE_PLANE])
+    layout['file'] = f'sprite_{SPRITE_PLANE}.png'
+    _write(out_dir / layout['file'], sprite_png)
+
+    index = {'source': version, 'slice_mode': slice_mode, 'planes': planes, 'sprite': layout}
+    _write(out_dir / INDEX_NAME, json.dumps(index).encode('utf-8'))
+    return index
@@ -13,8 +13,11 @@ from .views import (
     AIInferenceFilesListView,
     AIInferenceSegmentationView,
     AIInferenceSegmentationCompareView,
+    AIInferenceVolumeListView,
+    AIInferenceVolumeView,
     AIInferenceReviewView,
     AIInferenceM1ThumbnailView,
+    AIInferenceM1SpriteView,
     MGGeneExpressionView,
     AIModelsListView,
     AIModelDetailView,
@@ -57,8 +60,13 @@ urlpatterns = [
     path('inferences/<str:job_id>/segmentation/', AIInferenceSegmentationView.as_view(), name='inference-segmentation'),
     path('inferences/<str:job_id>/segmentation/compare/', AIInferenceSegmentationCompareView.as_view(), name='inference-segmentation-compare'),
 
+    # Binary volumes (native dtype, Range / slab / ETag)
+    path('inferences/<str:job_id>/volumes/', AIInferenceVolumeListView.as_view(), name='inference-volumes'),
+    path('inferences/<str:job_id>/volumes/<str:name>/', AIInferenceVolumeView.as_view(), name='inference-volume'),
+
     # Thumbnail (M1)
     path('inferences/<str:job_id>/thumbnail/', AIInferenceM1ThumbnailView.as_view(), name='inference-thumbnail'),
+    path('inferences/<str:job_id>/thumbnail/sprite/', AIInferenceM1SpriteView.as_view(), name='inference-thumbnail-sprite'),
 
     # Patient AI inference list (진료화면용)
     path('patients/<int:patient_id>/requests/', PatientAIInferenceListView.as_view(), name='patient-inference-list'),
@@ -10,12 +10,11 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
 
 from django.conf import settings as django_settings
 from apps.ocs.models import OCS
 from .models import AIInference
+from . import ingest, result_store, seg_compare, thumbnails, volumes
 from .serializers import InferenceRequestSerializer, InferenceCallbackSerializer, AIInferenceSerializer
 
 logger = logging.getLogger(__name__)
@@ -366,7 +365,10 @@ class InferenceCallbackView(APIView):
 
     POST /api/ai/callback/
     - FastAPI에서 추론 결과와 파일 내용을 함께 전송
-    - Django에서 CDSS_STORAGE/AI/<job_id>/에 파일 저장
+      - JSON: files = {filename: {content: base64, type}} (MG/MM)
+      - multipart: result_data(JSON 문자열) + files 바이너리 파트 (M1)
+    - 요청 thread에서는 파일을 CDSS_STORAGE/AI/<job_id>/로 옮기고 manifest만 기록 후 202 응답
+      (base64 디코딩, AIInference 갱신, WebSocket 알림은 ingest background worker에서 처리)
 
     Note: AllowAny - FastAPI 내부 서버 콜백용 (로컬 네트워크)
     IP 화이트리스트로 보안 강화
@@ -430,14 +432,27 @@ class InferenceCallbackView(APIView):
                 {'detail': '허용되지 않은 IP입니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
-        import base64
-        import numpy as np
+
+        # multipart 파일은 CDSS_STORAGE/AI/.incoming에 바로 기록 (본문 파싱 전에 지정)
+        request._request.upload_handlers = [ingest.StagingUploadHandler(request._request)]
+        # JSON 콜백 원본 - base64 파일은 background에서 디코딩
+        raw_body = None if request.content_type.startswith('multipart/') else request.body
 
         job_id = request.data.get('job_id')
         cb_status = request.data.get('status')
         result_data = request.data.get('result_data', {})
         error_message = request.data.get('error_message')
-        files_data = request.data.get('files', {})  # 파일 내용 (base64 인코딩)
+
+        # multipart 콜백: result_data는 JSON 문자열, 결과 파일은 바이너리 파트
+        uploaded_files = request.FILES.getlist('files')
+        if isinstance(result_data, str):
+            try:
+                result_data = json.loads(result_data)
+            except ValueError:
+                return Response(
+                    {'detail': 'result_data 형식이 올바르지 않습니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
         if not job_id:
             return Response(
@@ -445,120 +460,19 @@ class InferenceCallbackView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 추론 조회
-        try:
-            inference = AIInference.objects.get(job_id=job_id)
-        except AIInference.DoesNotExist:
+        if not AIInference.objects.filter(job_id=job_id).exists():
             return Response(
                 {'detail': 'Job을 찾을 수 없습니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # 상태 업데이트
-        if cb_status == 'completed':
-            # 파일 저장
-            if files_data:
-                saved_files = self._save_files(job_id, files_data)
-                result_data['saved_files'] = saved_files
-                logger.info(f'Files saved for job {job_id}: {list(saved_files.keys())}')
-
-            inference.status = AIInference.Status.COMPLETED
-            inference.result_data = result_data
-            inference.completed_at = timezone.now()
-        else:
-            inference.status = AIInference.Status.FAILED
-            inference.error_message = error_message
-
-        inference.save()
-
-        # WebSocket 알림 (manual 모드만)
-        if inference.mode == AIInference.Mode.MANUAL:
-            self._send_websocket_notification(inference)
-
-        logger.info(f'Callback 처리 완료: job_id={job_id}, status={cb_status}')
-
-        return Response({'status': 'ok'})
-
-    def _save_files(self, job_id: str, files_data: dict) -> dict:
-        """
-        FastAPI에서 받은 파일 내용을 CDSS_STORAGE에 저장
-
-        Args:
-            job_id: 작업 ID
-            files_data: {filename: {content: base64, type: 'json'|'npz'|'png'}}
-
-        Returns:
-            저장된 파일명 목록
-        """
-        import base64
-        import json
-        import numpy as np
-
-        output_dir = self.STORAGE_BASE / job_id
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        saved_files = {'job_id': job_id}
+        # 파일 이동 + manifest 기록 후 바로 응답, 나머지는 background 처리
+        ingest.stage_callback(job_id, cb_status, result_data, error_message, uploaded_files, raw_body)
+        ingest.schedule(job_id)
 
-        for filename, file_info in files_data.items():
-            try:
-                content = file_info.get('content')
-                file_type = file_info.get('type', 'binary')
-                file_path = output_dir / filename
-
-                if file_type == 'json':
-                    # JSON 파일은 문자열로 전송됨
-                    if isinstance(content, str):
-                        data = json.loads(content)
-                    else:
-                        data = content
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-
-                elif file_type == 'npz':
-                    # NPZ 파일은 base64로 인코딩된 바이너리
-                    binary_data = base64.b64decode(content)
-                    with open(file_path, 'wb') as f:
-                        f.write(binary_data)
-
-                elif file_type == 'png':
-                    # PNG 파일은 base64로 인코딩된 이미지
-                    binary_data = base64.b64decode(content)
-                    with open(file_path, 'wb') as f:
-                        f.write(binary_data)
-
-                else:
-                    # 기타 바이너리 파일
-                    binary_data = base64.b64decode(content)
-                    with open(file_path, 'wb') as f:
-                        f.write(binary_data)
-
-                # 파일명에서 확장자 제거한 키 생성
-                key = filename.rsplit('.', 1)[0] if '.' in filename else filename
-                saved_files[key] = filename
-                logger.info(f'  Saved: {filename}')
+        logger.info(f'Callback 수신: job_id={job_id}, status={cb_status}')
 
-            except Exception as e:
-                logger.error(f'Failed to save file {filename}: {e}')
-
-        return saved_files
-
-    def _send_websocket_notification(self, inference):
-        """WebSocket으로 결과 알림"""
-        try:
-            channel_layer = get_channel_layer()
-            async_to_sync(channel_layer.group_send)(
-                'ai_inference',
-                {
-                    'type': 'ai_inference_result',
-                    'job_id': inference.job_id,
-                    'model_type': inference.model_type,
-                    'status': inference.status,
-                    'result': inference.result_data if inference.status == AIInference.Status.COMPLETED else None,
-                    'error': inference.error_message if inference.status == AIInference.Status.FAILED else None,
-                }
-            )
-        except Exception as e:
-            logger.error(f'WebSocket 알림 실패: {str(e)}')
+        return Response({'status': 'accepted'}, status=status.HTTP_202_ACCEPTED)
 
 
 class AIInferenceListView(APIView):
@@ -822,7 +736,8 @@ class AIInferenceFilesListView(APIView):
 
         if result_dir.exists():
             for file_path in result_dir.iterdir():
-                if file_path.is_file():
+                # .ingest.json 등 처리 중 파일 제외
+                if file_path.is_file() and not file_path.name.startswith('.'):
                     stat = file_path.stat()
                     files.append({
                         'name': file_path.name,
@@ -897,7 +812,7 @@ class AIInferenceSegmentationView(APIView):
 
         try:
             # 세그멘테이션 NPZ 파일 로드
-            seg_data = np.load(seg_file, allow_pickle=True)
+            seg_data = result_store.load(seg_file)
 
             # 세그멘테이션 마스크 (mask 또는 segmentation_mask 키 사용)
             if 'mask' in seg_data:
@@ -920,7 +835,7 @@ class AIInferenceSegmentationView(APIView):
             mri_data = None
 
             if mri_file.exists():
-                mri_npz = np.load(mri_file, allow_pickle=True)
+                mri_npz = result_store.load(mri_file)
                 logger.info(f'Preprocessed MRI file found: {list(mri_npz.keys())}')
 
                 # 4채널 MRI 데이터 로드
@@ -998,6 +913,163 @@ class AIInferenceSegmentationView(APIView):
             )
 
 
+class AIInferenceVolumeListView(APIView):
+    """
+    M1 결과 볼륨 목록 (바이너리 볼륨 API)
+
+    GET /api/ai/inferences/<job_id>/volumes/
+
+    Returns:
+        - shape: 볼륨 크기 [X, Y, Z]
+        - volumes: {name: {shape, dtype, source_dtype, etag, url}}
+          name: mask, ground_truth, t1, t1ce, t2, flair (legacy: mri)
+        - has_ground_truth: GT 존재 여부 (없으면 mask를 그대로 사용, 중복 전송 없음)
+        - volumes_info: 종양 볼륨 정보
+    """
+    permission_classes = [IsAuthenticated]
+
+    STORAGE_BASE = CDSS_STORAGE_AI
+
+    def get(self, request, job_id):
+        if not AIInference.objects.filter(job_id=job_id).exists():
+            return Response(
+                {'detail': '추론 결과를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        result_dir = self.STORAGE_BASE / job_id
+        sources = volumes.volume_sources(result_dir)
+        if 'mask' not in sources:
+            return Response(
+                {'detail': '세그멘테이션 파일을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        volume_list = {}
+        for name, (path, key) in sources.items():
+            shape, source_dtype = volumes.volume_header(path, key)
+            dtype = 'uint8' if volumes.is_mask(name) else volumes.DEFAULT_MRI_DTYPE
+            volume_list[name] = {
+                'shape': shape,
+                'dtype': dtype,
+                'source_dtype': str(source_dtype),
+                'etag': volumes.make_etag(job_id, name, volumes.source_version(path), dtype),
+                'url': f'/api/ai/inferences/{job_id}/volumes/{name}/',
+            }
+
+        # 종양 볼륨 정보 (스칼라만 - 배열 압축 해제 없음)
+        volumes_info = {}
+        seg_path = sources['mask'][0]
+        with result_store.load(seg_path) as seg_data:
+            for key in ['wt_volume', 'tc_volume', 'et_volume', 'ncr_volume', 'ed_volume',
+                        'gt_wt_volume', 'gt_tc_volume', 'gt_et_volume', 'gt_ncr_volume', 'gt_ed_volume']:
+                if key in seg_data.files:
+                    volumes_info[key] = float(seg_data[key])
+
+        return Response({
+            'job_id': job_id,
+            'shape': volume_list['mask']['shape'],
+            'order': 'C',
+            'volumes': volume_list,
+            'has_ground_truth': 'ground_truth' in volume_list,
+            'volumes_info': volumes_info,
+            'mri_dtypes': list(volumes.MRI_DTYPES),
+        })
+
+
+class AIInferenceVolumeView(APIView):
+    """
+    M1 결과 볼륨 바이너리 (application/octet-stream)
+
+    GET /api/ai/inferences/<job_id>/volumes/<name>/
+    - dtype: MRI 채널 전송 dtype - float16(기본) | uint8(양자화) | float32, 마스크는 항상 uint8
+    - axis, start, count: axis(0|1|2) 방향 [start, start+count) slab만 전송 (생략 시 전체)
+    - Range: bytes=... 지원 (206), If-None-Match → 304, Accept-Encoding: gzip이면 압축
+
+    Response headers:
+        X-Volume-Shape: 응답 배열 shape (예: 128,128,1), C-order
+        X-Volume-Dtype: uint8 | float16 | float32
+        X-Volume-Scale / X-Volume-Offset: uint8 양자화 시 value = q * scale + offset
+    """
+    permission_classes = [IsAuthenticated]
+
+    STORAGE_BASE = CDSS_STORAGE_AI
+
+    def get(self, request, job_id, name):
+        if not AIInference.objects.filter(job_id=job_id).exists():
+            return Response(
+                {'detail': '추론 결과를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        sources = volumes.volume_sources(self.STORAGE_BASE / job_id)
+        if name not in sources:
+            return Response(
+                {'detail': '볼륨을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        path, key = sources[name]
+
+        dtype = 'uint8' if volumes.is_mask(name) else request.query_params.get('dtype', volumes.DEFAULT_MRI_DTYPE)
+        if dtype not in volumes.MRI_DTYPES:
+            return Response(
+                {'detail': f'dtype은 {", ".join(volumes.MRI_DTYPES)} 중 하나여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        axis = request.query_params.get('axis')
+        try:
+            if axis is not None:
+                axis = int(axis)
+                start = int(request.query_params.get('start', 0))
+                count = int(request.query_params.get('count', 1))
+                if axis not in (0, 1, 2) or start < 0 or count < 1:
+                    raise ValueError
+        except ValueError:
+            return Response(
+                {'detail': 'axis(0|1|2), start(>=0), count(>=1)가 올바르지 않습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        max_age = django_settings.AI_VOLUME_MAX_AGE
+        version = volumes.source_version(path)
+        etag = volumes.make_etag(job_id, name, version, dtype)
+        if axis is not None:
+            etag = volumes.make_etag(etag, axis, start, count)
+        if volumes.etag_matches(request, etag):
+            return volumes.not_modified(etag, max_age)
+
+        try:
+            # 결과 저장소가 있으면 mmap - slab 조회 시 해당 부분만 읽음
+            arr = volumes.load_volume(path, key)
+            if axis is not None and start >= arr.shape[axis]:
+                return Response(
+                    {'detail': f'start가 볼륨 범위({arr.shape[axis]})를 벗어났습니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # 양자화 scale/offset은 전체 볼륨 기준 (slab 간 일관성)
+            vrange = volumes.value_range(path, key, arr) if dtype == 'uint8' and not volumes.is_mask(name) else None
+            if axis is not None:
+                arr = volumes.slab(arr, axis, start, count)
+            arr, meta = volumes.encode_volume(name, arr, dtype, vrange)
+        except Exception as e:
+            logger.error(f'볼륨 로드 실패: {job_id}/{name}: {e}')
+            return Response(
+                {'detail': '데이터 로드에 실패했습니다.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        headers = {
+            'X-Volume-Shape': ','.join(str(n) for n in arr.shape),
+            'X-Volume-Dtype': meta['dtype'],
+        }
+        if 'scale' in meta:
+            headers['X-Volume-Scale'] = repr(meta['scale'])
+            headers['X-Volume-Offset'] = repr(meta['offset'])
+
+        return volumes.octet_response(request, arr.tobytes(), etag, headers, max_age)
+
+
 class MGGeneExpressionView(APIView):
     """
     MG Gene Expression 분석 데이터 조회
@@ -1712,7 +1784,9 @@ class AIInferenceSegmentationCompareView(APIView):
         - shape: 볼륨 크기
         - prediction_volumes: 예측 볼륨 정보
         - gt_volumes: GT 볼륨 정보 (있는 경우)
-        - comparison_metrics: 비교 메트릭 (Dice Score 등)
+        - comparison_metrics: 비교 메트릭 (Dice Score, 라벨별 통계, confusion matrix)
+
+    GT 볼륨은 SEG 시리즈별로, 메트릭은 (예측 결과, SEG 시리즈) 버전별로 캐시 (seg_compare)
     """
     permission_classes = [IsAuthenticated]
 
@@ -1725,124 +1799,7 @@ class AIInferenceSegmentationCompareView(APIView):
         arr_f32 = arr.astype(np.float32)
         return base64.b64encode(arr_f32.tobytes()).decode('ascii')
 
-    def _calculate_dice_score(self, pred, gt, label):
-        """
-        특정 라벨에 대한 Dice Score 계산
-        Dice = 2 * |P ∩ G| / (|P| + |G|)
-        """
-        import numpy as np
-        pred_mask = (pred == label)
-        gt_mask = (gt == label)
-
-        intersection = np.sum(pred_mask & gt_mask)
-        pred_sum = np.sum(pred_mask)
-        gt_sum = np.sum(gt_mask)
-
-        if pred_sum + gt_sum == 0:
-            return 1.0  # 둘 다 없으면 완벽한 일치
-        return 2.0 * intersection / (pred_sum + gt_sum)
-
-    def _calculate_volume(self, mask, label, voxel_volume_mm3=1.0):
-        """특정 라벨의 볼륨 계산 (mm³)"""
-        import numpy as np
-        return float(np.sum(mask == label)) * voxel_volume_mm3
-
-    def _load_orthanc_seg(self, ocs):
-        """
-        OCS의 worker_result에서 Orthanc SEG 시리즈를 찾아 로드
-
-        Returns:
-            - numpy array (3D) 또는 None
-        """
-        import numpy as np
-        import requests
-
-        # settings.py의 ORTHANC_BASE_URL 사용 (Docker Orthanc 연결)
-        ORTHANC_URL = django_settings.ORTHANC_BASE_URL.rstrip("/")
-
-        worker_result = ocs.worker_result or {}
-        orthanc_info = worker_result.get('orthanc', {})
-        orthanc_study_id = orthanc_info.get('orthanc_study_id')
-        series_list = orthanc_info.get('series', [])
-
-        if not orthanc_study_id:
-            logger.info(f"OCS {ocs.id}: Orthanc study ID가 없습니다.")
-            return None
-
-        # SEG 시리즈 찾기
-        seg_series = None
-        for series in series_list:
-            series_type = series.get('series_type', '')
-            if series_type == 'SEG':
-                seg_series = series
-                break
-
-        if not seg_series:
-            logger.info(f"OCS {ocs.id}: SEG 시리즈가 없습니다.")
-            return None
-
-        orthanc_series_id = seg_series.get('orthanc_series_id')
-        if not orthanc_series_id:
-            logger.warning(f"OCS {ocs.id}: SEG 시리즈의 Orthanc ID가 없습니다.")
-            return None
-
-        try:
-            # Orthanc에서 SEG 시리즈의 모든 인스턴스 가져오기
-            series_info = requests.get(
-                f"{ORTHANC_URL}/series/{orthanc_series_id}",
-                timeout=30
-            ).json()
-
-            instances = series_info.get('Instances', [])
-            if not instances:
-                logger.warning(f"SEG 시리즈 {orthanc_series_id}: 인스턴스가 없습니다.")
-                return None
-
-            logger.info(f"SEG 시리즈 로드: {orthanc_series_id}, 인스턴스 수: {len(instances)}")
-
-            # 각 인스턴스에서 픽셀 데이터 추출하여 3D 볼륨 구성
-            # SEG DICOM은 특수한 형식이므로 pydicom으로 처리
-            try:
-                import pydicom
-                from io import BytesIO
-
-                slices = []
-                for inst_id in instances:
-                    # DICOM 파일 다운로드
-                    dicom_resp = requests.get(
-                        f"{ORTHANC_URL}/instances/{inst_id}/file",
-                        timeout=30
-                    )
-                    dicom_resp.raise_for_status()
-
-                    # pydicom으로 파싱
-                    ds = pydicom.dcmread(BytesIO(dicom_resp.content))
-
-                    # 픽셀 데이터 추출
-                    if hasattr(ds, 'pixel_array'):
-                        pixel_data = ds.pixel_array
-                        slices.append(pixel_data)
-
-                if not slices:
-                    logger.warning(f"SEG 시리즈 {orthanc_series_id}: 픽셀 데이터가 없습니다.")
-                    return None
-
-                # 3D 볼륨으로 스택
-                seg_volume = np.stack(slices, axis=-1)
-                logger.info(f"SEG 볼륨 로드 완료: shape={seg_volume.shape}")
-
-                return seg_volume
-
-            except ImportError:
-                logger.error("pydicom이 설치되지 않았습니다.")
-                return None
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Orthanc SEG 로드 실패: {e}")
-            return None
-
     def get(self, request, job_id):
-        import numpy as np
         import time
 
         start_time = time.time()
@@ -1874,7 +1831,7 @@ class AIInferenceSegmentationCompareView(APIView):
             )
 
         try:
-            seg_data = np.load(seg_file, allow_pickle=True)
+            seg_data = result_store.load(seg_file)
 
             # 예측 마스크
             if 'mask' in seg_data:
@@ -1891,60 +1848,33 @@ class AIInferenceSegmentationCompareView(APIView):
                     vol_val = seg_data[key]
                     pred_volumes[key] = float(vol_val.item()) if hasattr(vol_val, 'item') else float(vol_val)
 
-            # 3. Orthanc SEG (Ground Truth) 로드 시도
+            # 3. Orthanc SEG (Ground Truth) 로드 - SEG 시리즈별 캐시
             gt_mask = None
             gt_volumes = {}
             comparison_metrics = {}
             orthanc_seg_status = 'not_found'
 
             if inference.mri_ocs:
-                gt_mask = self._load_orthanc_seg(inference.mri_ocs)
+                series_id = seg_compare.find_seg_series_id(inference.mri_ocs)
+                if series_id:
+                    try:
+                        gt_mask, series_version = seg_compare.load_seg_volume(series_id)
+                    except seg_compare.LOAD_ERRORS as e:
+                        logger.error(f"Orthanc SEG 로드 실패: {e}")
 
                 if gt_mask is not None:
                     orthanc_seg_status = 'loaded'
 
-                    # GT 볼륨 계산
-                    # BraTS 라벨: 0=배경, 1=NCR, 2=ED, 4=ET (3은 사용안함)
-                    # WT = 1 + 2 + 4, TC = 1 + 4, ET = 4
-                    gt_volumes = {
-                        'et_volume': self._calculate_volume(gt_mask, 4),
-                        'ncr_volume': self._calculate_volume(gt_mask, 1),
-                        'ed_volume': self._calculate_volume(gt_mask, 2),
-                    }
-                    gt_volumes['tc_volume'] = gt_volumes['et_volume'] + gt_volumes['ncr_volume']
-                    gt_volumes['wt_volume'] = gt_volumes['tc_volume'] + gt_volumes['ed_volume']
-
-                    # 비교 메트릭 계산
+                    # GT 볼륨 / Dice / confusion 통계 - (예측 결과, SEG 시리즈) 버전별로 저장된 결과 재사용
                     try:
-                        # 예측 마스크를 GT 크기에 맞게 리샘플링 (필요시)
-                        if pred_mask.shape != gt_mask.shape:
-                            from scipy.ndimage import zoom
-                            zoom_factors = [g / p for g, p in zip(gt_mask.shape, pred_mask.shape)]
-                            pred_resampled = zoom(pred_mask, zoom_factors, order=0)  # nearest neighbor
-                            logger.info(f"예측 마스크 리샘플링: {pred_mask.shape} -> {pred_resampled.shape}")
-                        else:
-                            pred_resampled = pred_mask
-
-                        # Dice Score 계산
-                        comparison_metrics = {
-                            'dice_wt': self._calculate_dice_score(
-                                np.isin(pred_resampled, [1, 2, 4]).astype(int),
-                                np.isin(gt_mask, [1, 2, 4]).astype(int),
-                                1
+                        cached = seg_compare.cached_comparison(
+                            result_dir, volumes.source_version(seg_file), series_id, series_version,
+                            lambda: seg_compare.compute_metrics(
+                                seg_compare.resample_to(pred_mask, gt_mask.shape), gt_mask
                             ),
-                            'dice_tc': self._calculate_dice_score(
-                                np.isin(pred_resampled, [1, 4]).astype(int),
-                                np.isin(gt_mask, [1, 4]).astype(int),
-                                1
-                            ),
-                            'dice_et': self._calculate_dice_score(pred_resampled, gt_mask, 4),
-                        }
-                        comparison_metrics['dice_mean'] = np.mean([
-                            comparison_metrics['dice_wt'],
-                            comparison_metrics['dice_tc'],
-                            comparison_metrics['dice_et']
-                        ])
-
+                        )
+                        gt_volumes = cached['gt_volumes']
+                        comparison_metrics = cached['comparison_metrics']
                     except Exception as e:
                         logger.error(f"비교 메트릭 계산 실패: {e}")
                         comparison_metrics = {'error': str(e)}
@@ -2053,20 +1983,20 @@ class AIInferenceM1ThumbnailView(APIView):
     M1 추론 결과 썸네일 (MRI + 세그멘테이션 오버레이)
 
     GET /api/ai/inferences/<job_id>/thumbnail/
+    GET /api/ai/inferences/<job_id>/thumbnail/?plane=axial|coronal|sagittal|sprite
 
     Returns:
-        - PNG 이미지: T1CE MRI 중간 슬라이스에 세그멘테이션 마스크 오버레이
+        - PNG 이미지: 단면(기본 axial 중간 슬라이스)에 세그멘테이션 마스크 오버레이
+        - plane=sprite: axial 슬라이스 격자 이미지 (배치 정보는 thumbnail/sprite/)
+
+    callback ingestion 시 사전 렌더링된 파일을 그대로 전송 (없으면 최초 요청 시 렌더링)
+    ?v=<버전>이 붙은 URL만 장기 캐시, 나머지는 짧은 캐시 + ETag 재검증
     """
     permission_classes = [AllowAny]
 
     STORAGE_BASE = CDSS_STORAGE_AI
 
     def get(self, request, job_id):
-        import numpy as np
-        from PIL import Image
-        import io
-        from django.http import HttpResponse
-
         try:
             inference = AIInference.objects.get(job_id=job_id)
         except AIInference.DoesNotExist:
@@ -2082,103 +2012,101 @@ class AIInferenceM1ThumbnailView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        result_dir = self.STORAGE_BASE / job_id
-        seg_file = result_dir / "m1_segmentation.npz"
-        mri_file = result_dir / "m1_preprocessed_mri.npz"
+        plane = request.query_params.get('plane', 'axial')
+        if plane not in thumbnails.PLANES and plane != 'sprite':
+            return Response(
+                {'detail': 'plane은 axial, coronal, sagittal, sprite 중 하나여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        if not seg_file.exists():
+        result_dir = self.STORAGE_BASE / job_id
+        if not (result_dir / thumbnails.SEG_FILE).exists():
             return Response(
                 {'detail': '세그멘테이션 파일을 찾을 수 없습니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
         try:
-            # 세그멘테이션 마스크 로드
-            seg_data = np.load(seg_file, allow_pickle=True)
-            if 'mask' in seg_data:
-                seg_mask = seg_data['mask']
-            elif 'segmentation_mask' in seg_data:
-                seg_mask = seg_data['segmentation_mask']
-            else:
-                raise KeyError("세그멘테이션 데이터를 찾을 수 없습니다.")
+            index = thumbnails.render_job(result_dir)
+        except Exception as e:
+            logger.error(f'M1 썸네일 생성 실패: {str(e)}')
+            return Response(
+                {'detail': f'썸네일 생성에 실패했습니다: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
-            # MRI 데이터 로드
-            mri_data = None
-            if mri_file.exists():
-                mri_npz = np.load(mri_file, allow_pickle=True)
-                # T1CE 채널 우선, 없으면 다른 채널 사용
-                for key in ['t1ce', 't1c', 'T1CE', 'T1C', 't1', 'T1']:
-                    if key in mri_npz:
-                        mri_data = mri_npz[key]
-                        break
-                if mri_data is None and len(mri_npz.files) > 0:
-                    mri_data = mri_npz[mri_npz.files[0]]
-
-            # MRI 없으면 세그멘테이션에서 MRI 찾기 (legacy)
-            if mri_data is None and 'mri' in seg_data:
-                mri_data = seg_data['mri']
-
-            # 중간 슬라이스 선택
-            mid_slice = seg_mask.shape[2] // 2
-            seg_slice = seg_mask[:, :, mid_slice]
+        filename = index['sprite']['file'] if plane == 'sprite' else index['planes'][plane]['file']
+        return thumbnail_file_response(request, thumbnails.thumb_dir(result_dir) / filename, index['source'])
 
-            if mri_data is not None:
-                mri_slice = mri_data[:, :, mid_slice]
-            else:
-                # MRI 없으면 빈 배경 사용
-                mri_slice = np.zeros_like(seg_slice)
 
-            # 오버레이 이미지 생성
-            img_bytes = self._create_overlay(mri_slice, seg_slice)
+class AIInferenceM1SpriteView(APIView):
+    """
+    M1 슬라이스 sprite 배치 정보
+
+    GET /api/ai/inferences/<job_id>/thumbnail/sprite/
+
+    Returns:
+        - image_url: sprite PNG
+        - tile_size, cols, rows: 격자 배치
+        - slices: 타일 순서별 axial 슬라이스 번호
+        - planes: 단면별 썸네일 슬라이스 번호
+    """
+    permission_classes = [AllowAny]
 
-            return HttpResponse(img_bytes, content_type='image/png')
+    STORAGE_BASE = CDSS_STORAGE_AI
 
+    def get(self, request, job_id):
+        inference = AIInference.objects.filter(job_id=job_id, model_type=AIInference.ModelType.M1).first()
+        if inference is None:
+            return Response(
+                {'detail': '추론 결과를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        result_dir = self.STORAGE_BASE / job_id
+        if not (result_dir / thumbnails.SEG_FILE).exists():
+            return Response(
+                {'detail': '세그멘테이션 파일을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            index = thumbnails.render_job(result_dir)
         except Exception as e:
             logger.error(f'M1 썸네일 생성 실패: {str(e)}')
-            import traceback
-            traceback.print_exc()
             return Response(
                 {'detail': f'썸네일 생성에 실패했습니다: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _create_overlay(self, mri_slice, seg_slice):
-        """MRI 슬라이스에 세그멘테이션 마스크를 오버레이한 PNG 이미지 생성"""
-        import numpy as np
-        from PIL import Image
-        import io
-
-        # MRI 정규화 (0-255)
-        if mri_slice.max() > mri_slice.min():
-            mri_norm = ((mri_slice - mri_slice.min()) / (mri_slice.max() - mri_slice.min()) * 255).astype(np.uint8)
-        else:
-            mri_norm = np.zeros_like(mri_slice, dtype=np.uint8)
-
-        # 그레이스케일 → RGB
-        rgb = np.stack([mri_norm] * 3, axis=-1)
-
-        # 세그멘테이션 마스크 컬러 오버레이
-        # BraTS 레이블: 1=NCR/NET (빨강), 2=ED (노랑), 4=ET (초록)
-        colors = {
-            1: [255, 100, 100],   # NCR/NET: 빨강
-            2: [255, 255, 100],   # ED: 노랑
-            4: [100, 255, 100],   # ET: 초록
-        }
-        alpha = 0.5
+        sprite = {k: v for k, v in index['sprite'].items() if k != 'file'}
+        return Response({
+            'job_id': job_id,
+            'image_url': thumbnails.thumbnail_url(inference, 'sprite'),
+            **sprite,
+            'planes': {plane: info['slice'] for plane, info in index['planes'].items()},
+        })
 
-        for label, color in colors.items():
-            mask = seg_slice == label
-            if np.any(mask):
-                rgb[mask] = (rgb[mask] * (1-alpha) + np.array(color) * alpha).astype(np.uint8)
 
-        # 이미지 회전 (상하 반전하여 정상 방향으로)
-        rgb = np.flipud(rgb)
+def thumbnail_file_response(request, path, source_version: str):
+    """
+    사전 렌더링된 PNG 전송 - ETag 일치 시 304
 
-        # PNG 인코딩
-        img = Image.fromarray(rgb)
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        return buffer.getvalue()
+    환자 영상이므로 private (공유 proxy 캐시 금지)
+    ?v=<버전>이 있는 URL만 장기 캐시, 없으면 짧은 max-age + ETag 재검증
+    """
+    etag = volumes.make_etag(path.name, source_version)
+    if request.query_params.get('v'):
+        max_age = django_settings.AI_THUMBNAIL_MAX_AGE
+    else:
+        max_age = django_settings.AI_THUMBNAIL_UNVERSIONED_MAX_AGE
+    if volumes.etag_matches(request, etag):
+        response = volumes.not_modified(etag, max_age)
+    else:
+        response = FileResponse(open(path, 'rb'), content_type='image/png')
+        response['ETag'] = etag
+    response['Cache-Control'] = f'private, max-age={max_age}'
+    return response
 
 
 class PatientAIInferenceListView(APIView):
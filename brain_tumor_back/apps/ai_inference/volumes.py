@@ -0,0 +1,227 @@
+"""
+M1 결과 볼륨 바이너리 전송 (SegMRIViewer용)
+
+JSON/base64 대신 볼륨별 raw octet stream으로 전송
+- 마스크(mask, ground_truth)는 uint8, MRI 채널은 float16 (또는 uint8 양자화 / float32)
+- C-order (X, Y, Z) 바이트열, 축/범위 지정 시 해당 slab만 전송 → 첫 슬라이스를 먼저 그리고 나머지는 스트리밍
+- strong ETag (파일 mtime/size + 요청 파라미터) → If-None-Match 304
+- Range: bytes=... → 206 Partial Content (identity 전송만), Accept-Encoding: gzip이면 압축 전송
+"""
+import gzip
+import hashlib
+import re
+import zipfile
+from pathlib import Path
+
+import numpy as np
+from django.http import HttpResponse
+
+from . import result_store
+
+SEG_FILE = 'm1_segmentation.npz'
+MRI_FILE = 'm1_preprocessed_mri.npz'
+
+MRI_CHANNELS = ('t1', 't1ce', 't2', 'flair')
+MASK_VOLUMES = ('mask', 'ground_truth')
+MRI_DTYPES = ('float16', 'uint8', 'float32')
+DEFAULT_MRI_DTYPE = 'float16'
+
+# 압축해도 이득이 없는 작은 응답은 그대로 전송
+GZIP_MIN_BYTES = 1024
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+# ============================================================
+# 볼륨 조회
+# ============================================================
+
+def volume_sources(job_dir: Path) -> dict:
+    """
+    job 폴더에서 제공 가능한 볼륨 목록
+
+    Returns:
+        {name: (npz 경로, npz key)} - mask, ground_truth, t1, t1ce, t2, flair (legacy: mri)
+    """
+    sources = {}
+    seg_file = job_dir / SEG_FILE
+    mri_file = job_dir / MRI_FILE
+
+    if seg_file.exists():
+        with result_store.load(seg_file) as seg_npz:
+            keys = set(seg_npz.files)
+        if 'mask' in keys:
+            sources['mask'] = (seg_file, 'mask')
+        elif 'segmentation_mask' in keys:
+            sources['mask'] = (seg_file, 'segmentation_mask')
+        if 'ground_truth' in keys:
+            sources['ground_truth'] = (seg_file, 'ground_truth')
+        # 이전 버전 호환: segmentation.npz에 MRI 포함
+        if 'mri' in keys and not mri_file.exists():
+            sources['mri'] = (seg_file, 'mri')
+
+    if mri_file.exists():
+        with result_store.load(mri_file) as mri_npz:
+            keys = set(mri_npz.files)
+        for ch_name in MRI_CHANNELS:
+            if ch_name in keys:
+                sources[ch_name] = (mri_file, ch_name)
+
+    return sources
+
+
+def source_version(path: Path) -> str:
+    """파일 변경 감지용 버전 문자열 (mtime_ns + size)"""
+    stat = path.stat()
+    return f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+
+
+def load_volume(path: Path, key: str) -> np.ndarray:
+    """볼륨 배열 - 결과 저장소가 있으면 mmap (slab 조회 시 해당 부분만 읽음)"""
+    with result_store.load(path) as npz:
+        return npz[key]
+
+
+def value_range(path: Path, key: str, arr: np.ndarray):
+    """uint8 양자화용 (min, max) - 저장소 index 값 우선, 없으면 전체 볼륨에서 계산"""
+    info = result_store.array_info(path, key)
+    if info is not None and 'min' in info:
+        return info['min'], info['max']
+    return float(arr.min()), float(arr.max())
+
+
+def volume_header(path: Path, key: str):
+    """(shape, dtype) - 결과 저장소 index 또는 npz 멤버의 .npy 헤더만 읽음 (압축 해제 없음)"""
+    info = result_store.array_info(path, key)
+    if info is not None:
+        return info['shape'], np.dtype(info['dtype'])
+    with zipfile.ZipFile(path) as zf, zf.open(f'{key}.npy') as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+    return list(shape), dtype
+
+
+def is_mask(name: str) -> bool:
+    return name in MASK_VOLUMES
+
+
+# ============================================================
+# 인코딩
+# ============================================================
+
+def encode_volume(name: str, arr: np.ndarray, dtype: str = DEFAULT_MRI_DTYPE, value_range=None):
+    """
+    전송용 dtype으로 변환
+
+    Args:
+        value_range: uint8 양자화 기준 (min, max) - slab 변환 시 전체 볼륨 기준값 전달
+
+    Returns:
+        (array, meta) - meta: dtype, (uint8 양자화 시) scale/offset → value = q * scale + offset
+    """
+    if is_mask(name):
+        return arr.astype(np.uint8, copy=False), {'dtype': 'uint8'}
+
+    if dtype == 'uint8':
+        lo, hi = value_range if value_range is not None else (float(arr.min()), float(arr.max()))
+        scale = (hi - lo) / 255.0 if hi > lo else 1.0
+        quantized = np.rint((arr - lo) / scale).astype(np.uint8)
+        return quantized, {'dtype': 'uint8', 'scale': scale, 'offset': lo}
+
+    return arr.astype(dtype, copy=False), {'dtype': dtype}
+
+
+def slab(arr: np.ndarray, axis: int, start: int, count: int) -> np.ndarray:
+    """axis 방향 [start, start+count) 구간 (C-order 연속 배열)"""
+    index = [slice(None)] * arr.ndim
+    index[axis] = slice(start, start + count)
+    return np.ascontiguousarray(arr[tuple(index)])
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1('|'.join(str(p) for p in parts).encode('utf-8')).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+# ============================================================
+# HTTP 응답
+# ============================================================
+
+def _gzip_etag(etag: str) -> str:
+    # 표현(representation)이 다르므로 strong ETag도 구분
+    return etag[:-1] + '-gz"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """If-None-Match 비교 (identity / gzip 표현 모두)"""
+    if_none_match = request.headers.get('If-None-Match', '')
+    if if_none_match.strip() == '*':
+        return True
+    tags = {t.strip() for t in if_none_match.split(',')}
+    return etag in tags or _gzip_etag(etag) in tags
+
+
+def not_modified(etag: str, max_age: int) -> HttpResponse:
+    response = HttpResponse(status=304)
+    response['ETag'] = etag
+    response['Cache-Control'] = f'private, max-age={max_age}'
+    return response
+
+
+def parse_range(header: str, size: int):
+    """단일 bytes range → (start, end) (end 포함), 형식 오류면 None, 범위 밖이면 ValueError"""
+    match = _RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        # bytes=-N : 마지막 N바이트
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError('unsatisfiable range')
+    return start, end
+
+
+def octet_response(request, payload: bytes, etag: str, headers: dict, max_age: int) -> HttpResponse:
+    """Range / gzip을 처리한 application/octet-stream 응답 (If-None-Match는 호출 측에서 먼저 확인)"""
+    range_header = request.headers.get('Range')
+    status_code = 200
+    content_range = None
+    content_encoding = None
+
+    if range_header:
+        try:
+            byte_range = parse_range(range_header, len(payload))
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{len(payload)}'
+            return response
+        if byte_range is not None:
+            start, end = byte_range
+            content_range = f'bytes {start}-{end}/{len(payload)}'
+            payload = payload[start:end + 1]
+            status_code = 206
+    elif len(payload) >= GZIP_MIN_BYTES and 'gzip' in request.headers.get('Accept-Encoding', ''):
+        payload = gzip.compress(payload, compresslevel=1)
+        content_encoding = 'gzip'
+
+    response = HttpResponse(payload, status=status_code, content_type='application/octet-stream')
+    if content_range:
+        response['Content-Range'] = content_range
+    if content_encoding:
+        response['Content-Encoding'] = content_encoding
+        response['ETag'] = _gzip_etag(etag)
+    else:
+        response['ETag'] = etag
+    response['Accept-Ranges'] = 'bytes'
+    response['Vary'] = 'Accept-Encoding'
+    response['Cache-Control'] = f'private, max-age={max_age}'
+    for key, value in headers.items():
+        response[key] = value
+    return response
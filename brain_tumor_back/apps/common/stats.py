@@ -0,0 +1,99 @@
+"""
+대시보드 / 현황 API 공통 집계
+
+- count_buckets: 조건(Q)별 건수를 COUNT(*) FILTER 한 번의 aggregate 쿼리로 계산
+- count_buckets_by: 그룹(values().annotate()) + 조건별 건수를 한 번의 쿼리로 계산
+- cached_stats: 짧은 TTL 응답 캐시 - 같은 프로세스의 동시 polling은 한 번만 DB 조회
+"""
+import threading
+import zlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+DASHBOARD_STATS_CACHE_TTL = getattr(settings, 'DASHBOARD_STATS_CACHE_TTL', 5)
+_CACHE_PREFIX = 'dashboard_stats'
+
+# 키별 잠금 대신 고정 개수 striped lock - 키(검색어 포함)가 늘어나도 메모리 일정
+_LOCK_STRIPES = 64
+_locks = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
+
+
+# ============================================================
+# 집계
+# ============================================================
+
+def _count_expressions(buckets: dict) -> dict:
+    """{이름: Q | None} → {별칭: Count} (한글/공백 등 이름은 별칭으로 대체, 모델 필드명과 충돌 방지)"""
+    return {
+        f'n{i}': Count('pk', filter=q) if q is not None else Count('pk')
+        for i, q in enumerate(buckets.values())
+    }
+
+
+def count_buckets(queryset, buckets: dict) -> dict:
+    """
+    조건별 건수 (쿼리 1회)
+
+    Args:
+        buckets: {이름: Q(...)} - None이면 전체 건수
+
+    Returns:
+        {이름: 건수}
+    """
+    row = queryset.order_by().aggregate(**_count_expressions(buckets))
+    return {name: row[f'n{i}'] or 0 for i, name in enumerate(buckets)}
+
+
+def count_buckets_by(queryset, field: str, buckets: dict) -> dict:
+    """
+    field 값별 조건 건수 (GROUP BY 쿼리 1회)
+
+    Returns:
+        {field 값: {이름: 건수}} - 건수가 없는 그룹은 포함되지 않음
+    """
+    rows = queryset.order_by().values(field).annotate(**_count_expressions(buckets))
+    return {
+        row[field]: {name: row[f'n{i}'] for i, name in enumerate(buckets)}
+        for row in rows
+    }
+
+
+# ============================================================
+# 캐시
+# ============================================================
+
+def _lock_for(key: str) -> threading.Lock:
+    return _locks[zlib.crc32(key.encode()) % _LOCK_STRIPES]
+
+
+def cache_key(name: str, *parts) -> str:
+    return ':'.join([_CACHE_PREFIX, name, *map(str, parts)])
+
+
+def cached_stats(name: str, build, *parts, ttl: int = None):
+    """
+    build() 결과를 TTL 동안 캐시 - build()가 예외를 던지면 캐시하지 않음
+
+    같은 키의 동시 요청은 잠금으로 직렬화해 첫 요청 결과를 공유
+    """
+    ttl = DASHBOARD_STATS_CACHE_TTL if ttl is None else ttl
+    if ttl <= 0:
+        return build()
+
+    key = cache_key(name, *parts)
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    with _lock_for(key):
+        result = cache.get(key)
+        if result is None:
+            result = build()
+            cache.set(key, result, ttl)
+    return result
+
+
+def invalidate(name: str, *parts) -> None:
+    cache.delete(cache_key(name, *parts))
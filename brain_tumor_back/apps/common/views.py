@@ -6,7 +6,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from django.utils import timezone
-from django.db.models import Count, Q
+from django.db.models import Q
 from django.db import connection
 from datetime import timedelta
 from drf_spectacular.utils import extend_schema, OpenApiResponse
@@ -17,6 +17,7 @@ from apps.ocs.models import OCS
 from apps.encounters.models import Encounter
 from apps.audit.models import AuditLog
 from apps.common.permission import IsAdmin, IsExternalOrAdmin, IsDoctorOrAdmin
+from apps.common.stats import cached_stats, count_buckets, count_buckets_by, invalidate
 
 logger = logging.getLogger(__name__)
 
@@ -75,51 +76,7 @@ class AdminDashboardStatsView(APIView):
 
     def get(self, request):
         try:
-            now = timezone.now()
-            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            week_ago = now - timedelta(days=7)
-
-            # 사용자 통계
-            users = User.objects.filter(is_active=True)
-            user_by_role = dict(
-                users.values('role__code')
-                .annotate(count=Count('id'))
-                .values_list('role__code', 'count')
-            )
-
-            # 환자 통계
-            patients = Patient.objects.filter(is_deleted=False)
-
-            # OCS 통계
-            ocs_all = OCS.objects.filter(is_deleted=False)
-            ocs_by_status = dict(
-                ocs_all.values('ocs_status')
-                .annotate(count=Count('id'))
-                .values_list('ocs_status', 'count')
-            )
-
-            return Response({
-                'users': {
-                    'total': users.count(),
-                    'by_role': user_by_role,
-                    'recent_logins': users.filter(last_login__gte=week_ago).count(),
-                },
-                'patients': {
-                    'total': patients.count(),
-                    'new_this_month': patients.filter(created_at__gte=month_start).count(),
-                },
-                'ocs': {
-                    'total': ocs_all.count(),
-                    'by_status': ocs_by_status,
-                    'pending_count': ocs_all.filter(
-                        ocs_status__in=[
-                            OCS.OcsStatus.ORDERED,
-                            OCS.OcsStatus.ACCEPTED,
-                            OCS.OcsStatus.IN_PROGRESS
-                        ]
-                    ).count(),
-                },
-            })
+            return Response(cached_stats('admin_dashboard', self._build_stats))
         except Exception as e:
             logger.error(f"Admin dashboard stats error: {str(e)}")
             return Response(
@@ -127,6 +84,52 @@ class AdminDashboardStatsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _build_stats(self):
+        now = timezone.now()
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        week_ago = now - timedelta(days=7)
+
+        # 사용자 통계 (역할별 + 최근 로그인, 쿼리 1회)
+        users_by_role = count_buckets_by(
+            User.objects.filter(is_active=True), 'role__code', {
+                'total': None,
+                'recent_logins': Q(last_login__gte=week_ago),
+            }
+        )
+
+        # 환자 통계
+        patients = count_buckets(Patient.objects.filter(is_deleted=False), {
+            'total': None,
+            'new_this_month': Q(created_at__gte=month_start),
+        })
+
+        # OCS 통계 (상태별, 쿼리 1회 - 전체/대기 건수는 상태별 합계)
+        ocs_by_status = {
+            ocs_status: counts['total']
+            for ocs_status, counts in count_buckets_by(
+                OCS.objects.filter(is_deleted=False), 'ocs_status', {'total': None}
+            ).items()
+        }
+        pending_statuses = [
+            OCS.OcsStatus.ORDERED,
+            OCS.OcsStatus.ACCEPTED,
+            OCS.OcsStatus.IN_PROGRESS
+        ]
+
+        return {
+            'users': {
+                'total': sum(counts['total'] for counts in users_by_role.values()),
+                'by_role': {code: counts['total'] for code, counts in users_by_role.items()},
+                'recent_logins': sum(counts['recent_logins'] for counts in users_by_role.values()),
+            },
+            'patients': patients,
+            'ocs': {
+                'total': sum(ocs_by_status.values()),
+                'by_status': ocs_by_status,
+                'pending_count': sum(ocs_by_status.get(ocs_status, 0) for ocs_status in pending_statuses),
+            },
+        }
+
 
 @extend_schema(
     tags=["Dashboard"],
@@ -144,52 +147,7 @@ class ExternalDashboardStatsView(APIView):
 
     def get(self, request):
         try:
-            now = timezone.now()
-            week_ago = now - timedelta(days=7)
-
-            # 외부 LIS 업로드 (extr_ prefix)
-            lis_external = OCS.objects.filter(
-                ocs_id__startswith='extr_',
-                job_role='LIS',
-                is_deleted=False
-            )
-
-            # 외부 RIS 업로드 (risx_ prefix)
-            ris_external = OCS.objects.filter(
-                ocs_id__startswith='risx_',
-                job_role='RIS',
-                is_deleted=False
-            )
-
-            # 최근 업로드
-            recent = OCS.objects.filter(
-                Q(ocs_id__startswith='extr_') | Q(ocs_id__startswith='risx_'),
-                is_deleted=False
-            ).select_related('patient').order_by('-created_at')[:10]
-
-            return Response({
-                'lis_uploads': {
-                    'pending': lis_external.filter(ocs_status=OCS.OcsStatus.RESULT_READY).count(),
-                    'completed': lis_external.filter(ocs_status=OCS.OcsStatus.CONFIRMED).count(),
-                    'total_this_week': lis_external.filter(created_at__gte=week_ago).count(),
-                },
-                'ris_uploads': {
-                    'pending': ris_external.filter(ocs_status=OCS.OcsStatus.RESULT_READY).count(),
-                    'completed': ris_external.filter(ocs_status=OCS.OcsStatus.CONFIRMED).count(),
-                    'total_this_week': ris_external.filter(created_at__gte=week_ago).count(),
-                },
-                'recent_uploads': [
-                    {
-                        'id': o.id,
-                        'ocs_id': o.ocs_id,
-                        'job_role': o.job_role,
-                        'status': o.ocs_status,
-                        'uploaded_at': o.created_at.isoformat(),
-                        'patient_name': o.patient.name if o.patient else '-',
-                    }
-                    for o in recent
-                ],
-            })
+            return Response(cached_stats('external_dashboard', self._build_stats))
         except Exception as e:
             logger.error(f"External dashboard stats error: {str(e)}")
             return Response(
@@ -197,6 +155,56 @@ class ExternalDashboardStatsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _build_stats(self):
+        now = timezone.now()
+        week_ago = now - timedelta(days=7)
+
+        # 외부 LIS 업로드 (extr_ prefix), 외부 RIS 업로드 (risx_ prefix)
+        lis_external = Q(ocs_id__startswith='extr_', job_role='LIS')
+        ris_external = Q(ocs_id__startswith='risx_', job_role='RIS')
+
+        # LIS/RIS 상태별 건수 (쿼리 1회)
+        counts = count_buckets(
+            OCS.objects.filter(lis_external | ris_external, is_deleted=False), {
+                'lis_pending': lis_external & Q(ocs_status=OCS.OcsStatus.RESULT_READY),
+                'lis_completed': lis_external & Q(ocs_status=OCS.OcsStatus.CONFIRMED),
+                'lis_total_this_week': lis_external & Q(created_at__gte=week_ago),
+                'ris_pending': ris_external & Q(ocs_status=OCS.OcsStatus.RESULT_READY),
+                'ris_completed': ris_external & Q(ocs_status=OCS.OcsStatus.CONFIRMED),
+                'ris_total_this_week': ris_external & Q(created_at__gte=week_ago),
+            }
+        )
+
+        # 최근 업로드
+        recent = OCS.objects.filter(
+            Q(ocs_id__startswith='extr_') | Q(ocs_id__startswith='risx_'),
+            is_deleted=False
+        ).select_related('patient').order_by('-created_at')[:10]
+
+        return {
+            'lis_uploads': {
+                'pending': counts['lis_pending'],
+                'completed': counts['lis_completed'],
+                'total_this_week': counts['lis_total_this_week'],
+            },
+            'ris_uploads': {
+                'pending': counts['ris_pending'],
+                'completed': counts['ris_completed'],
+                'total_this_week': counts['ris_total_this_week'],
+            },
+            'recent_uploads': [
+                {
+                    'id': o.id,
+                    'ocs_id': o.ocs_id,
+                    'job_role': o.job_role,
+                    'status': o.ocs_status,
+                    'uploaded_at': o.created_at.isoformat(),
+                    'patient_name': o.patient.name if o.patient else '-',
+                }
+                for o in recent
+            ],
+        }
+
 
 @extend_schema(
     tags=["Dashboard"],
@@ -214,49 +222,9 @@ class DoctorDashboardStatsView(APIView):
 
     def get(self, request):
         try:
-            now = timezone.now()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            today_end = today_start + timedelta(days=1)
-
-            # 전체 금일 통계 (상태별) - cancelled 제외
-            all_today = Encounter.objects.filter(
-                attending_doctor=request.user,
-                admission_date__gte=today_start,
-                admission_date__lt=today_end,
-                is_deleted=False
-            ).exclude(status='cancelled')
-
-            waiting = all_today.filter(status='scheduled').count()
-            in_progress = all_today.filter(status='in_progress').count()
-            completed = all_today.filter(status='completed').count()
-
-            # 금일 예약환자 5명 (시간순, 취소 제외)
-            today_appointments = all_today.select_related('patient').order_by('admission_date')[:5]
-
-            return Response({
-                'today_appointments': [
-                    {
-                        'encounter_id': enc.id,
-                        'patient_id': enc.patient.id,
-                        'patient_name': enc.patient.name,
-                        'patient_number': enc.patient.patient_number,
-                        'appointment_time': enc.admission_date.isoformat(),
-                        'scheduled_time': enc.scheduled_time.strftime('%H:%M:%S') if enc.scheduled_time else None,
-                        'encounter_type': enc.encounter_type,
-                        'status': enc.status,
-                        'reason': enc.chief_complaint or '',
-                        'department': enc.department,
-                    }
-                    for enc in today_appointments
-                ],
-                'stats': {
-                    'total_today': all_today.count(),
-                    'waiting': waiting,
-                    'in_progress': in_progress,
-                    'completed': completed,
-                },
-            })
-
+            return Response(cached_stats(
+                'doctor_dashboard', lambda: self._build_stats(request.user), request.user.pk
+            ))
         except Exception as e:
             logger.error(f"Doctor dashboard stats error: {str(e)}")
             return Response(
@@ -264,6 +232,48 @@ class DoctorDashboardStatsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _build_stats(self, doctor):
+        now = timezone.now()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today_end = today_start + timedelta(days=1)
+
+        # 전체 금일 통계 (상태별) - cancelled 제외
+        all_today = Encounter.objects.filter(
+            attending_doctor=doctor,
+            admission_date__gte=today_start,
+            admission_date__lt=today_end,
+            is_deleted=False
+        ).exclude(status='cancelled')
+
+        stats = count_buckets(all_today, {
+            'total_today': None,
+            'waiting': Q(status='scheduled'),
+            'in_progress': Q(status='in_progress'),
+            'completed': Q(status='completed'),
+        })
+
+        # 금일 예약환자 5명 (시간순, 취소 제외)
+        today_appointments = all_today.select_related('patient').order_by('admission_date')[:5]
+
+        return {
+            'today_appointments': [
+                {
+                    'encounter_id': enc.id,
+                    'patient_id': enc.patient.id,
+                    'patient_name': enc.patient.name,
+                    'patient_number': enc.patient.patient_number,
+                    'appointment_time': enc.admission_date.isoformat(),
+                    'scheduled_time': enc.scheduled_time.strftime('%H:%M:%S') if enc.scheduled_time else None,
+                    'encounter_type': enc.encounter_type,
+                    'status': enc.status,
+                    'reason': enc.chief_complaint or '',
+                    'department': enc.department,
+                }
+                for enc in today_appointments
+            ],
+            'stats': stats,
+        }
+
 
 @extend_schema(
     tags=["System Monitor"],
@@ -281,118 +291,8 @@ class SystemMonitorView(APIView):
 
     def get(self, request):
         try:
-            now = timezone.now()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-            # 1. 서버 상태 (Health Check)
-            server_status = "healthy"
-            database_status = "connected"
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute("SELECT 1")
-            except Exception:
-                server_status = "unhealthy"
-                database_status = "disconnected"
-
-            # 2. 시스템 리소스 (CPU, Memory, Disk)
-            import os
-            try:
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-            except Exception:
-                cpu_percent = 0.0
-
-            try:
-                memory = psutil.virtual_memory()
-                memory_percent = memory.percent
-                memory_used_gb = memory.used / (1024**3)
-                memory_total_gb = memory.total / (1024**3)
-            except Exception:
-                memory_percent = 0.0
-                memory_used_gb = 0.0
-                memory_total_gb = 0.0
-
-            try:
-                # Windows/Linux 호환 디스크 경로
-                if os.name == 'nt':  # Windows
-                    disk = psutil.disk_usage('C:\\')
-                else:  # Linux/Mac
-                    disk = psutil.disk_usage('/')
-                disk_percent = disk.percent
-            except Exception:
-                disk_percent = 0.0
-
-            # 3. 활성 세션 수 (최근 30분 이내 last_seen이 있는 사용자)
-            session_threshold = now - timedelta(minutes=30)
-            active_sessions = User.objects.filter(
-                is_active=True,
-                last_seen__gte=session_threshold
-            ).count()
-
-            # 4. 금일 로그인 통계 (AuditLog 기반)
-            today_login_success = AuditLog.objects.filter(
-                action='LOGIN_SUCCESS',
-                created_at__gte=today_start
-            ).count()
-
-            today_login_fail = AuditLog.objects.filter(
-                action='LOGIN_FAIL',
-                created_at__gte=today_start
-            ).count()
-
-            # 5. 오류 발생 건수 (금일 로그인 실패 + 잠금)
-            today_login_locked = AuditLog.objects.filter(
-                action='LOGIN_LOCKED',
-                created_at__gte=today_start
-            ).count()
-
-            error_count = today_login_fail + today_login_locked
-
-            # 6. 서버 상태 판단 (warning/error 조건)
-            if server_status == "unhealthy":
-                status_level = "error"
-            elif cpu_percent > 90 or memory_percent > 90 or error_count > 10:
-                status_level = "warning"
-            else:
-                status_level = "ok"
-
-            # 7. 확인된 경고 목록 조회
-            from .models import MonitorAlertAcknowledge
-            today_date = now.date()
-            acknowledged_alerts = list(
-                MonitorAlertAcknowledge.objects.filter(target_date=today_date)
-                .values_list('alert_type', flat=True)
-            )
-
-            return Response({
-                'server': {
-                    'status': status_level,
-                    'database': database_status,
-                },
-                'resources': {
-                    'cpu_percent': round(cpu_percent, 1),
-                    'memory_percent': round(memory_percent, 1),
-                    'memory_used_gb': round(memory_used_gb, 2),
-                    'memory_total_gb': round(memory_total_gb, 2),
-                    'disk_percent': round(disk_percent, 1),
-                },
-                'sessions': {
-                    'active_count': active_sessions,
-                },
-                'logins': {
-                    'today_total': today_login_success + today_login_fail,
-                    'today_success': today_login_success,
-                    'today_fail': today_login_fail,
-                    'today_locked': today_login_locked,
-                },
-                'errors': {
-                    'count': error_count,
-                    'login_fail': today_login_fail,
-                    'login_locked': today_login_locked,
-                },
-                'acknowledged_alerts': acknowledged_alerts,
-                'timestamp': now.isoformat(),
-            })
-
+            # CPU 측정(0.1초) / DB 조회를 짧은 TTL 동안 공유
+            return Response(cached_stats('system_monitor', self._build_stats))
         except Exception as e:
             logger.error(f"System monitor error: {str(e)}")
             return Response(
@@ -400,6 +300,118 @@ class SystemMonitorView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _build_stats(self):
+        now = timezone.now()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # 1. 서버 상태 (Health Check)
+        server_status = "healthy"
+        database_status = "connected"
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception:
+            server_status = "unhealthy"
+            database_status = "disconnected"
+
+        # 2. 시스템 리소스 (CPU, Memory, Disk)
+        import os
+        try:
+            cpu_percent = psutil.cpu_percent(interval=0.1)
+        except Exception:
+            cpu_percent = 0.0
+
+        try:
+            memory = psutil.virtual_memory()
+            memory_percent = memory.percent
+            memory_used_gb = memory.used / (1024**3)
+            memory_total_gb = memory.total / (1024**3)
+        except Exception:
+            memory_percent = 0.0
+            memory_used_gb = 0.0
+            memory_total_gb = 0.0
+
+        try:
+            # Windows/Linux 호환 디스크 경로
+            if os.name == 'nt':  # Windows
+                disk = psutil.disk_usage('C:\\')
+            else:  # Linux/Mac
+                disk = psutil.disk_usage('/')
+            disk_percent = disk.percent
+        except Exception:
+            disk_percent = 0.0
+
+        # 3. 활성 세션 수 (최근 30분 이내 last_seen이 있는 사용자)
+        session_threshold = now - timedelta(minutes=30)
+        active_sessions = User.objects.filter(
+            is_active=True,
+            last_seen__gte=session_threshold
+        ).count()
+
+        # 4. 금일 로그인 통계 (AuditLog 기반, 쿼리 1회)
+        # 5. 오류 발생 건수 (금일 로그인 실패 + 잠금)
+        logins = count_buckets(
+            AuditLog.objects.filter(
+                action__in=['LOGIN_SUCCESS', 'LOGIN_FAIL', 'LOGIN_LOCKED'],
+                created_at__gte=today_start
+            ), {
+                'success': Q(action='LOGIN_SUCCESS'),
+                'fail': Q(action='LOGIN_FAIL'),
+                'locked': Q(action='LOGIN_LOCKED'),
+            }
+        )
+        today_login_success = logins['success']
+        today_login_fail = logins['fail']
+        today_login_locked = logins['locked']
+
+        error_count = today_login_fail + today_login_locked
+
+        # 6. 서버 상태 판단 (warning/error 조건)
+        if server_status == "unhealthy":
+            status_level = "error"
+        elif cpu_percent > 90 or memory_percent > 90 or error_count > 10:
+            status_level = "warning"
+        else:
+            status_level = "ok"
+
+        # 7. 확인된 경고 목록 조회
+        from .models import MonitorAlertAcknowledge
+        today_date = now.date()
+        acknowledged_alerts = list(
+            MonitorAlertAcknowledge.objects.filter(target_date=today_date)
+            .values_list('alert_type', flat=True)
+        )
+
+        return {
+            'server': {
+                'status': status_level,
+                'database': database_status,
+            },
+            'resources': {
+                'cpu_percent': round(cpu_percent, 1),
+                'memory_percent': round(memory_percent, 1),
+                'memory_used_gb': round(memory_used_gb, 2),
+                'memory_total_gb': round(memory_total_gb, 2),
+                'disk_percent': round(disk_percent, 1),
+            },
+            'sessions': {
+                'active_count': active_sessions,
+            },
+            'logins': {
+                'today_total': today_login_success + today_login_fail,
+                'today_success': today_login_success,
+                'today_fail': today_login_fail,
+                'today_locked': today_login_locked,
+            },
+            'errors': {
+                'count': error_count,
+                'login_fail': today_login_fail,
+                'login_locked': today_login_locked,
+            },
+            'acknowledged_alerts': acknowledged_alerts,
+            'timestamp': now.isoformat(),
+        }
+
 
 # 모니터링 알림 설정 기본값 (배열 형태)
 DEFAULT_MONITOR_ALERTS = {
@@ -579,6 +591,8 @@ class MonitorAlertAcknowledgeView(APIView):
                 'note': note,
             }
         )
+        # 모니터링 응답의 acknowledged_alerts 즉시 반영
+        invalidate('system_monitor')
 
         return Response({
             'detail': '경고가 확인 처리되었습니다.',
@@ -605,6 +619,7 @@ class MonitorAlertAcknowledgeView(APIView):
             alert_type=alert_type,
             target_date=today
         ).delete()
+        invalidate('system_monitor')
 
         if deleted:
             return Response({'detail': '확인이 취소되었습니다.'})
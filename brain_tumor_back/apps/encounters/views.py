@@ -7,6 +7,7 @@ from rest_framework.pagination import PageNumberPagination
 from django.db.models import Q
 from django.db import transaction
 from django.utils import timezone
+from apps.common.stats import cached_stats, count_buckets
 from .models import Encounter
 
 logger = logging.getLogger(__name__)
@@ -109,40 +110,37 @@ class EncounterViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """진료 통계 조회"""
-        queryset = self.get_queryset()
-
-        stats = {
-            'total': queryset.count(),
-            'by_type': {},
-            'by_status': {},
-            'by_department': {},
-        }
-
-        # 진료 유형별 통계
-        for enc_type, label in Encounter.ENCOUNTER_TYPE_CHOICES:
-            count = queryset.filter(encounter_type=enc_type).count()
-            stats['by_type'][enc_type] = {
-                'label': label,
-                'count': count
-            }
-
-        # 상태별 통계
-        for enc_status, label in Encounter.STATUS_CHOICES:
-            count = queryset.filter(status=enc_status).count()
-            stats['by_status'][enc_status] = {
-                'label': label,
-                'count': count
+        # 같은 검색 조건의 polling은 짧은 TTL 동안 캐시 공유
+        return Response(cached_stats(
+            'encounter_statistics', self._build_statistics,
+            self.request.query_params.urlencode()
+        ))
+
+    # 통계 항목: (응답 키, 필드, choices)
+    STATISTICS_GROUPS = (
+        ('by_type', 'encounter_type', Encounter.ENCOUNTER_TYPE_CHOICES),
+        ('by_status', 'status', Encounter.STATUS_CHOICES),
+        ('by_department', 'department', Encounter.DEPARTMENT_CHOICES),
+    )
+
+    def _build_statistics(self):
+        """진료 유형별 / 상태별 / 진료과별 건수를 쿼리 한 번으로 계산"""
+        buckets = {'total': None}
+        for group, field, choices in self.STATISTICS_GROUPS:
+            for value, label in choices:
+                buckets[(group, value)] = Q(**{field: value})
+        counts = count_buckets(self.get_queryset(), buckets)
+
+        stats = {'total': counts['total']}
+        for group, field, choices in self.STATISTICS_GROUPS:
+            stats[group] = {
+                value: {
+                    'label': label,
+                    'count': counts[(group, value)]
+                }
+                for value, label in choices
             }
-
-        # 진료과별 통계
-        for dept, label in Encounter.DEPARTMENT_CHOICES:
-            count = queryset.filter(department=dept).count()
-            stats['by_department'][dept] = {
-                'label': label,
-                'count': count
-            }
-
-        return Response(stats)
+        return stats
 
     @action(detail=True, methods=['post'])
     def complete(self, request, pk=None):
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from django.db.models import OuterRef, Q, Subquery
 from django.utils import timezone
 from .models import OCS, OCSHistory
 from apps.patients.models import Patient
@@ -88,39 +89,26 @@ class OCSListSerializer(serializers.ModelSerializer):
 
     def get_ai_inference_info(self, obj):
         """OCS 타입별 AI 추론 완료 정보 반환"""
-        # MRI OCS → M1 추론 상태
-        if obj.job_type == 'MRI':
-            inference = AIInference.objects.filter(
-                mri_ocs=obj,
-                model_type=AIInference.ModelType.M1,
-                status=AIInference.Status.COMPLETED
-            ).order_by('-completed_at').first()
-
-            if inference:
+        # MRI OCS → M1 추론 상태, RNA_SEQ OCS → MG 추론 상태
+        model_type = INFERENCE_MODEL_BY_JOB_TYPE.get(obj.job_type)
+        if model_type:
+            if hasattr(obj, 'latest_inference_job_id'):
+                # with_latest_inference()로 annotate된 queryset (목록 조회)
+                job_id = obj.latest_inference_job_id
+                completed_at = obj.latest_inference_completed_at
+            else:
+                inference = _completed_inferences(mri_ocs=obj, rna_ocs=obj).first()
+                job_id = inference.job_id if inference else None
+                completed_at = inference.completed_at if inference else None
+
+            if job_id:
                 return {
-                    'model_type': 'M1',
+                    'model_type': model_type,
                     'status': 'completed',
-                    'job_id': inference.job_id,
-                    'completed_at': inference.completed_at.isoformat() if inference.completed_at else None
+                    'job_id': job_id,
+                    'completed_at': completed_at.isoformat() if completed_at else None
                 }
-            return {'model_type': 'M1', 'status': 'not_run'}
-
-        # RNA_SEQ OCS → MG 추론 상태
-        if obj.job_type == 'RNA_SEQ':
-            inference = AIInference.objects.filter(
-                rna_ocs=obj,
-                model_type=AIInference.ModelType.MG,
-                status=AIInference.Status.COMPLETED
-            ).order_by('-completed_at').first()
-
-            if inference:
-                return {
-                    'model_type': 'MG',
-                    'status': 'completed',
-                    'job_id': inference.job_id,
-                    'completed_at': inference.completed_at.isoformat() if inference.completed_at else None
-                }
-            return {'model_type': 'MG', 'status': 'not_run'}
+            return {'model_type': model_type, 'status': 'not_run'}
 
         # BIOMARKER OCS → 추론 불필요 (LIS에서 직접 제공)
         if obj.job_type == 'BIOMARKER':
@@ -129,6 +117,35 @@ class OCSListSerializer(serializers.ModelSerializer):
         return None
 
 
+# OCS job_type → 완료 여부를 표시할 AI 모델
+INFERENCE_MODEL_BY_JOB_TYPE = {
+    'MRI': AIInference.ModelType.M1,
+    'RNA_SEQ': AIInference.ModelType.MG,
+}
+
+
+def _completed_inferences(mri_ocs, rna_ocs):
+    """OCS의 완료된 M1(mri_ocs) / MG(rna_ocs) 추론 - 최근 완료 순"""
+    return AIInference.objects.filter(
+        Q(model_type=AIInference.ModelType.M1, mri_ocs=mri_ocs) |
+        Q(model_type=AIInference.ModelType.MG, rna_ocs=rna_ocs),
+        status=AIInference.Status.COMPLETED,
+    ).order_by('-completed_at')
+
+
+def with_latest_inference(queryset):
+    """
+    OCSListSerializer용 - 최근 완료된 M1/MG 추론을 annotate (행마다 추가 쿼리 없음)
+
+    latest_inference_job_id, latest_inference_completed_at
+    """
+    latest = _completed_inferences(mri_ocs=OuterRef('pk'), rna_ocs=OuterRef('pk'))
+    return queryset.annotate(
+        latest_inference_job_id=Subquery(latest.values('job_id')[:1]),
+        latest_inference_completed_at=Subquery(latest.values('completed_at')[:1]),
+    )
+
+
 class OCSDetailSerializer(serializers.ModelSerializer):
     """OCS 상세 조회용 Serializer"""
     patient = PatientMinimalSerializer(read_only=True)
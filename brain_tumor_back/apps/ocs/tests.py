@@ -1,9 +1,14 @@
+from datetime import timedelta
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from apps.accounts.models import User, Role
 from apps.patients.models import Patient
+from apps.ai_inference.models import AIInference
 from .models import OCS, OCSHistory
 
 
@@ -340,3 +345,61 @@ class OCSAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         for ocs in response.data['results']:
             self.assertEqual(ocs['ocs_status'], 'ORDERED')
+
+    def _create_ocs_with_inference(self, job_type, model_type, ocs_field):
+        """완료된 AI 추론 2건(이전/최근)이 연결된 OCS 생성 - 최근 추론 반환"""
+        ocs = OCS.objects.create(
+            patient=self.patient,
+            doctor=self.doctor,
+            job_role='RIS' if job_type == 'MRI' else 'LIS',
+            job_type=job_type
+        )
+        now = timezone.now()
+        for completed_at in (now - timedelta(hours=1), now):
+            inference = AIInference.objects.create(
+                model_type=model_type,
+                patient=self.patient,
+                status=AIInference.Status.COMPLETED,
+                completed_at=completed_at,
+                **{ocs_field: ocs}
+            )
+        return inference
+
+    def _get_list(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/ocs/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_ocs_list_ai_inference_info(self):
+        """목록의 ai_inference_info는 최근 완료 추론"""
+        self.client.force_authenticate(user=self.doctor)
+        m1 = self._create_ocs_with_inference('MRI', AIInference.ModelType.M1, 'mri_ocs')
+        mg = self._create_ocs_with_inference('RNA_SEQ', AIInference.ModelType.MG, 'rna_ocs')
+        not_run = OCS.objects.create(
+            patient=self.patient, doctor=self.doctor, job_role='RIS', job_type='MRI'
+        )
+
+        response, _ = self._get_list()
+        info = {ocs['id']: ocs['ai_inference_info'] for ocs in response.data['results']}
+
+        self.assertEqual(info[m1.mri_ocs_id]['model_type'], 'M1')
+        self.assertEqual(info[m1.mri_ocs_id]['job_id'], m1.job_id)
+        self.assertEqual(info[m1.mri_ocs_id]['completed_at'], m1.completed_at.isoformat())
+        self.assertEqual(info[mg.rna_ocs_id]['model_type'], 'MG')
+        self.assertEqual(info[mg.rna_ocs_id]['job_id'], mg.job_id)
+        self.assertEqual(info[not_run.id], {'model_type': 'M1', 'status': 'not_run'})
+
+    def test_ocs_list_query_count(self):
+        """목록 조회 쿼리 수는 행 수와 무관 (ai_inference_info N+1 방지)"""
+        self.client.force_authenticate(user=self.doctor)
+        self._create_ocs_with_inference('MRI', AIInference.ModelType.M1, 'mri_ocs')
+        _, single_count = self._get_list()
+
+        for _ in range(5):
+            self._create_ocs_with_inference('MRI', AIInference.ModelType.M1, 'mri_ocs')
+            self._create_ocs_with_inference('RNA_SEQ', AIInference.ModelType.MG, 'rna_ocs')
+        response, many_count = self._get_list()
+
+        self.assertEqual(response.data['count'], 11)
+        self.assertEqual(many_count, single_count)
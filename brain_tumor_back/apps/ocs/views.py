@@ -27,6 +27,7 @@ from .serializers import (
     OCSConfirmSerializer,
     OCSCancelSerializer,
     OCSHistorySerializer,
+    with_latest_inference,
 )
 from .notifications import notify_ocs_status_changed, notify_ocs_created, notify_ocs_cancelled
 
@@ -72,6 +73,8 @@ class OCSViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [IsAuthenticated, OCSPermission]
     pagination_class = OCSPagination
+    # OCSListSerializer를 사용하는 목록 액션
+    LIST_ACTIONS = ('list', 'pending', 'by_patient', 'by_doctor', 'by_worker')
 
     def get_queryset(self):
         """필터링된 OCS 목록 반환"""
@@ -80,10 +83,12 @@ class OCSViewSet(viewsets.ModelViewSet):
         )
 
         # 목록 조회 시 최적화: 큰 JSON 필드 제외, history prefetch 안함
-        if self.action == 'list':
+        if self.action in self.LIST_ACTIONS:
             # worker_result는 AI 추론 페이지에서 DICOM study_uid 접근에 필요하므로 유지
             # attachments, doctor_request만 defer로 지연 로딩
             queryset = queryset.defer('attachments', 'doctor_request')
+            # 최근 완료 AI 추론(ai_inference_info)을 subquery로 함께 조회
+            queryset = with_latest_inference(queryset)
         elif self.action == 'retrieve':
             # 상세 조회 시에만 history prefetch
             queryset = queryset.prefetch_related('history')
@@ -1159,6 +1164,8 @@ from django.db.models import Count, Q
 from datetime import timedelta
 import logging
 
+from apps.common.stats import cached_stats, count_buckets_by
+
 logger = logging.getLogger(__name__)
 
 
@@ -1298,37 +1305,7 @@ class OCSProcessStatusView(APIView):
     )
     def get(self, request):
         try:
-            now = timezone.now()
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-            # 공통 필터: 삭제되지 않은 OCS
-            base_qs = OCS.objects.filter(is_deleted=False)
-
-            # RIS 통계
-            ris_qs = base_qs.filter(job_role='RIS')
-            ris_stats = self._get_job_stats(ris_qs, today_start)
-
-            # LIS 통계
-            lis_qs = base_qs.filter(job_role='LIS')
-            lis_stats = self._get_job_stats(lis_qs, today_start)
-
-            # 통합 통계
-            combined = {
-                'total_ordered': ris_stats['ordered'] + lis_stats['ordered'],
-                'total_accepted': ris_stats['accepted'] + lis_stats['accepted'],
-                'total_in_progress': ris_stats['in_progress'] + lis_stats['in_progress'],
-                'total_result_ready': ris_stats['result_ready'] + lis_stats['result_ready'],
-                'total_confirmed': ris_stats['confirmed'] + lis_stats['confirmed'],
-                'total_cancelled': ris_stats['cancelled'] + lis_stats['cancelled'],
-                'total_today': ris_stats['total_today'] + lis_stats['total_today'],
-            }
-
-            return Response({
-                'ris': ris_stats,
-                'lis': lis_stats,
-                'combined': combined,
-            })
-
+            return Response(cached_stats('ocs_process_status', self._build_stats))
         except Exception as e:
             logger.error(f"OCS process status error: {str(e)}")
             return Response(
@@ -1336,25 +1313,54 @@ class OCSProcessStatusView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _get_job_stats(self, queryset, today_start):
-        """job_role별 통계 계산 - 모든 상태별 카운트"""
-        # 개별 상태별 카운트
-        ordered = queryset.filter(ocs_status=OCS.OcsStatus.ORDERED).count()
-        accepted = queryset.filter(ocs_status=OCS.OcsStatus.ACCEPTED).count()
-        in_progress = queryset.filter(ocs_status=OCS.OcsStatus.IN_PROGRESS).count()
-        result_ready = queryset.filter(ocs_status=OCS.OcsStatus.RESULT_READY).count()
-        confirmed = queryset.filter(ocs_status=OCS.OcsStatus.CONFIRMED).count()
-        cancelled = queryset.filter(ocs_status=OCS.OcsStatus.CANCELLED).count()
+    def _build_stats(self):
+        now = timezone.now()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # 오늘 생성된 OCS 수
-        total_today = queryset.filter(created_at__gte=today_start).count()
+        # 공통 필터: 삭제되지 않은 OCS - RIS/LIS 상태별 카운트를 쿼리 한 번으로
+        by_role = count_buckets_by(
+            OCS.objects.filter(is_deleted=False, job_role__in=['RIS', 'LIS']),
+            'job_role',
+            self._job_stat_buckets(today_start),
+        )
+        ris_stats = self._get_job_stats(by_role.get('RIS'))
+        lis_stats = self._get_job_stats(by_role.get('LIS'))
+
+        # 통합 통계
+        combined = {
+            'total_ordered': ris_stats['ordered'] + lis_stats['ordered'],
+            'total_accepted': ris_stats['accepted'] + lis_stats['accepted'],
+            'total_in_progress': ris_stats['in_progress'] + lis_stats['in_progress'],
+            'total_result_ready': ris_stats['result_ready'] + lis_stats['result_ready'],
+            'total_confirmed': ris_stats['confirmed'] + lis_stats['confirmed'],
+            'total_cancelled': ris_stats['cancelled'] + lis_stats['cancelled'],
+            'total_today': ris_stats['total_today'] + lis_stats['total_today'],
+        }
+
+        return {
+            'ris': ris_stats,
+            'lis': lis_stats,
+            'combined': combined,
+        }
+
+    @staticmethod
+    def _job_stat_buckets(today_start):
+        """job_role별 통계 조건 - 모든 상태별 카운트 + 오늘 생성된 OCS 수"""
+        return {
+            'ordered': Q(ocs_status=OCS.OcsStatus.ORDERED),
+            'accepted': Q(ocs_status=OCS.OcsStatus.ACCEPTED),
+            'in_progress': Q(ocs_status=OCS.OcsStatus.IN_PROGRESS),
+            'result_ready': Q(ocs_status=OCS.OcsStatus.RESULT_READY),
+            'confirmed': Q(ocs_status=OCS.OcsStatus.CONFIRMED),
+            'cancelled': Q(ocs_status=OCS.OcsStatus.CANCELLED),
+            'total_today': Q(created_at__gte=today_start),
+        }
 
+    def _get_job_stats(self, counts):
+        """job_role별 통계 (해당 job_role OCS가 없으면 모두 0)"""
+        counts = counts or {}
         return {
-            'ordered': ordered,
-            'accepted': accepted,
-            'in_progress': in_progress,
-            'result_ready': result_ready,
-            'confirmed': confirmed,
-            'cancelled': cancelled,
-            'total_today': total_today,
+            name: counts.get(name, 0)
+            for name in ('ordered', 'accepted', 'in_progress', 'result_ready',
+                         'confirmed', 'cancelled', 'total_today')
         }
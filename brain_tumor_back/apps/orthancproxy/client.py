@@ -0,0 +1,208 @@
+"""
+Orthanc REST 클라이언트
+
+- keep-alive 커넥션 풀을 공유하는 Orthanc 호출 헬퍼 (orthancproxy views, ai_inference 공용)
+- fetch_many: 인스턴스 단위 조회를 ORTHANC_PROXY_MAX_WORKERS개까지 동시 실행
+- SeriesSliceIndex: 시리즈 인스턴스를 슬라이스 위치 순으로 정렬해 저장 / 재사용
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+from .models import SeriesSliceIndex
+
+logger = logging.getLogger(__name__)
+
+ORTHANC = settings.ORTHANC_BASE_URL.rstrip("/")
+ORTHANC_PROXY_MAX_WORKERS = getattr(settings, "ORTHANC_PROXY_MAX_WORKERS", 8)
+
+
+# -------------------------------------------------------------
+# HTTP (keep-alive 커넥션 풀 공유)
+# -------------------------------------------------------------
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=max(ORTHANC_PROXY_MAX_WORKERS, 10),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+
+def get_json(path: str, params=None):
+    url = f"{ORTHANC}{path}"
+    r = _session.get(url, params=params, timeout=10)
+    r.raise_for_status()
+    return r.json()
+
+
+def get_raw(path: str, timeout: int = 10) -> requests.Response:
+    r = _session.get(f"{ORTHANC}{path}", timeout=timeout)
+    r.raise_for_status()
+    return r
+
+
+def post_json(path: str, payload, timeout: int = 30):
+    r = _session.post(f"{ORTHANC}{path}", json=payload, timeout=timeout)
+    r.raise_for_status()
+    return r.json()
+
+
+def delete(path: str):
+    url = f"{ORTHANC}{path}"
+    r = _session.delete(url, timeout=10)
+    r.raise_for_status()
+    return r.json() if r.text else {}
+
+
+def fetch_many(fn, items):
+    """
+    items 각각에 fn을 동시 실행 (최대 ORTHANC_PROXY_MAX_WORKERS개)
+
+    Returns:
+        [(item, result_or_None, error_or_None), ...] - 입력 순서 유지
+    """
+    def _safe(item):
+        try:
+            return item, fn(item), None
+        except Exception as e:
+            return item, None, e
+
+    items = list(items)
+    if len(items) <= 1:
+        return [_safe(item) for item in items]
+
+    workers = min(ORTHANC_PROXY_MAX_WORKERS, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_safe, items))
+
+
+def post_instance(dicom_bytes: bytes):
+    url = f"{ORTHANC}/instances"
+    r = _session.post(
+        url,
+        data=dicom_bytes,
+        headers={"Content-Type": "application/dicom"},
+        timeout=30,
+    )
+    r.raise_for_status()
+    try:
+        return r.json()
+    except Exception:
+        return {}
+
+
+# -------------------------------------------------------------
+# DICOM 태그
+# -------------------------------------------------------------
+def normalize_tag_value(v):
+    if v is None:
+        return ""
+    if isinstance(v, list):
+        return normalize_tag_value(v[0]) if v else ""
+    if isinstance(v, dict):
+        if "Value" in v:
+            return normalize_tag_value(v["Value"])
+        if "value" in v:
+            return normalize_tag_value(v["value"])
+        return ""
+    return str(v)
+
+
+# list_instances 응답에 필요한 태그 (/tools/find RequestedTags)
+INSTANCE_TAGS = [
+    "InstanceNumber", "SOPInstanceUID",
+    "Rows", "Columns", "PixelSpacing", "SliceThickness", "SliceLocation",
+    "ImagePositionPatient",
+    "PatientID", "PatientName", "StudyInstanceUID", "SeriesInstanceUID", "SeriesNumber",
+]
+
+
+def find_instance_tags(series_uid: str):
+    """
+    /tools/find 한 번으로 시리즈 전체 인스턴스 태그 조회
+
+    Returns:
+        {instance_id: tags} - RequestedTags 미지원(Orthanc < 1.11)이면 None
+    """
+    answers = post_json("/tools/find", {
+        "Level": "Instance",
+        "Query": {"SeriesInstanceUID": series_uid},
+        "Expand": True,
+        "RequestedTags": INSTANCE_TAGS,
+    })
+
+    tags_by_id = {}
+    for answer in answers:
+        requested = answer.get("RequestedTags")
+        if requested is None:
+            return None
+        tags = dict(answer.get("MainDicomTags", {}) or {})
+        tags.update(requested)
+        tags_by_id[answer.get("ID")] = tags
+    return tags_by_id
+
+
+# -------------------------------------------------------------
+# 슬라이스 정렬 인덱스
+# -------------------------------------------------------------
+def slice_position(tags: dict) -> float:
+    """정렬 기준 위치 - SliceLocation이 가장 정확, 없으면 InstanceNumber, 둘 다 없으면 0"""
+    for name in ("SliceLocation", "InstanceNumber"):
+        value = normalize_tag_value(tags.get(name))
+        if value:
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                continue
+    return 0
+
+
+def build_slice_index(series_id: str, series_info: dict = None) -> SeriesSliceIndex:
+    """시리즈 인스턴스를 슬라이스 위치로 정렬해 인덱스 저장"""
+    if series_info is None:
+        series_info = get_json(f"/series/{series_id}")
+    instances = series_info.get("Instances", [])
+
+    series_uid = (series_info.get("MainDicomTags", {}) or {}).get("SeriesInstanceUID")
+    tags_by_id = None
+    if series_uid:
+        try:
+            tags_by_id = find_instance_tags(series_uid)
+        except Exception as e:
+            logger.warning("tools/find failed for series %s, falling back: %s", series_id, e)
+
+    if tags_by_id is None:
+        tags_by_id = {}
+        fetched = fetch_many(lambda inst_id: get_json(f"/instances/{inst_id}/simplified-tags"), instances)
+        for inst_id, tags, error in fetched:
+            if error is not None:
+                # 개별 인스턴스 조회 실패 시 기본 위치(0) 사용
+                logger.warning(f"Failed to get tags for instance {inst_id}: {error}")
+                continue
+            tags_by_id[inst_id] = tags
+
+    ordered = sorted(instances, key=lambda inst_id: slice_position(tags_by_id.get(inst_id, {})))
+
+    index, _ = SeriesSliceIndex.objects.update_or_create(
+        orthanc_series_id=series_id,
+        defaults={
+            "orthanc_study_id": series_info.get("ParentStudy") or "",
+            "instance_ids": ordered,
+            "instances_count": len(instances),
+            "orthanc_last_update": series_info.get("LastUpdate") or "",
+        },
+    )
+    return index
+
+
+def get_slice_index(series_id: str) -> SeriesSliceIndex:
+    """저장된 인덱스가 최신이면 재사용 (Orthanc 호출 1회), 아니면 재계산"""
+    series_info = get_json(f"/series/{series_id}")
+    index = SeriesSliceIndex.objects.filter(orthanc_series_id=series_id).first()
+    if index is not None and index.is_current(series_info):
+        return index
+    return build_slice_index(series_id, series_info)
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SeriesSliceIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "orthanc_series_id",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="Orthanc Series ID"
+                    ),
+                ),
+                (
+                    "orthanc_study_id",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        max_length=64,
+                        verbose_name="Orthanc Study ID",
+                    ),
+                ),
+                (
+                    "instance_ids",
+                    models.JSONField(default=list, verbose_name="정렬된 Instance ID 목록"),
+                ),
+                (
+                    "instances_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Instance 수"),
+                ),
+                (
+                    "orthanc_last_update",
+                    models.CharField(
+                        blank=True, max_length=32, verbose_name="Orthanc LastUpdate"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "Series 슬라이스 인덱스",
+                "verbose_name_plural": "Series 슬라이스 인덱스",
+                "db_table": "orthanc_series_slice_index",
+            },
+        ),
+    ]
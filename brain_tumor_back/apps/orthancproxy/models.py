@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class SeriesSliceIndex(models.Model):
+    """
+    Orthanc Series 슬라이스 정렬 인덱스
+    - 인스턴스 ID를 슬라이스 위치(SliceLocation → InstanceNumber) 순으로 저장
+    - 썸네일(중간 슬라이스) 선택 시 인스턴스별 태그 조회를 생략
+    - Orthanc의 LastUpdate / 인스턴스 수가 바뀌면 재계산
+    """
+    orthanc_series_id = models.CharField(max_length=64, unique=True, verbose_name='Orthanc Series ID')
+    orthanc_study_id = models.CharField(max_length=64, blank=True, db_index=True, verbose_name='Orthanc Study ID')
+    instance_ids = models.JSONField(default=list, verbose_name='정렬된 Instance ID 목록')
+    instances_count = models.PositiveIntegerField(default=0, verbose_name='Instance 수')
+    orthanc_last_update = models.CharField(max_length=32, blank=True, verbose_name='Orthanc LastUpdate')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+
+    class Meta:
+        db_table = 'orthanc_series_slice_index'
+        verbose_name = 'Series 슬라이스 인덱스'
+        verbose_name_plural = 'Series 슬라이스 인덱스'
+
+    def __str__(self):
+        return f"{self.orthanc_series_id} ({self.instances_count})"
+
+    @property
+    def middle_instance_id(self):
+        if not self.instance_ids:
+            return None
+        return self.instance_ids[len(self.instance_ids) // 2]
+
+    def is_current(self, series_info: dict) -> bool:
+        """Orthanc /series/{id} 응답과 비교해 인덱스가 최신인지 확인"""
+        return (
+            self.instances_count == len(series_info.get("Instances", []))
+            and self.orthanc_last_update == (series_info.get("LastUpdate") or "")
+        )
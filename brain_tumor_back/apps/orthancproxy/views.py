@@ -4,7 +4,10 @@ from django.shortcuts import render
 # (예) orthancproxy/views.py  또는 현재 올리신 views.py 파일에 그대로 복붙
 
 import io
+import os
 import logging
+import tempfile
+from pathlib import Path
 from typing import List
 import uuid
 from datetime import datetime
@@ -15,12 +18,16 @@ import pydicom
 from pydicom.uid import generate_uid
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 
+from . import client
+from .models import SeriesSliceIndex
+
 logger = logging.getLogger(__name__)
 
 if not logger.handlers:
@@ -53,50 +60,53 @@ def dlog(label: str, payload):
     logger.info("%s:\n%s", label, text)
 
 
-ORTHANC = settings.ORTHANC_BASE_URL.rstrip("/")
+ORTHANC_PROXY_CACHE_TTL = getattr(settings, "ORTHANC_PROXY_CACHE_TTL", 10)
+ORTHANC_THUMBNAIL_CACHE_DIR = Path(getattr(
+    settings, "ORTHANC_THUMBNAIL_CACHE_DIR",
+    Path(settings.CDSS_STORAGE_ROOT) / ".cache" / "orthanc_thumbnails",
+))
+ORTHANC_THUMBNAIL_MAX_AGE = getattr(settings, "ORTHANC_THUMBNAIL_MAX_AGE", 3600)
+ORTHANC_THUMBNAIL_CACHE_MAX_BYTES = getattr(settings, "ORTHANC_THUMBNAIL_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+# 썸네일 캐시 용량 검사 주기 (PNG 기록 N회마다 디렉토리 스캔)
+ORTHANC_THUMBNAIL_EVICT_EVERY = 50
+_thumbnail_writes = 0
 
 
-def _get(path: str):
-    url = f"{ORTHANC}{path}"
-    r = requests.get(url, timeout=10)
-    r.raise_for_status()
-    return r.json()
+# -------------------------------------------------------------
+# 목록 응답 캐시 (짧은 TTL, 업로드/삭제 시 전체 무효화)
+#   - 캐시 키에 세대(generation) 번호를 넣어 incr 한 번으로 무효화
+# -------------------------------------------------------------
+_CACHE_PREFIX = "orthancproxy"
+_CACHE_GENERATION_KEY = f"{_CACHE_PREFIX}:generation"
 
 
-def _delete(path: str):
-    url = f"{ORTHANC}{path}"
-    r = requests.delete(url, timeout=10)
-    r.raise_for_status()
-    return r.json() if r.text else {}
+def _cache_key(name: str, *parts) -> str:
+    generation = cache.get(_CACHE_GENERATION_KEY)
+    if generation is None:
+        cache.add(_CACHE_GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(_CACHE_GENERATION_KEY, 1)
+    return ":".join([_CACHE_PREFIX, str(generation), name, *map(str, parts)])
 
 
-def _post_instance(dicom_bytes: bytes):
-    url = f"{ORTHANC}/instances"
-    r = requests.post(
-        url,
-        data=dicom_bytes,
-        headers={"Content-Type": "application/dicom"},
-        timeout=30,
-    )
-    r.raise_for_status()
-    try:
-        return r.json()
-    except Exception:
-        return {}
+def _cached_listing(name: str, key_part: str, build):
+    """목록 결과를 TTL 동안 캐시 - build()가 예외를 던지면 캐시하지 않음"""
+    if ORTHANC_PROXY_CACHE_TTL <= 0:
+        return build()
 
+    key = _cache_key(name, key_part)
+    result = cache.get(key)
+    if result is None:
+        result = build()
+        cache.set(key, result, ORTHANC_PROXY_CACHE_TTL)
+    return result
 
-def _normalize_tag_value(v):
-    if v is None:
-        return ""
-    if isinstance(v, list):
-        return _normalize_tag_value(v[0]) if v else ""
-    if isinstance(v, dict):
-        if "Value" in v:
-            return _normalize_tag_value(v["Value"])
-        if "value" in v:
-            return _normalize_tag_value(v["value"])
-        return ""
-    return str(v)
+
+def _invalidate_listing_cache():
+    """업로드/삭제 후 목록 캐시 무효화"""
+    try:
+        cache.incr(_CACHE_GENERATION_KEY)
+    except ValueError:
+        cache.set(_CACHE_GENERATION_KEY, 1, timeout=None)
 
 
 def _parse_series_type(series_description: str) -> str:
@@ -163,45 +173,47 @@ def _parse_series_type(series_description: str) -> str:
 def _auto_cleanup_if_empty(patient_id=None, study_id=None):
     try:
         if study_id:
-            study = _get(f"/studies/{study_id}")
+            study = client.get_json(f"/studies/{study_id}")
             if not study.get("Series", []):
                 logger.info(f"Auto-clean: deleting empty study {study_id}")
-                _delete(f"/studies/{study_id}")
+                client.delete(f"/studies/{study_id}")
                 study_id = None
 
         if patient_id:
-            patient = _get(f"/patients/{patient_id}")
+            patient = client.get_json(f"/patients/{patient_id}")
             if not patient.get("Studies", []):
                 logger.info(f"Auto-clean: deleting empty patient {patient_id}")
-                _delete(f"/patients/{patient_id}")
+                client.delete(f"/patients/{patient_id}")
 
     except Exception as e:
         logger.warning("auto-cleanup skipped: %s", e)
 
 
+def _build_patients() -> list:
+    # ?expand: 환자별 상세 조회 없이 한 번에
+    patients = client.get_json("/patients", params={"expand": ""})
+    result = []
+
+    for detail in patients:
+        tags = detail.get("MainDicomTags", {}) or {}
+        result.append(
+            {
+                "orthancId": detail.get("ID", ""),
+                "patientId": tags.get("PatientID", ""),
+                "patientName": tags.get("PatientName", ""),
+                "studiesCount": len(detail.get("Studies", [])),
+            }
+        )
+
+    result.sort(key=lambda x: (x["patientId"], x["orthancId"]))
+    return result
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_patients(request):
     try:
-        ids: List[str] = _get("/patients")
-        result = []
-
-        for pid in ids:
-            try:
-                detail = _get(f"/patients/{pid}")
-                tags = detail.get("MainDicomTags", {}) or {}
-                result.append(
-                    {
-                        "orthancId": pid,
-                        "patientId": tags.get("PatientID", ""),
-                        "patientName": tags.get("PatientName", ""),
-                        "studiesCount": len(detail.get("Studies", [])),
-                    }
-                )
-            except Exception as e:
-                logger.warning("patient read failed %s: %s", pid, e)
-
-        result.sort(key=lambda x: (x["patientId"], x["orthancId"]))
+        result = _cached_listing("patients", "all", _build_patients)
         dlog("list_patients result", {"count": len(result), "items": result})
         return Response(result)
 
@@ -212,6 +224,27 @@ def list_patients(request):
         return Response(data, status=500)
 
 
+def _build_studies(pid: str) -> list:
+    # /patients/{id}/studies 는 Study 상세(expand)를 한 번에 반환
+    studies = client.get_json(f"/patients/{pid}/studies")
+    result = []
+
+    for s in studies:
+        tags = s.get("MainDicomTags", {}) or {}
+        result.append(
+            {
+                "orthancId": s.get("ID", ""),
+                "studyInstanceUID": tags.get("StudyInstanceUID", ""),
+                "description": tags.get("StudyDescription", ""),
+                "studyDate": tags.get("StudyDate", ""),
+                "seriesCount": len(s.get("Series", [])),
+            }
+        )
+
+    result.sort(key=lambda x: (x["studyDate"], x["orthancId"]))
+    return result
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_studies(request):
@@ -222,27 +255,7 @@ def list_studies(request):
         return Response(data, status=400)
 
     try:
-        p = _get(f"/patients/{pid}")
-        study_ids: List[str] = p.get("Studies", [])
-        result = []
-
-        for sid in study_ids:
-            try:
-                s = _get(f"/studies/{sid}")
-                tags = s.get("MainDicomTags", {}) or {}
-                result.append(
-                    {
-                        "orthancId": sid,
-                        "studyInstanceUID": tags.get("StudyInstanceUID", ""),
-                        "description": tags.get("StudyDescription", ""),
-                        "studyDate": tags.get("StudyDate", ""),
-                        "seriesCount": len(s.get("Series", [])),
-                    }
-                )
-            except Exception as e:
-                logger.warning("study read failed %s: %s", sid, e)
-
-        result.sort(key=lambda x: (x["studyDate"], x["orthancId"]))
+        result = _cached_listing("studies", pid, lambda: _build_studies(pid))
         dlog("list_studies result", {"count": len(result), "items": result})
         return Response(result)
 
@@ -253,6 +266,30 @@ def list_studies(request):
         return Response(data, status=500)
 
 
+def _build_series(sid: str) -> list:
+    # /studies/{id}/series 는 Series 상세(expand)를 한 번에 반환
+    series_list = client.get_json(f"/studies/{sid}/series")
+    result = []
+
+    for ser in series_list:
+        tags = ser.get("MainDicomTags", {}) or {}
+        series_desc = tags.get("SeriesDescription", "")
+        result.append(
+            {
+                "orthancId": ser.get("ID", ""),
+                "seriesInstanceUID": tags.get("SeriesInstanceUID", ""),
+                "seriesNumber": tags.get("SeriesNumber", ""),
+                "description": series_desc,
+                "seriesType": _parse_series_type(series_desc),  # T1, T2, T1C, FLAIR, OTHER
+                "modality": tags.get("Modality", ""),
+                "instancesCount": len(ser.get("Instances", [])),
+            }
+        )
+
+    result.sort(key=lambda x: (str(x["seriesNumber"]), x["orthancId"]))
+    return result
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_series(request):
@@ -263,30 +300,7 @@ def list_series(request):
         return Response(data, status=400)
 
     try:
-        s = _get(f"/studies/{sid}")
-        series_ids: List[str] = s.get("Series", [])
-        result = []
-
-        for ser_id in series_ids:
-            try:
-                ser = _get(f"/series/{ser_id}")
-                tags = ser.get("MainDicomTags", {}) or {}
-                series_desc = tags.get("SeriesDescription", "")
-                result.append(
-                    {
-                        "orthancId": ser_id,
-                        "seriesInstanceUID": tags.get("SeriesInstanceUID", ""),
-                        "seriesNumber": tags.get("SeriesNumber", ""),
-                        "description": series_desc,
-                        "seriesType": _parse_series_type(series_desc),  # T1, T2, T1C, FLAIR, OTHER
-                        "modality": tags.get("Modality", ""),
-                        "instancesCount": len(ser.get("Instances", [])),
-                    }
-                )
-            except Exception as e:
-                logger.warning("series read failed %s: %s", ser_id, e)
-
-        result.sort(key=lambda x: (str(x["seriesNumber"]), x["orthancId"]))
+        result = _cached_listing("series", sid, lambda: _build_series(sid))
         dlog("list_series result", {"count": len(result), "items": result})
         return Response(result)
 
@@ -297,6 +311,69 @@ def list_series(request):
         return Response(data, status=500)
 
 
+def _instance_meta(inst_id: str, tags: dict) -> dict:
+    num = client.normalize_tag_value(tags.get("InstanceNumber"))
+    try:
+        num_int = int(num)
+    except Exception:
+        num_int = None
+
+    return {
+        "orthancId": inst_id,
+        "instanceNumber": num,
+        "instanceNumberInt": num_int,
+        "sopInstanceUID": client.normalize_tag_value(tags.get("SOPInstanceUID")),
+        "rows": client.normalize_tag_value(tags.get("Rows")),
+        "columns": client.normalize_tag_value(tags.get("Columns")),
+        "pixelSpacing": client.normalize_tag_value(tags.get("PixelSpacing")),
+        "sliceThickness": client.normalize_tag_value(tags.get("SliceThickness")),
+        "sliceLocation": client.normalize_tag_value(tags.get("SliceLocation")),
+        "imagePositionPatient": client.normalize_tag_value(tags.get("ImagePositionPatient")),
+        "patientId": client.normalize_tag_value(tags.get("PatientID")),
+        "patientName": client.normalize_tag_value(tags.get("PatientName")),
+        "studyInstanceUID": client.normalize_tag_value(tags.get("StudyInstanceUID")),
+        "seriesInstanceUID": client.normalize_tag_value(tags.get("SeriesInstanceUID")),
+        "seriesNumber": client.normalize_tag_value(tags.get("SeriesNumber")),
+    }
+
+
+def _build_instances(sid: str) -> list:
+    ser = client.get_json(f"/series/{sid}")
+    ids: List[str] = ser.get("Instances", [])
+    logger.info("list_instances called: series_id=%s, instances=%d", sid, len(ids))
+
+    series_uid = (ser.get("MainDicomTags", {}) or {}).get("SeriesInstanceUID")
+    tags_by_id = None
+    if series_uid:
+        try:
+            tags_by_id = client.find_instance_tags(series_uid)
+        except Exception as e:
+            logger.warning("tools/find failed for series %s, falling back: %s", sid, e)
+
+    if tags_by_id is None:
+        # fallback: 인스턴스별 simplified-tags를 동시 조회
+        tags_by_id = {}
+        fetched = client.fetch_many(lambda inst_id: client.get_json(f"/instances/{inst_id}/simplified-tags"), ids)
+        for inst_id, tags, error in fetched:
+            if error is not None:
+                logger.warning("instance read failed %s: %s", inst_id, error)
+                continue
+            tags_by_id[inst_id] = tags
+
+    result = []
+    for idx, inst_id in enumerate(ids, start=1):
+        tags = tags_by_id.get(inst_id)
+        if tags is None:
+            continue
+        meta = _instance_meta(inst_id, tags)
+        if idx <= 3:
+            dlog(f"built meta for {inst_id}", meta)
+        result.append(meta)
+
+    result.sort(key=lambda x: (x["instanceNumberInt"] or 0))
+    return result
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_instances(request):
@@ -307,60 +384,7 @@ def list_instances(request):
         return Response(data, status=400)
 
     try:
-        ser = _get(f"/series/{sid}")
-        ids: List[str] = ser.get("Instances", [])
-        logger.info("list_instances called: series_id=%s, instances=%d", sid, len(ids))
-
-        result = []
-
-        for idx, inst_id in enumerate(ids, start=1):
-            try:
-                tags = _get(f"/instances/{inst_id}/simplified-tags")
-                if idx <= 3:
-                    dlog(f"simplified-tags for {inst_id}", tags)
-
-                num = _normalize_tag_value(tags.get("InstanceNumber"))
-                try:
-                    num_int = int(num)
-                except Exception:
-                    num_int = None
-
-                sop = _normalize_tag_value(tags.get("SOPInstanceUID"))
-
-                rows = _normalize_tag_value(tags.get("Rows"))
-                cols = _normalize_tag_value(tags.get("Columns"))
-                pixel_spacing = _normalize_tag_value(tags.get("PixelSpacing"))
-                slice_thickness = _normalize_tag_value(tags.get("SliceThickness"))
-                slice_location = _normalize_tag_value(tags.get("SliceLocation"))
-                image_position_patient = _normalize_tag_value(tags.get("ImagePositionPatient"))
-
-                meta = {
-                    "orthancId": inst_id,
-                    "instanceNumber": num,
-                    "instanceNumberInt": num_int,
-                    "sopInstanceUID": sop,
-                    "rows": rows,
-                    "columns": cols,
-                    "pixelSpacing": pixel_spacing,
-                    "sliceThickness": slice_thickness,
-                    "sliceLocation": slice_location,
-                    "imagePositionPatient": image_position_patient,
-                    "patientId": _normalize_tag_value(tags.get("PatientID")),
-                    "patientName": _normalize_tag_value(tags.get("PatientName")),
-                    "studyInstanceUID": _normalize_tag_value(tags.get("StudyInstanceUID")),
-                    "seriesInstanceUID": _normalize_tag_value(tags.get("SeriesInstanceUID")),
-                    "seriesNumber": _normalize_tag_value(tags.get("SeriesNumber")),
-                }
-
-                if idx <= 3:
-                    dlog(f"built meta for {inst_id}", meta)
-
-                result.append(meta)
-
-            except Exception as e:
-                logger.warning("instance read failed %s: %s", inst_id, e)
-
-        result.sort(key=lambda x: (x["instanceNumberInt"] or 0))
+        result = _cached_listing("instances", sid, lambda: _build_instances(sid))
         dlog("list_instances result", {"count": len(result), "first": result[0] if result else None})
         return Response(result)
 
@@ -375,8 +399,7 @@ def list_instances(request):
 @permission_classes([AllowAny])
 def get_instance_file(request, instance_id: str):
     try:
-        r = requests.get(f"{ORTHANC}/instances/{instance_id}/file", timeout=20)
-        r.raise_for_status()
+        r = client.get_raw(f"/instances/{instance_id}/file", timeout=20)
         dlog("get_instance_file info", {"instance_id": instance_id, "content_length": len(r.content)})
         return HttpResponse(r.content, content_type="application/dicom")
     except Exception as e:
@@ -518,7 +541,7 @@ def upload_patient(request):
             ds.save_as(bio)
             bio.seek(0)
 
-            resp = _post_instance(bio.getvalue())
+            resp = client.post_instance(bio.getvalue())
             if isinstance(resp, dict):
                 ps = resp.get("ParentSeries")
                 if ps:
@@ -535,11 +558,21 @@ def upload_patient(request):
     if uploaded_series:
         try:
             first_series_id = list(uploaded_series)[0]
-            series_info = _get(f"/series/{first_series_id}")
+            series_info = client.get_json(f"/series/{first_series_id}")
             orthanc_study_id = series_info.get("ParentStudy")
         except Exception as e:
             logger.warning("Failed to get ParentStudy: %s", e)
 
+    if uploaded:
+        _invalidate_listing_cache()
+
+    # 썸네일용 슬라이스 정렬 인덱스 미리 계산
+    for ser_id in uploaded_series:
+        try:
+            client.build_slice_index(ser_id)
+        except Exception as e:
+            logger.warning("slice index build failed %s: %s", ser_id, e)
+
     resp_data = {
         "patientId": patient_id,
         "studyUid": study_uid,
@@ -559,21 +592,24 @@ def upload_patient(request):
 @api_view(["DELETE"])
 def delete_instance(request, instance_id: str):
     try:
-        meta = _get(f"/instances/{instance_id}")
+        meta = client.get_json(f"/instances/{instance_id}")
         series_id = meta.get("ParentSeries")
         study_id = meta.get("ParentStudy")
         patient_id = meta.get("ParentPatient")
 
-        _delete(f"/instances/{instance_id}")
+        client.delete(f"/instances/{instance_id}")
+        SeriesSliceIndex.objects.filter(orthanc_series_id=series_id).delete()
 
         try:
-            series = _get(f"/series/{series_id}")
+            series = client.get_json(f"/series/{series_id}")
             if not series.get("Instances", []):
-                _delete(f"/series/{series_id}")
+                client.delete(f"/series/{series_id}")
                 _auto_cleanup_if_empty(patient_id, study_id)
         except Exception:
             pass
 
+        _invalidate_listing_cache()
+
         data = {"deleted": True, "instance_id": instance_id}
         dlog("delete_instance result", data)
         return Response(data)
@@ -588,13 +624,16 @@ def delete_instance(request, instance_id: str):
 @api_view(["DELETE"])
 def delete_series(request, series_id: str):
     try:
-        ser = _get(f"/series/{series_id}")
+        ser = client.get_json(f"/series/{series_id}")
         study_id = ser.get("ParentStudy")
         patient_id = ser.get("ParentPatient")
 
-        _delete(f"/series/{series_id}")
+        client.delete(f"/series/{series_id}")
+        SeriesSliceIndex.objects.filter(orthanc_series_id=series_id).delete()
         _auto_cleanup_if_empty(patient_id, study_id)
 
+        _invalidate_listing_cache()
+
         data = {"deleted": True, "series_id": series_id}
         dlog("delete_series result", data)
         return Response(data)
@@ -609,12 +648,15 @@ def delete_series(request, series_id: str):
 @api_view(["DELETE"])
 def delete_study(request, study_id: str):
     try:
-        stu = _get(f"/studies/{study_id}")
+        stu = client.get_json(f"/studies/{study_id}")
         patient_id = stu.get("ParentPatient")
 
-        _delete(f"/studies/{study_id}")
+        client.delete(f"/studies/{study_id}")
+        SeriesSliceIndex.objects.filter(orthanc_study_id=study_id).delete()
         _auto_cleanup_if_empty(patient_id)
 
+        _invalidate_listing_cache()
+
         data = {"deleted": True, "study_id": study_id}
         dlog("delete_study result", data)
         return Response(data)
@@ -629,7 +671,11 @@ def delete_study(request, study_id: str):
 @api_view(["DELETE"])
 def delete_patient(request, patient_id: str):
     try:
-        _delete(f"/patients/{patient_id}")
+        study_ids = client.get_json(f"/patients/{patient_id}").get("Studies", [])
+        client.delete(f"/patients/{patient_id}")
+        SeriesSliceIndex.objects.filter(orthanc_study_id__in=study_ids).delete()
+        _invalidate_listing_cache()
+
         data = {"deleted": True, "patient_id": patient_id}
         dlog("delete_patient result", data)
         return Response(data)
@@ -645,6 +691,77 @@ def delete_patient(request, patient_id: str):
 #    - Series의 중간 슬라이스 이미지를 PNG로 반환
 #    - 4개 채널 (T1, T1CE, T2, FLAIR) 썸네일 지원
 # -------------------------------------------------------------
+def _cached_preview_png(instance_id: str) -> bytes:
+    """
+    인스턴스 preview PNG (디스크 캐시)
+
+    Orthanc Instance ID는 UID 기반 해시라 같은 ID의 preview는 바뀌지 않음
+    """
+    global _thumbnail_writes
+
+    path = ORTHANC_THUMBNAIL_CACHE_DIR / f"{instance_id}.png"
+    try:
+        content = path.read_bytes()
+        os.utime(path, None)  # LRU: 최근 사용 시각 갱신
+        return content
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("thumbnail cache read failed %s: %s", instance_id, e)
+
+    content = client.get_raw(f"/instances/{instance_id}/preview").content
+    try:
+        ORTHANC_THUMBNAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=ORTHANC_THUMBNAIL_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("thumbnail cache write failed %s: %s", instance_id, e)
+        return content
+
+    _thumbnail_writes += 1
+    if _thumbnail_writes % ORTHANC_THUMBNAIL_EVICT_EVERY == 1:
+        _evict_thumbnail_cache()
+    return content
+
+
+def _evict_thumbnail_cache() -> int:
+    """최근 사용 순으로 ORTHANC_THUMBNAIL_CACHE_MAX_BYTES 이하가 될 때까지 오래된 PNG 삭제"""
+    entries = []
+    for path in ORTHANC_THUMBNAIL_CACHE_DIR.glob("*.png"):
+        try:
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        except FileNotFoundError:
+            continue
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= ORTHANC_THUMBNAIL_CACHE_MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+
+    if removed:
+        logger.info("thumbnail cache evicted %d entries", removed)
+    return removed
+
+
+def _png_response(request, instance_id: str, max_age: int):
+    """ETag(Instance ID) 일치 시 304, 아니면 캐시된 PNG 반환"""
+    etag = f'"{instance_id}"'
+    if etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(_cached_preview_png(instance_id), content_type="image/png")
+    response["ETag"] = etag
+    response["Cache-Control"] = f"private, max-age={max_age}"
+    return response
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def get_series_thumbnail(request, series_id: str):
@@ -653,67 +770,20 @@ def get_series_thumbnail(request, series_id: str):
 
     Orthanc의 preview 기능을 활용하여 DICOM 이미지를 PNG로 변환
     슬라이스 위치(SliceLocation 또는 InstanceNumber)를 기준으로 정렬하여 일관된 중간 슬라이스 선택
+    - 정렬 결과는 SeriesSliceIndex에 저장, 렌더링된 PNG는 디스크 캐시
     """
     try:
-        # 시리즈 정보 조회
-        series_info = _get(f"/series/{series_id}")
-        instances = series_info.get("Instances", [])
+        index = client.get_slice_index(series_id)
+        middle_instance_id = index.middle_instance_id
 
-        if not instances:
+        if not middle_instance_id:
             return Response({"detail": "No instances in series"}, status=404)
 
-        # 각 인스턴스의 슬라이스 위치 정보 수집
-        instance_positions = []
-        for inst_id in instances:
-            try:
-                # Orthanc simplified-tags에서 슬라이스 정보 가져오기
-                tags = _get(f"/instances/{inst_id}/simplified-tags")
-
-                # SliceLocation이 가장 정확, 없으면 InstanceNumber 사용
-                slice_loc = tags.get("SliceLocation")
-                instance_num = tags.get("InstanceNumber")
-
-                # 정렬 기준 값 결정
-                if slice_loc is not None:
-                    try:
-                        position = float(slice_loc)
-                    except (ValueError, TypeError):
-                        position = None
-                else:
-                    position = None
-
-                # SliceLocation이 없으면 InstanceNumber 사용
-                if position is None and instance_num is not None:
-                    try:
-                        position = float(instance_num)
-                    except (ValueError, TypeError):
-                        position = None
-
-                instance_positions.append({
-                    "id": inst_id,
-                    "position": position if position is not None else 0
-                })
-            except Exception as e:
-                # 개별 인스턴스 조회 실패 시 기본값 사용
-                logger.warning(f"Failed to get tags for instance {inst_id}: {e}")
-                instance_positions.append({"id": inst_id, "position": 0})
-
-        # 슬라이스 위치로 정렬
-        instance_positions.sort(key=lambda x: x["position"])
-
-        # 정렬된 목록에서 중간 슬라이스 선택
-        middle_idx = len(instance_positions) // 2
-        middle_instance_id = instance_positions[middle_idx]["id"]
-
-        # Orthanc의 preview 기능 사용 (PNG 반환)
-        preview_url = f"{ORTHANC}/instances/{middle_instance_id}/preview"
-        r = requests.get(preview_url, timeout=10)
-        r.raise_for_status()
-
-        return HttpResponse(r.content, content_type="image/png")
+        return _png_response(request, middle_instance_id, ORTHANC_THUMBNAIL_MAX_AGE)
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
+            SeriesSliceIndex.objects.filter(orthanc_series_id=series_id).delete()
             return Response({"detail": "Series not found"}, status=404)
         raise
     except Exception as e:
@@ -730,13 +800,12 @@ def get_study_thumbnails(request, study_id: str):
     MRI 4채널 (T1, T1CE, T2, FLAIR)에 대한 썸네일 URL 목록 제공
     """
     try:
-        study_info = _get(f"/studies/{study_id}")
-        series_ids = study_info.get("Series", [])
+        series_list = client.get_json(f"/studies/{study_id}/series")
 
         thumbnails = []
-        for ser_id in series_ids:
+        for ser in series_list:
+            ser_id = ser.get("ID", "")
             try:
-                ser = _get(f"/series/{ser_id}")
                 tags = ser.get("MainDicomTags", {}) or {}
                 series_desc = tags.get("SeriesDescription", "")
                 series_type = _parse_series_type(series_desc)
@@ -781,11 +850,8 @@ def get_instance_preview(request, instance_id: str):
     특정 인스턴스의 미리보기 이미지 반환 (PNG)
     """
     try:
-        preview_url = f"{ORTHANC}/instances/{instance_id}/preview"
-        r = requests.get(preview_url, timeout=10)
-        r.raise_for_status()
-
-        return HttpResponse(r.content, content_type="image/png")
+        # 같은 Instance ID의 preview는 바뀌지 않으므로 길게 캐시
+        return _png_response(request, instance_id, 86400)
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
@@ -316,10 +316,10 @@ def patient_summary(request, patient_id):
 
     # OCS 이력 (최근 10건)
     from apps.ocs.models import OCS
-    from apps.ocs.serializers import OCSListSerializer
-    ocs_list = OCS.objects.filter(
+    from apps.ocs.serializers import OCSListSerializer, with_latest_inference
+    ocs_list = with_latest_inference(OCS.objects.filter(
         patient=patient, is_deleted=False
-    ).order_by('-created_at')[:10]
+    )).order_by('-created_at')[:10]
     ocs_data = OCSListSerializer(ocs_list, many=True).data
 
     # AI 추론 이력 (최근 5건)
@@ -547,19 +547,19 @@ def patient_examination_summary(request, patient_id):
     # 최근 OCS (RIS/LIS 각각 5건)
     try:
         from apps.ocs.models import OCS
-        from apps.ocs.serializers import OCSListSerializer
+        from apps.ocs.serializers import OCSListSerializer, with_latest_inference
 
-        recent_ris = OCS.objects.filter(
+        recent_ris = with_latest_inference(OCS.objects.filter(
             patient=patient,
             job_role='RIS',
             is_deleted=False
-        ).order_by('-created_at')[:5]
+        )).order_by('-created_at')[:5]
 
-        recent_lis = OCS.objects.filter(
+        recent_lis = with_latest_inference(OCS.objects.filter(
             patient=patient,
             job_role='LIS',
             is_deleted=False
-        ).order_by('-created_at')[:5]
+        )).order_by('-created_at')[:5]
 
         ocs_data = {
             'ris': OCSListSerializer(recent_ris, many=True).data,
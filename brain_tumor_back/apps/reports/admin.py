@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import FinalReport, ReportAttachment, ReportLog
+from .models import FinalReport, ReportAttachment, ReportLog, ClinicalEvent
 
 
 @admin.register(FinalReport)
@@ -30,3 +30,10 @@ class ReportLogAdmin(admin.ModelAdmin):
     list_display = ['report', 'action', 'actor', 'created_at']
     list_filter = ['action']
     search_fields = ['report__report_id', 'message']
+
+
+@admin.register(ClinicalEvent)
+class ClinicalEventAdmin(admin.ModelAdmin):
+    list_display = ['source_key', 'event_type', 'patient', 'event_time', 'updated_at']
+    list_filter = ['event_type']
+    search_fields = ['source_key', 'patient__name']
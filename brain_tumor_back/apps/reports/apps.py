@@ -5,3 +5,7 @@ class ReportsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.reports'
     verbose_name = '진료 보고서 관리'
+
+    def ready(self):
+        # ClinicalEvent 인덱스 갱신 signal 등록
+        from . import signals  # noqa: F401
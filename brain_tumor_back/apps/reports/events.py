@@ -0,0 +1,456 @@
+"""
+임상 이벤트 인덱스 (ClinicalEvent) 갱신 / 조회
+
+통합 보고서 대시보드와 환자 타임라인이 OCS / AIInference / FinalReport를 각각 조회해
+메모리에서 병합/정렬하던 것을 ClinicalEvent 한 테이블의 인덱스 조회로 대체
+- 갱신: signals.py (OCS 확정/확정 해제, AI 추론 완료, 보고서 저장/삭제) → sync_*()
+- 기존 데이터: migrate 시 reports 0003 마이그레이션이 채움
+  (signal을 거치지 않은 변경 후 재생성: `python manage.py build_clinical_events`)
+- 조회: (event_time, id) 역순 keyset 페이지네이션 (cursor)
+"""
+import base64
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from apps.ai_inference import thumbnails
+from apps.ai_inference.models import AIInference
+from apps.ocs.models import OCS
+from .models import ClinicalEvent, FinalReport
+
+AI_TYPE_DISPLAY = {
+    'M1': 'MRI 종양 분석',
+    'MG': '유전자 발현 분석',
+    'MM': '멀티모달 분석',
+}
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+# ============================================================
+# 썸네일 / 결과 표시
+# ============================================================
+
+def ocs_thumbnail(ocs):
+    """OCS 썸네일 정보 생성"""
+    if ocs.job_role == 'RIS':
+        # Orthanc Study ID가 있으면 실제 DICOM 썸네일 사용
+        worker_result = ocs.worker_result or {}
+        orthanc_info = worker_result.get('orthanc') or {}
+        orthanc_study_id = orthanc_info.get('orthanc_study_id')
+
+        if orthanc_study_id:
+            # 시리즈 정보가 있으면 각 채널별 썸네일 URL 생성
+            series_list = orthanc_info.get('series', [])
+            if series_list:
+                # 각 채널 (T1, T1C, T2, FLAIR)에 대한 썸네일 생성
+                channel_thumbnails = []
+                channel_order = {'T1': 0, 'T1C': 1, 'T2': 2, 'FLAIR': 3}
+
+                for series in series_list:
+                    series_type = series.get('series_type', 'OTHER')
+                    orthanc_id = series.get('orthanc_id')
+
+                    # MRI 4채널만 포함 (SEG 제외)
+                    if series_type in channel_order and orthanc_id:
+                        channel_thumbnails.append({
+                            'channel': series_type,
+                            'url': f'/api/orthanc/series/{orthanc_id}/thumbnail/',
+                            'description': series.get('description', series_type),
+                        })
+
+                # 채널 순서로 정렬
+                channel_thumbnails.sort(key=lambda x: channel_order.get(x['channel'], 99))
+
+                if channel_thumbnails:
+                    return {
+                        'type': 'dicom_multi',
+                        'orthanc_study_id': orthanc_study_id,
+                        'thumbnails_url': f'/api/orthanc/studies/{orthanc_study_id}/thumbnails/',
+                        'channels': channel_thumbnails,
+                    }
+
+            # 시리즈 정보가 없으면 study 썸네일 API 사용
+            return {
+                'type': 'dicom',
+                'orthanc_study_id': orthanc_study_id,
+                'thumbnails_url': f'/api/orthanc/studies/{orthanc_study_id}/thumbnails/',
+            }
+
+        # DICOM 정보 없으면 아이콘 폴백
+        return {
+            'type': 'icon',
+            'icon': 'mri',
+            'color': '#3b82f6',  # blue
+        }
+    elif ocs.job_role == 'LIS':
+        job_type = ocs.job_type or ''
+        if 'GENE' in job_type.upper() or 'RNA' in job_type.upper():
+            return {
+                'type': 'icon',
+                'icon': 'dna',
+                'color': '#10b981',  # green
+            }
+        elif 'BIOMARKER' in job_type.upper() or 'PROTEIN' in job_type.upper():
+            return {
+                'type': 'icon',
+                'icon': 'protein',
+                'color': '#8b5cf6',  # purple
+            }
+        return {
+            'type': 'icon',
+            'icon': 'lab',
+            'color': '#f59e0b',  # amber
+        }
+    return {'type': 'icon', 'icon': 'document'}
+
+
+def ai_thumbnail(ai):
+    """AI 추론 썸네일 정보 생성"""
+    if ai.model_type == AIInference.ModelType.M1:
+        # M1: MRI 채널 + 세그멘테이션 오버레이 썸네일
+        thumbnail_data = {
+            'type': 'segmentation_overlay',
+            'job_id': ai.job_id,
+            'overlay_url': thumbnails.thumbnail_url(ai),
+            'plane_urls': {
+                plane: thumbnails.thumbnail_url(ai, plane) for plane in thumbnails.PLANES
+            },
+            'sprite_url': f'/api/ai/inferences/{ai.job_id}/thumbnail/sprite/',
+            'icon': 'brain',
+            'color': '#ef4444',
+        }
+
+        # mri_ocs가 있으면 원본 MRI 채널 정보도 포함
+        if ai.mri_ocs:
+            mri_thumb = ocs_thumbnail(ai.mri_ocs)
+            if mri_thumb.get('type') == 'dicom_multi':
+                thumbnail_data['channels'] = mri_thumb.get('channels', [])
+                thumbnail_data['type'] = 'segmentation_with_mri'
+
+        return thumbnail_data
+    elif ai.model_type == AIInference.ModelType.MG:
+        # MG: 유전자 발현 차트
+        return {
+            'type': 'chart',
+            'chart_type': 'gene_expression',
+            'job_id': ai.job_id,
+            'icon': 'dna',
+            'color': '#10b981',  # green
+        }
+    elif ai.model_type == AIInference.ModelType.MM:
+        # MM: 멀티모달 분석
+        return {
+            'type': 'icon',
+            'icon': 'multimodal',
+            'color': '#6366f1',  # indigo
+        }
+    return {'type': 'icon', 'icon': 'ai'}
+
+
+def ai_result_summary(ai):
+    """AI 결과 요약"""
+    result_data = ai.result_data or {}
+    if ai.model_type == AIInference.ModelType.M1:
+        return {
+            'tumor_detected': result_data.get('tumor_detected', False),
+            'classification': result_data.get('classification'),
+            'volumes': result_data.get('volumes', {}),
+        }
+    elif ai.model_type == AIInference.ModelType.MG:
+        return {
+            'prediction': result_data.get('prediction'),
+            'confidence': result_data.get('confidence'),
+        }
+    elif ai.model_type == AIInference.ModelType.MM:
+        return {
+            'final_prediction': result_data.get('final_prediction'),
+            'survival_prediction': result_data.get('survival_prediction'),
+        }
+    return result_data
+
+
+def ai_result_display(ai):
+    """AI 결과 표시 문자열 (대시보드)"""
+    result_data = ai.result_data or {}
+    if ai.model_type == AIInference.ModelType.M1:
+        if result_data.get('tumor_detected'):
+            return f"종양 발견 - {result_data.get('classification', '분류 중')}"
+        return "종양 미발견"
+    elif ai.model_type == AIInference.ModelType.MG:
+        pred = result_data.get('prediction', '분석 중')
+        conf = result_data.get('confidence')
+        if conf:
+            return f"{pred} ({conf:.1%})"
+        return pred
+    elif ai.model_type == AIInference.ModelType.MM:
+        return result_data.get('final_prediction', '분석 완료')
+    return '완료'
+
+
+def ai_timeline_result(ai):
+    """AI 결과 표시 문자열 (타임라인)"""
+    result_data = ai.result_data or {}
+    if ai.model_type == AIInference.ModelType.M1:
+        if result_data.get('tumor_detected'):
+            return "종양 발견"
+        return "종양 미발견"
+    elif ai.model_type == AIInference.ModelType.MG:
+        return result_data.get('prediction', '분석 완료')
+    elif ai.model_type == AIInference.ModelType.MM:
+        return result_data.get('final_prediction', '분석 완료')
+    return '완료'
+
+
+def _report_title(report, max_length):
+    diagnosis = report.primary_diagnosis or ''
+    if len(diagnosis) > max_length:
+        return f'{report.get_report_type_display()} - {diagnosis[:max_length]}...'
+    return f'{report.get_report_type_display()} - {diagnosis}'
+
+
+# ============================================================
+# 갱신
+# ============================================================
+
+def _upsert(source_key, event_type, patient_id, event_time, report_data, timeline_data):
+    ClinicalEvent.objects.update_or_create(
+        source_key=source_key,
+        defaults={
+            'event_type': event_type,
+            'patient_id': patient_id,
+            'event_time': event_time,
+            'report_data': report_data,
+            'timeline_data': timeline_data,
+        },
+    )
+
+
+def remove(source_key):
+    ClinicalEvent.objects.filter(source_key=source_key).delete()
+
+
+def sync_ocs_event(ocs):
+    """OCS 결과 보고서 (CONFIRMED 상태만)"""
+    source_key = f'ocs_{ocs.id}'
+    if ocs.ocs_status != OCS.OcsStatus.CONFIRMED:
+        remove(source_key)
+        return
+
+    type_display = '영상검사' if ocs.job_role == 'RIS' else '임상검사'
+    title = f'{ocs.job_type} 검사 결과'
+    author = ocs.worker.name if ocs.worker else None
+    link = f'/ocs/report/{ocs.id}'
+    _upsert(
+        source_key, f'OCS_{ocs.job_role}', ocs.patient_id, ocs.confirmed_at or ocs.created_at,
+        {
+            'id': source_key,
+            'type': f'OCS_{ocs.job_role}',
+            'type_display': type_display,
+            'sub_type': ocs.job_type,
+            'title': title,
+            'status': 'CONFIRMED',
+            'status_display': '확정',
+            'result': ocs.ocs_result,
+            'result_display': '정상' if ocs.ocs_result else '비정상',
+            'created_at': _iso(ocs.created_at),
+            'completed_at': _iso(ocs.confirmed_at),
+            'author': author,
+            'doctor': ocs.doctor.name if ocs.doctor else None,
+            'thumbnail': ocs_thumbnail(ocs),
+            'link': link,
+        },
+        {
+            'id': source_key,
+            'type': f'OCS_{ocs.job_role}',
+            'type_display': type_display,
+            'sub_type': ocs.job_type,
+            'title': title,
+            'date': _iso(ocs.confirmed_at or ocs.created_at),
+            'status': 'CONFIRMED',
+            'result': '정상' if ocs.ocs_result else '비정상',
+            'result_flag': 'normal' if ocs.ocs_result else 'abnormal',
+            'author': author,
+            'link': link,
+        },
+    )
+
+
+def sync_ocs_inferences(ocs):
+    """이 OCS를 MRI로 사용한 M1 이벤트 갱신 (M1 썸네일은 MRI OCS의 Orthanc 채널 정보를 포함)"""
+    if ocs.job_role != 'RIS':
+        return
+    for ai in AIInference.objects.filter(
+        mri_ocs=ocs,
+        model_type=AIInference.ModelType.M1,
+        status=AIInference.Status.COMPLETED
+    ).select_related('requested_by'):
+        ai.mri_ocs = ocs
+        sync_inference(ai)
+
+
+def sync_inference(ai):
+    """AI 추론 결과 (COMPLETED 상태만)"""
+    source_key = f'ai_{ai.job_id}'
+    if ai.status != AIInference.Status.COMPLETED:
+        remove(source_key)
+        return
+
+    type_display = AI_TYPE_DISPLAY.get(ai.model_type, 'AI 분석')
+    author = ai.requested_by.name if ai.requested_by else None
+    # 모델 타입에 따른 상세 페이지 경로 (M1 -> m1, MG -> mg, MM -> mm)
+    link = f'/ai/{ai.model_type.lower()}/{ai.job_id}'
+    _upsert(
+        source_key, f'AI_{ai.model_type}', ai.patient_id, ai.completed_at or ai.created_at,
+        {
+            'id': source_key,
+            'type': f'AI_{ai.model_type}',
+            'type_display': type_display,
+            'sub_type': ai.model_type,
+            'title': f'{type_display} 분석 결과',
+            'status': 'COMPLETED',
+            'status_display': '완료',
+            'result': ai_result_summary(ai),
+            'result_display': ai_result_display(ai),
+            'created_at': _iso(ai.created_at),
+            'completed_at': _iso(ai.completed_at),
+            'author': author,
+            'doctor': None,
+            'thumbnail': ai_thumbnail(ai),
+            'link': link,
+        },
+        {
+            'id': source_key,
+            'type': f'AI_{ai.model_type}',
+            'type_display': type_display,
+            'sub_type': ai.model_type,
+            'title': f'{type_display} 결과',
+            'date': _iso(ai.completed_at or ai.created_at),
+            'status': 'COMPLETED',
+            'result': ai_timeline_result(ai),
+            'result_flag': 'ai',
+            'author': author,
+            'link': link,
+        },
+    )
+
+
+def sync_report(report):
+    """최종 진료 보고서 (삭제되지 않은 보고서)"""
+    source_key = f'final_{report.id}'
+    if report.is_deleted:
+        remove(source_key)
+        return
+
+    author = report.created_by.name if report.created_by else None
+    link = f'/reports/{report.id}'
+    _upsert(
+        source_key, ClinicalEvent.EventType.FINAL, report.patient_id,
+        report.finalized_at or report.created_at,
+        {
+            'id': source_key,
+            'type': 'FINAL',
+            'type_display': '최종 보고서',
+            'sub_type': report.report_type,
+            'title': _report_title(report, 30),
+            'status': report.status,
+            'status_display': report.get_status_display(),
+            'result': None,
+            'result_display': report.get_status_display(),
+            'created_at': _iso(report.created_at),
+            'completed_at': _iso(report.finalized_at),
+            'author': author,
+            'doctor': author,
+            'thumbnail': {'type': 'icon', 'icon': 'document'},
+            'link': link,
+        },
+        {
+            'id': source_key,
+            'type': 'FINAL',
+            'type_display': '최종 보고서',
+            'sub_type': report.report_type,
+            'title': _report_title(report, 20),
+            'date': _iso(report.finalized_at or report.created_at),
+            'status': report.status,
+            'result': report.get_status_display(),
+            'result_flag': 'final',
+            'author': author,
+            'link': link,
+        },
+    )
+
+
+def rebuild():
+    """전체 재생성 - 원본 기준으로 없는 이벤트 삭제 후 다시 기록. (ocs, ai, final) 건수 반환"""
+    ocs_list = OCS.objects.filter(
+        ocs_status=OCS.OcsStatus.CONFIRMED
+    ).select_related('doctor', 'worker')
+    ai_list = AIInference.objects.filter(
+        status=AIInference.Status.COMPLETED
+    ).select_related('mri_ocs', 'requested_by')
+    report_list = FinalReport.objects.filter(is_deleted=False).select_related('created_by')
+
+    keys = set()
+    for ocs in ocs_list.iterator():
+        # 연결된 M1 이벤트는 아래에서 따로 기록
+        sync_ocs_event(ocs)
+        keys.add(f'ocs_{ocs.id}')
+    for ai in ai_list.iterator():
+        sync_inference(ai)
+        keys.add(f'ai_{ai.job_id}')
+    for report in report_list.iterator():
+        sync_report(report)
+        keys.add(f'final_{report.id}')
+
+    ClinicalEvent.objects.exclude(source_key__in=keys).delete()
+    return (
+        sum(1 for key in keys if key.startswith('ocs_')),
+        sum(1 for key in keys if key.startswith('ai_')),
+        sum(1 for key in keys if key.startswith('final_')),
+    )
+
+
+# ============================================================
+# 조회 (keyset 페이지네이션)
+# ============================================================
+
+def encode_cursor(event) -> str:
+    raw = f'{event.event_time.isoformat()}|{event.id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str):
+    """cursor → (event_time, id) - 형식이 잘못되면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        time_part, id_part = raw.rsplit('|', 1)
+        event_time = parse_datetime(time_part)
+        event_id = int(id_part)
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f'잘못된 cursor: {cursor}') from e
+    if event_time is None:
+        raise ValueError(f'잘못된 cursor: {cursor}')
+    return event_time, event_id
+
+
+def page(queryset, cursor, limit: int):
+    """
+    (event_time, id) 역순으로 limit건 조회
+
+    Returns:
+        (events, next_cursor) - 다음 페이지가 없으면 next_cursor는 None
+    """
+    queryset = queryset.order_by('-event_time', '-id')
+    if cursor:
+        event_time, event_id = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(event_time__lt=event_time) | Q(event_time=event_time, id__lt=event_id)
+        )
+
+    events = list(queryset[:limit + 1])
+    if len(events) > limit:
+        events = events[:limit]
+        return events, encode_cursor(events[-1])
+    return events, None
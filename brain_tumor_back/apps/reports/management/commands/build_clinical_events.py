@@ -0,0 +1,25 @@
+"""
+ClinicalEvent 인덱스 전체 재생성
+
+signal로 자동 갱신되고 기존 데이터는 migrate(reports 0003)가 채우므로
+signal을 거치지 않은 변경(bulk update, raw SQL, loaddata 등) 후에만 필요
+
+사용법:
+    python manage.py build_clinical_events
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.reports import events
+
+
+class Command(BaseCommand):
+    help = 'OCS 확정 / AI 추론 완료 / 최종 보고서로 ClinicalEvent 인덱스 재생성'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            ocs_count, ai_count, report_count = events.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"OCS: {ocs_count}, AI: {ai_count}, Final: {report_count}"
+        ))
@@ -0,0 +1,99 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("patients", "0002_add_severity_update_status"),
+        ("reports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClinicalEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "source_key",
+                    models.CharField(
+                        max_length=50, unique=True, verbose_name="원본 키"
+                    ),
+                ),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("OCS_RIS", "영상검사"),
+                            ("OCS_LIS", "임상검사"),
+                            ("AI_M1", "MRI 종양 분석"),
+                            ("AI_MG", "유전자 발현 분석"),
+                            ("AI_MM", "멀티모달 분석"),
+                            ("FINAL", "최종 보고서"),
+                        ],
+                        max_length=20,
+                        verbose_name="이벤트 유형",
+                    ),
+                ),
+                ("event_time", models.DateTimeField(verbose_name="이벤트 일시")),
+                (
+                    "report_data",
+                    models.JSONField(
+                        default=dict,
+                        help_text="통합 보고서 대시보드 응답 항목 (환자 정보 제외)",
+                        verbose_name="대시보드 항목",
+                    ),
+                ),
+                (
+                    "timeline_data",
+                    models.JSONField(
+                        default=dict,
+                        help_text="환자 타임라인 응답 항목",
+                        verbose_name="타임라인 항목",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "patient",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="clinical_events",
+                        to="patients.patient",
+                        verbose_name="환자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "임상 이벤트",
+                "verbose_name_plural": "임상 이벤트 목록",
+                "db_table": "clinical_event",
+                "ordering": ["-event_time", "-id"],
+                "indexes": [
+                    models.Index(
+                        fields=["-event_time", "-id"], name="clinical_event_time_idx"
+                    ),
+                    models.Index(
+                        fields=["patient", "-event_time", "-id"],
+                        name="clinical_event_patient_idx",
+                    ),
+                    models.Index(
+                        fields=["event_type", "-event_time", "-id"],
+                        name="clinical_event_type_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# ClinicalEvent 인덱스 초기 채우기
+#
+# 대시보드 / 타임라인이 clinical_event만 조회하므로, 인덱스 도입 전 데이터
+# (확정 OCS, 완료 AI 추론, 최종 보고서)를 migrate 시 한 번 기록.
+# 저장 항목(썸네일, 표시 문자열)은 apps.reports.events가 만들기 때문에
+# historical 모델 대신 events.rebuild()를 그대로 사용
+# (이후 재생성: python manage.py build_clinical_events)
+
+from django.db import migrations
+
+
+def backfill_clinical_events(apps, schema_editor):
+    from apps.reports import events
+
+    events.rebuild()
+
+
+def clear_clinical_events(apps, schema_editor):
+    apps.get_model("reports", "ClinicalEvent").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reports", "0002_clinicalevent"),
+        ("ocs", "0004_remove_ai_status_fields"),
+        ("ai_inference", "0002_alter_aiinference_requested_by"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_clinical_events, clear_clinical_events),
+    ]
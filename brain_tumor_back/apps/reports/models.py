@@ -366,3 +366,72 @@ class ReportLog(models.Model):
 
     def __str__(self):
         return f"{self.report.report_id} - {self.get_action_display()}"
+
+
+class ClinicalEvent(models.Model):
+    """
+    임상 이벤트 인덱스 (통합 보고서 대시보드 / 환자 타임라인)
+
+    OCS 확정, AI 추론 완료, 최종 보고서를 한 테이블에 비정규화해 저장.
+    원본 모델 저장 시 signal로 갱신 (apps.reports.events 참조).
+    """
+
+    class EventType(models.TextChoices):
+        OCS_RIS = 'OCS_RIS', '영상검사'
+        OCS_LIS = 'OCS_LIS', '임상검사'
+        AI_M1 = 'AI_M1', 'MRI 종양 분석'
+        AI_MG = 'AI_MG', '유전자 발현 분석'
+        AI_MM = 'AI_MM', '멀티모달 분석'
+        FINAL = 'FINAL', '최종 보고서'
+
+    # 원본 식별자 (응답의 id와 같음: ocs_<id>, ai_<job_id>, final_<id>)
+    source_key = models.CharField(
+        max_length=50,
+        unique=True,
+        verbose_name='원본 키'
+    )
+
+    event_type = models.CharField(
+        max_length=20,
+        choices=EventType.choices,
+        verbose_name='이벤트 유형'
+    )
+
+    patient = models.ForeignKey(
+        Patient,
+        on_delete=models.CASCADE,
+        related_name='clinical_events',
+        verbose_name='환자'
+    )
+
+    # 정렬 기준: 확정/완료 일시 (없으면 생성일시)
+    event_time = models.DateTimeField(verbose_name='이벤트 일시')
+
+    report_data = models.JSONField(
+        default=dict,
+        verbose_name='대시보드 항목',
+        help_text='통합 보고서 대시보드 응답 항목 (환자 정보 제외)'
+    )
+
+    timeline_data = models.JSONField(
+        default=dict,
+        verbose_name='타임라인 항목',
+        help_text='환자 타임라인 응답 항목'
+    )
+
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+
+    class Meta:
+        db_table = 'clinical_event'
+        verbose_name = '임상 이벤트'
+        verbose_name_plural = '임상 이벤트 목록'
+        ordering = ['-event_time', '-id']
+        indexes = [
+            # keyset 페이지네이션: (event_time, id) 역순
+            models.Index(fields=['-event_time', '-id'], name='clinical_event_time_idx'),
+            models.Index(fields=['patient', '-event_time', '-id'], name='clinical_event_patient_idx'),
+            models.Index(fields=['event_type', '-event_time', '-id'], name='clinical_event_type_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.source_key} ({self.event_type})"
@@ -0,0 +1,92 @@
+"""
+ClinicalEvent 인덱스 갱신 signal
+
+- OCS: CONFIRMED가 되면 기록, CONFIRMED에서 다른 상태로 바뀌면 삭제
+  (확정된 적 없는 OCS 저장은 이벤트 테이블을 건드리지 않음)
+  RIS의 Orthanc 정보(worker_result)가 바뀌면 연결된 M1 이벤트 썸네일도 갱신
+- AIInference: COMPLETED가 되면 기록 (ingestion의 save(update_fields=...) 포함)
+- FinalReport: 저장/상태 변경/최종 확정 시 갱신, soft delete 시 삭제
+"""
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.ai_inference.models import AIInference
+from apps.ocs.models import OCS
+from . import events
+from .models import FinalReport
+
+
+# OCS 이벤트 항목에 쓰이는 필드 - update_fields에 하나도 없으면 갱신 생략
+OCS_EVENT_FIELDS = frozenset({
+    'ocs_status', 'confirmed_at', 'ocs_result', 'worker_result', 'job_role', 'job_type',
+    'worker', 'worker_id', 'doctor', 'doctor_id', 'patient', 'patient_id',
+})
+
+# 불러온 시점의 상태를 모름 (deferred 필드) → 저장 시 항상 갱신
+_UNKNOWN = object()
+
+
+def _orthanc_info(worker_result):
+    return (worker_result or {}).get('orthanc')
+
+
+@receiver(post_init, sender=OCS)
+def ocs_loaded(sender, instance, **kwargs):
+    # deferred 필드 접근으로 쿼리가 나가지 않도록 __dict__에서 직접 읽음
+    instance._event_status = instance.__dict__.get('ocs_status', _UNKNOWN)
+
+
+@receiver(pre_save, sender=OCS)
+def ocs_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    """RIS: 저장 전 Orthanc 정보와 비교해 M1 이벤트 갱신 여부 결정 (새 OCS는 연결된 추론 없음)"""
+    instance._event_orthanc_changed = False
+    if raw or instance.pk is None or instance.job_role != 'RIS':
+        return
+    if update_fields is not None and 'worker_result' not in update_fields:
+        return
+    previous = OCS.objects.filter(pk=instance.pk).values_list('worker_result', flat=True).first()
+    instance._event_orthanc_changed = _orthanc_info(previous) != _orthanc_info(instance.worker_result)
+
+
+@receiver(post_save, sender=OCS)
+def ocs_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not OCS_EVENT_FIELDS.intersection(update_fields):
+        return
+
+    previous_status = getattr(instance, '_event_status', _UNKNOWN)
+    if OCS.OcsStatus.CONFIRMED in (instance.ocs_status, previous_status) or previous_status is _UNKNOWN:
+        events.sync_ocs_event(instance)
+    if getattr(instance, '_event_orthanc_changed', False):
+        events.sync_ocs_inferences(instance)
+
+    if update_fields is None or 'ocs_status' in update_fields:
+        instance._event_status = instance.ocs_status
+
+
+@receiver(post_save, sender=AIInference)
+def inference_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        events.sync_inference(instance)
+
+
+@receiver(post_save, sender=FinalReport)
+def report_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        events.sync_report(instance)
+
+
+@receiver(post_delete, sender=OCS)
+def ocs_deleted(sender, instance, **kwargs):
+    events.remove(f'ocs_{instance.id}')
+
+
+@receiver(post_delete, sender=AIInference)
+def inference_deleted(sender, instance, **kwargs):
+    events.remove(f'ai_{instance.job_id}')
+
+
+@receiver(post_delete, sender=FinalReport)
+def report_deleted(sender, instance, **kwargs):
+    events.remove(f'final_{instance.id}')
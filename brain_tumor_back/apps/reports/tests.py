@@ -0,0 +1,257 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from apps.accounts.models import User, Role
+from apps.patients.models import Patient
+from apps.ai_inference.models import AIInference
+from apps.ocs.models import OCS
+from . import events
+from .models import ClinicalEvent, FinalReport
+
+
+class ClinicalEventSignalTest(TestCase):
+    """ClinicalEvent 인덱스 갱신 signal 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.doctor_role = Role.objects.create(code='DOCTOR', name='의사')
+        self.doctor = User.objects.create_user(
+            username='doctor1',
+            password='testpass123',
+            email='doctor@test.com',
+            role=self.doctor_role
+        )
+        self.patient = Patient.objects.create(
+            name='테스트환자',
+            birth_date='1990-01-01',
+            gender='M',
+            phone='010-1234-5678',
+            ssn='9001011234567'
+        )
+
+    def _confirmed_ocs(self):
+        ocs = OCS.objects.create(
+            patient=self.patient,
+            doctor=self.doctor,
+            job_role='RIS',
+            job_type='MRI'
+        )
+        ocs.ocs_status = OCS.OcsStatus.CONFIRMED
+        ocs.confirmed_at = timezone.now()
+        ocs.save()
+        return ocs
+
+    def test_ocs_confirm_creates_event(self):
+        """OCS 확정 시 이벤트 기록"""
+        ocs = OCS.objects.create(
+            patient=self.patient,
+            doctor=self.doctor,
+            job_role='RIS',
+            job_type='MRI'
+        )
+        self.assertFalse(ClinicalEvent.objects.filter(source_key=f'ocs_{ocs.id}').exists())
+
+        ocs.ocs_status = OCS.OcsStatus.CONFIRMED
+        ocs.confirmed_at = timezone.now()
+        ocs.save()
+
+        event = ClinicalEvent.objects.get(source_key=f'ocs_{ocs.id}')
+        self.assertEqual(event.event_type, ClinicalEvent.EventType.OCS_RIS)
+        self.assertEqual(event.patient, self.patient)
+        self.assertEqual(event.event_time, ocs.confirmed_at)
+        self.assertEqual(event.report_data['link'], f'/ocs/report/{ocs.id}')
+
+    def test_ocs_unconfirm_removes_event(self):
+        """확정 해제(다른 상태로 변경) 시 이벤트 삭제"""
+        ocs = self._confirmed_ocs()
+        self.assertTrue(ClinicalEvent.objects.filter(source_key=f'ocs_{ocs.id}').exists())
+
+        ocs.ocs_status = OCS.OcsStatus.CANCELLED
+        ocs.save()
+
+        self.assertFalse(ClinicalEvent.objects.filter(source_key=f'ocs_{ocs.id}').exists())
+
+    def test_unconfirmed_ocs_save_skips_event_table(self):
+        """확정된 적 없는 OCS 저장은 clinical_event / 연결 추론을 조회하지 않음"""
+        ocs = OCS.objects.create(
+            patient=self.patient,
+            doctor=self.doctor,
+            job_role='RIS',
+            job_type='MRI'
+        )
+        ocs.ocs_status = OCS.OcsStatus.ACCEPTED
+        ocs.worker = self.doctor
+
+        with CaptureQueriesContext(connection) as ctx:
+            ocs.save()
+
+        sql = ' '.join(query['sql'] for query in ctx.captured_queries)
+        self.assertNotIn('clinical_event', sql)
+        self.assertNotIn(AIInference._meta.db_table, sql)
+
+    def test_ocs_orthanc_change_refreshes_m1_event(self):
+        """RIS worker_result의 Orthanc 정보가 바뀌면 연결된 M1 썸네일 갱신"""
+        ocs = self._confirmed_ocs()
+        inference = AIInference.objects.create(
+            model_type=AIInference.ModelType.M1,
+            patient=self.patient,
+            mri_ocs=ocs,
+            status=AIInference.Status.COMPLETED,
+            completed_at=timezone.now()
+        )
+        event = ClinicalEvent.objects.get(source_key=f'ai_{inference.job_id}')
+        self.assertEqual(event.report_data['thumbnail']['type'], 'segmentation_overlay')
+
+        ocs.worker_result = {
+            'orthanc': {
+                'orthanc_study_id': 'study-1',
+                'series': [{'series_type': 'T1', 'orthanc_id': 'series-t1'}],
+            }
+        }
+        ocs.save(update_fields=['worker_result'])
+
+        event.refresh_from_db()
+        self.assertEqual(event.report_data['thumbnail']['type'], 'segmentation_with_mri')
+        self.assertEqual(event.report_data['thumbnail']['channels'][0]['channel'], 'T1')
+
+    def test_ocs_delete_removes_event(self):
+        """OCS 삭제 시 이벤트 삭제"""
+        ocs = self._confirmed_ocs()
+        source_key = f'ocs_{ocs.id}'
+        ocs.delete()
+
+        self.assertFalse(ClinicalEvent.objects.filter(source_key=source_key).exists())
+
+    def test_inference_completion_creates_event(self):
+        """AI 추론 완료 시 이벤트 기록 (save(update_fields=...) 포함)"""
+        inference = AIInference.objects.create(
+            model_type=AIInference.ModelType.MG,
+            patient=self.patient,
+            requested_by=self.doctor,
+            result_data={'prediction': 'High', 'confidence': 0.9}
+        )
+        self.assertFalse(ClinicalEvent.objects.filter(source_key=f'ai_{inference.job_id}').exists())
+
+        inference.status = AIInference.Status.COMPLETED
+        inference.completed_at = timezone.now()
+        inference.save(update_fields=['status', 'completed_at'])
+
+        event = ClinicalEvent.objects.get(source_key=f'ai_{inference.job_id}')
+        self.assertEqual(event.event_type, ClinicalEvent.EventType.AI_MG)
+        self.assertEqual(event.event_time, inference.completed_at)
+        self.assertEqual(event.report_data['result_display'], 'High (90.0%)')
+        self.assertEqual(event.timeline_data['link'], f'/ai/mg/{inference.job_id}')
+
+    def test_inference_failure_removes_event(self):
+        """COMPLETED가 아닌 상태로 바뀌면 이벤트 삭제"""
+        inference = AIInference.objects.create(
+            model_type=AIInference.ModelType.MG,
+            patient=self.patient,
+            status=AIInference.Status.COMPLETED,
+            completed_at=timezone.now()
+        )
+        self.assertTrue(ClinicalEvent.objects.filter(source_key=f'ai_{inference.job_id}').exists())
+
+        inference.status = AIInference.Status.FAILED
+        inference.save(update_fields=['status'])
+
+        self.assertFalse(ClinicalEvent.objects.filter(source_key=f'ai_{inference.job_id}').exists())
+
+    def test_report_save_and_soft_delete(self):
+        """보고서 저장 시 기록, soft delete 시 삭제"""
+        report = FinalReport.objects.create(
+            patient=self.patient,
+            primary_diagnosis='Glioblastoma',
+            created_by=self.doctor
+        )
+
+        event = ClinicalEvent.objects.get(source_key=f'final_{report.id}')
+        self.assertEqual(event.event_type, ClinicalEvent.EventType.FINAL)
+        self.assertEqual(event.report_data['status'], report.status)
+
+        report.is_deleted = True
+        report.save()
+
+        self.assertFalse(ClinicalEvent.objects.filter(source_key=f'final_{report.id}').exists())
+
+    def test_rebuild_matches_signals(self):
+        """rebuild()는 signal로 쌓인 인덱스와 같은 결과"""
+        self._confirmed_ocs()
+        FinalReport.objects.create(
+            patient=self.patient,
+            primary_diagnosis='Glioblastoma',
+            created_by=self.doctor
+        )
+        before = set(ClinicalEvent.objects.values_list('source_key', flat=True))
+
+        counts = events.rebuild()
+
+        self.assertEqual(counts, (1, 0, 1))
+        self.assertEqual(set(ClinicalEvent.objects.values_list('source_key', flat=True)), before)
+
+
+class ClinicalEventPageTest(TestCase):
+    """events.page() keyset 페이지네이션 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 설정 - event_time이 같은 이벤트 포함"""
+        self.patient = Patient.objects.create(
+            name='테스트환자',
+            birth_date='1990-01-01',
+            gender='M',
+            phone='010-1234-5678',
+            ssn='9001011234567'
+        )
+        now = timezone.now()
+        # 동일 시각 4건 + 이전 시각 2건 + 이후 시각 1건
+        times = [now] * 4 + [now - timedelta(hours=1)] * 2 + [now + timedelta(hours=1)]
+        for i, event_time in enumerate(times):
+            ClinicalEvent.objects.create(
+                source_key=f'final_{i}',
+                event_type=ClinicalEvent.EventType.FINAL,
+                patient=self.patient,
+                event_time=event_time
+            )
+        self.expected = list(
+            ClinicalEvent.objects.order_by('-event_time', '-id').values_list('id', flat=True)
+        )
+
+    def _collect(self, limit):
+        ids = []
+        cursor = None
+        pages = 0
+        while True:
+            page_events, cursor = events.page(ClinicalEvent.objects.all(), cursor, limit)
+            ids.extend(event.id for event in page_events)
+            pages += 1
+            if cursor is None:
+                return ids, pages
+
+    def test_page_continuity_with_ties(self):
+        """동일 event_time이 페이지 경계에 걸려도 누락/중복 없음"""
+        for limit in (1, 2, 3):
+            ids, pages = self._collect(limit)
+            self.assertEqual(ids, self.expected)
+            self.assertEqual(pages, -(-len(self.expected) // limit))
+
+    def test_last_page_has_no_cursor(self):
+        """마지막 페이지는 next_cursor가 None"""
+        page_events, cursor = events.page(ClinicalEvent.objects.all(), None, len(self.expected))
+
+        self.assertEqual([event.id for event in page_events], self.expected)
+        self.assertIsNone(cursor)
+
+    def test_cursor_round_trip(self):
+        """encode_cursor / decode_cursor 왕복"""
+        event = ClinicalEvent.objects.get(id=self.expected[2])
+        event_time, event_id = events.decode_cursor(events.encode_cursor(event))
+
+        self.assertEqual(event_time, event.event_time)
+        self.assertEqual(event_id, event.id)
+
+    def test_invalid_cursor(self):
+        """잘못된 cursor는 ValueError"""
+        with self.assertRaises(ValueError):
+            events.page(ClinicalEvent.objects.all(), 'not-a-cursor', 2)
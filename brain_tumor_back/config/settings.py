@@ -188,6 +188,15 @@ CORS_ALLOW_HEADERS = list(default_headers) + [
 ]
 # 쿠키를 포함한 cross-origin 요청
 CORS_ALLOW_CREDENTIALS = True
+# 바이너리 볼륨 API 응답 헤더 (브라우저에서 읽을 수 있도록)
+CORS_EXPOSE_HEADERS = [
+    "ETag",
+    "Content-Range",
+    "X-Volume-Shape",
+    "X-Volume-Dtype",
+    "X-Volume-Scale",
+    "X-Volume-Offset",
+]
 
 
 # Swagger 설정
@@ -238,6 +247,25 @@ DEFAULT_FROM_EMAIL = f"BrainTumor System <{EMAIL_HOST_USER}>"
 ORTHANC_BASE_URL = os.getenv("ORTHANC_URL", "http://localhost:8042")
 DATA_UPLOAD_MAX_NUMBER_FILES = None
 ORTHANC_DEBUG_LOG = True
+# Orthanc 프록시 목록 API: 동시 요청 수 / 응답 캐시 TTL(초)
+ORTHANC_PROXY_MAX_WORKERS = int(os.getenv("ORTHANC_PROXY_MAX_WORKERS", "8"))
+ORTHANC_PROXY_CACHE_TTL = int(os.getenv("ORTHANC_PROXY_CACHE_TTL", "10"))
+# 시리즈 썸네일 브라우저 캐시(초) - ETag로 재검증
+ORTHANC_THUMBNAIL_MAX_AGE = int(os.getenv("ORTHANC_THUMBNAIL_MAX_AGE", "3600"))
+# 시리즈 썸네일 디스크 캐시 최대 용량(bytes) - 초과 시 오래 사용하지 않은 PNG부터 삭제
+ORTHANC_THUMBNAIL_CACHE_MAX_BYTES = int(os.getenv("ORTHANC_THUMBNAIL_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# AI callback 후처리(파일 디코딩, DB 갱신, WebSocket 알림) background worker 수
+AI_CALLBACK_INGEST_WORKERS = int(os.getenv("AI_CALLBACK_INGEST_WORKERS", "2"))
+# M1 결과 볼륨 바이너리 API 브라우저 캐시(초) - ETag로 재검증
+AI_VOLUME_MAX_AGE = int(os.getenv("AI_VOLUME_MAX_AGE", "3600"))
+# M1 사전 렌더링 썸네일 브라우저 캐시(초, private)
+# - URL에 결과 버전(v)이 있으면 장기 캐시, 없으면 짧게 캐시 후 ETag로 재검증
+AI_THUMBNAIL_MAX_AGE = int(os.getenv("AI_THUMBNAIL_MAX_AGE", str(60 * 60 * 24 * 365)))
+AI_THUMBNAIL_UNVERSIONED_MAX_AGE = int(os.getenv("AI_THUMBNAIL_UNVERSIONED_MAX_AGE", "60"))
+# M1 썸네일 단면 슬라이스: middle (중간 슬라이스) | largest_tumor (종양 면적 최대)
+AI_THUMBNAIL_SLICE = os.getenv("AI_THUMBNAIL_SLICE", "middle")
+# 대시보드 / 처리 현황 통계 응답 캐시 TTL(초) - 0이면 캐시 안함
+DASHBOARD_STATS_CACHE_TTL = int(os.getenv("DASHBOARD_STATS_CACHE_TTL", "5"))
 
 # ==================================================
 # External Patient Raw Data
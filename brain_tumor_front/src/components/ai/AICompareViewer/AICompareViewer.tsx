@@ -6,6 +6,7 @@
 
 import React, { useState, useEffect } from 'react'
 import { aiApi } from '@/services/ai.api'
+import { type Volume3D, volumeShape, voxelAt } from '@/components/ai/SegMRIViewer/volume'
 import './AICompareViewer.css'
 
 interface InferenceDetail {
@@ -31,8 +32,8 @@ interface InferenceDetail {
 }
 
 interface SegmentationData {
-  mri: number[][][] | null
-  prediction: number[][][] | null
+  mri: Volume3D | null
+  prediction: Volume3D | null
   shape: [number, number, number]
 }
 
@@ -53,17 +54,21 @@ const AICompareViewer: React.FC<AICompareViewerProps> = ({ job1, job2, viewMode
 
   // 세그멘테이션 데이터 로드
   useEffect(() => {
-    loadSegmentationData()
+    // 작업 변경/언마운트 시 남은 slab 로드 중단
+    const controller = new AbortController()
+    loadSegmentationData(controller.signal)
+    return () => controller.abort()
   }, [job1.job_id, job2.job_id])
 
-  const loadSegmentationData = async () => {
+  const loadSegmentationData = async (signal: AbortSignal) => {
     try {
       setLoading(true)
       setError('')
 
+      // 가운데 slab을 먼저 표시하고 나머지 slab은 받는 대로 갱신
       const [data1, data2] = await Promise.all([
-        aiApi.getSegmentationData(job1.job_id),
-        aiApi.getSegmentationData(job2.job_id),
+        aiApi.getSegmentationData(job1.job_id, { signal, onUpdate: setSeg1 }),
+        aiApi.getSegmentationData(job2.job_id, { signal, onUpdate: setSeg2 }),
       ])
 
       setSeg1(data1)
@@ -74,6 +79,7 @@ const AICompareViewer: React.FC<AICompareViewerProps> = ({ job1, job2, viewMode
         setSliceIndex(Math.floor(data1.shape[2] / 2))
       }
     } catch (err: any) {
+      if (signal.aborted) return
       console.error('Failed to load segmentation data:', err)
       setError('세그멘테이션 데이터를 불러올 수 없습니다.')
     } finally {
@@ -88,30 +94,36 @@ const AICompareViewer: React.FC<AICompareViewerProps> = ({ job1, job2, viewMode
 
   // 2D 슬라이스 추출
   const getSlice = (
-    volume: number[][][] | null,
+    volume: Volume3D | null,
     axis: 'axial' | 'coronal' | 'sagittal',
     index: number
   ): number[][] | null => {
     if (!volume) return null
 
-    const [dimX, dimY, dimZ] = [volume.length, volume[0]?.length || 0, volume[0]?.[0]?.length || 0]
+    const [dimX, dimY, dimZ] = volumeShape(volume)
 
-    try {
-      switch (axis) {
-        case 'axial':
-          // XY plane at Z index
-          return volume.map((row) => row.map((col) => col[Math.min(index, dimZ - 1)] || 0))
-        case 'coronal':
-          // XZ plane at Y index
-          return volume.map((row) => row[Math.min(index, dimY - 1)] || [])
-        case 'sagittal':
-          // YZ plane at X index
-          return volume[Math.min(index, dimX - 1)] || []
-        default:
-          return null
+    // (행, 열) 크기와 복셀 좌표 매핑
+    const plane = (rows: number, cols: number, at: (r: number, c: number) => number): number[][] =>
+      Array.from({ length: rows }, (_, r) => Array.from({ length: cols }, (_, c) => at(r, c)))
+
+    switch (axis) {
+      case 'axial': {
+        // XY plane at Z index
+        const z = Math.min(index, dimZ - 1)
+        return plane(dimX, dimY, (x, y) => voxelAt(volume, x, y, z))
+      }
+      case 'coronal': {
+        // XZ plane at Y index
+        const y = Math.min(index, dimY - 1)
+        return plane(dimX, dimZ, (x, z) => voxelAt(volume, x, y, z))
+      }
+      case 'sagittal': {
+        // YZ plane at X index
+        const x = Math.min(index, dimX - 1)
+        return plane(dimY, dimZ, (y, z) => voxelAt(volume, x, y, z))
       }
-    } catch {
-      return null
+      default:
+        return null
     }
   }
 
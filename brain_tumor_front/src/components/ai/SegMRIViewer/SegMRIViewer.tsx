@@ -12,6 +12,7 @@
 
 import React, { useState, useEffect, useRef, useCallback, lazy, Suspense } from 'react'
 import './SegMRIViewer.css'
+import { type Volume3D, volumeShape, voxelAt } from './volume'
 
 // 3D 뷰어 동적 로딩 (Three.js 번들 분리)
 const Volume3DViewer = lazy(() => import('./Volume3DViewer'))
@@ -28,18 +29,18 @@ export interface SliceMapping {
 /** MRI 채널 타입 */
 export type MRIChannel = 't1' | 't1ce' | 't2' | 'flair'
 
-/** 세그멘테이션 데이터 */
+/** 세그멘테이션 데이터 (볼륨: 중첩 배열 [X][Y][Z] 또는 C-order typed array) */
 export interface SegmentationData {
-  mri: number[][][]           // 3D MRI 볼륨 [X][Y][Z] (기본: T1CE)
-  groundTruth: number[][][]   // 3D GT 레이블 볼륨
-  prediction: number[][][]    // 3D 예측 레이블 볼륨
+  mri: Volume3D               // 3D MRI 볼륨 (기본: T1CE)
+  groundTruth: Volume3D       // 3D GT 레이블 볼륨
+  prediction: Volume3D        // 3D 예측 레이블 볼륨
   shape: [number, number, number]  // [X, Y, Z] 크기
   sliceMapping?: SliceMapping      // 원본 슬라이스 매핑 (선택)
   mri_channels?: {            // 4채널 MRI 데이터 (선택)
-    t1?: number[][][]
-    t1ce?: number[][][]
-    t2?: number[][][]
-    flair?: number[][][]
+    t1?: Volume3D
+    t1ce?: Volume3D
+    t2?: Volume3D
+    flair?: Volume3D
   }
 }
 
@@ -163,10 +164,11 @@ const SegMRIViewer: React.FC<SegMRIViewerProps> = ({
   }, [data.mri_channels])
 
   /** 3D 볼륨에서 2D 슬라이스 추출 */
-  const getSlice = useCallback((volume: number[][][], sliceIdx: number, mode: ViewMode): number[][] | null => {
-    if (!volume || volume.length === 0) return null
+  const getSlice = useCallback((volume: Volume3D, sliceIdx: number, mode: ViewMode): number[][] | null => {
+    if (!volume) return null
 
-    const [X, Y, Z] = [volume.length, volume[0]?.length || 0, volume[0]?.[0]?.length || 0]
+    const [X, Y, Z] = volumeShape(volume)
+    if (X === 0) return null
 
     switch (mode) {
       case 'axial': {
@@ -175,7 +177,7 @@ const SegMRIViewer: React.FC<SegMRIViewerProps> = ({
         for (let y = 0; y < Y; y++) {
           const row: number[] = []
           for (let x = 0; x < X; x++) {
-            row.push(volume[x]?.[Y - 1 - y]?.[sliceIdx] || 0)
+            row.push(voxelAt(volume, x, Y - 1 - y, sliceIdx))
           }
           slice.push(row)
         }
@@ -187,7 +189,7 @@ const SegMRIViewer: React.FC<SegMRIViewerProps> = ({
         for (let z = 0; z < Z; z++) {
           const row: number[] = []
           for (let y = 0; y < Y; y++) {
-            row.push(volume[sliceIdx]?.[Y - 1 - y]?.[Z - 1 - z] || 0)
+            row.push(voxelAt(volume, sliceIdx, Y - 1 - y, Z - 1 - z))
           }
           slice.push(row)
         }
@@ -199,7 +201,7 @@ const SegMRIViewer: React.FC<SegMRIViewerProps> = ({
         for (let z = 0; z < Z; z++) {
           const row: number[] = []
           for (let x = 0; x < X; x++) {
-            row.push(volume[x]?.[sliceIdx]?.[Z - 1 - z] || 0)
+            row.push(voxelAt(volume, x, sliceIdx, Z - 1 - z))
           }
           slice.push(row)
         }
@@ -282,7 +284,7 @@ const SegMRIViewer: React.FC<SegMRIViewerProps> = ({
   }, [isPlaying, getMaxSlices])
 
   /** 특정 채널의 MRI 볼륨 가져오기 */
-  const getMriVolumeByChannel = useCallback((channel: MRIChannel): number[][][] | null => {
+  const getMriVolumeByChannel = useCallback((channel: MRIChannel): Volume3D | null => {
     if (data.mri_channels) {
       const channelData = data.mri_channels[channel]
       if (channelData) return channelData
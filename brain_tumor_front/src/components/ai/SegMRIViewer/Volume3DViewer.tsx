@@ -7,14 +7,15 @@
 
 import React, { useRef, useEffect, useState, useCallback } from 'react'
 import * as THREE from 'three'
+import { type Volume3D, voxelAt } from './volume'
 
 // ============== Types ==============
 
 export interface Volume3DViewerProps {
   /** 세그멘테이션 데이터 (prediction 볼륨) */
-  segmentationVolume: number[][][]
+  segmentationVolume: Volume3D
   /** MRI 볼륨 (배경 표시용) */
-  mriVolume?: number[][][]
+  mriVolume?: Volume3D
   /** 볼륨 shape [X, Y, Z] */
   shape: [number, number, number]
   /** 컨테이너 너비 */
@@ -71,7 +72,7 @@ const Volume3DViewer: React.FC<Volume3DViewerProps> = ({
 
   /** MRI 볼륨에서 뇌 표면 추출 (threshold 기반) */
   const extractBrainSurface = useCallback((
-    volume: number[][][],
+    volume: Volume3D,
     subsample: number = 3
   ): { positions: number[], intensities: number[] } => {
     const positions: number[] = []
@@ -84,7 +85,7 @@ const Volume3DViewer: React.FC<Volume3DViewerProps> = ({
     for (let x = 0; x < X; x += subsample) {
       for (let y = 0; y < Y; y += subsample) {
         for (let z = 0; z < Z; z += subsample) {
-          const val = volume[x]?.[y]?.[z] || 0
+          const val = voxelAt(volume, x, y, z)
           if (val > 0) {
             if (val < minVal) minVal = val
             if (val > maxVal) maxVal = val
@@ -100,17 +101,17 @@ const Volume3DViewer: React.FC<Volume3DViewerProps> = ({
     for (let x = 0; x < X; x += subsample) {
       for (let y = 0; y < Y; y += subsample) {
         for (let z = 0; z < Z; z += subsample) {
-          const val = volume[x]?.[y]?.[z] || 0
+          const val = voxelAt(volume, x, y, z)
           if (val < threshold) continue
 
           // 표면 체크: 6방향 이웃 중 하나라도 threshold 미만이면 표면
           const neighbors = [
-            volume[x-subsample]?.[y]?.[z] || 0,
-            volume[x+subsample]?.[y]?.[z] || 0,
-            volume[x]?.[y-subsample]?.[z] || 0,
-            volume[x]?.[y+subsample]?.[z] || 0,
-            volume[x]?.[y]?.[z-subsample] || 0,
-            volume[x]?.[y]?.[z+subsample] || 0,
+            voxelAt(volume, x-subsample, y, z),
+            voxelAt(volume, x+subsample, y, z),
+            voxelAt(volume, x, y-subsample, z),
+            voxelAt(volume, x, y+subsample, z),
+            voxelAt(volume, x, y, z-subsample),
+            voxelAt(volume, x, y, z+subsample),
           ]
 
           const isSurface = neighbors.some(n => n < threshold)
@@ -134,7 +135,7 @@ const Volume3DViewer: React.FC<Volume3DViewerProps> = ({
 
   /** 볼륨에서 세그멘테이션 표면 포인트 추출 */
   const extractSurfacePoints = useCallback((
-    volume: number[][][],
+    volume: Volume3D,
     targetLabel: number,
     subsample: number = 1
   ): { positions: number[], colors: number[] } => {
@@ -146,17 +147,17 @@ const Volume3DViewer: React.FC<Volume3DViewerProps> = ({
     for (let x = 0; x < X; x += subsample) {
       for (let y = 0; y < Y; y += subsample) {
         for (let z = 0; z < Z; z += subsample) {
-          const label = volume[x]?.[y]?.[z] || 0
+          const label = voxelAt(volume, x, y, z)
           if (label !== targetLabel) continue
 
           // 표면 체크
           const isSurface =
-            (volume[x-1]?.[y]?.[z] || 0) !== targetLabel ||
-            (volume[x+1]?.[y]?.[z] || 0) !== targetLabel ||
-            (volume[x]?.[y-1]?.[z] || 0) !== targetLabel ||
-            (volume[x]?.[y+1]?.[z] || 0) !== targetLabel ||
-            (volume[x]?.[y]?.[z-1] || 0) !== targetLabel ||
-            (volume[x]?.[y]?.[z+1] || 0) !== targetLabel
+            (voxelAt(volume, x-1, y, z)) !== targetLabel ||
+            (voxelAt(volume, x+1, y, z)) !== targetLabel ||
+            (voxelAt(volume, x, y-1, z)) !== targetLabel ||
+            (voxelAt(volume, x, y+1, z)) !== targetLabel ||
+            (voxelAt(volume, x, y, z-1)) !== targetLabel ||
+            (voxelAt(volume, x, y, z+1)) !== targetLabel
 
           if (isSurface) {
             positions.push(
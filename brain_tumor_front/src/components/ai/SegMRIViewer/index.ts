@@ -6,3 +6,4 @@ export {
   type DisplayMode,
   type SegMRIViewerProps,
 } from './SegMRIViewer'
+export { type Volume3D, type VolumeGrid, voxelAt } from './volume'
@@ -0,0 +1,31 @@
+/**
+ * 3D 볼륨 접근 헬퍼
+ * - 중첩 배열 [X][Y][Z] 와 C-order typed array 볼륨을 같은 방식으로 읽음
+ * - typed array 볼륨은 slab 단위로 채워지므로 아직 받지 않은 영역은 0
+ */
+
+/** C-order typed array 볼륨 (index = (x * Y + y) * Z + z) */
+export interface VolumeGrid {
+  shape: number[]
+  values: Uint8Array | Float32Array
+}
+
+/** 3D 볼륨 */
+export type Volume3D = number[][][] | VolumeGrid
+
+/** 볼륨 shape [X, Y, Z] */
+export const volumeShape = (volume: Volume3D): [number, number, number] => {
+  if (Array.isArray(volume)) {
+    return [volume.length, volume[0]?.length || 0, volume[0]?.[0]?.length || 0]
+  }
+  const [X, Y, Z] = volume.shape
+  return [X, Y, Z]
+}
+
+/** (x, y, z) 복셀 값 - 범위 밖이면 0 */
+export const voxelAt = (volume: Volume3D, x: number, y: number, z: number): number => {
+  if (Array.isArray(volume)) return volume[x]?.[y]?.[z] || 0
+  const [X, Y, Z] = volume.shape
+  if (x < 0 || y < 0 || z < 0 || x >= X || y >= Y || z >= Z) return 0
+  return volume.values[(x * Y + y) * Z + z] || 0
+}
@@ -1,8 +1,8 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { useParams, useNavigate, Link } from 'react-router-dom'
 import { InferenceResult } from '@/components/InferenceResult'
 import SegMRIViewer, { type SegmentationData } from '@/components/ai/SegMRIViewer'
-import { aiApi, getPatientAIHistory, type AIInferenceRequest } from '@/services/ai.api'
+import { aiApi, getPatientAIHistory, type AIInferenceRequest, type SegmentationVolumeData } from '@/services/ai.api'
 import { useThumbnailCache } from '@/context/ThumbnailCacheContext'
 import PdfPreviewModal from '@/components/PdfPreviewModal'
 import type { PdfWatermarkConfig } from '@/services/pdfWatermark.api'
@@ -86,6 +86,8 @@ export default function M1DetailPage() {
   const [segmentationData, setSegmentationData] = useState<SegmentationData | null>(null)
   const [loadingSegmentation, setLoadingSegmentation] = useState(false)
   const [segmentationError, setSegmentationError] = useState<string>('')
+  // 백그라운드 slab 로드 중단용
+  const segmentationAbortRef = useRef<AbortController | null>(null)
 
   // PDF 미리보기 모달
   const [pdfPreviewOpen, setPdfPreviewOpen] = useState(false)
@@ -94,6 +96,9 @@ export default function M1DetailPage() {
   const [otherM1Results, setOtherM1Results] = useState<AIInferenceRequest[]>([])
   const [loadingOtherResults, setLoadingOtherResults] = useState(false)
 
+  // 언마운트 시 남은 slab 로드 중단
+  useEffect(() => () => segmentationAbortRef.current?.abort(), [])
+
   // 데이터 로드
   useEffect(() => {
     if (jobId) {
@@ -146,29 +151,39 @@ export default function M1DetailPage() {
   }
 
   const loadSegmentationData = async (jobIdToLoad: string) => {
+    segmentationAbortRef.current?.abort()
+    const controller = new AbortController()
+    segmentationAbortRef.current = controller
+
     try {
       setLoadingSegmentation(true)
       setSegmentationError('')
       setSegmentationData(null)
 
-      const data = await aiApi.getSegmentationData(jobIdToLoad)
+      const toSegmentationData = (d: SegmentationVolumeData): SegmentationData => ({
+        mri: d.mri,
+        groundTruth: d.groundTruth || d.prediction,
+        prediction: d.prediction,
+        shape: d.shape as [number, number, number],
+        mri_channels: d.mri_channels,
+      })
 
-      const segData: SegmentationData = {
-        mri: data.mri,
-        groundTruth: data.groundTruth || data.prediction,
-        prediction: data.prediction,
-        shape: data.shape as [number, number, number],
-        mri_channels: data.mri_channels,
-      }
+      // 가운데 slab을 먼저 표시하고 나머지 slab은 받는 대로 갱신
+      const data = await aiApi.getSegmentationData(jobIdToLoad, {
+        signal: controller.signal,
+        onUpdate: (next) => setSegmentationData(toSegmentationData(next)),
+      })
+      const segData = toSegmentationData(data)
 
       setSegmentationData(segData)
     } catch (err: any) {
+      if (controller.signal.aborted) return
       console.error('Failed to load segmentation data:', err)
       setSegmentationError(
         err.response?.data?.error || '세그멘테이션 데이터를 불러오는데 실패했습니다.'
       )
     } finally {
-      setLoadingSegmentation(false)
+      if (segmentationAbortRef.current === controller) setLoadingSegmentation(false)
     }
   }
 
@@ -1,9 +1,9 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { OCSTable, type OCSItem } from '@/components/OCSTable'
 import { InferenceResult } from '@/components/InferenceResult'
 import SegMRIViewer, { type SegmentationData } from '@/components/ai/SegMRIViewer'
 import { useAIInference } from '@/context/AIInferenceContext'
-import { ocsApi, aiApi } from '@/services/ai.api'
+import { ocsApi, aiApi, type SegmentationVolumeData } from '@/services/ai.api'
 
 interface M1Result {
   grade?: {
@@ -64,10 +64,15 @@ export default function M1InferencePage() {
   const [segmentationData, setSegmentationData] = useState<SegmentationData | null>(null)
   const [loadingSegmentation, setLoadingSegmentation] = useState(false)
   const [segmentationError, setSegmentationError] = useState<string>('')
+  // 백그라운드 slab 로드 중단용
+  const segmentationAbortRef = useRef<AbortController | null>(null)
 
   // WebSocket (from Context)
   const { lastMessage, isConnected } = useAIInference()
 
+  // 언마운트 시 남은 slab 로드 중단
+  useEffect(() => () => segmentationAbortRef.current?.abort(), [])
+
   // OCS 데이터 로드
   useEffect(() => {
     loadOcsData()
@@ -144,31 +149,41 @@ export default function M1InferencePage() {
 
   // 세그멘테이션 데이터 로드
   const loadSegmentationData = async (jobIdToLoad: string) => {
+    segmentationAbortRef.current?.abort()
+    const controller = new AbortController()
+    segmentationAbortRef.current = controller
+
     try {
       setLoadingSegmentation(true)
       setSegmentationError('')
       setSegmentationData(null)
 
-      const data = await aiApi.getSegmentationData(jobIdToLoad)
-
       // API 응답을 SegmentationData 형식으로 변환
-      const segData: SegmentationData = {
-        mri: data.mri,
-        groundTruth: data.groundTruth || data.prediction,  // GT가 없으면 prediction 사용
-        prediction: data.prediction,
-        shape: data.shape as [number, number, number],
-        mri_channels: data.mri_channels,  // T1, T1CE, T2, FLAIR 4채널
-      }
+      const toSegmentationData = (d: SegmentationVolumeData): SegmentationData => ({
+        mri: d.mri,
+        groundTruth: d.groundTruth || d.prediction,  // GT가 없으면 prediction 사용
+        prediction: d.prediction,
+        shape: d.shape as [number, number, number],
+        mri_channels: d.mri_channels,  // T1, T1CE, T2, FLAIR 4채널
+      })
+
+      // 가운데 slab을 먼저 표시하고 나머지 slab은 받는 대로 갱신
+      const data = await aiApi.getSegmentationData(jobIdToLoad, {
+        signal: controller.signal,
+        onUpdate: (next) => setSegmentationData(toSegmentationData(next)),
+      })
+      const segData = toSegmentationData(data)
 
       setSegmentationData(segData)
       console.log('Segmentation data loaded:', segData.shape, 'channels:', data.mri_channels ? Object.keys(data.mri_channels) : 'none')
     } catch (err: any) {
+      if (controller.signal.aborted) return
       console.error('Failed to load segmentation data:', err)
       setSegmentationError(
         err.response?.data?.error || '세그멘테이션 데이터를 불러오는데 실패했습니다.'
       )
     } finally {
-      setLoadingSegmentation(false)
+      if (segmentationAbortRef.current === controller) setLoadingSegmentation(false)
     }
   }
 
@@ -179,6 +194,7 @@ export default function M1InferencePage() {
     setInferenceStatus('')
     setJobId('')
     setIsCached(false)
+    segmentationAbortRef.current?.abort()
     setSegmentationData(null)
     setSegmentationError('')
   }
@@ -238,6 +254,7 @@ export default function M1InferencePage() {
     if (record.status === 'COMPLETED') {
       loadSegmentationData(record.job_id)
     } else {
+      segmentationAbortRef.current?.abort()
       setSegmentationData(null)
       setSegmentationError('')
     }
@@ -257,6 +274,7 @@ export default function M1InferencePage() {
         setInferenceResult(null)
         setInferenceStatus('')
         setError('')
+        segmentationAbortRef.current?.abort()
         setSegmentationData(null)
         setSegmentationError('')
       }
@@ -6,7 +6,7 @@
  */
 import { useState, useEffect } from 'react';
 import { getPatientAIRequests, aiApi } from '@/services/ai.api';
-import type { AIInferenceRequest } from '@/services/ai.api';
+import type { AIInferenceRequest, SegmentationVolumeData } from '@/services/ai.api';
 import SegMRIViewer, { type SegmentationData, type DiceScores } from '@/components/ai/SegMRIViewer/SegMRIViewer';
 import './AIViewerPanel.css';
 
@@ -30,6 +30,9 @@ export default function AIViewerPanel({ ocsId, patientId }: AIViewerPanelProps)
   const baseUrl = import.meta.env.VITE_API_BASE_URL || 'http://127.0.0.1:8000';
 
   useEffect(() => {
+    // 언마운트/대상 변경 시 남은 slab 로드 중단
+    const controller = new AbortController();
+
     const fetchAIResult = async () => {
       if (!patientId) {
         setLoading(false);
@@ -50,15 +53,20 @@ export default function AIViewerPanel({ ocsId, patientId }: AIViewerPanelProps)
           setSegLoading(true);
           setSegError(null);
           try {
-            const segResponse = await aiApi.getSegmentationData(matchingRequest.request_id);
+            const toSegmentationData = (d: SegmentationVolumeData): SegmentationData => ({
+              mri: d.mri,
+              groundTruth: d.groundTruth || d.prediction, // GT 없으면 prediction 사용
+              prediction: d.prediction,
+              shape: d.shape,
+              mri_channels: d.mri_channels,
+            });
+            // 가운데 slab을 먼저 표시하고 나머지 slab은 받는 대로 갱신
+            const segResponse = await aiApi.getSegmentationData(matchingRequest.request_id, {
+              signal: controller.signal,
+              onUpdate: (next) => setSegData(toSegmentationData(next)),
+            });
             if (segResponse && segResponse.mri && segResponse.prediction) {
-              setSegData({
-                mri: segResponse.mri,
-                groundTruth: segResponse.groundTruth || segResponse.prediction, // GT 없으면 prediction 사용
-                prediction: segResponse.prediction,
-                shape: segResponse.shape,
-                mri_channels: segResponse.mri_channels,
-              });
+              setSegData(toSegmentationData(segResponse));
               // Dice scores (비교 API에서 가져올 수도 있음)
               if (segResponse.comparison_metrics) {
                 setDiceScores({
@@ -83,6 +91,7 @@ export default function AIViewerPanel({ ocsId, patientId }: AIViewerPanelProps)
     };
 
     fetchAIResult();
+    return () => controller.abort();
   }, [ocsId, patientId]);
 
   const visualizationPaths = aiRequest?.result?.visualization_paths || [];
@@ -442,6 +442,178 @@ export const ocsApi = {
 };
 
 // AI Inference API
+// =============================================================================
+// 바이너리 볼륨 (GET /ai/inferences/<job_id>/volumes/)
+// =============================================================================
+
+export interface SegmentationVolumeInfo {
+  shape: number[];
+  dtype: 'uint8' | 'float16' | 'float32';
+  source_dtype: string;
+  etag: string;
+  url: string;
+}
+
+export interface SegmentationVolumeManifest {
+  job_id: string;
+  shape: number[];
+  order: 'C';
+  volumes: Record<string, SegmentationVolumeInfo>;
+  has_ground_truth: boolean;
+  volumes_info: Record<string, number>;
+  mri_dtypes: string[];
+}
+
+export interface VolumeFetchOptions {
+  dtype?: 'float16' | 'uint8' | 'float32';
+  axis?: 0 | 1 | 2;
+  start?: number;
+  count?: number;
+}
+
+export interface VolumeData {
+  shape: number[];
+  dtype: 'uint8' | 'float16' | 'float32';
+  values: Uint8Array | Float32Array;
+  // uint8 양자화 시 value = q * scale + offset
+  scale?: number;
+  offset?: number;
+}
+
+// float16 → float32 변환 테이블 (65536개, 최초 1회 생성)
+let halfTable: Float32Array | null = null;
+
+const getHalfTable = (): Float32Array => {
+  if (halfTable) return halfTable;
+  halfTable = new Float32Array(65536);
+  for (let h = 0; h < 65536; h++) {
+    const sign = h & 0x8000 ? -1 : 1;
+    const exp = (h >> 10) & 0x1f;
+    const frac = h & 0x3ff;
+    if (exp === 0) halfTable[h] = sign * 2 ** -14 * (frac / 1024);
+    else if (exp === 0x1f) halfTable[h] = frac ? NaN : sign * Infinity;
+    else halfTable[h] = sign * 2 ** (exp - 15) * (1 + frac / 1024);
+  }
+  return halfTable;
+};
+
+const decodeVolumeBuffer = (buffer: ArrayBuffer, dtype: VolumeData['dtype']): Uint8Array | Float32Array => {
+  if (dtype === 'uint8') return new Uint8Array(buffer);
+  if (dtype === 'float32') return new Float32Array(buffer);
+  const table = getHalfTable();
+  const half = new Uint16Array(buffer);
+  const out = new Float32Array(half.length);
+  for (let i = 0; i < half.length; i++) out[i] = table[half[i]];
+  return out;
+};
+
+// 세그멘테이션 데이터 (볼륨은 C-order typed array, slab 단위로 채워짐)
+export interface SegmentationVolumeData {
+  job_id: string;
+  shape: [number, number, number];
+  prediction: VolumeData;
+  mri: VolumeData;
+  mri_channels?: Record<string, VolumeData>;
+  groundTruth: VolumeData;
+  has_ground_truth: boolean;
+  volumes: Record<string, number>;
+  gt_volumes?: Record<string, number>;
+  // slab 방향으로 받은 슬라이스 수 / 전체 슬라이스 수
+  loaded_slices: number;
+  total_slices: number;
+}
+
+export interface SegmentationLoadOptions {
+  // slab 방향 (기본 2: axial)
+  axis?: 0 | 1 | 2;
+  // slab당 슬라이스 수
+  slabSize?: number;
+  // 나머지 slab을 받을 때마다 호출 (새 객체 - 볼륨 버퍼는 공유)
+  onUpdate?: (data: SegmentationVolumeData) => void;
+  signal?: AbortSignal;
+}
+
+const SEGMENTATION_SLAB_SIZE = 16;
+
+// 가운데 slab부터 바깥쪽으로 [start, count] 목록
+const slabOrder = (size: number, slabSize: number): [number, number][] => {
+  const first = Math.max(0, Math.min(size - slabSize, Math.floor(size / 2) - Math.floor(slabSize / 2)));
+  const slabs: [number, number][] = [[first, Math.min(slabSize, size - first)]];
+  let below = first;
+  let above = first + slabSize;
+  while (below > 0 || above < size) {
+    if (above < size) {
+      slabs.push([above, Math.min(slabSize, size - above)]);
+      above += slabSize;
+    }
+    if (below > 0) {
+      const start = Math.max(0, below - slabSize);
+      slabs.push([start, below - start]);
+      below = start;
+    }
+  }
+  return slabs;
+};
+
+// slab을 전체 볼륨 버퍼의 해당 위치에 기록 (양자화 값 복원 포함)
+const writeSlab = (
+  target: Uint8Array | Float32Array,
+  shape: number[],
+  slab: VolumeData,
+  axis: 0 | 1 | 2,
+  start: number
+) => {
+  const [, sy, sz] = shape;
+  const [bx, by, bz] = slab.shape;
+  const origin = [0, 0, 0];
+  origin[axis] = start;
+  const { values } = slab;
+  const scale = slab.scale ?? 1;
+  const offset = slab.offset ?? 0;
+  const dequantize = slab.scale !== undefined;
+  let idx = 0;
+  for (let x = 0; x < bx; x++) {
+    for (let y = 0; y < by; y++) {
+      const base = ((x + origin[0]) * sy + (y + origin[1])) * sz + origin[2];
+      for (let z = 0; z < bz; z++) {
+        const v = values[idx++];
+        target[base + z] = dequantize ? v * scale + offset : v;
+      }
+    }
+  }
+};
+
+// 결과 볼륨 목록 조회
+const fetchSegmentationVolumes = async (jobId: string): Promise<SegmentationVolumeManifest> => {
+  const response = await api.get(`/ai/inferences/${jobId}/volumes/`);
+  return response.data;
+};
+
+// 결과 볼륨 바이너리 조회
+const fetchSegmentationVolume = async (
+  jobId: string,
+  name: string,
+  options: VolumeFetchOptions = {},
+  signal?: AbortSignal
+): Promise<VolumeData> => {
+  const response = await api.get(`/ai/inferences/${jobId}/volumes/${name}/`, {
+    params: options,
+    responseType: 'arraybuffer',
+    signal,
+  });
+  const dtype = response.headers['x-volume-dtype'] as VolumeData['dtype'];
+  const shape = String(response.headers['x-volume-shape']).split(',').map(Number);
+  const scale = response.headers['x-volume-scale'];
+  const offset = response.headers['x-volume-offset'];
+  return {
+    shape,
+    dtype,
+    values: decodeVolumeBuffer(response.data as ArrayBuffer, dtype),
+    scale: scale !== undefined ? Number(scale) : undefined,
+    offset: offset !== undefined ? Number(offset) : undefined,
+  };
+};
+
 export const aiApi = {
   // M1 추론 요청
   requestM1Inference: async (ocsId: number, mode: 'manual' | 'auto' = 'manual') => {
@@ -505,73 +677,96 @@ export const aiApi = {
     return `/api/ai/inferences/${jobId}/files/${filename}/`;
   },
 
-  // 세그멘테이션 데이터 조회 (MRI + Segmentation mask)
-  getSegmentationData: async (jobId: string) => {
-    const response = await api.get(`/ai/inferences/${jobId}/segmentation/`, {
-      params: { enc: 'binary' }
-    });
-    const data = response.data;
+  // 결과 볼륨 목록 조회 (바이너리 볼륨 API)
+  getSegmentationVolumes: fetchSegmentationVolumes,
 
-    // base64 인코딩된 경우 디코딩
-    if (data.encoding === 'base64') {
-      const shape = data.shape as [number, number, number];
+  // 결과 볼륨 바이너리 조회 (native dtype) - axis/start/count 지정 시 해당 slab만 조회
+  getSegmentationVolume: fetchSegmentationVolume,
 
-      // base64 → Float32Array → 3D 배열 변환 (에러 처리 포함)
-      const decodeBase64To3D = (base64: string): number[][][] | null => {
-        if (!base64 || typeof base64 !== 'string') {
-          console.warn('Invalid base64 input');
-          return null;
-        }
-        try {
-          const binary = atob(base64);
-          const bytes = new Uint8Array(binary.length);
-          for (let i = 0; i < binary.length; i++) {
-            bytes[i] = binary.charCodeAt(i);
-          }
-          const float32 = new Float32Array(bytes.buffer);
+  // 세그멘테이션 데이터 조회 (MRI + Segmentation mask)
+  // 가운데 slab을 먼저 받아 바로 반환하고, 나머지 slab은 백그라운드로 받아 onUpdate로 전달
+  // 볼륨은 typed array 그대로 유지 - GT가 없으면 prediction을 그대로 참조
+  getSegmentationData: async (
+    jobId: string,
+    options: SegmentationLoadOptions = {}
+  ): Promise<SegmentationVolumeData> => {
+    const { axis = 2, slabSize = SEGMENTATION_SLAB_SIZE, onUpdate, signal } = options;
+    const manifest = await fetchSegmentationVolumes(jobId);
+    const shape = manifest.shape as [number, number, number];
+    const names = Object.keys(manifest.volumes);
+    const total = shape[0] * shape[1] * shape[2];
+
+    // 마스크는 uint8, MRI는 float32로 복원해 보관
+    const buffers: Record<string, Uint8Array | Float32Array> = {};
+    for (const name of names) {
+      buffers[name] = manifest.volumes[name].dtype === 'uint8'
+        ? new Uint8Array(total)
+        : new Float32Array(total);
+    }
 
-          // 1D → 3D 변환
-          const result: number[][][] = [];
-          let idx = 0;
-          for (let x = 0; x < shape[0]; x++) {
-            result[x] = [];
-            for (let y = 0; y < shape[1]; y++) {
-              result[x][y] = [];
-              for (let z = 0; z < shape[2]; z++) {
-                result[x][y][z] = float32[idx++] ?? 0;
-              }
-            }
-          }
-          return result;
-        } catch (error) {
-          console.error('Base64 디코딩 실패:', error);
-          return null;
-        }
-      };
+    const gtVolumes: Record<string, number> = {};
+    const predVolumes: Record<string, number> = {};
+    for (const [key, value] of Object.entries(manifest.volumes_info)) {
+      if (key.startsWith('gt_')) gtVolumes[key] = value;
+      else predVolumes[key] = value;
+    }
 
-      // MRI 및 prediction 디코딩
-      if (typeof data.mri === 'string') {
-        data.mri = decodeBase64To3D(data.mri);
-      }
-      if (typeof data.prediction === 'string') {
-        data.prediction = decodeBase64To3D(data.prediction);
-      }
-      if (typeof data.groundTruth === 'string') {
-        data.groundTruth = decodeBase64To3D(data.groundTruth);
+    const toVolume = (name: string): VolumeData | undefined => buffers[name] && {
+      shape,
+      dtype: buffers[name] instanceof Uint8Array ? 'uint8' : 'float32',
+      values: buffers[name],
+    };
+    const emptyMri = new Uint8Array(total);
+
+    // 매 갱신마다 새 객체를 만들어 React 상태 변경으로 인식되도록 함
+    const build = (loadedSlices: number): SegmentationVolumeData => {
+      const mriChannels: Record<string, VolumeData> = {};
+      for (const ch of ['t1', 't1ce', 't2', 'flair']) {
+        const volume = toVolume(ch);
+        if (volume) mriChannels[ch] = volume;
       }
+      const prediction: VolumeData = toVolume('mask') ?? { shape, dtype: 'uint8', values: emptyMri };
+      return {
+        job_id: jobId,
+        shape,
+        prediction,
+        mri: mriChannels.t1ce ?? mriChannels.t1 ?? toVolume('mri') ?? { shape, dtype: 'uint8', values: emptyMri },
+        mri_channels: Object.keys(mriChannels).length > 0 ? mriChannels : undefined,
+        groundTruth: toVolume('ground_truth') ?? prediction,
+        has_ground_truth: manifest.has_ground_truth,
+        volumes: predVolumes,
+        gt_volumes: Object.keys(gtVolumes).length > 0 ? gtVolumes : undefined,
+        loaded_slices: loadedSlices,
+        total_slices: shape[axis],
+      };
+    };
 
-      // MRI 채널 디코딩 (T1, T1CE, T2, FLAIR)
-      if (data.mri_channels) {
-        const channels = ['t1', 't1ce', 't2', 'flair'];
-        for (const ch of channels) {
-          if (typeof data.mri_channels[ch] === 'string') {
-            data.mri_channels[ch] = decodeBase64To3D(data.mri_channels[ch]);
-          }
+    const loadSlab = async ([start, count]: [number, number]) => {
+      const slabs = await Promise.all(
+        names.map((name) => fetchSegmentationVolume(jobId, name, { axis, start, count }, signal))
+      );
+      names.forEach((name, i) => writeSlab(buffers[name], shape, slabs[i], axis, start));
+    };
+
+    const [first, ...rest] = slabOrder(shape[axis], slabSize);
+    await loadSlab(first);
+    let loaded = first[1];
+
+    if (rest.length > 0) {
+      (async () => {
+        for (const slab of rest) {
+          if (signal?.aborted) return;
+          await loadSlab(slab);
+          if (signal?.aborted) return;
+          loaded += slab[1];
+          onUpdate?.(build(loaded));
         }
-      }
+      })().catch((err) => {
+        if (!signal?.aborted) console.error('Failed to load segmentation slab:', err);
+      });
     }
 
-    return data;
+    return build(loaded);
   },
 
   // 추론 결과 삭제 (job_id로)
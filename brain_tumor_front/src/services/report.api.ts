@@ -49,6 +49,7 @@ export interface ReportThumbnail {
 export interface UnifiedReportResponse {
   count: number;
   reports: UnifiedReport[];
+  next_cursor: string | null;  // 다음 페이지 cursor (없으면 null)
 }
 
 export interface ReportDashboardParams {
@@ -57,6 +58,7 @@ export interface ReportDashboardParams {
   date_from?: string;
   date_to?: string;
   limit?: number;
+  cursor?: string;
 }
 
 // 환자 타임라인 아이템
@@ -80,6 +82,7 @@ export interface PatientTimelineResponse {
   patient_name: string;
   count: number;
   timeline: TimelineItem[];
+  next_cursor: string | null;
 }
 
 // 통합 보고서 대시보드 조회
@@ -89,8 +92,11 @@ export async function getReportDashboard(params?: ReportDashboardParams): Promis
 }
 
 // 환자별 보고서 타임라인 조회
-export async function getPatientReportTimeline(patientId: number): Promise<PatientTimelineResponse> {
-  const response = await api.get(`/reports/patient/${patientId}/timeline/`);
+export async function getPatientReportTimeline(
+  patientId: number,
+  params?: { limit?: number; cursor?: string }
+): Promise<PatientTimelineResponse> {
+  const response = await api.get(`/reports/patient/${patientId}/timeline/`, { params });
   return response.data;
 }
 
@@ -0,0 +1 @@
+"""modAI inference pipeline benchmarks (python -m benchmarks.run_benchmarks)"""
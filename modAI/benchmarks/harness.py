@@ -0,0 +1,122 @@
+"""
+Benchmark measurement helpers
+
+- wall time: time.perf_counter (반복 실행 min / mean)
+- peak RSS: Linux는 /proc/self/clear_refs로 단계마다 high-water mark 초기화 후 VmHWM 측정,
+  그 외 OS는 ru_maxrss (프로세스 전체 최대값이라 단계별 구분 불가)
+- allocations: tracemalloc peak (Python/NumPy 할당 - torch CPU allocator는 포함되지 않음)
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def _reset_peak_rss() -> bool:
+    """peak RSS(VmHWM) 초기화 - 지원하지 않으면 False"""
+    try:
+        _PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def _status_kb(field: str) -> Optional[int]:
+    try:
+        for line in _PROC_STATUS.read_text().splitlines():
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb() -> float:
+    hwm = _status_kb("VmHWM")
+    if hwm is not None:
+        return hwm / 1024
+
+    import resource
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB
+    return maxrss / 1024 ** 2 if sys.platform == "darwin" else maxrss / 1024
+
+
+def measure(name: str, fn: Callable[[], Any], repeats: int = 1) -> Tuple[Any, Dict[str, Any]]:
+    """
+    fn을 repeats회 실행하며 측정
+
+    Returns:
+        (마지막 실행 결과, 측정값 dict)
+    """
+    gc.collect()
+    per_stage_rss = _reset_peak_rss()
+    rss_before = _status_kb("VmRSS")
+
+    tracemalloc.start()
+    times: List[float] = []
+    result = None
+    for _ in range(max(repeats, 1)):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = {
+        "wall_ms_min": round(min(times), 2),
+        "wall_ms_mean": round(sum(times) / len(times), 2),
+        "repeats": len(times),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "peak_rss_per_stage": per_stage_rss,
+        "rss_before_mb": round(rss_before / 1024, 1) if rss_before is not None else None,
+        "alloc_peak_mb": round(alloc_peak / 1024 ** 2, 2),
+    }
+    print(f"[Bench] {name:<36} {stats['wall_ms_min']:>10.1f}ms  "
+          f"rss={stats['peak_rss_mb']:.0f}MB  alloc={stats['alloc_peak_mb']:.1f}MB")
+    return result, stats
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = 0.2,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    stage별 wall_ms_min 비율 비교
+
+    Returns:
+        {stage: {'baseline_ms', 'current_ms', 'ratio', 'regression'}}
+    """
+    comparison = {}
+    for stage, current in results.items():
+        base = baseline.get(stage)
+        if not base or not base.get("wall_ms_min"):
+            continue
+        ratio = current["wall_ms_min"] / base["wall_ms_min"]
+        comparison[stage] = {
+            "baseline_ms": base["wall_ms_min"],
+            "current_ms": current["wall_ms_min"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + threshold,
+        }
+    return comparison
+
+
+def load_json(path: Path) -> Optional[Dict[str, Any]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_json(path: Path, data: Dict[str, Any]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
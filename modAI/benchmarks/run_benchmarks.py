@@ -0,0 +1,354 @@
+"""
+modAI Inference Pipeline Benchmark
+
+합성 4-모달리티 DICOM study로 M1 전처리/추론 단계와 MG/MM 추론을 단계별로 측정
+- GPU / 모델 가중치 / Orthanc 없이 CPU에서 random-weight 모델로 실행
+- 결과: stage별 wall time, peak RSS, tracemalloc peak → JSON
+- --baseline 파일과 비교해 regression 표시 (--update-baseline으로 갱신)
+- m1_logging_overhead: 운영 로그 레벨(INFO) vs job debug 모드의 M1 predict 시간 비교
+- m1_segmentation_modes: sliding window vs 전체 볼륨 segmentation의 label별 Dice / voxel 일치율
+
+사용법 (modAI 디렉토리에서):
+    python -m benchmarks.run_benchmarks --shape 240x240x155 --repeats 3
+    python -m benchmarks.run_benchmarks --stages load,resample --skip-models
+"""
+import io
+import sys
+import time
+import logging
+import argparse
+import platform
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import torch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from benchmarks import synthetic
+from benchmarks.harness import compare_to_baseline, load_json, measure, write_json
+from utils.log import ROOT_LOGGER_NAME, get_logger, job_context
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCH_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+PREPROCESS_STAGES = [
+    "load_dicom_from_bytes",
+    "load_modalities_parallel",
+    "resample_volume",
+    "get_foreground_bbox",
+    "apply_crop_and_resize",
+    "fused_resample_crop_resize",
+    "m1_preprocess_total",
+]
+MODEL_STAGES = [
+    "m1_predict",
+    "m1_segmentation",
+    "m1_predict_with_segmentation",
+    "m1_prepare_results_for_callback",
+    "m1_logging_overhead",
+    "m1_segmentation_modes",
+    "mg_predict",
+    "mm_predict",
+]
+
+
+def _parse_triplet(text: str, sep: str, cast):
+    values = tuple(cast(v) for v in text.split(sep))
+    if len(values) != 3:
+        raise argparse.ArgumentTypeError(f"expected 3 values separated by '{sep}': {text}")
+    return values
+
+
+def _use_random_weights() -> Path:
+    """가중치 경로를 존재하지 않는 파일로 돌려 random-weight 모델로 로드"""
+    missing = Path(tempfile.gettempdir()) / "modai_bench_no_weights" / "missing.pth"
+    settings.M1_SEG_WEIGHTS_PATH = missing
+    settings.M1_WEIGHTS_PATH = missing
+    settings.DEVICE = "cpu"
+    return missing
+
+
+def run_preprocess_stages(study: Dict[str, List[bytes]], selected, repeats, results, context):
+    from inference.m1_preprocess import (
+        M1Preprocessor, TARGET_SIZE, TARGET_SPACING,
+        load_dicom_from_bytes, load_modalities_parallel, resample_volume,
+        get_foreground_bbox, apply_crop_and_resize, fused_resample_crop_resize,
+    )
+    import numpy as np
+
+    loaded, stats = measure(
+        "load_dicom_from_bytes",
+        lambda: [load_dicom_from_bytes(study[m]) for m in synthetic.MODALITIES],
+        repeats,
+    )
+    if "load_dicom_from_bytes" in selected:
+        results["load_dicom_from_bytes"] = stats
+    volumes = [v for v, _ in loaded]
+    spacings = [s for _, s in loaded]
+
+    if "load_modalities_parallel" in selected:
+        _, results["load_modalities_parallel"] = measure(
+            "load_modalities_parallel", lambda: load_modalities_parallel(study), repeats
+        )
+
+    resampled, stats = measure(
+        "resample_volume",
+        lambda: [resample_volume(v, s, TARGET_SPACING) for v, s in zip(volumes, spacings)],
+        repeats,
+    )
+    if "resample_volume" in selected:
+        results["resample_volume"] = stats
+
+    image_4ch = torch.cat([
+        torch.from_numpy(np.flip(v, axis=(0, 1)).copy()).unsqueeze(0) for v in resampled
+    ], dim=0)
+
+    bbox, stats = measure("get_foreground_bbox", lambda: get_foreground_bbox(image_4ch, margin=5), repeats)
+    if "get_foreground_bbox" in selected:
+        results["get_foreground_bbox"] = stats
+
+    if "apply_crop_and_resize" in selected:
+        _, results["apply_crop_and_resize"] = measure(
+            "apply_crop_and_resize",
+            lambda: apply_crop_and_resize(image_4ch, bbox, TARGET_SIZE, mode='trilinear'),
+            repeats,
+        )
+    del image_4ch, resampled
+
+    if "fused_resample_crop_resize" in selected:
+        _, results["fused_resample_crop_resize"] = measure(
+            "fused_resample_crop_resize",
+            lambda: fused_resample_crop_resize(volumes, spacings, TARGET_SPACING, TARGET_SIZE),
+            repeats,
+        )
+
+    preprocessor = M1Preprocessor()
+    preprocessed, stats = measure(
+        "m1_preprocess_total",
+        lambda: preprocessor.preprocess_from_dicom_bytes(
+            study['T1'], study['T1CE'], study['T2'], study['FLAIR'],
+            patient_id="BENCH0001", verbose=False,
+        ),
+        repeats,
+    )
+    if "m1_preprocess_total" in selected:
+        results["m1_preprocess_total"] = stats
+    context["preprocessed"] = preprocessed
+
+
+@contextmanager
+def _capture_modai_logs():
+    """측정 중 modai 로그를 메모리 버퍼로 - 콘솔 I/O를 빼고 포맷팅 비용만 비교"""
+    target = logging.getLogger(ROOT_LOGGER_NAME)
+    handler = logging.StreamHandler(io.StringIO())
+    propagate = target.propagate
+    target.addHandler(handler)
+    target.propagate = False
+    try:
+        yield handler.stream
+    finally:
+        target.removeHandler(handler)
+        target.propagate = propagate
+
+
+def run_logging_overhead(m1, preprocessed, repeats, results) -> Dict[str, Any]:
+    """
+    운영 경로(INFO) vs job debug 모드 M1 predict 비교 + 비활성 debug 호출 단가
+
+    Returns:
+        report["logging_overhead"]에 들어갈 요약
+    """
+    with _capture_modai_logs():
+        _, results["m1_predict_log_info"] = measure(
+            "m1_predict_log_info", lambda: m1.predict(preprocessed), repeats
+        )
+        with job_context("bench_job", debug=True):
+            _, results["m1_predict_log_debug"] = measure(
+                "m1_predict_log_debug", lambda: m1.predict(preprocessed), repeats
+            )
+
+    # 비활성 debug 호출 (텐서 인자) vs 텐서 문자열 변환 단가
+    logger = get_logger("benchmark")
+    tensor = torch.randn(1, 768)
+    calls = 10000
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.debug("features: %s", tensor)
+    disabled_ns = (time.perf_counter() - start) / calls * 1e9
+
+    start = time.perf_counter()
+    for _ in range(100):
+        str(tensor)
+    tensor_str_us = (time.perf_counter() - start) / 100 * 1e6
+
+    info_ms = results["m1_predict_log_info"]["wall_ms_min"]
+    debug_ms = results["m1_predict_log_debug"]["wall_ms_min"]
+    summary = {
+        "info_ms": info_ms,
+        "debug_ms": debug_ms,
+        "debug_overhead_pct": round((debug_ms / info_ms - 1) * 100, 1) if info_ms else None,
+        "disabled_debug_call_ns": round(disabled_ns, 1),
+        "tensor_str_us": round(tensor_str_us, 1),
+    }
+    print(f"[Bench] logging overhead: INFO {info_ms:.1f}ms vs DEBUG {debug_ms:.1f}ms "
+          f"({summary['debug_overhead_pct']}%), disabled debug call {summary['disabled_debug_call_ns']}ns, "
+          f"str(tensor) {summary['tensor_str_us']}us")
+    return summary
+
+
+def run_segmentation_modes(m1, preprocessed) -> Dict[str, Any]:
+    """
+    sliding window 결과의 전체 볼륨 결과 대비 일치도
+
+    Returns:
+        report["segmentation_modes"]에 들어갈 요약
+    """
+    summary = m1.compare_segmentation_modes(preprocessed)
+    dice = ", ".join(f"{label}={value:.4f}" for label, value in summary["dice"].items())
+    print(f"[Bench] segmentation modes (roi {summary['roi_size']}): Dice {dice}, "
+          f"voxel agreement {summary['voxel_agreement']:.4f}, "
+          f"whole {summary['whole_ms']:.1f}ms vs sliding window {summary['sliding_window_ms']:.1f}ms")
+    return summary
+
+
+def run_model_stages(selected, repeats, results, context):
+    from services.m1_service import M1InferenceService
+    from services.mg_service import MGInferenceService
+    from services.mm_service import MMInferenceService
+
+    missing = _use_random_weights()
+    torch.manual_seed(0)
+
+    if any(stage.startswith("m1_") and stage != "m1_preprocess_total" for stage in selected):
+        m1 = M1InferenceService()
+        _, results["m1_load_model"] = measure("m1_load_model", m1.load_model)
+        preprocessed = context["preprocessed"]
+
+        if "m1_predict" in selected:
+            _, results["m1_predict"] = measure("m1_predict", lambda: m1.predict(preprocessed), repeats)
+
+        if "m1_segmentation" in selected:
+            input_tensor = m1._prepare_input(preprocessed)
+            _, results["m1_segmentation"] = measure(
+                "m1_segmentation", lambda: m1._run_segmentation(input_tensor), repeats
+            )
+
+        m1_result, stats = measure(
+            "m1_predict_with_segmentation", lambda: m1.predict_with_segmentation(preprocessed), repeats
+        )
+        if "m1_predict_with_segmentation" in selected:
+            results["m1_predict_with_segmentation"] = stats
+
+        if "m1_prepare_results_for_callback" in selected:
+            _, results["m1_prepare_results_for_callback"] = measure(
+                "m1_prepare_results_for_callback",
+                lambda: m1.prepare_results_for_callback(m1_result, "bench_job"),
+                repeats,
+            )
+
+        if "m1_logging_overhead" in selected:
+            context["logging_overhead"] = run_logging_overhead(m1, preprocessed, repeats, results)
+
+        if "m1_segmentation_modes" in selected:
+            context["segmentation_modes"] = run_segmentation_modes(m1, preprocessed)
+        del m1
+
+    if "mg_predict" in selected:
+        mg = MGInferenceService(device="cpu")
+        mg.weights_path = missing
+        mg.load_model()
+        expression = synthetic.make_gene_expression(mg.n_genes)
+        _, results["mg_predict"] = measure("mg_predict", lambda: mg.predict(expression), repeats)
+
+    if "mm_predict" in selected:
+        mm = MMInferenceService(weights_path=str(missing), device="cpu")
+        mm.load_model()
+        features = synthetic.make_mm_features(mm.model.protein_proj[0].in_features)
+        _, results["mm_predict"] = measure("mm_predict", lambda: mm.predict(**features), repeats)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="modAI inference pipeline benchmark (CPU, synthetic data)")
+    parser.add_argument("--shape", default="240x240x155", type=lambda t: _parse_triplet(t, "x", int),
+                        help="합성 볼륨 크기 rows x cols x slices")
+    parser.add_argument("--spacing", default="1.0,1.0,1.0", type=lambda t: _parse_triplet(t, ",", float),
+                        help="PixelSpacing(row,col) + SliceThickness (mm)")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--stages", default="", help="쉼표 구분 stage 이름/접두어 (비어있으면 전체)")
+    parser.add_argument("--skip-models", action="store_true", help="전처리 단계만 측정")
+    parser.add_argument("--threads", type=int, default=0, help="torch.set_num_threads (0이면 기본값)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2, help="baseline 대비 허용 지연 비율")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    all_stages = PREPROCESS_STAGES + ([] if args.skip_models else MODEL_STAGES)
+    filters = [f.strip() for f in args.stages.split(",") if f.strip()]
+    selected = [s for s in all_stages if not filters or any(s.startswith(f) for f in filters)]
+
+    print(f"[Bench] Generating synthetic study {args.shape} @ {args.spacing}mm...")
+    study = synthetic.make_study(args.shape, args.spacing)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    context: Dict[str, Any] = {}
+    with torch.no_grad():
+        run_preprocess_stages(study, selected, args.repeats, results, context)
+        if any(s in MODEL_STAGES for s in selected):
+            run_model_stages(selected, args.repeats, results, context)
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(),
+            "shape": list(args.shape),
+            "spacing": list(args.spacing),
+            "repeats": args.repeats,
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "torch_threads": torch.get_num_threads(),
+            "machine": platform.machine(),
+        },
+        "stages": results,
+    }
+    if "logging_overhead" in context:
+        report["logging_overhead"] = context["logging_overhead"]
+    if "segmentation_modes" in context:
+        report["segmentation_modes"] = context["segmentation_modes"]
+
+    baseline = load_json(Path(args.baseline))
+    regressions = []
+    if baseline and not args.update_baseline:
+        if baseline.get("meta", {}).get("shape") != report["meta"]["shape"]:
+            print("[Bench] WARNING: baseline was recorded with a different volume shape")
+        comparison = compare_to_baseline(results, baseline.get("stages", {}), args.threshold)
+        report["comparison"] = comparison
+        regressions = [stage for stage, c in comparison.items() if c["regression"]]
+        for stage, c in comparison.items():
+            flag = "  REGRESSION" if c["regression"] else ""
+            print(f"[Bench] {stage:<36} x{c['ratio']:.2f} vs baseline{flag}")
+
+    write_json(Path(args.output), report)
+    print(f"[Bench] Results written to {args.output}")
+
+    if args.update_baseline:
+        write_json(Path(args.baseline), report)
+        print(f"[Bench] Baseline updated: {args.baseline}")
+
+    if regressions and args.fail_on_regression:
+        print(f"[Bench] Regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
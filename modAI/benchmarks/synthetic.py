@@ -0,0 +1,125 @@
+"""
+Synthetic benchmark inputs
+
+- 4-모달리티 MRI DICOM study (T1/T1CE/T2/FLAIR) - 타원체 뇌 + 종양 blob
+- MG gene expression / MM feature 벡터
+모든 입력은 seed로 재현 가능
+"""
+import io
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pydicom
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, MRImageStorage, generate_uid
+
+MODALITIES = ('T1', 'T1CE', 'T2', 'FLAIR')
+
+# 모달리티별 (뇌 실질, 종양) 신호 강도
+_INTENSITY = {
+    'T1': (600, 450),
+    'T1CE': (620, 1400),
+    'T2': (500, 1200),
+    'FLAIR': (450, 1300),
+}
+
+
+def make_volume(
+    shape: Tuple[int, int, int],
+    modality: str,
+    seed: int = 0,
+) -> np.ndarray:
+    """(rows, cols, slices) int16 합성 볼륨 - 배경 0, 타원체 뇌, 구형 종양"""
+    rng = np.random.default_rng(seed + MODALITIES.index(modality))
+    rows, cols, slices = shape
+    r, c, s = np.meshgrid(
+        np.linspace(-1, 1, rows), np.linspace(-1, 1, cols), np.linspace(-1, 1, slices),
+        indexing='ij',
+    )
+    brain = (r / 0.8) ** 2 + (c / 0.7) ** 2 + (s / 0.75) ** 2 <= 1
+    tumor = (r - 0.25) ** 2 + (c + 0.15) ** 2 + (s - 0.1) ** 2 <= 0.2 ** 2
+
+    tissue, lesion = _INTENSITY[modality]
+    volume = np.zeros(shape, dtype=np.float32)
+    volume[brain] = tissue
+    volume[tumor] = lesion
+    volume += rng.normal(0, 20, size=shape).astype(np.float32) * brain
+    return np.clip(volume, 0, 4095).astype(np.int16)
+
+
+def make_series(
+    volume: np.ndarray,
+    spacing: Tuple[float, float, float],
+    modality: str,
+    study_uid: str,
+    series_number: int,
+) -> List[bytes]:
+    """볼륨 → 슬라이스별 DICOM bytes (SliceLocation / InstanceNumber 포함)"""
+    rows, cols, slices = volume.shape
+    series_uid = generate_uid()
+    files = []
+
+    for k in range(slices):
+        meta = FileMetaDataset()
+        meta.MediaStorageSOPClassUID = MRImageStorage
+        meta.MediaStorageSOPInstanceUID = generate_uid()
+        meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+        ds = Dataset()
+        ds.file_meta = meta
+        ds.SOPClassUID = MRImageStorage
+        ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+        ds.Modality = 'MR'
+        ds.PatientID = 'BENCH0001'
+        ds.PatientName = 'Benchmark^Synthetic'
+        ds.StudyInstanceUID = study_uid
+        ds.SeriesInstanceUID = series_uid
+        ds.SeriesNumber = series_number
+        ds.SeriesDescription = modality
+        ds.InstanceNumber = k + 1
+        ds.SliceLocation = float(k * spacing[2])
+        ds.ImagePositionPatient = [0.0, 0.0, float(k * spacing[2])]
+        ds.PixelSpacing = [float(spacing[0]), float(spacing[1])]
+        ds.SliceThickness = float(spacing[2])
+        ds.Rows = rows
+        ds.Columns = cols
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = 'MONOCHROME2'
+        ds.BitsAllocated = 16
+        ds.BitsStored = 16
+        ds.HighBit = 15
+        ds.PixelRepresentation = 1
+        ds.PixelData = np.ascontiguousarray(volume[:, :, k]).tobytes()
+
+        buffer = io.BytesIO()
+        pydicom.dcmwrite(buffer, ds, enforce_file_format=True)
+        files.append(buffer.getvalue())
+
+    return files
+
+
+def make_study(
+    shape: Tuple[int, int, int] = (240, 240, 155),
+    spacing: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+    seed: int = 0,
+) -> Dict[str, List[bytes]]:
+    """M1 입력과 같은 {'T1': [bytes], 'T1CE': ..., 'T2': ..., 'FLAIR': ...}"""
+    study_uid = generate_uid()
+    return {
+        modality: make_series(make_volume(shape, modality, seed), spacing, modality, study_uid, i + 1)
+        for i, modality in enumerate(MODALITIES)
+    }
+
+
+def make_gene_expression(n_genes: int = 2000, seed: int = 0) -> List[float]:
+    rng = np.random.default_rng(seed)
+    return rng.lognormal(mean=3.0, sigma=1.5, size=n_genes).astype(np.float32).tolist()
+
+
+def make_mm_features(protein_dim: int = 203, seed: int = 0) -> Dict[str, List[float]]:
+    rng = np.random.default_rng(seed)
+    return {
+        'mri_features': rng.normal(size=768).astype(np.float32).tolist(),
+        'gene_features': rng.normal(size=64).astype(np.float32).tolist(),
+        'protein_features': rng.normal(size=protein_dim).astype(np.float32).tolist(),
+    }
@@ -2,7 +2,10 @@
 Celery Application Configuration
 """
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from config import settings
+from utils.log import install_celery_hooks as install_job_log_hooks
+from utils.metrics import install_celery_hooks, mark_worker_process_dead, start_worker_metrics_server
 
 celery_app = Celery(
     'modai_tasks',
@@ -23,7 +26,7 @@ celery_app.conf.update(
 
     # Worker settings
     worker_prefetch_multiplier=1,  # 메모리 최적화
-    worker_max_tasks_per_child=5,  # 메모리 누수 방지 (GPU 모델 로드 때문에 낮게 설정)
+    worker_max_tasks_per_child=settings.CELERY_MAX_TASKS_PER_CHILD,  # 메모리 누수 방지 (재시작 시 모델 재로드)
     result_expires=3600,  # 1시간 후 결과 만료
 
     # Task settings
@@ -47,6 +50,43 @@ celery_app.conf.update(
 )
 
 
+@worker_process_init.connect
+def warm_up_models(**kwargs):
+    """워커 프로세스 시작 시 모델 레지스트리 warm-up"""
+    from services.model_registry import model_registry
+
+    codes = [c.strip() for c in settings.MODEL_WARMUP.split(',') if c.strip()]
+    if codes:
+        model_registry.warm_up(codes)
+
+
+@worker_process_init.connect
+def replay_callback_outbox(**kwargs):
+    """이전 실행에서 전송하지 못한 callback 재전송 (백그라운드, 항목별 lock으로 중복 방지)"""
+    from utils.callback_dispatcher import callback_dispatcher
+
+    callback_dispatcher.replay_in_background()
+
+
+@worker_process_init.connect
+def start_metrics(**kwargs):
+    """워커 프로세스 metrics 노출"""
+    start_worker_metrics_server(settings.METRICS_WORKER_PORT)
+
+
+@worker_process_shutdown.connect
+def cleanup_metrics(**kwargs):
+    mark_worker_process_dead()
+
+
+# task latency histogram (task_prerun / task_postrun / task_failure)
+install_celery_hooks()
+# task kwargs의 job_id / debug → job 단위 로그 context (utils/log.py)
+install_job_log_hooks()
+
+
 # Celery 실행 명령:
 # Windows: celery -A celery_app worker --loglevel=info --pool=solo
 # Linux/Mac: celery -A celery_app worker --loglevel=info
+# M1 micro-batching (M1_BATCH_MAX_SIZE > 1):
+#   celery -A celery_app worker --loglevel=info --pool=threads --concurrency=4 -Q m1_queue
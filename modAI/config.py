@@ -74,6 +74,59 @@ class Settings(BaseSettings):
     # Device
     DEVICE: str = "auto"  # auto, cuda, cpu
 
+    # Orthanc archive 다운로드
+    ORTHANC_ARCHIVE_SPOOL_BYTES: int = 64 * 1024 ** 2  # 초과 시 임시 파일로 spool
+    ORTHANC_FETCH_STUDY_ARCHIVE: bool = False  # True: /studies/{id}/archive 1회 요청
+
+    # M1 전처리 결과 캐시 (STORAGE_DIR/.cache/m1_preprocess)
+    PREPROCESS_CACHE_ENABLED: bool = True
+    PREPROCESS_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # 2GB (항목당 약 34MB)
+
+    # Model registry
+    # 워커 프로세스 시작 시 미리 로드할 모델 (쉼표 구분, 비어있으면 warm-up 생략)
+    MODEL_WARMUP: str = "M1,MG,MM"
+    # 모델이 프로세스에 상주하므로 재시작 주기를 환경별로 조정 가능
+    CELERY_MAX_TASKS_PER_CHILD: int = 5
+
+    # M1 micro-batching (1이면 비활성 - job별 batch 1로 추론)
+    # batch는 같은 프로세스의 동시 task끼리만 형성되므로 M1 워커를 --pool=threads로 실행
+    M1_BATCH_MAX_SIZE: int = 1
+    M1_BATCH_MAX_WAIT_MS: int = 200
+
+    # M1 segmentation 모드
+    # whole: 128³ 전체 볼륨 1회 forward / sliding_window: ROI 타일 단위 추론 (저메모리 CPU 워커용)
+    # auto: 전체 볼륨 예상 peak가 M1_SEG_MEMORY_BUDGET_MB를 넘으면 sliding_window
+    M1_SEG_MODE: str = "whole"
+    M1_SEG_MEMORY_BUDGET_MB: int = 0  # >0이면 budget에 맞춰 ROI 크기 자동 선택
+    M1_SW_ROI_SIZE: int = 96  # budget 미설정 시 ROI 한 변 (32의 배수)
+    M1_SW_OVERLAP: float = 0.25
+    M1_SW_BLEND_MODE: str = "gaussian"  # gaussian / constant
+    M1_SW_BATCH_SIZE: int = 1
+
+    # 모델별 추론 backend: eager / int8 / compile / torchscript
+    # scripts/export_models.py 의 accuracy-delta report를 보고 배포 환경별로 선택
+    M1_INFERENCE_BACKEND: str = "eager"
+    MG_INFERENCE_BACKEND: str = "eager"
+    MM_INFERENCE_BACKEND: str = "eager"
+
+    # Django callback 전송 (utils/callback_dispatcher.py)
+    # 전송 전 payload를 outbox에 기록하고 Django가 2xx로 응답하면 삭제
+    CALLBACK_OUTBOX_DIR: str = ""  # 비어있으면 STORAGE_DIR/.callback_outbox
+    CALLBACK_MAX_ATTEMPTS: int = 5
+    CALLBACK_BACKOFF_BASE: float = 2.0  # 초 - 2, 4, 8, 16... (jitter 포함)
+    CALLBACK_BACKOFF_MAX: float = 60.0
+    CALLBACK_TIMEOUT: float = 120.0  # M1 NPZ 파트가 크므로 넉넉하게
+
+    # Logging (utils/log.py) - DEBUG 로그는 텐서 값 포맷팅을 포함하므로 운영에서는 INFO 이상
+    LOG_LEVEL: str = "INFO"
+    # 전역 레벨과 무관하게 DEBUG 로그를 남길 job_id (쉼표 구분) - 요청의 debug=True와 동일
+    DEBUG_JOB_IDS: str = ""
+
+    # Prometheus metrics - 워커 프로세스별 노출 포트 (0이면 비활성)
+    # PROMETHEUS_MULTIPROC_DIR 환경변수를 FastAPI/워커에 같이 주면 FastAPI /metrics에서 합산
+    # (같은 컨테이너/호스트일 때만 - 별도 컨테이너면 워커는 이 포트로 별도 scrape)
+    METRICS_WORKER_PORT: int = 0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
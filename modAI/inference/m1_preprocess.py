@@ -32,6 +32,12 @@ from typing import Optional, Tuple, Union, List, Dict
 import torch
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.log import get_logger, lazy
+
+logger = get_logger("m1_preprocess")
+
 
 # ============================================================
 # Timer Utility
@@ -65,6 +71,13 @@ class Timer:
         self.step_start = now
         return elapsed
 
+    def record(self, step_name: str, elapsed: float):
+        """외부에서 측정한 단계 시간 기록 (병렬 작업용, step 시작 시점은 변경하지 않음)"""
+        self.steps.append((step_name, elapsed))
+        if self.verbose:
+            print(f"  [{elapsed:.3f}s] {step_name}")
+        return elapsed
+
     def total(self) -> float:
         """전체 소요 시간"""
         return time.time() - self.start_time if self.start_time else 0
@@ -211,44 +224,74 @@ def convert_brats_labels(label_tensor: torch.Tensor) -> torch.Tensor:
 # DICOM Processing Functions
 # ============================================================
 
-def load_dicom_series(dicom_files: List[str]) -> Tuple[np.ndarray, Tuple[float, float, float]]:
+# 정렬/spacing 계산에 필요한 헤더 태그 (pixel data 이전에 위치)
+_HEADER_TAGS = [
+    'SliceLocation', 'InstanceNumber', 'PixelSpacing', 'SliceThickness',
+    'Rows', 'Columns',
+]
+
+
+def _read_dicom(source, **kwargs):
     """
-    DICOM 시리즈를 3D numpy 배열로 변환
+    DICOM 소스 읽기
 
-    Args:
-        dicom_files: DICOM 파일 경로 리스트
+    source: 파일 경로, 바이트, 또는 open()을 제공하는 객체
+            (예: OrthancClient의 ArchiveMember - ZIP member를 필요할 때 압축 해제)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return pydicom.dcmread(io.BytesIO(source), **kwargs)
+    if isinstance(source, (str, os.PathLike)):
+        return pydicom.dcmread(source, **kwargs)
+    with source.open() as f:
+        return pydicom.dcmread(f, **kwargs)
 
-    Returns:
-        volume: 3D numpy array (H, W, D)
-        spacing: (row_spacing, col_spacing, slice_spacing)
+
+def _load_dicom_volume(sources: List[Union[str, bytes]]) -> Tuple[np.ndarray, Tuple[float, float, float]]:
     """
-    if not PYDICOM_AVAILABLE:
-        raise ImportError("pydicom is required for DICOM processing")
+    DICOM 슬라이스들을 (H, W, D) float32 볼륨으로 로드
+
+    1. 헤더 태그만 읽어 정렬 (pixel data 미로드)
+    2. (H, W, D) float32 볼륨 사전 할당
+    3. 정렬 순서대로 pixel data를 디코딩하여 제자리(in-place) 채움
+       (슬라이스별 astype 복사 + np.stack 복사 제거)
+    """
+    if not sources:
+        raise ValueError("No DICOM slices provided")
 
-    # Load all slices
-    slices = []
-    for f in dicom_files:
-        ds = pydicom.dcmread(f)
-        slices.append(ds)
+    headers = [
+        _read_dicom(src, stop_before_pixels=True, specific_tags=_HEADER_TAGS)
+        for src in sources
+    ]
 
     # Sort by SliceLocation or InstanceNumber
+    order = list(range(len(headers)))
     try:
-        slices.sort(key=lambda x: float(x.SliceLocation))
+        order.sort(key=lambda i: float(headers[i].SliceLocation))
     except AttributeError:
-        slices.sort(key=lambda x: int(x.InstanceNumber))
-
-    # Extract pixel arrays
-    pixel_arrays = [s.pixel_array.astype(np.float32) for s in slices]
-    volume = np.stack(pixel_arrays, axis=-1)  # (H, W, D)
+        order.sort(key=lambda i: int(headers[i].InstanceNumber))
+
+    first = headers[order[0]]
+    rows, cols = int(first.Rows), int(first.Columns)
+    volume = np.empty((rows, cols, len(order)), dtype=np.float32)
+
+    # Extract pixel arrays directly into the preallocated volume
+    for k, i in enumerate(order):
+        ds = _read_dicom(sources[i])
+        pixels = ds.pixel_array
+        if pixels.shape != (rows, cols):
+            raise ValueError(
+                f"Inconsistent slice shape: {pixels.shape} vs {(rows, cols)}"
+            )
+        volume[:, :, k] = pixels
 
     # Get spacing
-    ds = slices[0]
-    pixel_spacing = ds.PixelSpacing if hasattr(ds, 'PixelSpacing') else [1.0, 1.0]
-    slice_thickness = ds.SliceThickness if hasattr(ds, 'SliceThickness') else 1.0
+    pixel_spacing = first.PixelSpacing if hasattr(first, 'PixelSpacing') else [1.0, 1.0]
+    slice_thickness = first.SliceThickness if hasattr(first, 'SliceThickness') else 1.0
 
     # Calculate actual slice spacing from SliceLocation if available
-    if len(slices) > 1 and hasattr(slices[0], 'SliceLocation'):
-        slice_spacing = abs(float(slices[1].SliceLocation) - float(slices[0].SliceLocation))
+    if len(order) > 1 and hasattr(first, 'SliceLocation'):
+        second = headers[order[1]]
+        slice_spacing = abs(float(second.SliceLocation) - float(first.SliceLocation))
     else:
         slice_spacing = float(slice_thickness)
 
@@ -257,6 +300,23 @@ def load_dicom_series(dicom_files: List[str]) -> Tuple[np.ndarray, Tuple[float,
     return volume, spacing
 
 
+def load_dicom_series(dicom_files: List[str]) -> Tuple[np.ndarray, Tuple[float, float, float]]:
+    """
+    DICOM 시리즈를 3D numpy 배열로 변환
+
+    Args:
+        dicom_files: DICOM 파일 경로 리스트
+
+    Returns:
+        volume: 3D numpy array (H, W, D)
+        spacing: (row_spacing, col_spacing, slice_spacing)
+    """
+    if not PYDICOM_AVAILABLE:
+        raise ImportError("pydicom is required for DICOM processing")
+
+    return _load_dicom_volume(dicom_files)
+
+
 def load_dicom_from_bytes(dicom_bytes_list: List[bytes]) -> Tuple[np.ndarray, Tuple[float, float, float]]:
     """
     DICOM 바이트 데이터를 3D numpy 배열로 변환 (Orthanc에서 직접 받을 때 사용)
@@ -271,35 +331,50 @@ def load_dicom_from_bytes(dicom_bytes_list: List[bytes]) -> Tuple[np.ndarray, Tu
     if not PYDICOM_AVAILABLE:
         raise ImportError("pydicom is required for DICOM processing")
 
-    # Load all slices from bytes
-    slices = []
-    for dcm_bytes in dicom_bytes_list:
-        ds = pydicom.dcmread(io.BytesIO(dcm_bytes))
-        slices.append(ds)
+    return _load_dicom_volume(dicom_bytes_list)
 
-    # Sort by SliceLocation or InstanceNumber
-    try:
-        slices.sort(key=lambda x: float(x.SliceLocation))
-    except AttributeError:
-        slices.sort(key=lambda x: int(x.InstanceNumber))
 
-    # Extract pixel arrays
-    pixel_arrays = [s.pixel_array.astype(np.float32) for s in slices]
-    volume = np.stack(pixel_arrays, axis=-1)  # (H, W, D)
+# 4개 모달리티 동시 디코딩 worker 수
+DICOM_DECODE_WORKERS = 4
 
-    # Get spacing
-    ds = slices[0]
-    pixel_spacing = ds.PixelSpacing if hasattr(ds, 'PixelSpacing') else [1.0, 1.0]
-    slice_thickness = ds.SliceThickness if hasattr(ds, 'SliceThickness') else 1.0
 
-    if len(slices) > 1 and hasattr(slices[0], 'SliceLocation'):
-        slice_spacing = abs(float(slices[1].SliceLocation) - float(slices[0].SliceLocation))
-    else:
-        slice_spacing = float(slice_thickness)
+def load_modalities_parallel(
+    modality_sources: Dict[str, List[Union[str, bytes]]],
+    timer: Optional[Timer] = None,
+    max_workers: int = DICOM_DECODE_WORKERS,
+) -> Dict[str, Tuple[np.ndarray, Tuple[float, float, float]]]:
+    """
+    여러 모달리티를 스레드 풀에서 동시에 디코딩
 
-    spacing = (float(pixel_spacing[0]), float(pixel_spacing[1]), slice_spacing)
+    pixel data 디코딩/복사는 대부분 NumPy/pydicom C 코드에서 수행되므로
+    스레드로도 병렬 효과가 있고, 바이트를 프로세스 간 복사할 필요가 없습니다.
 
-    return volume, spacing
+    Args:
+        modality_sources: {'T1': [bytes|path], 'T1CE': [...], ...}
+        timer: 모달리티별 소요 시간을 기록할 Timer
+        max_workers: 스레드 수
+
+    Returns:
+        {'T1': (volume, spacing), ...} - 입력 순서 유지
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not PYDICOM_AVAILABLE:
+        raise ImportError("pydicom is required for DICOM processing")
+
+    def _load(name: str):
+        start = time.time()
+        result = _load_dicom_volume(modality_sources[name])
+        return name, result, time.time() - start
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(modality_sources)))) as executor:
+        for name, result, elapsed in executor.map(_load, list(modality_sources.keys())):
+            results[name] = result
+            if timer is not None:
+                timer.record(f"Load {name} ({len(modality_sources[name])} slices, parallel)", elapsed)
+
+    return results
 
 
 def resample_volume(
@@ -332,6 +407,180 @@ def resample_volume(
     return resampled
 
 
+# ============================================================
+# Fused Resample / Crop / Resize Engine
+# ============================================================
+#
+# 기존 경로: zoom(1mm) → flip → cat → bbox → crop → Resize(128³)
+#   - 채널마다 full-resolution 중간 볼륨을 2번 보간/할당
+# Fused 경로: 최종 128³ 좌표를 원본 voxel 좌표로 직접 역매핑하여 1회만 보간
+#   - 모든 변환이 축 정렬(axis-aligned)이므로 축별 선형 보간(separable trilinear)으로 계산
+#   - 좌표계/bbox/original_shape 의미는 기존 경로(1mm resample + RAS flip 기준)와 동일
+
+def _resampled_shape(
+    in_shape: Tuple[int, ...],
+    spacing: Tuple[float, float, float],
+    target_spacing: Tuple[float, float, float],
+) -> Tuple[int, int, int]:
+    """scipy.ndimage.zoom과 동일한 규칙의 resample 후 shape"""
+    if spacing == target_spacing:
+        return tuple(int(n) for n in in_shape)
+    return tuple(
+        int(round(n * (sp / tsp))) for n, sp, tsp in zip(in_shape, spacing, target_spacing)
+    )
+
+
+def _resampled_to_original(coords: np.ndarray, out_n: int, in_n: int) -> np.ndarray:
+    """resample 좌표 → 원본 voxel 좌표 (scipy zoom, grid_mode=False 기준)"""
+    if out_n <= 1 or in_n <= 1:
+        return np.zeros_like(coords)
+    return coords * ((in_n - 1) / (out_n - 1))
+
+
+def _foreground_bbox_fused(
+    volumes: List[np.ndarray],
+    resampled_shape: Tuple[int, int, int],
+    flip_axes: Tuple[int, ...],
+    margin: int = 5,
+) -> Optional[Tuple]:
+    """
+    원본 해상도에서 foreground bbox를 계산한 뒤 resample/flip 좌표로 변환
+
+    get_foreground_bbox()와 같은 기준(채널 합 > mean * 0.1, margin)을 사용합니다.
+    (resample 보간 차이로 경계가 ±1 voxel 달라질 수 있음)
+    """
+    combined = volumes[0].astype(np.float32, copy=True)
+    for vol in volumes[1:]:
+        combined += vol
+    fg_mask = combined > combined.mean() * 0.1
+    del combined
+
+    bbox = []
+    for axis in range(3):
+        other_axes = tuple(a for a in range(3) if a != axis)
+        hits = np.flatnonzero(fg_mask.any(axis=other_axes))
+        if hits.size == 0:
+            return None
+
+        in_n, out_n = fg_mask.shape[axis], resampled_shape[axis]
+        scale = (out_n - 1) / (in_n - 1) if in_n > 1 else 0.0
+        # 경계 바깥 원본 voxel과 보간되는 resample voxel까지 포함
+        lo = int(np.floor((hits[0] - 1) * scale)) + 1
+        hi = int(np.ceil((hits[-1] + 1) * scale)) - 1
+        lo, hi = max(0, lo), min(out_n - 1, hi)
+        if axis in flip_axes:
+            lo, hi = out_n - 1 - hi, out_n - 1 - lo
+
+        lo = max(0, lo - margin)
+        hi = min(out_n - 1, hi + margin)
+        bbox.extend([lo, hi + 1])
+
+    return tuple(bbox)
+
+
+def _axis_sampling(
+    target_n: int,
+    crop_min: int,
+    crop_len: int,
+    out_n: int,
+    in_n: int,
+    flip: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    한 축에 대해 target index → 원본 voxel (i0, i1, weight) 계산
+
+    1. target → crop 좌표 (F.interpolate trilinear, align_corners=False 규칙)
+    2. crop → resample 좌표 (+ RAS flip 역변환)
+    3. resample → 원본 좌표 (zoom 역변환)
+    """
+    t = np.arange(target_n, dtype=np.float64)
+    src = (t + 0.5) * (crop_len / target_n) - 0.5
+    src = np.clip(src, 0.0, crop_len - 1)
+    coords = crop_min + src
+    if flip:
+        coords = (out_n - 1) - coords
+
+    orig = np.clip(_resampled_to_original(coords, out_n, in_n), 0.0, in_n - 1)
+    i0 = np.floor(orig).astype(np.int64)
+    i1 = np.minimum(i0 + 1, in_n - 1)
+    w = (orig - i0).astype(np.float32)
+    return i0, i1, w
+
+
+def _interp_axis(volume: np.ndarray, axis: int, i0: np.ndarray, i1: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """한 축 선형 보간 (take 2회 + FMA)"""
+    a = np.take(volume, i0, axis=axis)
+    b = np.take(volume, i1, axis=axis)
+    shape = [1] * volume.ndim
+    shape[axis] = -1
+    b -= a
+    b *= w.reshape(shape)
+    a += b
+    return a
+
+
+def fused_resample_crop_resize(
+    volumes: List[np.ndarray],
+    spacings: List[Tuple[float, float, float]],
+    target_spacing: Tuple[float, float, float] = TARGET_SPACING,
+    target_size: Tuple[int, int, int] = TARGET_SIZE,
+    flip_axes: Tuple[int, ...] = (0, 1),
+    margin: int = 5,
+) -> Tuple[torch.Tensor, Optional[Tuple], Tuple[int, int, int]]:
+    """
+    resample(1mm) + RAS flip + foreground crop + resize(128³)를 채널당 1회 보간으로 수행
+
+    Args:
+        volumes: 채널별 원본 볼륨 (H, W, D) - 모두 같은 shape
+        spacings: 채널별 원본 spacing (첫 채널 기준으로 resample 격자 결정)
+        target_spacing: resample 목표 spacing
+        target_size: 출력 크기
+        flip_axes: RAS 변환용 flip 축
+        margin: bbox margin (voxel, resample 좌표 기준)
+
+    Returns:
+        image: (C, *target_size) float32 tensor (정규화 전)
+        bbox: resample+flip 좌표 기준 bbox (get_foreground_bbox 형식)
+        resampled_shape: resample+flip 후 shape (기존 original_shape와 동일한 의미)
+    """
+    in_shape = volumes[0].shape
+    if any(v.shape != in_shape for v in volumes):
+        raise ValueError("fused resample requires identical channel shapes")
+
+    # 기준 좌표계: 첫 채널(T1)의 resample 결과 (기존 경로와 동일)
+    resampled_shape = _resampled_shape(in_shape, spacings[0], target_spacing)
+
+    bbox = _foreground_bbox_fused(volumes, resampled_shape, flip_axes, margin=margin)
+    if bbox is None:
+        crop = [(0, n) for n in resampled_shape]
+    else:
+        crop = [(bbox[0], bbox[1]), (bbox[2], bbox[3]), (bbox[4], bbox[5])]
+
+    # 샘플링 좌표는 shape에만 의존하므로 모든 채널이 공유
+    # (기존 경로도 채널별 resample 결과 shape가 같아야 cat 가능)
+    sampling = []
+    for axis in range(3):
+        crop_min, crop_max = crop[axis]
+        sampling.append(_axis_sampling(
+            target_size[axis], crop_min, crop_max - crop_min,
+            resampled_shape[axis], in_shape[axis], flip=axis in flip_axes,
+        ))
+
+    # 축소 비율이 큰 축부터 보간 → 중간 배열 크기 최소화
+    order = sorted(range(3), key=lambda a: in_shape[a] / target_size[a], reverse=True)
+
+    output = torch.empty((len(volumes), *target_size), dtype=torch.float32)
+    for c, vol in enumerate(volumes):
+        result = np.asarray(vol, dtype=np.float32)
+        for axis in order:
+            i0, i1, w = sampling[axis]
+            result = _interp_axis(result, axis, i0, i1, w)
+
+        output[c] = torch.from_numpy(np.ascontiguousarray(result))
+
+    return output, bbox, resampled_shape
+
+
 # ============================================================
 # Main Preprocessing Classes
 # ============================================================
@@ -343,10 +592,13 @@ class M1Preprocessor:
         self,
         target_size: Tuple[int, int, int] = TARGET_SIZE,
         target_spacing: Tuple[float, float, float] = TARGET_SPACING,
+        fused_resample: bool = True,
     ):
         self.target_size = target_size
         self.target_spacing = target_spacing
         self.use_monai = MONAI_AVAILABLE
+        # DICOM 경로: resample/crop/resize를 채널당 1회 보간으로 수행
+        self.fused_resample = fused_resample
 
         if not self.use_monai:
             print("Warning: Using basic preprocessing (MONAI not available)")
@@ -487,57 +739,38 @@ class M1Preprocessor:
     # DICOM Processing Methods
     # ============================================================
 
-    def preprocess_from_dicom_files(
+    def _resample_crop_resize(
         self,
-        t1_files: List[str],
-        t1ce_files: List[str],
-        t2_files: List[str],
-        flair_files: List[str],
-        patient_id: Optional[str] = None,
-        verbose: bool = True,
-    ) -> dict:
+        volumes: List[np.ndarray],
+        spacings: List[Tuple[float, float, float]],
+        timer: Timer,
+    ) -> Tuple[torch.Tensor, Optional[Tuple], Tuple[int, int, int]]:
         """
-        DICOM 파일 리스트에서 전처리 (파일 경로 사용)
-
-        Args:
-            t1_files: T1 DICOM 파일 경로 리스트
-            t1ce_files: T1CE DICOM 파일 경로 리스트
-            t2_files: T2 DICOM 파일 경로 리스트
-            flair_files: FLAIR DICOM 파일 경로 리스트
-            patient_id: 환자 ID
-            verbose: 타이밍 정보 출력 여부
+        4채널 볼륨 → resample + RAS flip + crop + resize (정규화 전)
 
         Returns:
-            전처리된 데이터 dict
+            (image_tensor (4, *target_size), bbox, original_shape after resample + flip)
         """
-        if not PYDICOM_AVAILABLE:
-            raise ImportError("pydicom is required for DICOM processing")
-
-        timer = Timer(name="DICOM Preprocessing (files)", verbose=verbose)
-        timer.start()
-
-        # Load each modality
-        t1_vol, t1_spacing = load_dicom_series(t1_files)
-        timer.step(f"Load T1 ({len(t1_files)} slices)")
-
-        t1ce_vol, t1ce_spacing = load_dicom_series(t1ce_files)
-        timer.step(f"Load T1CE ({len(t1ce_files)} slices)")
-
-        t2_vol, t2_spacing = load_dicom_series(t2_files)
-        timer.step(f"Load T2 ({len(t2_files)} slices)")
-
-        flair_vol, flair_spacing = load_dicom_series(flair_files)
-        timer.step(f"Load FLAIR ({len(flair_files)} slices)")
+        if self.fused_resample and all(v.shape == volumes[0].shape for v in volumes):
+            image_tensor, bbox, original_shape = fused_resample_crop_resize(
+                volumes, spacings,
+                target_spacing=self.target_spacing,
+                target_size=self.target_size,
+                flip_axes=(0, 1),
+                margin=5,
+            )
+            timer.step(f"Fused resample/flip/crop/resize to {self.target_size} (bbox: {bbox})")
+            return image_tensor, bbox, original_shape
 
-        # Use T1 spacing as reference (all should be similar)
-        spacing = t1_spacing
+        # Use T1 spacing as reference
+        spacing = spacings[0]
 
         # Resample to 1mm isotropic if needed
         if spacing != self.target_spacing:
-            t1_vol = resample_volume(t1_vol, spacing, self.target_spacing)
-            t1ce_vol = resample_volume(t1ce_vol, t1ce_spacing, self.target_spacing)
-            t2_vol = resample_volume(t2_vol, t2_spacing, self.target_spacing)
-            flair_vol = resample_volume(flair_vol, flair_spacing, self.target_spacing)
+            volumes = [
+                resample_volume(vol, sp, self.target_spacing)
+                for vol, sp in zip(volumes, spacings)
+            ]
             timer.step(f"Resample to 1mm isotropic (from {spacing})")
         else:
             timer.step("Spacing already 1mm (skip resample)")
@@ -545,20 +778,12 @@ class M1Preprocessor:
         # Apply RAS orientation (flip X and Y axes to match NIfTI preprocessing)
         # Original NIfTI has affine with negative X, Y (LPS -> RAS requires flip)
         # DICOM data needs same transformation for consistency
-        t1_vol = np.flip(t1_vol, axis=(0, 1)).copy()
-        t1ce_vol = np.flip(t1ce_vol, axis=(0, 1)).copy()
-        t2_vol = np.flip(t2_vol, axis=(0, 1)).copy()
-        flair_vol = np.flip(flair_vol, axis=(0, 1)).copy()
+        volumes = [np.flip(vol, axis=(0, 1)).copy() for vol in volumes]
         timer.step("Apply RAS orientation (flip X, Y)")
 
         # Stack to 4-channel tensor (C, H, W, D) - same as MONAI output format
         # DICOM loads as (H, W, D), keep same order and add channel dim
-        t1_tensor = torch.from_numpy(t1_vol).unsqueeze(0)
-        t1ce_tensor = torch.from_numpy(t1ce_vol).unsqueeze(0)
-        t2_tensor = torch.from_numpy(t2_vol).unsqueeze(0)
-        flair_tensor = torch.from_numpy(flair_vol).unsqueeze(0)
-
-        image_4ch = torch.cat([t1_tensor, t1ce_tensor, t2_tensor, flair_tensor], dim=0)
+        image_4ch = torch.cat([torch.from_numpy(vol).unsqueeze(0) for vol in volumes], dim=0)
         timer.step(f"Stack 4-channel tensor {tuple(image_4ch.shape)}")
 
         # Get foreground bbox
@@ -571,6 +796,57 @@ class M1Preprocessor:
         )
         timer.step(f"Crop & resize to {self.target_size}")
 
+        return image_tensor, bbox, tuple(image_4ch.shape[1:])
+
+    def preprocess_from_dicom_files(
+        self,
+        t1_files: List[str],
+        t1ce_files: List[str],
+        t2_files: List[str],
+        flair_files: List[str],
+        patient_id: Optional[str] = None,
+        verbose: bool = True,
+    ) -> dict:
+        """
+        DICOM 파일 리스트에서 전처리 (파일 경로 사용)
+
+        Args:
+            t1_files: T1 DICOM 파일 경로 리스트
+            t1ce_files: T1CE DICOM 파일 경로 리스트
+            t2_files: T2 DICOM 파일 경로 리스트
+            flair_files: FLAIR DICOM 파일 경로 리스트
+            patient_id: 환자 ID
+            verbose: 타이밍 정보 출력 여부
+
+        Returns:
+            전처리된 데이터 dict
+        """
+        if not PYDICOM_AVAILABLE:
+            raise ImportError("pydicom is required for DICOM processing")
+
+        timer = Timer(name="DICOM Preprocessing (files)", verbose=verbose)
+        timer.start()
+
+        # Load each modality (4개 모달리티 동시 디코딩)
+        volumes = load_modalities_parallel({
+            'T1': t1_files,
+            'T1CE': t1ce_files,
+            'T2': t2_files,
+            'FLAIR': flair_files,
+        }, timer=timer)
+        t1_vol, t1_spacing = volumes['T1']
+        t1ce_vol, t1ce_spacing = volumes['T1CE']
+        t2_vol, t2_spacing = volumes['T2']
+        flair_vol, flair_spacing = volumes['FLAIR']
+        timer.step("Load 4 modalities (wall time)")
+
+        # Resample(1mm) + RAS flip + foreground crop + resize(128³)
+        image_tensor, bbox, original_shape = self._resample_crop_resize(
+            [t1_vol, t1ce_vol, t2_vol, flair_vol],
+            [t1_spacing, t1ce_spacing, t2_spacing, flair_spacing],
+            timer,
+        )
+
         # Normalize each channel separately (0-1)
         image_tensor = normalize_channels_separately(image_tensor)
         image_tensor = image_tensor.float()
@@ -600,7 +876,7 @@ class M1Preprocessor:
         DICOM 바이트 데이터에서 전처리 (Orthanc API에서 직접 받을 때 사용)
 
         Args:
-            t1_bytes: T1 DICOM 바이트 데이터 리스트
+            t1_bytes: T1 DICOM 바이트 데이터 리스트 (또는 open()을 제공하는 ArchiveMember)
             t1ce_bytes: T1CE DICOM 바이트 데이터 리스트
             t2_bytes: T2 DICOM 바이트 데이터 리스트
             flair_bytes: FLAIR DICOM 바이트 데이터 리스트
@@ -616,60 +892,25 @@ class M1Preprocessor:
         timer = Timer(name="DICOM Preprocessing (bytes)", verbose=verbose)
         timer.start()
 
-        # Load each modality from bytes
-        t1_vol, t1_spacing = load_dicom_from_bytes(t1_bytes)
-        timer.step(f"Load T1 ({len(t1_bytes)} slices)")
-
-        t1ce_vol, t1ce_spacing = load_dicom_from_bytes(t1ce_bytes)
-        timer.step(f"Load T1CE ({len(t1ce_bytes)} slices)")
-
-        t2_vol, t2_spacing = load_dicom_from_bytes(t2_bytes)
-        timer.step(f"Load T2 ({len(t2_bytes)} slices)")
-
-        flair_vol, flair_spacing = load_dicom_from_bytes(flair_bytes)
-        timer.step(f"Load FLAIR ({len(flair_bytes)} slices)")
-
-        # Use T1 spacing as reference
-        spacing = t1_spacing
-
-        # Resample to 1mm isotropic if needed
-        if spacing != self.target_spacing:
-            t1_vol = resample_volume(t1_vol, spacing, self.target_spacing)
-            t1ce_vol = resample_volume(t1ce_vol, t1ce_spacing, self.target_spacing)
-            t2_vol = resample_volume(t2_vol, t2_spacing, self.target_spacing)
-            flair_vol = resample_volume(flair_vol, flair_spacing, self.target_spacing)
-            timer.step(f"Resample to 1mm isotropic (from {spacing})")
-        else:
-            timer.step("Spacing already 1mm (skip resample)")
-
-        # Apply RAS orientation (flip X and Y axes to match NIfTI preprocessing)
-        # Original NIfTI has affine with negative X, Y (LPS -> RAS requires flip)
-        # DICOM data needs same transformation for consistency
-        t1_vol = np.flip(t1_vol, axis=(0, 1)).copy()
-        t1ce_vol = np.flip(t1ce_vol, axis=(0, 1)).copy()
-        t2_vol = np.flip(t2_vol, axis=(0, 1)).copy()
-        flair_vol = np.flip(flair_vol, axis=(0, 1)).copy()
-        timer.step("Apply RAS orientation (flip X, Y)")
-
-        # Stack to 4-channel tensor (C, H, W, D) - same as MONAI output format
-        # DICOM loads as (H, W, D), keep same order and add channel dim
-        t1_tensor = torch.from_numpy(t1_vol).unsqueeze(0)
-        t1ce_tensor = torch.from_numpy(t1ce_vol).unsqueeze(0)
-        t2_tensor = torch.from_numpy(t2_vol).unsqueeze(0)
-        flair_tensor = torch.from_numpy(flair_vol).unsqueeze(0)
-
-        image_4ch = torch.cat([t1_tensor, t1ce_tensor, t2_tensor, flair_tensor], dim=0)
-        timer.step(f"Stack 4-channel tensor {tuple(image_4ch.shape)}")
-
-        # Get foreground bbox
-        bbox = get_foreground_bbox(image_4ch, margin=5)
-        timer.step(f"Calculate foreground bbox: {bbox}")
-
-        # Crop and resize
-        image_tensor = apply_crop_and_resize(
-            image_4ch, bbox, self.target_size, mode='trilinear'
+        # Load each modality from bytes (4개 모달리티 동시 디코딩)
+        volumes = load_modalities_parallel({
+            'T1': t1_bytes,
+            'T1CE': t1ce_bytes,
+            'T2': t2_bytes,
+            'FLAIR': flair_bytes,
+        }, timer=timer)
+        t1_vol, t1_spacing = volumes['T1']
+        t1ce_vol, t1ce_spacing = volumes['T1CE']
+        t2_vol, t2_spacing = volumes['T2']
+        flair_vol, flair_spacing = volumes['FLAIR']
+        timer.step("Load 4 modalities (wall time)")
+
+        # Resample(1mm) + RAS flip + foreground crop + resize(128³)
+        image_tensor, bbox, original_shape = self._resample_crop_resize(
+            [t1_vol, t1ce_vol, t2_vol, flair_vol],
+            [t1_spacing, t1ce_spacing, t2_spacing, flair_spacing],
+            timer,
         )
-        timer.step(f"Crop & resize to {self.target_size}")
 
         # Normalize each channel separately (0-1)
         image_tensor = normalize_channels_separately(image_tensor)
@@ -679,7 +920,7 @@ class M1Preprocessor:
         timing_summary = timer.summary()
 
         # Calculate slice mapping info for verification
-        original_shape = tuple(image_4ch.shape[1:])  # (H, W, D) after RAS flip
+        # original_shape: (H, W, D) after resample + RAS flip
         slice_mapping = self._calculate_slice_mapping(
             original_shape=original_shape,
             bbox=bbox,
@@ -831,7 +1072,7 @@ class M1Preprocessor:
             raise ImportError("pydicom is required for DICOM processing")
 
         if not seg_bytes:
-            print("[GT Preprocess] No segmentation bytes provided")
+            logger.debug("[GT Preprocess] No segmentation bytes provided")
             return None
 
         timer = Timer(name="GT Preprocessing", verbose=verbose)
@@ -842,7 +1083,7 @@ class M1Preprocessor:
             seg_vol, seg_spacing = load_dicom_from_bytes(seg_bytes)
             timer.step(f"Load SEG ({len(seg_bytes)} slices)")
 
-            print(f"[GT Preprocess] Loaded GT shape: {seg_vol.shape}, spacing: {seg_spacing}")
+            logger.debug("[GT Preprocess] Loaded GT shape: %s, spacing: %s", seg_vol.shape, seg_spacing)
 
             # Resample to 1mm isotropic if needed
             if seg_spacing != self.target_spacing:
@@ -862,7 +1103,7 @@ class M1Preprocessor:
             seg_vol = np.flip(seg_vol, axis=(0, 1)).copy()
             timer.step("Apply RAS orientation (flip X, Y)")
 
-            print(f"[GT Preprocess] After orientation: {seg_vol.shape}")
+            logger.debug("[GT Preprocess] After orientation: %s", seg_vol.shape)
 
             # Convert to tensor and add channel dim
             seg_tensor = torch.from_numpy(seg_vol.astype(np.float32)).unsqueeze(0)
@@ -875,7 +1116,7 @@ class M1Preprocessor:
             else:
                 timer.step("No bbox (skip crop)")
 
-            print(f"[GT Preprocess] After crop: {tuple(seg_tensor.shape)}")
+            logger.debug("[GT Preprocess] After crop: %s", tuple(seg_tensor.shape))
 
             # Resize to target size using nearest neighbor (for labels)
             if MONAI_AVAILABLE:
@@ -894,7 +1135,7 @@ class M1Preprocessor:
 
             # Check unique values before conversion
             unique_vals = np.unique(seg_result)
-            print(f"[GT Preprocess] Raw unique values: {unique_vals}")
+            logger.debug("[GT Preprocess] Raw unique values: %s", unique_vals)
 
             # Handle different label formats:
             # 1. BraTS format: 0, 1, 2, 4 -> 0, 1, 2, 3
@@ -916,7 +1157,7 @@ class M1Preprocessor:
                     else:
                         label_map[val] = min(i, 3)
 
-                print(f"[GT Preprocess] uint16 label mapping: {label_map}")
+                logger.debug("[GT Preprocess] uint16 label mapping: %s", label_map)
                 seg_mapped = np.zeros_like(seg_result, dtype=np.uint8)
                 for old_val, new_val in label_map.items():
                     seg_mapped[seg_result == old_val] = new_val
@@ -934,19 +1175,17 @@ class M1Preprocessor:
 
             timer.step("Convert labels to standard format")
 
-            # Print label distribution
-            unique_labels, counts = np.unique(seg_result, return_counts=True)
-            label_info = {int(l): int(c) for l, c in zip(unique_labels, counts)}
-            print(f"[GT Preprocess] Label distribution: {label_info}")
+            # Label distribution (DEBUG일 때만 계산)
+            logger.debug("[GT Preprocess] Label distribution: %s", lazy(lambda: {
+                int(l): int(c) for l, c in zip(*np.unique(seg_result, return_counts=True))
+            }))
 
             timer.summary()
 
             return seg_result
 
         except Exception as e:
-            print(f"[GT Preprocess] Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[GT Preprocess] Error: %s", e)
             return None
 
 
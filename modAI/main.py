@@ -9,12 +9,13 @@ import os
 # OpenMP 중복 라이브러리 허용 (PyTorch 관련)
 os.environ['KMP_DUPLICATE_LIB_OK'] = 'TRUE'
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import torch
 
 from config import settings
+from utils.metrics import render_latest
 
 
 # 전역 모델 저장소
@@ -112,6 +113,13 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics (단계별 latency histogram)"""
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
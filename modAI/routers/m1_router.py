@@ -47,6 +47,7 @@ async def start_m1_inference(request: M1InferenceRequest):
                 'ocs_id': request.ocs_id,
                 'callback_url': request.callback_url,
                 'mode': request.mode,
+                'debug': request.debug,
                 'series_ids': request.series_ids,
             },
             queue='m1_queue'
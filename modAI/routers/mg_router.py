@@ -46,6 +46,7 @@ async def start_mg_inference(request: MGInferenceRequest):
                 'csv_content': request.csv_content,  # 파일 경로 대신 내용 전달
                 'callback_url': request.callback_url,
                 'mode': request.mode,
+                'debug': request.debug,
             },
             queue='mg_queue'  # MG는 mg_queue 사용
         )
@@ -38,6 +38,7 @@ async def start_mm_inference(request: MMInferenceRequest):
                 'patient_id': request.patient_id,
                 'callback_url': request.callback_url,
                 'mode': request.mode,
+                'debug': request.debug,
                 'mri_features': request.mri_features,
                 'gene_features': request.gene_features,
                 'protein_data': request.protein_data,
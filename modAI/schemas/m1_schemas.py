@@ -14,6 +14,7 @@ class M1InferenceRequest(BaseModel):
     ocs_id: Optional[int] = Field(default=None, description="OCS ID")
     callback_url: str = Field(..., description="Django 콜백 URL")
     mode: str = Field(default="manual", description="추론 모드: manual / auto")
+    debug: bool = Field(default=False, description="이 job만 DEBUG 로그 출력 (텐서 값 포함)")
 
 
 class M1InferenceResponse(BaseModel):
@@ -15,6 +15,7 @@ class MGInferenceRequest(BaseModel):
     csv_content: str = Field(..., description="Gene Expression CSV 파일 내용")
     callback_url: str = Field(..., description="Django 콜백 URL")
     mode: str = Field(default="manual", description="추론 모드: manual / auto")
+    debug: bool = Field(default=False, description="이 job만 DEBUG 로그 출력 (텐서 값 포함)")
 
 
 class MGInferenceResponse(BaseModel):
@@ -0,0 +1,191 @@
+"""
+Model Export / Backend Accuracy Report
+
+M1/MG/MM 모델을 int8 / compile / torchscript backend로 변환해 fp32(eager) 출력과 비교
+- 고정 seed 합성 입력으로 출력별 max/mean abs 차이, M1 segmentation label 일치율 측정
+- 첫 호출(compile 포함) / 평균 추론 시간 측정
+- torchscript(M1 분류 head), int8 변환 모듈은 --out 디렉토리에 저장
+- 결과: <out>/backend_report.json
+
+사용법 (modAI 디렉토리에서):
+    python scripts/export_models.py --models M1,MG,MM --backends int8,compile,torchscript
+"""
+import sys
+import copy
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import torch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from services.model_registry import MODEL_SPECS
+from services.model_backends import apply_backend, export_variant, output_delta, time_call
+
+M1_HEADS = ('grade_head', 'idh_head', 'mgmt_head', 'survival_head')
+
+
+# ============================================================
+# 모델별 합성 입력 / forward
+# ============================================================
+
+def _m1_forward(service, inputs):
+    x = inputs['image']
+    if not hasattr(service.model, 'swinViT'):
+        pooled = service.model(x)
+        return {name: getattr(service.cls_heads, name)(pooled) for name in M1_HEADS}
+
+    hidden_states = service.model.swinViT(x, service.model.normalize)
+    pooled = service._pool_hidden_states(hidden_states, x.size(0))
+    outputs = {name: getattr(service.cls_heads, name)(pooled) for name in M1_HEADS}
+    outputs['segmentation'] = service._decode(x, hidden_states)
+    return outputs
+
+
+def _m1_inputs(service, size: int):
+    generator = torch.Generator().manual_seed(0)
+    image = torch.randn(1, 4, size, size, size, generator=generator)
+    return {'image': image.to(service.device)}
+
+
+def _mg_forward(service, inputs):
+    return service.model(inputs['expr'], inputs['deg'])
+
+
+def _mg_inputs(service, size: int):
+    generator = torch.Generator().manual_seed(0)
+    expr = torch.randn(1, service.n_genes, generator=generator)
+    deg = torch.randn(1, service.n_deg_clusters, generator=generator)
+    return {'expr': expr.to(service.device), 'deg': deg.to(service.device)}
+
+
+def _mm_forward(service, inputs):
+    return service.model(
+        mri_features=inputs['mri'],
+        gene_features=inputs['gene'],
+        protein_features=inputs['protein'],
+    )
+
+
+def _mm_inputs(service, size: int):
+    generator = torch.Generator().manual_seed(0)
+    protein_dim = service.model.protein_proj[0].in_features
+    return {
+        'mri': torch.randn(1, 768, generator=generator).to(service.device),
+        'gene': torch.randn(1, 64, generator=generator).to(service.device),
+        'protein': torch.randn(1, protein_dim, generator=generator).to(service.device),
+    }
+
+
+RUNNERS = {
+    'M1': (_m1_inputs, _m1_forward),
+    'MG': (_mg_inputs, _mg_forward),
+    'MM': (_mm_inputs, _mm_forward),
+}
+
+
+def _apply(code: str, service, backend: str) -> None:
+    if code == 'M1':
+        service._apply_inference_backend(backend)
+    else:
+        service.model = apply_backend(service.model, backend, service.device, name=code)
+
+
+def _export(code: str, service, backend: str, out_dir: Path) -> list:
+    exported = []
+    if code == 'M1' and backend == 'torchscript':
+        for name in M1_HEADS:
+            path = export_variant(getattr(service.cls_heads, name), backend, out_dir / f"m1_{name}_torchscript.pt")
+            if path:
+                exported.append(str(path))
+    else:
+        path = export_variant(service.model, backend, out_dir / f"{code.lower()}_{backend}.pt")
+        if path:
+            exported.append(str(path))
+    return exported
+
+
+def _seg_agreement(reference, candidate):
+    if not isinstance(reference, dict) or 'segmentation' not in reference:
+        return None
+    ref = torch.argmax(reference['segmentation'], dim=1)
+    cand = torch.argmax(candidate['segmentation'], dim=1)
+    return float((ref == cand).float().mean())
+
+
+def evaluate_model(code: str, backends: list, out_dir: Path, m1_size: int, repeats: int) -> dict:
+    """fp32 기준 출력 / 시간 측정 후 backend별 차이 비교"""
+    factory, _ = MODEL_SPECS[code]
+    make_inputs, forward = RUNNERS[code]
+
+    # 기준 모델은 항상 eager(fp32)로 로드
+    setattr(settings, f"{code}_INFERENCE_BACKEND", 'eager')
+    reference_service = factory()
+    reference_service.load_model()
+
+    inputs = make_inputs(reference_service, m1_size)
+    reference = time_call(lambda: forward(reference_service, inputs), repeats)
+    report = {'fp32': {'first_ms': reference['first_ms'], 'avg_ms': reference['avg_ms']}}
+    print(f"[Export] {code} fp32: {reference['avg_ms']}ms")
+
+    for backend in backends:
+        service = copy.deepcopy(reference_service)
+        try:
+            _apply(code, service, backend)
+            timed = time_call(lambda: forward(service, inputs), repeats)
+        except Exception as e:
+            print(f"[Export] {code} {backend} failed: {e}")
+            report[backend] = {'error': str(e)}
+            continue
+
+        entry = {
+            'first_ms': timed['first_ms'],
+            'avg_ms': timed['avg_ms'],
+            'speedup': round(reference['avg_ms'] / timed['avg_ms'], 2) if timed['avg_ms'] else None,
+            'delta': output_delta(reference['output'], timed['output']),
+            'exported': _export(code, service, backend, out_dir),
+        }
+        agreement = _seg_agreement(reference['output'], timed['output'])
+        if agreement is not None:
+            entry['segmentation_label_agreement'] = agreement
+
+        report[backend] = entry
+        print(f"[Export] {code} {backend}: {timed['avg_ms']}ms (x{entry['speedup']})")
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export model backends and report accuracy delta vs fp32")
+    parser.add_argument('--models', default='M1,MG,MM')
+    parser.add_argument('--backends', default='int8,compile,torchscript')
+    parser.add_argument('--out', default=str(Path(settings.MODEL_DIR) / 'exported'))
+    parser.add_argument('--m1-size', type=int, default=128, help='M1 합성 입력 한 변 (32의 배수)')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    backends = [b.strip().lower() for b in args.backends.split(',') if b.strip()]
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'torch_version': torch.__version__,
+        'num_threads': torch.get_num_threads(),
+        'm1_input_size': args.m1_size,
+        'models': {},
+    }
+    with torch.no_grad():
+        for code in [c.strip().upper() for c in args.models.split(',') if c.strip()]:
+            report['models'][code] = evaluate_model(code, backends, out_dir, args.m1_size, args.repeats)
+
+    report_path = out_dir / 'backend_report.json'
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"[Export] Report written to {report_path}")
+
+
+if __name__ == '__main__':
+    main()
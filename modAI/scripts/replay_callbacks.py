@@ -0,0 +1,72 @@
+"""
+Callback Outbox Replay
+
+전송에 실패해 outbox에 남은 Django callback을 재전송 (추론 재실행 없음)
+- Django가 2xx로 응답한 항목만 outbox에서 삭제
+- 다른 워커가 전송 중인 항목(lock)은 건너뜀
+- non-retryable 4xx 항목은 dead-letter에 있으므로 --dead로 확인, 원인 수정 후 --requeue
+
+사용법 (modAI 디렉토리에서 - outbox volume이 마운트된 컨테이너 안에서 실행):
+    docker compose -f docker/docker-compose.fastapi.yml exec fastapi-celery python scripts/replay_callbacks.py --list
+
+    python scripts/replay_callbacks.py --list
+    python scripts/replay_callbacks.py                    # 전체 재전송
+    python scripts/replay_callbacks.py --job-id ai_req_0001 --attempts 3
+    python scripts/replay_callbacks.py --discard <entry_id>
+    python scripts/replay_callbacks.py --dead
+    python scripts/replay_callbacks.py --requeue <entry_id>
+"""
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.callback_dispatcher import callback_dispatcher
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay undelivered Django callbacks from the outbox")
+    parser.add_argument('--list', action='store_true', help='outbox 항목만 출력')
+    parser.add_argument('--job-id', default=None)
+    parser.add_argument('--attempts', type=int, default=1, help='항목당 시도 횟수 (backoff 포함)')
+    parser.add_argument('--discard', metavar='ENTRY_ID', help='항목 삭제 (Django에서 수동 처리한 경우)')
+    parser.add_argument('--dead', action='store_true', help='dead-letter 항목만 출력')
+    parser.add_argument('--requeue', metavar='ENTRY_ID', help='dead-letter 항목을 outbox로 되돌림')
+    args = parser.parse_args()
+
+    if args.requeue:
+        moved = callback_dispatcher.requeue(args.requeue)
+        print(f"[Replay] {'Requeued' if moved else 'Not found'}: {args.requeue}")
+        return 0 if moved else 1
+
+    if args.dead:
+        entries = callback_dispatcher.dead_letters(args.job_id)
+        print(f"[Replay] Dead-letter: {callback_dispatcher.dead_letter_dir} ({len(entries)} entries)")
+        for meta in entries:
+            print(f"  {meta['entry_id']}  {meta.get('model', ''):<3} {meta['job_id']:<20} "
+                  f"dead_at={meta.get('dead_at')} last_error={meta.get('last_error')}")
+        return 0
+
+    if args.discard:
+        removed = callback_dispatcher.discard(args.discard)
+        print(f"[Replay] {'Discarded' if removed else 'Not found'}: {args.discard}")
+        return 0 if removed else 1
+
+    entries = callback_dispatcher.pending(args.job_id)
+    print(f"[Replay] Outbox: {callback_dispatcher.outbox_dir} ({len(entries)} pending)")
+    for meta in entries:
+        lock = " [locked]" if meta.get('locked') else ""
+        print(f"  {meta['entry_id']}  {meta.get('model', ''):<3} {meta['job_id']:<20} "
+              f"attempts={meta.get('attempts', 0)} last_error={meta.get('last_error')}{lock}")
+
+    if args.list or not entries:
+        return 0
+
+    stats = callback_dispatcher.replay(job_id=args.job_id, attempts=args.attempts)
+    print(f"[Replay] delivered={stats['delivered']} failed={stats['failed']} skipped={stats['skipped']}")
+    return 0 if stats['failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+M1 Batch Executor
+
+동시에 들어온 M1 job들을 모아 SwinUNETR forward를 batch 1회로 실행
+- 첫 요청 후 최대 M1_BATCH_MAX_WAIT_MS 동안, 최대 M1_BATCH_MAX_SIZE개까지 수집
+- model_registry의 M1 서비스로 predict_batch() 실행 후 job별 Future로 결과 반환
+- 같은 프로세스에서 task가 동시에 실행되어야 batch가 형성됨
+  (예: celery -A celery_app worker --pool=threads --concurrency=4 -Q m1_queue)
+- 제출한 task의 job_id / debug 모드를 항목과 함께 넘겨 batch 스레드에서 job log context로 복원
+"""
+import sys
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from services.model_registry import model_registry
+from utils.log import current_job_id, get_logger, job_context, job_debug_enabled
+
+logger = get_logger("m1_batcher")
+
+
+class M1BatchExecutor:
+    """M1 micro-batching executor (프로세스당 백그라운드 스레드 1개)"""
+
+    def __init__(self, max_batch_size: Optional[int] = None, max_wait_ms: Optional[int] = None):
+        self.max_batch_size = max_batch_size or settings.M1_BATCH_MAX_SIZE
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else settings.M1_BATCH_MAX_WAIT_MS
+        # (전처리 결과, Future, job_id, debug)
+        self._queue: "queue.Queue[Tuple[dict, Future, Optional[str], bool]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="m1-batcher", daemon=True)
+                self._thread.start()
+
+    def submit(self, preprocessed: dict) -> Future:
+        """전처리 결과를 batch 대기열에 추가 (호출한 task의 job log context 포함)"""
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((preprocessed, future, current_job_id(), job_debug_enabled()))
+        return future
+
+    def infer(self, preprocessed: dict, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """submit() 후 결과 대기 - predict_with_segmentation()과 같은 결과 반환"""
+        return self.submit(preprocessed).result(timeout=timeout)
+
+    def _collect(self) -> List[Tuple[dict, Future, Optional[str], bool]]:
+        """첫 요청을 기다린 뒤 wait window 동안 최대 max_batch_size개 수집"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            items = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not items:
+                continue
+
+            # batch 안의 job들 context로 실행 - [job=a,b] prefix, 하나라도 debug면 DEBUG 로그
+            job_ids = ",".join(job_id for _, _, job_id, _ in items if job_id) or None
+            with job_context(job_ids, debug=any(debug for *_, debug in items)):
+                self._run_batch(items)
+
+    def _run_batch(self, items: List[Tuple[dict, Future, Optional[str], bool]]) -> None:
+        logger.info("[M1Batcher] Running batch of %d job(s)", len(items))
+        try:
+            service = model_registry.get('M1')
+            with model_registry.track_inference('M1'):
+                results = service.predict_batch([preprocessed for preprocessed, *_ in items])
+        except Exception as e:
+            logger.exception("[M1Batcher] Batch failed: %s", e)
+            for _, future, *_ in items:
+                future.set_exception(e)
+            return
+
+        for (_, future, *_), result in zip(items, results):
+            future.set_result(result)
+
+
+_batcher: Optional[M1BatchExecutor] = None
+_batcher_lock = threading.Lock()
+
+
+def get_m1_batcher() -> Optional[M1BatchExecutor]:
+    """M1_BATCH_MAX_SIZE > 1이면 프로세스 전역 executor 반환, 아니면 None (batch 비활성)"""
+    global _batcher
+    if settings.M1_BATCH_MAX_SIZE <= 1:
+        return None
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = M1BatchExecutor()
+        return _batcher
@@ -11,7 +11,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import time
 import logging
 
@@ -19,8 +19,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import settings
 from inference.m1_preprocess import M1Preprocessor
+from services.model_backends import apply_backend, get_backend
+from utils.log import get_logger, lazy, tensor_stats
 
-logger = logging.getLogger(__name__)
+logger = get_logger("m1_service")
+
+# SwinUNETR(feature_size=48) fp32 추론 시 입력 voxel당 peak 메모리 대략치
+# (activation + skip connection 포함, 가중치 제외) - ROI 자동 선택에 사용
+SEG_PEAK_BYTES_PER_VOXEL = 2048
+# sliding window ROI 후보 (SwinUNETR 입력은 32의 배수여야 함)
+SW_ROI_CANDIDATES = (128, 96, 64)
 
 
 class M1InferenceService:
@@ -52,23 +60,19 @@ class M1InferenceService:
     def load_model(self) -> None:
         """모델 로드 - SwinUNETR backbone + Classification heads"""
         if self.model is not None:
-            print("[M1Service] Model already loaded, skipping...")
+            logger.debug("[M1Service] Model already loaded, skipping...")
             return
 
-        print("=" * 60)
-        print("[M1Service] Loading M1 model...")
-        print(f"  Backbone weights: {settings.M1_SEG_WEIGHTS_PATH}")
-        print(f"  Classification weights: {settings.M1_WEIGHTS_PATH}")
-        print(f"  Device: {self.device}")
-        print(f"  Backbone exists: {Path(settings.M1_SEG_WEIGHTS_PATH).exists()}")
-        print(f"  Classification exists: {Path(settings.M1_WEIGHTS_PATH).exists()}")
+        logger.info("[M1Service] Loading M1 model (device=%s)", self.device)
+        logger.info("[M1Service] Backbone weights: %s (exists=%s)",
+                    settings.M1_SEG_WEIGHTS_PATH, Path(settings.M1_SEG_WEIGHTS_PATH).exists())
+        logger.info("[M1Service] Classification weights: %s (exists=%s)",
+                    settings.M1_WEIGHTS_PATH, Path(settings.M1_WEIGHTS_PATH).exists())
 
         try:
-            print("[M1Service] Importing MONAI SwinUNETR...")
             from monai.networks.nets import SwinUNETR
 
             # Create SwinUNETR model
-            print("[M1Service] Creating SwinUNETR model...")
             self.model = SwinUNETR(
                 in_channels=4,
                 out_channels=4,
@@ -77,23 +81,24 @@ class M1InferenceService:
                 spatial_dims=3,
             )
             self.encoder_dim = 768  # 48 * 16
-            print(f"[M1Service] SwinUNETR created, encoder_dim={self.encoder_dim}")
+            logger.debug("[M1Service] SwinUNETR created, encoder_dim=%d", self.encoder_dim)
 
             # Load backbone weights from M1_Seg_separate_best.pth
             seg_weights_path = settings.M1_SEG_WEIGHTS_PATH
             if Path(seg_weights_path).exists():
-                print(f"[M1Service] Loading backbone weights from {seg_weights_path}...")
+                logger.info("[M1Service] Loading backbone weights from %s", seg_weights_path)
                 checkpoint = torch.load(
                     seg_weights_path, map_location=self.device, weights_only=False
                 )
-                print(f"[M1Service] Checkpoint keys: {list(checkpoint.keys()) if isinstance(checkpoint, dict) else 'raw_state_dict'}")
+                logger.debug("[M1Service] Checkpoint keys: %s",
+                             lazy(lambda: list(checkpoint.keys()) if isinstance(checkpoint, dict) else 'raw_state_dict'))
 
                 if 'model_state_dict' in checkpoint:
                     state_dict = checkpoint['model_state_dict']
                 else:
                     state_dict = checkpoint
 
-                print(f"[M1Service] State dict has {len(state_dict)} keys")
+                logger.debug("[M1Service] State dict has %d keys", len(state_dict))
 
                 # Filter out incompatible keys
                 model_dict = self.model.state_dict()
@@ -109,30 +114,46 @@ class M1InferenceService:
                         skipped_keys.append(f"{k}: not in model")
 
                 self.model.load_state_dict(filtered_dict, strict=False)
-                print(f"[M1Service] Loaded {len(filtered_dict)}/{len(model_dict)} backbone layers")
+                logger.info("[M1Service] Loaded %d/%d backbone layers", len(filtered_dict), len(model_dict))
                 if skipped_keys and len(skipped_keys) < 10:
-                    print(f"[M1Service] Skipped keys: {skipped_keys}")
+                    logger.debug("[M1Service] Skipped keys: %s", skipped_keys)
             else:
-                print(f"[M1Service] WARNING: Backbone weights not found: {seg_weights_path}")
-
-            print("[M1Service] MONAI SwinUNETR backbone loaded successfully")
+                logger.warning("[M1Service] Backbone weights not found: %s", seg_weights_path)
 
         except Exception as e:
-            import traceback
-            print(f"[M1Service] ERROR: MONAI SwinUNETR failed: {e}")
-            print(traceback.format_exc())
-            print("[M1Service] Using simplified model for demo")
+            logger.exception("[M1Service] MONAI SwinUNETR failed: %s", e)
+            logger.warning("[M1Service] Using simplified model for demo")
             self.model = self._create_simple_model()
             self.encoder_dim = self.model.feature_dim
 
         # Add classification heads
-        print("[M1Service] Adding classification heads...")
         self._add_classification_heads()
 
         self.model.to(self.device)
         self.model.eval()
-        print(f"[M1Service] M1 model ready on {self.device}!")
-        print("=" * 60)
+        self.cls_heads.eval()
+        self._apply_inference_backend(get_backend('M1'))
+        logger.info("[M1Service] M1 model ready on %s", self.device)
+
+    def _apply_inference_backend(self, backend: str) -> None:
+        """M1_INFERENCE_BACKEND 적용 (분류 head + SwinUNETR backbone)"""
+        if backend == 'eager':
+            return
+
+        # 분류 head는 Sequential이라 torchscript 가능
+        for head_name in ('grade_head', 'idh_head', 'mgmt_head', 'survival_head'):
+            head = getattr(self.cls_heads, head_name)
+            setattr(self.cls_heads, head_name, apply_backend(
+                head, backend, self.device, scriptable=True, name=f"M1.{head_name}"
+            ))
+
+        if not hasattr(self.model, 'swinViT'):
+            return
+        if backend == 'compile':
+            # fused 경로는 swinViT / decoder 블록을 직접 호출하므로 encoder 서브모듈을 compile
+            self.model.swinViT = apply_backend(self.model.swinViT, backend, self.device, name="M1.swinViT")
+        else:
+            self.model = apply_backend(self.model, backend, self.device, name="M1.SwinUNETR")
 
     def _create_simple_model(self) -> nn.Module:
         """Create a simple model for demo (fallback)"""
@@ -209,13 +230,14 @@ class M1InferenceService:
         """Load trained classification head weights from m1_best.pth"""
         cls_weights_path = settings.M1_WEIGHTS_PATH
         if not Path(cls_weights_path).exists():
-            print(f"[M1Service] WARNING: Classification weights not found: {cls_weights_path}")
+            logger.warning("[M1Service] Classification weights not found: %s", cls_weights_path)
             return
 
         try:
-            print(f"[M1Service] Loading classification weights from {cls_weights_path}...")
+            logger.info("[M1Service] Loading classification weights from %s", cls_weights_path)
             checkpoint = torch.load(cls_weights_path, map_location=self.device, weights_only=False)
-            print(f"[M1Service] Classification checkpoint keys: {list(checkpoint.keys()) if isinstance(checkpoint, dict) else 'raw_state_dict'}")
+            logger.debug("[M1Service] Classification checkpoint keys: %s",
+                         lazy(lambda: list(checkpoint.keys()) if isinstance(checkpoint, dict) else 'raw_state_dict'))
 
             state_dict = checkpoint.get('model_state_dict', checkpoint)
 
@@ -225,65 +247,92 @@ class M1InferenceService:
                 if any(head in k for head in ['grade_head', 'idh_head', 'mgmt_head', 'survival_head']):
                     cls_state_dict[k] = v
 
-            print(f"[M1Service] Found {len(cls_state_dict)} classification head layers:")
-            for k in cls_state_dict.keys():
-                print(f"  - {k}: {cls_state_dict[k].shape}")
+            logger.info("[M1Service] Found %d classification head layers", len(cls_state_dict))
+            logger.debug("[M1Service] Classification head shapes: %s",
+                         lazy(lambda: {k: tuple(v.shape) for k, v in cls_state_dict.items()}))
 
             # Load into cls_heads
             self.cls_heads.load_state_dict(cls_state_dict, strict=False)
-            print(f"[M1Service] Classification heads loaded successfully")
 
-            # Print metrics if available
+            # Log metrics if available
             if 'metrics' in checkpoint:
                 metrics = checkpoint['metrics']
-                print(f"[M1Service] Model metrics:")
-                print(f"  - Grade Acc: {metrics.get('grade_acc', 0):.1%}")
-                print(f"  - IDH AUC: {metrics.get('idh_auc', 0):.3f}")
-                print(f"  - MGMT AUC: {metrics.get('mgmt_auc', 0):.3f}")
+                logger.info("[M1Service] Model metrics: Grade Acc=%.1f%%, IDH AUC=%.3f, MGMT AUC=%.3f",
+                            metrics.get('grade_acc', 0) * 100, metrics.get('idh_auc', 0), metrics.get('mgmt_auc', 0))
 
             if 'best_score' in checkpoint:
-                print(f"[M1Service] Best score: {checkpoint['best_score']:.4f}")
+                logger.info("[M1Service] Best score: %.4f", checkpoint['best_score'])
 
         except Exception as e:
-            import traceback
-            print(f"[M1Service] ERROR: Failed to load classification weights: {e}")
-            print(traceback.format_exc())
+            logger.exception("[M1Service] Failed to load classification weights: %s", e)
 
     def _get_features(self, input_tensor: torch.Tensor) -> torch.Tensor:
         """Extract features from model using swinViT"""
-        print(f"[M1Service] Extracting features from input shape: {input_tensor.shape}")
+        logger.debug("[M1Service] Extracting features from input shape: %s", input_tensor.shape)
 
         with torch.no_grad():
             if hasattr(self.model, 'swinViT'):
                 # MONAI SwinUNETR - get hidden states from swinViT
-                print("[M1Service] Using swinViT for feature extraction...")
                 hidden_states = self.model.swinViT(input_tensor, self.model.normalize)
-                print(f"[M1Service] Got {len(hidden_states)} hidden states")
-                for i, hs in enumerate(hidden_states):
-                    print(f"  - hidden_state[{i}]: {hs.shape}")
-
-                features = hidden_states[-1]  # Last hidden state
-                print(f"[M1Service] Using last hidden state: {features.shape}")
-
-                pooled = F.adaptive_avg_pool3d(features, 1).view(input_tensor.size(0), -1)
-                print(f"[M1Service] After pooling: {pooled.shape}")
+                pooled = self._pool_hidden_states(hidden_states, input_tensor.size(0))
 
             elif hasattr(self.model, 'encoder'):
                 # Simple model
-                print("[M1Service] Using simple encoder...")
                 pooled = self.model(input_tensor)
             else:
-                print("[M1Service] WARNING: No valid encoder found, using random features!")
+                logger.warning("[M1Service] No valid encoder found, using random features!")
                 pooled = torch.randn(input_tensor.size(0), self.encoder_dim).to(self.device)
 
             # Adjust dimension if needed
             if pooled.shape[-1] != self.encoder_dim:
-                print(f"[M1Service] Adjusting feature dim from {pooled.shape[-1]} to {self.encoder_dim}")
+                logger.debug("[M1Service] Adjusting feature dim from %d to %d", pooled.shape[-1], self.encoder_dim)
                 pooled = F.adaptive_avg_pool1d(pooled.unsqueeze(1), self.encoder_dim).squeeze(1)
 
-        print(f"[M1Service] Final features shape: {pooled.shape}")
+        logger.debug("[M1Service] Final features shape: %s", pooled.shape)
         return pooled
 
+    def _pool_hidden_states(self, hidden_states, batch_size: int) -> torch.Tensor:
+        """swinViT hidden states → pooled encoder features (B, encoder_dim)"""
+        logger.debug("[M1Service] Hidden state shapes: %s",
+                     lazy(lambda: [tuple(hs.shape) for hs in hidden_states]))
+
+        features = hidden_states[-1]  # Last hidden state
+        pooled = F.adaptive_avg_pool3d(features, 1).view(batch_size, -1)
+
+        if pooled.shape[-1] != self.encoder_dim:
+            logger.debug("[M1Service] Adjusting feature dim from %d to %d", pooled.shape[-1], self.encoder_dim)
+            pooled = F.adaptive_avg_pool1d(pooled.unsqueeze(1), self.encoder_dim).squeeze(1)
+        return pooled
+
+    def _decode(self, input_tensor: torch.Tensor, hidden_states) -> torch.Tensor:
+        """
+        SwinUNETR decoder 경로만 실행 (swinViT hidden states 재사용)
+
+        MONAI SwinUNETR.forward()에서 swinViT 호출을 제외한 부분과 동일합니다.
+        """
+        m = self.model
+        enc0 = m.encoder1(input_tensor)
+        enc1 = m.encoder2(hidden_states[0])
+        enc2 = m.encoder3(hidden_states[1])
+        enc3 = m.encoder4(hidden_states[2])
+        dec4 = m.encoder10(hidden_states[4])
+        dec3 = m.decoder5(dec4, hidden_states[3])
+        dec2 = m.decoder4(dec3, enc3)
+        dec1 = m.decoder3(dec2, enc2)
+        dec0 = m.decoder2(dec1, enc1)
+        out = m.decoder1(dec0, enc0)
+        return m.out(out)
+
+    def _prepare_input(self, preprocessed: dict) -> torch.Tensor:
+        """전처리 결과 → (1, 4, D, H, W) 텐서 (device 이동)"""
+        image_tensor = preprocessed['image']
+        logger.debug("[M1Service] Input tensor shape: %s, dtype: %s", image_tensor.shape, image_tensor.dtype)
+
+        if image_tensor.ndim == 4:
+            image_tensor = image_tensor.unsqueeze(0)
+
+        return image_tensor.to(self.device)
+
     def preprocess(
         self,
         dicom_data: Dict[str, List[bytes]],
@@ -299,7 +348,7 @@ class M1InferenceService:
         Returns:
             전처리된 데이터 dict with 'image' tensor (4, 128, 128, 128)
         """
-        logger.info(f"Preprocessing DICOM data for patient: {patient_id}")
+        logger.info("[M1Service] Preprocessing DICOM data for patient: %s", patient_id)
 
         return self.preprocessor.preprocess_from_dicom_bytes(
             t1_bytes=dicom_data['T1'],
@@ -307,7 +356,8 @@ class M1InferenceService:
             t2_bytes=dicom_data['T2'],
             flair_bytes=dicom_data['FLAIR'],
             patient_id=patient_id,
-            verbose=True,
+            # 단계별 타이밍 출력은 DEBUG에서만 (timing dict는 항상 결과에 포함)
+            verbose=logger.isEnabledFor(logging.DEBUG),
         )
 
     def predict(self, preprocessed: dict) -> Dict[str, Any]:
@@ -320,35 +370,38 @@ class M1InferenceService:
         Returns:
             추론 결과 dict
         """
-        print("[M1Service] Starting prediction...")
         self.load_model()
         start_time = time.time()
 
         # 이미지 텐서 추출 및 device 이동
-        image_tensor = preprocessed['image']
-        print(f"[M1Service] Input tensor shape: {image_tensor.shape}, dtype: {image_tensor.dtype}")
-
-        if image_tensor.ndim == 4:
-            image_tensor = image_tensor.unsqueeze(0)
-            print(f"[M1Service] Added batch dim: {image_tensor.shape}")
-
-        image_tensor = image_tensor.to(self.device)
-        print(f"[M1Service] Tensor moved to {self.device}")
+        image_tensor = self._prepare_input(preprocessed)
 
         # Extract features from encoder
-        print("[M1Service] Extracting encoder features...")
         pooled = self._get_features(image_tensor)
 
+        results = self._classify(pooled)
+
+        processing_time = (time.time() - start_time) * 1000
+        results["processing_time_ms"] = processing_time
+
+        logger.info("[M1Service] Prediction complete in %.1fms: Grade=%s, IDH=%s, MGMT=%s",
+                    processing_time, results['grade']['predicted_class'],
+                    results['idh']['predicted_class'], results['mgmt']['predicted_class'])
+
+        return results
+
+    def _classify(self, pooled: torch.Tensor) -> Dict[str, Any]:
+        """
+        Pooled encoder features → 분류 결과 (grade/idh/mgmt/survival + encoder_features)
+        """
         results = {}
 
-        print("[M1Service] Running classification heads...")
         with torch.no_grad():
             # Grade
-            print("[M1Service] Grade prediction...")
             grade_logits = self.cls_heads.grade_head(pooled)
-            print(f"  - grade_logits: {grade_logits}")
+            # 텐서는 %s 인자로만 전달 - DEBUG가 아니면 문자열 변환(device sync) 없음
+            logger.debug("[M1Service] grade_logits: %s", grade_logits)
             grade_probs = F.softmax(grade_logits, dim=-1).squeeze().cpu().numpy()
-            print(f"  - grade_probs: {grade_probs}")
             grade_idx = int(np.argmax(grade_probs))
             results["grade"] = {
                 "predicted_class": self.GRADE_CLASSES[grade_idx],
@@ -357,42 +410,33 @@ class M1InferenceService:
                     cls: float(p) for cls, p in zip(self.GRADE_CLASSES, grade_probs)
                 }
             }
-            print(f"  - Grade result: {results['grade']['predicted_class']} ({results['grade']['probability']:.2%})")
 
             # IDH
-            print("[M1Service] IDH prediction...")
             idh_logit = self.cls_heads.idh_head(pooled)
-            print(f"  - idh_logit: {idh_logit}")
+            logger.debug("[M1Service] idh_logit: %s", idh_logit)
             idh_prob = torch.sigmoid(idh_logit).item()
-            print(f"  - idh_prob (mutant): {idh_prob:.4f}")
             results["idh"] = {
                 "predicted_class": "Mutant" if idh_prob > 0.5 else "Wildtype",
                 "probability": float(idh_prob if idh_prob > 0.5 else 1 - idh_prob),
                 "mutant_probability": float(idh_prob),
                 "wildtype_probability": float(1 - idh_prob),
             }
-            print(f"  - IDH result: {results['idh']['predicted_class']}")
 
             # MGMT
-            print("[M1Service] MGMT prediction...")
             mgmt_logit = self.cls_heads.mgmt_head(pooled)
-            print(f"  - mgmt_logit: {mgmt_logit}")
+            logger.debug("[M1Service] mgmt_logit: %s", mgmt_logit)
             mgmt_prob = torch.sigmoid(mgmt_logit).item()
-            print(f"  - mgmt_prob (methylated): {mgmt_prob:.4f}")
             results["mgmt"] = {
                 "predicted_class": "Methylated" if mgmt_prob > 0.5 else "Unmethylated",
                 "probability": float(mgmt_prob if mgmt_prob > 0.5 else 1 - mgmt_prob),
                 "methylated_probability": float(mgmt_prob),
                 "unmethylated_probability": float(1 - mgmt_prob),
             }
-            print(f"  - MGMT result: {results['mgmt']['predicted_class']}")
 
             # Survival
-            print("[M1Service] Survival prediction...")
             surv_out = self.cls_heads.survival_head(pooled)
-            print(f"  - surv_out: {surv_out}")
+            logger.debug("[M1Service] surv_out: %s", surv_out)
             risk_score = torch.sigmoid(surv_out).item()
-            print(f"  - risk_score: {risk_score:.4f}")
             risk_group = "High" if risk_score > 0.7 else ("Medium" if risk_score > 0.3 else "Low")
 
             # Confidence calculation
@@ -419,48 +463,103 @@ class M1InferenceService:
                 "interpretation": interpretation,
                 "model_cindex": self.MODEL_CINDEX,
             }
-            print(f"  - Survival result: {risk_group} (risk_score={risk_score:.4f})")
+            logger.debug("[M1Service] Classification: grade=%s (%.2f), idh=%.4f, mgmt=%.4f, risk=%.4f (%s)",
+                         results['grade']['predicted_class'], results['grade']['probability'],
+                         idh_prob, mgmt_prob, risk_score, risk_group)
 
         # Encoder features for MM model (768-dim)
-        print("[M1Service] Extracting encoder features for MM model...")
+        logger.debug("[M1Service] Encoder features: %s", lazy(lambda: tensor_stats(pooled)))
         encoder_features = pooled.squeeze().cpu().numpy()
-        print(f"  - Encoder features shape: {encoder_features.shape}")
-        print(f"  - Encoder features stats: min={encoder_features.min():.4f}, max={encoder_features.max():.4f}, mean={encoder_features.mean():.4f}")
         results["encoder_features"] = encoder_features.tolist()
 
-        processing_time = (time.time() - start_time) * 1000
-        results["processing_time_ms"] = processing_time
+        return results
 
-        print(f"[M1Service] Prediction complete in {processing_time:.1f}ms")
-        print(f"[M1Service] Results: Grade={results['grade']['predicted_class']}, IDH={results['idh']['predicted_class']}, MGMT={results['mgmt']['predicted_class']}")
+    def _segmentation_plan(self, spatial_shape) -> Tuple[str, Optional[Tuple[int, int, int]]]:
+        """
+        segmentation 실행 방식 결정
 
-        return results
+        Returns:
+            ('whole', None) 또는 ('sliding_window', roi_size)
+        """
+        mode = settings.M1_SEG_MODE.lower()
+        if mode not in ('auto', 'sliding_window'):
+            return 'whole', None
+
+        spatial_shape = tuple(int(d) for d in spatial_shape)
+        budget_bytes = settings.M1_SEG_MEMORY_BUDGET_MB * 1024 ** 2
+        whole_bytes = int(np.prod(spatial_shape)) * SEG_PEAK_BYTES_PER_VOXEL
+
+        if mode == 'auto' and (budget_bytes <= 0 or whole_bytes <= budget_bytes):
+            return 'whole', None
+
+        if budget_bytes > 0:
+            # budget 안에 들어가는 가장 큰 ROI (sw_batch_size개 타일 동시 실행 고려)
+            roi = SW_ROI_CANDIDATES[-1]
+            for candidate in SW_ROI_CANDIDATES:
+                tile_bytes = candidate ** 3 * SEG_PEAK_BYTES_PER_VOXEL * settings.M1_SW_BATCH_SIZE
+                if tile_bytes <= budget_bytes:
+                    roi = candidate
+                    break
+        else:
+            roi = settings.M1_SW_ROI_SIZE
+
+        roi_size = tuple(min(roi, d) for d in spatial_shape)
+        return 'sliding_window', roi_size
+
+    def _sliding_window_segment(self, input_tensor: torch.Tensor, roi_size: Tuple[int, int, int]) -> torch.Tensor:
+        """ROI 타일 단위 SwinUNETR 추론 후 overlap 영역 blending → (B, 4, D, H, W) logits"""
+        from monai.inferers import sliding_window_inference
+
+        logger.info("[M1Service] Running sliding-window segmentation: roi=%s, overlap=%s, blend=%s",
+                    roi_size, settings.M1_SW_OVERLAP, settings.M1_SW_BLEND_MODE)
+        return sliding_window_inference(
+            inputs=input_tensor,
+            roi_size=roi_size,
+            sw_batch_size=settings.M1_SW_BATCH_SIZE,
+            predictor=self.model,
+            overlap=settings.M1_SW_OVERLAP,
+            mode=settings.M1_SW_BLEND_MODE,
+        )
 
-    def _run_segmentation(self, input_tensor: torch.Tensor) -> Dict[str, Any]:
+    def _run_segmentation(
+        self,
+        input_tensor: torch.Tensor,
+        hidden_states=None,
+        seg_output: Optional[torch.Tensor] = None,
+    ) -> Dict[str, Any]:
         """
         Run segmentation and return mask + volumes + MRI for visualization
 
         Args:
             input_tensor: 전처리된 MRI 입력 (1, 4, 128, 128, 128)
+            hidden_states: swinViT hidden states (주어지면 encoder 재계산 없이 decoder만 실행)
+            seg_output: 이미 계산된 segmentation logits (1, 4, D, H, W) - batch 추론에서 사용
 
         Returns:
             세그멘테이션 결과 dict (volumes, mask, visualization)
         """
-        print("[M1Service] Running segmentation...")
+        seg_plan = ('whole', None)
+        if seg_output is None and hasattr(self.model, 'swinViT'):
+            seg_plan = self._segmentation_plan(input_tensor.shape[2:])
 
         with torch.no_grad():
+            if seg_plan[0] == 'sliding_window':
+                seg_output = self._sliding_window_segment(input_tensor, seg_plan[1])
+
+            if seg_output is not None:
+                seg_mask = torch.argmax(seg_output, dim=1).squeeze().cpu().numpy()  # (D, H, W)
+            elif hidden_states is not None and hasattr(self.model, 'swinViT'):
+                # Fused path - encoder 결과 재사용, decoder만 실행
+                seg_output = self._decode(input_tensor, hidden_states)  # (1, 4, D, H, W)
+                seg_mask = torch.argmax(seg_output, dim=1).squeeze().cpu().numpy()  # (D, H, W)
             # Run full model forward pass for segmentation
-            if hasattr(self.model, 'swinViT'):
+            elif hasattr(self.model, 'swinViT'):
                 # MONAI SwinUNETR - full forward pass
-                print("[M1Service] Running SwinUNETR forward pass for segmentation...")
                 seg_output = self.model(input_tensor)  # (1, 4, D, H, W)
-                print(f"[M1Service] Segmentation output shape: {seg_output.shape}")
-
                 seg_mask = torch.argmax(seg_output, dim=1).squeeze().cpu().numpy()  # (D, H, W)
-                print(f"[M1Service] Segmentation mask shape: {seg_mask.shape}")
             else:
                 # Simple model - create dummy segmentation
-                print("[M1Service] Using simple model - creating dummy segmentation")
+                logger.warning("[M1Service] Using simple model - creating dummy segmentation")
                 seg_mask = np.zeros((128, 128, 128), dtype=np.uint8)
 
             # Calculate tumor volumes (assuming 1mm isotropic voxels)
@@ -476,12 +575,8 @@ class M1InferenceService:
             # Tumor Core (TC) = NCR + ET
             tc_volume = ncr_volume + et_volume
 
-            print(f"[M1Service] Tumor volumes:")
-            print(f"  - Whole Tumor (WT): {wt_volume:.2f} ml")
-            print(f"  - Tumor Core (TC): {tc_volume:.2f} ml")
-            print(f"  - Enhancing Tumor (ET): {et_volume:.2f} ml")
-            print(f"  - Necrotic Core (NCR): {ncr_volume:.2f} ml")
-            print(f"  - Edema (ED): {ed_volume:.2f} ml")
+            logger.debug("[M1Service] Tumor volumes: WT=%.2fml, TC=%.2fml, ET=%.2fml, NCR=%.2fml, ED=%.2fml",
+                         wt_volume, tc_volume, et_volume, ncr_volume, ed_volume)
 
             # Get MRI data for visualization (T1CE channel, normalized 0-1)
             mri_data = input_tensor[0, 1].cpu().numpy()  # T1CE channel (index 1)
@@ -499,7 +594,7 @@ class M1InferenceService:
             # Count unique labels
             unique_labels, label_counts = np.unique(seg_mask, return_counts=True)
             label_info = {int(label): int(count) for label, count in zip(unique_labels, label_counts)}
-            print(f"[M1Service] Label distribution: {label_info}")
+            logger.debug("[M1Service] Segmentation mask %s, label distribution: %s", seg_mask.shape, label_info)
 
             return {
                 "wt_volume": round(wt_volume, 2),
@@ -510,37 +605,138 @@ class M1InferenceService:
                 "mask_shape": list(seg_mask.shape),
                 "label_distribution": label_info,
                 "visualization": {
-                    "mri": mri_down.round(3).tolist(),  # 128x128x128 MRI
-                    "prediction": seg_down.tolist(),  # 128x128x128 segmentation
+                    # NumPy 배열 그대로 유지 (list 변환 없이 npz로 직렬화)
+                    "mri": mri_down.round(3).astype(np.float32),  # 128x128x128 MRI
+                    "prediction": seg_down,  # 128x128x128 segmentation (uint8)
                     "shape": list(seg_down.shape),
                 }
             }
 
-    def predict_with_segmentation(self, preprocessed: dict) -> Dict[str, Any]:
+    def predict_fused(self, preprocessed: dict) -> Tuple[Dict[str, Any], torch.Tensor]:
+        """
+        M1 모델 추론 - swinViT encoder 1회 실행
+
+        encoder hidden states를 분류 head(pooled 768-dim)와 segmentation decoder가
+        함께 사용하므로 predict() + _run_segmentation() 대비 encoder 연산이 절반입니다.
+
+        Returns:
+            (predict() 결과 + 'segmentation', device 위의 입력 텐서)
+        """
+        self.load_model()
+        start_time = time.time()
+
+        image_tensor = self._prepare_input(preprocessed)
+
+        if not hasattr(self.model, 'swinViT'):
+            # Simple model - 공유할 hidden states 없음
+            results = self._classify(self._get_features(image_tensor))
+            results["segmentation"] = self._run_segmentation(image_tensor)
+        else:
+            with torch.no_grad():
+                stage_start = time.perf_counter()
+                hidden_states = self.model.swinViT(image_tensor, self.model.normalize)
+                pooled = self._pool_hidden_states(hidden_states, image_tensor.size(0))
+                encoder_seconds = time.perf_counter() - stage_start
+
+            results = self._classify(pooled)
+            if self._segmentation_plan(image_tensor.shape[2:])[0] == 'sliding_window':
+                # 타일 추론은 hidden states를 쓰지 않으므로 먼저 해제 (peak 메모리 감소)
+                hidden_states = None
+            stage_start = time.perf_counter()
+            results["segmentation"] = self._run_segmentation(image_tensor, hidden_states)
+            del hidden_states
+            # 단계별 소요 시간 (초) - metrics 기록용
+            results["stage_timing"] = {
+                "encoder_forward": encoder_seconds,
+                "segmentation": time.perf_counter() - stage_start,
+            }
+
+        processing_time = (time.time() - start_time) * 1000
+        results["processing_time_ms"] = processing_time
+        logger.info("[M1Service] Fused prediction complete in %.1fms", processing_time)
+
+        return results, image_tensor
+
+    def predict_with_segmentation(self, preprocessed: dict, fused: bool = True) -> Dict[str, Any]:
         """
         M1 모델 추론 (분류 + 세그멘테이션)
 
         Args:
             preprocessed: 전처리된 데이터 dict with 'image' tensor
+            fused: True면 encoder 1회 실행 (기본), False면 분류/세그멘테이션 각각 forward
 
         Returns:
             추론 결과 dict (분류 결과 + 세그멘테이션 결과 + 전처리된 MRI)
         """
-        print("[M1Service] Starting prediction with segmentation...")
+        if fused:
+            results, image_tensor = self.predict_fused(preprocessed)
+        else:
+            # 먼저 분류 결과 얻기
+            results = self.predict(preprocessed)
+
+            # 세그멘테이션 실행
+            image_tensor = preprocessed['image']
+            if image_tensor.ndim == 4:
+                image_tensor = image_tensor.unsqueeze(0)
+            image_tensor = image_tensor.to(self.device)
+
+            seg_result = self._run_segmentation(image_tensor)
+            results["segmentation"] = seg_result
+
+        self._attach_preprocessed_mri(results, image_tensor)
+        return results
 
-        # 먼저 분류 결과 얻기
-        results = self.predict(preprocessed)
+    def predict_batch(self, preprocessed_list: List[dict]) -> List[Dict[str, Any]]:
+        """
+        여러 job의 M1 추론을 batch 1회로 실행 (분류 + 세그멘테이션)
 
-        # 세그멘테이션 실행
-        image_tensor = preprocessed['image']
-        if image_tensor.ndim == 4:
-            image_tensor = image_tensor.unsqueeze(0)
-        image_tensor = image_tensor.to(self.device)
+        swinViT encoder와 decoder를 (B, 4, D, H, W) 입력으로 한 번씩 실행하고
+        결과를 job별로 나눠 predict_with_segmentation()과 같은 형태로 반환합니다.
+        """
+        self.load_model()
+        tiled = settings.M1_SEG_MODE.lower() != 'whole'
+        if len(preprocessed_list) == 1 or tiled or not hasattr(self.model, 'swinViT'):
+            # 타일 추론은 batch 메모리 이점이 없으므로 job별 실행
+            return [self.predict_with_segmentation(p) for p in preprocessed_list]
+
+        batch_size = len(preprocessed_list)
+        start_time = time.time()
+
+        batch_tensor = torch.cat([self._prepare_input(p) for p in preprocessed_list], dim=0)
+
+        with torch.no_grad():
+            stage_start = time.perf_counter()
+            hidden_states = self.model.swinViT(batch_tensor, self.model.normalize)
+            pooled = self._pool_hidden_states(hidden_states, batch_size)
+            encoder_seconds = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            seg_output = self._decode(batch_tensor, hidden_states)
+            decode_seconds = time.perf_counter() - stage_start
+        del hidden_states
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info("[M1Service] Batched forward (batch=%d) complete in %.1fms (%.1fms/job)",
+                    batch_size, elapsed_ms, elapsed_ms / batch_size)
+
+        batch_results = []
+        for i in range(batch_size):
+            image_tensor = batch_tensor[i:i + 1]
+            results = self._classify(pooled[i:i + 1])
+            results["segmentation"] = self._run_segmentation(image_tensor, seg_output=seg_output[i:i + 1])
+            results["processing_time_ms"] = elapsed_ms / batch_size
+            results["batch_size"] = batch_size
+            results["stage_timing"] = {
+                "encoder_forward": encoder_seconds / batch_size,
+                "segmentation": decode_seconds / batch_size,
+            }
+            self._attach_preprocessed_mri(results, image_tensor)
+            batch_results.append(results)
 
-        seg_result = self._run_segmentation(image_tensor)
-        results["segmentation"] = seg_result
+        return batch_results
 
-        # 전처리된 MRI 4채널 저장 (T1, T1CE, T2, FLAIR) - SegMRIViewer용
+    def _attach_preprocessed_mri(self, results: Dict[str, Any], image_tensor: torch.Tensor) -> None:
+        """전처리된 MRI 4채널 (T1, T1CE, T2, FLAIR)을 결과에 추가 - SegMRIViewer용"""
         # image_tensor shape: (1, 4, 128, 128, 128)
         mri_numpy = image_tensor[0].cpu().numpy()  # (4, 128, 128, 128)
 
@@ -558,10 +754,54 @@ class M1InferenceService:
 
         preprocessed_mri['shape'] = list(mri_numpy.shape[1:])  # [128, 128, 128]
         results["preprocessed_mri"] = preprocessed_mri
-        print(f"[M1Service] Preprocessed MRI saved: shape={mri_numpy.shape}")
+        logger.debug("[M1Service] Preprocessed MRI attached: shape=%s", mri_numpy.shape)
 
-        print("[M1Service] Prediction with segmentation complete!")
-        return results
+    def compare_segmentation_modes(
+        self,
+        preprocessed: dict,
+        roi_size: Optional[Tuple[int, int, int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        sliding window 결과를 전체 볼륨 결과와 비교 (정확도 검증용)
+
+        Returns:
+            label별 Dice, voxel 일치율, 각 모드 소요 시간(ms)
+        """
+        self.load_model()
+        if not hasattr(self.model, 'swinViT'):
+            raise RuntimeError("SwinUNETR가 로드되지 않아 비교할 수 없습니다")
+
+        input_tensor = self._prepare_input(preprocessed)
+        if roi_size is None:
+            roi_size = tuple(min(settings.M1_SW_ROI_SIZE, d) for d in input_tensor.shape[2:])
+
+        with torch.no_grad():
+            start = time.time()
+            whole = torch.argmax(self.model(input_tensor), dim=1).squeeze().cpu().numpy()
+            whole_ms = (time.time() - start) * 1000
+
+            start = time.time()
+            tiled_logits = self._sliding_window_segment(input_tensor, roi_size)
+            tiled = torch.argmax(tiled_logits, dim=1).squeeze().cpu().numpy()
+            tiled_ms = (time.time() - start) * 1000
+
+        dice = {}
+        for label in (1, 2, 3):
+            a, b = whole == label, tiled == label
+            denom = int(a.sum() + b.sum())
+            dice[int(label)] = 1.0 if denom == 0 else float(2 * np.logical_and(a, b).sum() / denom)
+
+        report = {
+            "roi_size": list(roi_size),
+            "overlap": settings.M1_SW_OVERLAP,
+            "blend_mode": settings.M1_SW_BLEND_MODE,
+            "dice": dice,
+            "voxel_agreement": float((whole == tiled).mean()),
+            "whole_ms": round(whole_ms, 1),
+            "sliding_window_ms": round(tiled_ms, 1),
+        }
+        logger.info("[M1Service] Segmentation mode comparison: %s", report)
+        return report
 
     def get_encoder_features(self, preprocessed: dict) -> np.ndarray:
         """
@@ -625,7 +865,7 @@ class M1InferenceService:
             "job_id": job_id,
         }
 
-        print(f"[M1Service] Saving results to: {output_dir}")
+        logger.info("[M1Service] Saving results to: %s", output_dir)
 
         # ============================================================
         # 1. Classification 결과 저장 (JSON)
@@ -646,7 +886,6 @@ class M1InferenceService:
             json.dump(classification_data, f, ensure_ascii=False, indent=2)
 
         saved_files["m1_classification"] = cls_filename
-        print(f"  - Classification saved: {cls_filename}")
 
         # ============================================================
         # 2. Encoder Features 저장 (NPZ)
@@ -662,7 +901,6 @@ class M1InferenceService:
                 dtype=str(encoder_features.dtype)
             )
             saved_files["m1_encoder_features"] = feat_filename
-            print(f"  - Encoder features saved: {feat_filename} (shape={encoder_features.shape})")
 
         # ============================================================
         # 3. Segmentation 결과 저장 (NPZ)
@@ -682,7 +920,7 @@ class M1InferenceService:
             # 세그멘테이션 마스크
             seg_mask = None
             if "visualization" in seg and "prediction" in seg["visualization"]:
-                seg_mask = np.array(seg["visualization"]["prediction"], dtype=np.uint8)
+                seg_mask = np.asarray(seg["visualization"]["prediction"], dtype=np.uint8)
 
             seg_filename = "m1_segmentation.npz"
             segmentation_file = output_dir / seg_filename
@@ -701,14 +939,11 @@ class M1InferenceService:
 
             # MRI 데이터도 함께 저장 (SegMRIViewer용)
             if "visualization" in seg and "mri" in seg["visualization"]:
-                mri_data = np.array(seg["visualization"]["mri"], dtype=np.float32)
+                mri_data = np.asarray(seg["visualization"]["mri"], dtype=np.float32)
                 save_data["mri"] = mri_data
-                print(f"    MRI data saved: shape={mri_data.shape}")
 
             np.savez_compressed(segmentation_file, **save_data)
             saved_files["m1_segmentation"] = seg_filename
-            print(f"  - Segmentation saved: {seg_filename}")
-            print(f"    Volumes: WT={volumes['wt_volume']:.2f}ml, TC={volumes['tc_volume']:.2f}ml, ET={volumes['et_volume']:.2f}ml")
 
         # ============================================================
         # 4. Preprocessed MRI 저장 (NPZ) - SegMRIViewer용
@@ -728,32 +963,34 @@ class M1InferenceService:
 
             np.savez_compressed(mri_file, **mri_save_data)
             saved_files["m1_preprocessed_mri"] = mri_filename
-            print(f"  - Preprocessed MRI saved: {mri_filename}")
-            print(f"    Channels: T1, T1CE, T2, FLAIR (shape={mri.get('shape')})")
 
-        print(f"[M1Service] All results saved successfully!")
-        print(f"[M1Service] Files: {saved_files}")
+        logger.info("[M1Service] Results saved: %s", saved_files)
 
         return saved_files
 
-    def prepare_results_for_callback(
+    def prepare_result_files(
         self,
         result: Dict[str, Any],
         job_id: str,
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, bytes]:
         """
-        추론 결과를 callback용 파일 내용으로 변환 (CDSS_STORAGE 직접 저장 없음)
+        추론 결과를 파일 바이트로 변환 (CDSS_STORAGE 직접 저장 없음)
+
+        배열은 NumPy 그대로 npz로 직렬화하며 base64 인코딩을 하지 않습니다.
+        multipart callback의 파일 파트로 바로 전송할 수 있습니다.
 
         Returns:
-            {filename: {content: base64/json, type: 'json'|'npz'}}
+            {filename: bytes}
         """
         import json
-        import base64
         from io import BytesIO
 
-        files_data = {}
+        def _npz_bytes(**arrays) -> bytes:
+            buffer = BytesIO()
+            np.savez_compressed(buffer, **arrays)
+            return buffer.getvalue()
 
-        print(f"[M1Service] Preparing results for callback: job_id={job_id}")
+        files = {}
 
         # ============================================================
         # 1. Classification 결과 (JSON)
@@ -768,99 +1005,88 @@ class M1InferenceService:
             "processing_time_ms": result.get("processing_time_ms"),
         }
 
-        files_data["m1_classification.json"] = {
-            "content": json.dumps(classification_data, ensure_ascii=False, indent=2),
-            "type": "json"
-        }
-        print(f"  - Classification prepared")
+        files["m1_classification.json"] = json.dumps(
+            classification_data, ensure_ascii=False, indent=2
+        ).encode("utf-8")
 
         # ============================================================
-        # 2. Encoder Features (NPZ -> base64)
+        # 2. Encoder Features (NPZ)
         # ============================================================
         if "encoder_features" in result:
-            encoder_features = np.array(result["encoder_features"])
-            buffer = BytesIO()
-            np.savez_compressed(
-                buffer,
+            encoder_features = np.asarray(result["encoder_features"])
+            files["m1_encoder_features.npz"] = _npz_bytes(
                 features=encoder_features,
                 shape=encoder_features.shape,
                 dtype=str(encoder_features.dtype)
             )
-            buffer.seek(0)
-            files_data["m1_encoder_features.npz"] = {
-                "content": base64.b64encode(buffer.read()).decode('ascii'),
-                "type": "npz"
-            }
-            print(f"  - Encoder features prepared (shape={encoder_features.shape})")
 
         # ============================================================
-        # 3. Segmentation 결과 (NPZ -> base64)
+        # 3. Segmentation 결과 (NPZ)
         # ============================================================
         if "segmentation" in result:
             seg = result["segmentation"]
 
-            volumes = {
+            save_data = {
                 "wt_volume": seg.get("wt_volume", 0),
                 "tc_volume": seg.get("tc_volume", 0),
                 "et_volume": seg.get("et_volume", 0),
                 "ncr_volume": seg.get("ncr_volume", 0),
                 "ed_volume": seg.get("ed_volume", 0),
-            }
-
-            seg_mask = None
-            if "visualization" in seg and "prediction" in seg["visualization"]:
-                seg_mask = np.array(seg["visualization"]["prediction"], dtype=np.uint8)
-
-            save_data = {
-                "wt_volume": volumes["wt_volume"],
-                "tc_volume": volumes["tc_volume"],
-                "et_volume": volumes["et_volume"],
-                "ncr_volume": volumes["ncr_volume"],
-                "ed_volume": volumes["ed_volume"],
                 "mask_shape": np.array(seg.get("mask_shape", [128, 128, 128])),
                 "label_distribution": np.array(list(seg.get("label_distribution", {}).items())),
             }
 
-            if seg_mask is not None:
-                save_data["mask"] = seg_mask
+            visualization = seg.get("visualization", {})
+            if "prediction" in visualization:
+                save_data["mask"] = np.asarray(visualization["prediction"], dtype=np.uint8)
+            if "mri" in visualization:
+                save_data["mri"] = np.asarray(visualization["mri"], dtype=np.float32)
 
-            if "visualization" in seg and "mri" in seg["visualization"]:
-                mri_data = np.array(seg["visualization"]["mri"], dtype=np.float32)
-                save_data["mri"] = mri_data
-
-            buffer = BytesIO()
-            np.savez_compressed(buffer, **save_data)
-            buffer.seek(0)
-            files_data["m1_segmentation.npz"] = {
-                "content": base64.b64encode(buffer.read()).decode('ascii'),
-                "type": "npz"
-            }
-            print(f"  - Segmentation prepared")
+            files["m1_segmentation.npz"] = _npz_bytes(**save_data)
 
         # ============================================================
-        # 4. Preprocessed MRI (NPZ -> base64)
+        # 4. Preprocessed MRI (NPZ)
         # ============================================================
         if "preprocessed_mri" in result:
             mri = result["preprocessed_mri"]
-            mri_save_data = {
-                "t1": mri.get("t1"),
-                "t1ce": mri.get("t1ce"),
-                "t2": mri.get("t2"),
-                "flair": mri.get("flair"),
-                "shape": np.array(mri.get("shape", [128, 128, 128])),
-            }
+            files["m1_preprocessed_mri.npz"] = _npz_bytes(
+                t1=mri.get("t1"),
+                t1ce=mri.get("t1ce"),
+                t2=mri.get("t2"),
+                flair=mri.get("flair"),
+                shape=np.array(mri.get("shape", [128, 128, 128])),
+            )
 
-            buffer = BytesIO()
-            np.savez_compressed(buffer, **mri_save_data)
-            buffer.seek(0)
-            files_data["m1_preprocessed_mri.npz"] = {
-                "content": base64.b64encode(buffer.read()).decode('ascii'),
-                "type": "npz"
-            }
-            print(f"  - Preprocessed MRI prepared")
+        total_bytes = sum(len(v) for v in files.values())
+        logger.info("[M1Service] %d result files prepared (%.1f MB)", len(files), total_bytes / 1024 / 1024)
+
+        return files
+
+    def prepare_results_for_callback(
+        self,
+        result: Dict[str, Any],
+        job_id: str,
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        추론 결과를 JSON callback용 파일 내용으로 변환 (base64)
 
-        print(f"[M1Service] Total {len(files_data)} files prepared for callback")
+        기존 JSON callback 호환용입니다. M1 task는 prepare_result_files() +
+        multipart callback을 사용합니다.
 
+        Returns:
+            {filename: {content: base64/json, type: 'json'|'npz'}}
+        """
+        import base64
+
+        files_data = {}
+        for filename, content in self.prepare_result_files(result, job_id).items():
+            if filename.endswith(".json"):
+                files_data[filename] = {"content": content.decode("utf-8"), "type": "json"}
+            else:
+                files_data[filename] = {
+                    "content": base64.b64encode(content).decode('ascii'),
+                    "type": "npz"
+                }
         return files_data
 
     @staticmethod
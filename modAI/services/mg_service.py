@@ -20,6 +20,10 @@ import base64
 from io import BytesIO
 
 from config import settings
+from services.model_backends import apply_backend, get_backend
+from utils.log import get_logger
+
+logger = get_logger("mg_service")
 
 
 class MGInferenceService:
@@ -109,11 +113,10 @@ class MGInferenceService:
         if self.model is not None:
             return
 
-        print(f"Loading MG model from {self.weights_path}...")
+        logger.info("[MG] Loading MG model from %s", self.weights_path)
 
         if not self.weights_path.exists():
-            print(f"  Warning: Model weights not found at {self.weights_path}")
-            print(f"  Using random initialization for testing")
+            logger.warning("[MG] Model weights not found at %s, using random initialization", self.weights_path)
             gene_embeddings = torch.randn(self.n_genes, self.emb_dim)
             self.model = self._create_model(gene_embeddings)
         else:
@@ -141,11 +144,12 @@ class MGInferenceService:
             # Load state dict
             if 'model_state_dict' in checkpoint:
                 self.model.load_state_dict(checkpoint['model_state_dict'], strict=True)
-                print("  Model weights loaded successfully")
+                logger.info("[MG] Model weights loaded")
 
         self.model.to(self.device)
         self.model.eval()
-        print(f"  MG Model ready on {self.device}")
+        self.model = apply_backend(self.model, get_backend('MG'), self.device, name="MG.GeneExpressionCDSS")
+        logger.info("[MG] MG model ready on %s", self.device)
 
     def _create_model(self, gene_embeddings: torch.Tensor) -> nn.Module:
         """Create MG model architecture"""
@@ -575,5 +579,5 @@ class MGInferenceService:
             return visualizations
 
         except Exception as e:
-            print(f"Visualization error: {e}")
+            logger.warning("[MG] Visualization error: %s", e)
             return {}
@@ -16,6 +16,11 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import time
 
+from services.model_backends import apply_backend, get_backend
+from utils.log import get_logger
+
+logger = get_logger("mm_service")
+
 
 class MMModel(nn.Module):
     """MM Multimodal Model (Clinical 제외) - 학습 스크립트와 동일 구조"""
@@ -221,7 +226,7 @@ class MMInferenceService:
         if self.model is not None:
             return
 
-        print(f"[MM] Loading MM model (v2.0 - no clinical)...")
+        logger.info("[MM] Loading MM model (v2.0 - no clinical)")
 
         # Default protein dim
         protein_dim = 203
@@ -245,7 +250,7 @@ class MMInferenceService:
 
             # Load weights
             self.model.load_state_dict(state_dict, strict=False)
-            print(f"[MM] Model weights loaded (protein_dim={protein_dim})")
+            logger.info("[MM] Model weights loaded (protein_dim=%d)", protein_dim)
 
             # Load C-Index
             if isinstance(checkpoint, dict) and 'metrics' in checkpoint:
@@ -255,14 +260,15 @@ class MMInferenceService:
                     self.survival_cindex = checkpoint['metrics']['survival_cindex']
 
                 if self.survival_cindex:
-                    print(f"[MM] Survival C-Index: {self.survival_cindex:.4f}")
+                    logger.info("[MM] Survival C-Index: %.4f", self.survival_cindex)
         else:
             # Create model with default dimensions
             self.model = MMModel(protein_dim=protein_dim)
-            print(f"[MM] Warning: MM model weights not found. Using random weights.")
+            logger.warning("[MM] MM model weights not found, using random weights")
 
         self.model.to(self.device)
         self.model.eval()
+        self.model = apply_backend(self.model, get_backend('MM'), self.device, name="MMModel")
 
     def parse_protein_csv(self, csv_content: str) -> List[float]:
         """
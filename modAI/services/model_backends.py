@@ -0,0 +1,160 @@
+"""
+Model Inference Backends
+
+모델별 CPU 추론 backend 변환 (config: M1/MG/MM_INFERENCE_BACKEND)
+- eager: fp32 PyTorch (기본)
+- int8: nn.Linear dynamic quantization (CPU 전용)
+- compile: torch.compile
+- torchscript: torch.jit.script - 고정 입력/텐서 출력 모듈만 (M1 분류 head)
+  dict 출력 / Optional 입력을 쓰는 SwinUNETR, GeneExpressionCDSS, MMModel은 eager 유지
+
+지원하지 않는 조합은 경고 후 원본 모듈을 그대로 반환합니다.
+"""
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import torch
+import torch.nn as nn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from utils.log import get_logger
+
+logger = get_logger("model_backends")
+
+BACKENDS = ('eager', 'int8', 'compile', 'torchscript')
+
+
+def get_backend(code: str) -> str:
+    """모델 코드별 설정된 backend"""
+    backend = getattr(settings, f"{code.upper()}_INFERENCE_BACKEND", 'eager').lower()
+    if backend not in BACKENDS:
+        logger.warning("[ModelBackends] Unknown backend '%s' for %s, using eager", backend, code)
+        return 'eager'
+    return backend
+
+
+def apply_backend(
+    module: nn.Module,
+    backend: str,
+    device: str = 'cpu',
+    scriptable: bool = False,
+    name: str = 'model',
+) -> nn.Module:
+    """
+    eval 상태의 모듈을 backend에 맞게 변환
+
+    Args:
+        module: 변환할 모듈 (eval() 호출 후)
+        backend: BACKENDS 중 하나
+        device: 모델 device (int8은 cpu에서만 적용)
+        scriptable: torch.jit.script 가능한 모듈인지 여부
+        name: 로그용 이름
+    """
+    if backend == 'eager':
+        return module
+
+    try:
+        if backend == 'int8':
+            if str(device).startswith('cuda'):
+                logger.warning("[ModelBackends] int8 dynamic quantization is CPU-only, keeping %s fp32", name)
+                return module
+            converted = torch.ao.quantization.quantize_dynamic(module, {nn.Linear}, dtype=torch.qint8)
+        elif backend == 'compile':
+            if not hasattr(torch, 'compile'):
+                logger.warning("[ModelBackends] torch.compile unavailable, keeping %s eager", name)
+                return module
+            converted = torch.compile(module, dynamic=True)
+        elif backend == 'torchscript':
+            if not scriptable:
+                logger.warning("[ModelBackends] %s is not scriptable (dict outputs / optional inputs), keeping eager", name)
+                return module
+            converted = torch.jit.script(module)
+        else:
+            return module
+    except Exception as e:
+        logger.warning("[ModelBackends] %s conversion failed for %s, keeping eager: %s", backend, name, e)
+        return module
+
+    logger.info("[ModelBackends] %s -> %s", name, backend)
+    return converted
+
+
+def export_variant(module: nn.Module, backend: str, path: Path) -> Optional[Path]:
+    """
+    변환된 모듈 저장
+
+    - torchscript: torch.jit.save (Python 코드 없이 로드 가능)
+    - int8: 모듈 전체 pickle (quantized Linear 포함)
+    - compile: 직렬화 불가 - 로드 시점에 적용되므로 저장하지 않음
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if backend == 'torchscript' and isinstance(module, torch.jit.ScriptModule):
+        torch.jit.save(module, str(path))
+    elif backend == 'int8':
+        torch.save(module, path)
+    else:
+        return None
+    return path
+
+
+# ============================================================
+# 정확도 비교 (fp32 대비)
+# ============================================================
+
+def _flatten_outputs(outputs: Any, prefix: str = '') -> Dict[str, torch.Tensor]:
+    """모델 출력(tensor / dict / tuple) → {key: tensor}"""
+    if isinstance(outputs, torch.Tensor):
+        return {prefix or 'output': outputs}
+    flat = {}
+    if isinstance(outputs, dict):
+        items = outputs.items()
+    elif isinstance(outputs, (list, tuple)):
+        items = enumerate(outputs)
+    else:
+        return flat
+    for key, value in items:
+        flat.update(_flatten_outputs(value, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def output_delta(reference: Any, candidate: Any) -> Dict[str, Dict[str, float]]:
+    """출력별 max/mean abs 차이 (shape가 다른 항목은 제외)"""
+    ref_flat = _flatten_outputs(reference)
+    cand_flat = _flatten_outputs(candidate)
+
+    delta = {}
+    for key, ref in ref_flat.items():
+        cand = cand_flat.get(key)
+        if cand is None or cand.shape != ref.shape or not ref.is_floating_point():
+            continue
+        diff = (ref.detach().float().cpu() - cand.detach().float().cpu()).abs()
+        delta[key] = {
+            'max_abs': float(diff.max()) if diff.numel() else 0.0,
+            'mean_abs': float(diff.mean()) if diff.numel() else 0.0,
+        }
+    return delta
+
+
+def time_call(fn: Callable[[], Any], repeats: int = 3) -> Dict[str, Any]:
+    """첫 호출(warm-up/compile 포함)과 이후 평균 시간(ms)"""
+    with torch.no_grad():
+        start = time.perf_counter()
+        output = fn()
+        first_ms = (time.perf_counter() - start) * 1000
+
+        elapsed = []
+        for _ in range(max(repeats, 0)):
+            start = time.perf_counter()
+            output = fn()
+            elapsed.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'output': output,
+        'first_ms': round(first_ms, 2),
+        'avg_ms': round(sum(elapsed) / len(elapsed), 2) if elapsed else round(first_ms, 2),
+    }
@@ -0,0 +1,212 @@
+"""
+Model Registry
+
+Celery worker 프로세스 단위 모델 캐시
+- M1/MG/MM 서비스를 프로세스당 한 번만 생성 (task마다 SwinUNETR 재생성 방지)
+- 모델 코드 + 가중치 파일 fingerprint(mtime/size)로 캐시 키 구성
+- 가중치 파일 변경 시 자동 hot-reload, reload()로 명시적 재로드
+- 모델 로드 시간 / 추론 시간 metrics 기록
+"""
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from utils.log import get_logger
+
+logger = get_logger("model_registry")
+
+
+# ============================================================
+# 모델 정의 (코드 → 서비스 factory / 가중치 경로)
+# ============================================================
+
+def _create_m1():
+    from services.m1_service import M1InferenceService
+    return M1InferenceService()
+
+
+def _create_mg():
+    from services.mg_service import MGInferenceService
+    return MGInferenceService()
+
+
+def _create_mm():
+    from services.mm_service import MMInferenceService
+    return MMInferenceService()
+
+
+def _m1_weights() -> List[Path]:
+    return [Path(settings.M1_SEG_WEIGHTS_PATH), Path(settings.M1_WEIGHTS_PATH)]
+
+
+def _mg_weights() -> List[Path]:
+    return [Path(settings.MODEL_DIR) / "mg_4tasks_best.pt"]
+
+
+def _mm_weights() -> List[Path]:
+    return [Path(settings.BASE_DIR) / "model" / "mm_best.pt"]
+
+
+MODEL_SPECS: Dict[str, Tuple[Callable[[], Any], Callable[[], List[Path]]]] = {
+    'M1': (_create_m1, _m1_weights),
+    'MG': (_create_mg, _mg_weights),
+    'MM': (_create_mm, _mm_weights),
+}
+
+
+def weights_fingerprint(paths: List[Path]) -> Tuple:
+    """가중치 파일 fingerprint (경로, mtime_ns, size) - 파일이 없으면 None"""
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((str(path), None, None))
+    return tuple(fingerprint)
+
+
+@dataclass
+class ModelMetrics:
+    """모델별 로드/추론 시간 통계"""
+    load_count: int = 0
+    last_load_ms: float = 0.0
+    total_load_ms: float = 0.0
+    inference_count: int = 0
+    last_inference_ms: float = 0.0
+    total_inference_ms: float = 0.0
+    loaded_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'load_count': self.load_count,
+            'last_load_ms': round(self.last_load_ms, 1),
+            'total_load_ms': round(self.total_load_ms, 1),
+            'inference_count': self.inference_count,
+            'last_inference_ms': round(self.last_inference_ms, 1),
+            'avg_inference_ms': round(
+                self.total_inference_ms / self.inference_count, 1
+            ) if self.inference_count else 0.0,
+            'loaded_at': self.loaded_at,
+        }
+
+
+@dataclass
+class _Entry:
+    service: Any
+    fingerprint: Tuple
+    metrics: ModelMetrics = field(default_factory=ModelMetrics)
+
+
+class ModelRegistry:
+    """프로세스 단위 모델 레지스트리"""
+
+    def __init__(self, specs: Dict[str, Tuple[Callable[[], Any], Callable[[], List[Path]]]] = None):
+        self._specs = specs or MODEL_SPECS
+        self._entries: Dict[str, _Entry] = {}
+        self._metrics: Dict[str, ModelMetrics] = {}
+        self._lock = threading.RLock()
+
+    def _check_code(self, code: str) -> str:
+        code = code.upper()
+        if code not in self._specs:
+            raise KeyError(f"Unknown model code: {code}")
+        return code
+
+    def _load(self, code: str, fingerprint: Tuple) -> _Entry:
+        factory, _ = self._specs[code]
+        metrics = self._metrics.setdefault(code, ModelMetrics())
+
+        start = time.perf_counter()
+        service = factory()
+        service.load_model()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        metrics.load_count += 1
+        metrics.last_load_ms = elapsed_ms
+        metrics.total_load_ms += elapsed_ms
+        metrics.loaded_at = time.time()
+        logger.info("[ModelRegistry] %s loaded in %.1fms (load #%d)", code, elapsed_ms, metrics.load_count)
+
+        entry = _Entry(service=service, fingerprint=fingerprint, metrics=metrics)
+        self._entries[code] = entry
+        return entry
+
+    def get(self, code: str) -> Any:
+        """
+        모델 서비스 반환 (필요 시 로드)
+
+        가중치 파일의 mtime/size가 캐시된 값과 다르면 재로드합니다.
+        """
+        code = self._check_code(code)
+        _, weights = self._specs[code]
+        fingerprint = weights_fingerprint(weights())
+
+        with self._lock:
+            entry = self._entries.get(code)
+            if entry is not None and entry.fingerprint == fingerprint:
+                return entry.service
+            if entry is not None:
+                logger.info("[ModelRegistry] %s weights changed, reloading...", code)
+            return self._load(code, fingerprint).service
+
+    def reload(self, code: str) -> Any:
+        """모델 강제 재로드 (hot-reload)"""
+        code = self._check_code(code)
+        _, weights = self._specs[code]
+        with self._lock:
+            self._entries.pop(code, None)
+            return self._load(code, weights_fingerprint(weights())).service
+
+    def warm_up(self, codes: List[str]) -> None:
+        """지정한 모델 미리 로드 - 실패해도 워커 기동은 계속"""
+        for code in codes:
+            try:
+                self.get(code)
+            except Exception as e:
+                logger.warning("[ModelRegistry] Warm-up failed for %s: %s", code, e)
+
+    def is_loaded(self, code: str) -> bool:
+        return self._check_code(code) in self._entries
+
+    @contextmanager
+    def track_inference(self, code: str):
+        """추론 시간 측정 context manager"""
+        code = self._check_code(code)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                metrics = self._metrics.setdefault(code, ModelMetrics())
+                metrics.inference_count += 1
+                metrics.last_inference_ms = elapsed_ms
+                metrics.total_inference_ms += elapsed_ms
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 metrics"""
+        with self._lock:
+            return {
+                code: {
+                    'loaded': code in self._entries,
+                    **metrics.to_dict(),
+                }
+                for code, metrics in self._metrics.items()
+            }
+
+
+# 프로세스 전역 레지스트리
+model_registry = ModelRegistry()
+
+
+def get_model_service(code: str) -> Any:
+    """레지스트리에서 모델 서비스 조회"""
+    return model_registry.get(code)
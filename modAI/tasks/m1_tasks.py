@@ -6,9 +6,9 @@ M1 MRI 추론을 위한 비동기 Celery task
 - 결과 파일은 callback으로 Django에 전송
 """
 import os
+import json
 import time
 import logging
-import httpx
 from pathlib import Path
 from celery import shared_task
 from celery.utils.log import get_task_logger
@@ -16,8 +16,13 @@ from celery.utils.log import get_task_logger
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from services.m1_service import M1InferenceService
+from config import settings
+from services.model_registry import model_registry
+from services.m1_batcher import get_m1_batcher
 from utils.orthanc_client import OrthancClient
+from utils.preprocess_cache import preprocess_cache
+from utils.metrics import observe_stage, record_stage_timing, record_timer_summary, track_stage
+from utils.callback_dispatcher import callback_dispatcher
 
 logger = get_task_logger(__name__)
 
@@ -61,6 +66,7 @@ def run_m1_inference(
     mode: str = 'manual',
     series_ids: list = None,
     ocs_id: int = None,
+    debug: bool = False,
 ):
     """
     M1 추론 Celery Task
@@ -78,6 +84,7 @@ def run_m1_inference(
         mode: 추론 모드 (manual/auto)
         series_ids: Orthanc Series ID 목록 (없으면 study_uid로 자동 탐색)
         ocs_id: OCS ID
+        debug: True면 이 job만 DEBUG 로그 출력 (celery_app의 job log hook에서 사용)
     """
     task_id = self.request.id
     start_time = time.time()
@@ -94,27 +101,50 @@ def run_m1_inference(
             'status': 'Orthanc에서 DICOM 데이터 로드 중...'
         })
 
-        orthanc = OrthancClient()
-        # 최적화된 Archive API 사용 (620 요청 → 4 요청)
-        dicom_data = orthanc.fetch_study_dicom_bytes_fast(study_uid, series_ids)
-
-        # 모달리티 확인
-        for mod in ['T1', 'T1CE', 'T2', 'FLAIR']:
-            count = len(dicom_data.get(mod, []))
-            logger.info(f"[M1] {mod}: {count} slices")
-            if count == 0:
-                raise ValueError(f"Missing modality: {mod}")
-
-        self.update_state(state='PROCESSING', meta={
-            'progress': 30,
-            'status': 'DICOM 데이터 로드 완료, 전처리 중...'
-        })
-
-        # ============================================================
-        # 2. 전처리
-        # ============================================================
-        service = M1InferenceService()
-        preprocessed = service.preprocess(dicom_data, patient_id)
+        service = model_registry.get('M1')
+
+        with OrthancClient() as orthanc:
+            with track_stage('M1', 'orthanc_fetch'):
+                series_map = orthanc.resolve_study_modalities(study_uid, series_ids)
+            for mod in ['T1', 'T1CE', 'T2', 'FLAIR']:
+                if mod not in series_map:
+                    raise ValueError(f"Missing modality: {mod}")
+
+            # 전처리 캐시 확인 (같은 Series/Instance 구성이면 fetch + 전처리 생략)
+            cache_key = preprocess_cache.make_key(series_map, service.preprocessor)
+            preprocessed = preprocess_cache.get(cache_key)
+
+            if preprocessed is not None:
+                logger.info(f"[M1] Preprocess cache hit: {cache_key[:12]}, skipping fetch/preprocess")
+                preprocessed['patient_id'] = patient_id
+            else:
+                # Archive 스트리밍 (ZIP은 spool 파일에 두고 DICOM member는 디코딩 시 압축 해제)
+                with track_stage('M1', 'orthanc_fetch'):
+                    if settings.ORTHANC_FETCH_STUDY_ARCHIVE:
+                        archives = orthanc.open_study_archive(series_map)
+                    else:
+                        archives = orthanc.open_modality_archives(series_map)
+
+                with archives as dicom_data:
+                    # 모달리티 확인
+                    for mod in ['T1', 'T1CE', 'T2', 'FLAIR']:
+                        count = len(dicom_data.get(mod, []))
+                        logger.info(f"[M1] {mod}: {count} slices")
+                        if count == 0:
+                            raise ValueError(f"Missing modality: {mod}")
+
+                    self.update_state(state='PROCESSING', meta={
+                        'progress': 30,
+                        'status': 'DICOM 데이터 로드 완료, 전처리 중...'
+                    })
+
+                    # ============================================================
+                    # 2. 전처리
+                    # ============================================================
+                    preprocessed = service.preprocess(dicom_data, patient_id)
+                    record_timer_summary('M1', preprocessed.get('timing'))
+
+                preprocess_cache.put(cache_key, preprocessed)
 
         logger.info(f"[M1] Preprocessing complete: shape={preprocessed['image'].shape}")
 
@@ -126,8 +156,16 @@ def run_m1_inference(
         # ============================================================
         # 3. M1 모델 추론 (분류 + 세그멘테이션)
         # ============================================================
-        result = service.predict_with_segmentation(preprocessed)
-
+        batcher = get_m1_batcher()
+        if batcher is not None:
+            # 동시에 대기 중인 다른 job과 묶어 batch forward (최대 M1_BATCH_MAX_WAIT_MS 대기)
+            result = batcher.infer(preprocessed)
+            logger.info(f"[M1] Batched inference: batch_size={result.get('batch_size', 1)}")
+        else:
+            with model_registry.track_inference('M1'):
+                result = service.predict_with_segmentation(preprocessed)
+
+        record_stage_timing('M1', result.get('stage_timing'))
         logger.info(f"[M1] Inference complete: grade={result.get('grade', {}).get('predicted_class')}")
 
         if 'segmentation' in result:
@@ -145,8 +183,9 @@ def run_m1_inference(
         processing_time = (time.time() - start_time) * 1000
         result['processing_time_ms'] = processing_time
 
-        # 파일 내용을 callback용으로 준비
-        files_data = service.prepare_results_for_callback(result, job_id)
+        # 파일 바이트 준비 (NumPy → npz, base64 인코딩 없음)
+        with track_stage('M1', 'payload_encode'):
+            files_data = service.prepare_result_files(result, job_id)
 
         logger.info(f"[M1] Files prepared for callback: {list(files_data.keys())}")
 
@@ -183,32 +222,33 @@ def run_m1_inference(
                 'label_distribution': seg.get('label_distribution', {}),
             }
 
+        # multipart/form-data: 메타데이터는 form field, 결과 파일은 바이너리 파트
         callback_data = {
             'job_id': job_id,
             'status': 'completed',
-            'result_data': callback_result,
-            'files': files_data,  # 파일 내용 포함
+            'result_data': json.dumps(callback_result, ensure_ascii=False, default=str),
         }
 
-        try:
-            resolved_callback_url = resolve_callback_url(callback_url)
-            response = httpx.post(
-                resolved_callback_url,
-                json=callback_data,
-                timeout=120.0  # NPZ 파일이 크므로 타임아웃 증가
-            )
-            response.raise_for_status()
+        # outbox에 먼저 기록 후 전송 - 실패해도 결과는 남아 replay로 재전송 (재추론 불필요)
+        callback_start = time.perf_counter()
+        delivered = callback_dispatcher.send_multipart(
+            job_id, resolve_callback_url(callback_url), callback_data, files_data, model='M1'
+        )
+        observe_stage('M1', 'callback_post', time.perf_counter() - callback_start,
+                      'success' if delivered else 'failure')
+        if delivered:
             logger.info(f"[M1] Callback sent successfully with {len(files_data)} files")
-        except httpx.HTTPError as e:
-            logger.error(f"[M1] Callback failed: {str(e)}")
-            # 콜백 실패 시 재시도하거나 에러 처리
+        else:
+            logger.error(f"[M1] Callback not delivered, result kept in outbox: job_id={job_id}")
 
         logger.info(f"[M1] Inference completed: job_id={job_id}, time={processing_time:.1f}ms")
+        logger.info(f"[M1] Model metrics: {model_registry.stats().get('M1')}")
 
         return {
             'status': 'completed',
             'job_id': job_id,
             'processing_time_ms': processing_time,
+            'callback_delivered': delivered,
         }
 
     except Exception as e:
@@ -216,16 +256,11 @@ def run_m1_inference(
 
         # Django에 실패 callback
         try:
-            resolved_callback_url = resolve_callback_url(callback_url)
-            httpx.post(
-                resolved_callback_url,
-                json={
-                    'job_id': job_id,
-                    'status': 'failed',
-                    'error_message': str(e),
-                },
-                timeout=30.0
-            )
+            callback_dispatcher.send_json(job_id, resolve_callback_url(callback_url), {
+                'job_id': job_id,
+                'status': 'failed',
+                'error_message': str(e),
+            }, model='M1')
         except Exception as callback_error:
             logger.error(f"[M1] Failed to send error callback: {str(callback_error)}")
 
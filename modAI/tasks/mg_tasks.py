@@ -8,10 +8,13 @@ Gene Expression 기반 추론 태스크
 """
 import os
 import json
+import time
 import base64
-import httpx
 import numpy as np
 from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
 
 
 def resolve_callback_url(callback_url: str) -> str:
@@ -49,7 +52,8 @@ def run_mg_inference(
     patient_id: str,
     csv_content: str,  # 파일 경로 대신 내용
     callback_url: str,
-    mode: str = 'manual'
+    mode: str = 'manual',
+    debug: bool = False,
 ):
     """
     MG 추론 Celery Task
@@ -57,8 +61,12 @@ def run_mg_inference(
     1. CSV 내용에서 gene expression 데이터 파싱
     2. 전처리 및 추론
     3. 결과를 callback으로 Django에 전송 (Django에서 저장)
+
+    debug=True면 이 job만 DEBUG 로그 출력 (celery_app의 job log hook에서 사용)
     """
-    from services.mg_service import MGInferenceService
+    from services.model_registry import model_registry
+    from utils.metrics import observe_stage, track_stage
+    from utils.callback_dispatcher import callback_dispatcher
 
     def update_progress(progress: int, status: str):
         """진행 상태 업데이트"""
@@ -81,7 +89,7 @@ def run_mg_inference(
 
         # 2. MG 서비스 초기화 및 CSV 파싱
         update_progress(20, "Initializing MG service...")
-        service = MGInferenceService()
+        service = model_registry.get('MG')
 
         update_progress(30, "Parsing gene expression data...")
         gene_data = service.load_csv_content(csv_content)  # 내용으로 직접 파싱
@@ -89,11 +97,12 @@ def run_mg_inference(
 
         # 3. 추론 수행
         update_progress(50, "Running MG inference...")
-        result = service.predict(
-            gene_expression=gene_data['gene_expression'],
-            gene_names=gene_data['gene_names'],
-            include_visualizations=True
-        )
+        with model_registry.track_inference('MG'), track_stage('MG', 'inference'):
+            result = service.predict(
+                gene_expression=gene_data['gene_expression'],
+                gene_names=gene_data['gene_names'],
+                include_visualizations=True
+            )
         print(f"  Inference complete: {result.get('processing_time_ms', 0):.1f}ms")
 
         # 4. 결과 데이터 준비 (파일로 저장하지 않고 callback에 포함)
@@ -115,6 +124,7 @@ def run_mg_inference(
         }
 
         # 5. 파일 내용 준비 (Django에서 저장할 파일들)
+        payload_start = time.perf_counter()
         files_data = {}
 
         # mg_result.json
@@ -147,6 +157,8 @@ def run_mg_inference(
                     }
             print(f"  Prepared {len(result['visualizations'])} visualizations")
 
+        observe_stage('MG', 'payload_encode', time.perf_counter() - payload_start)
+
         # 6. Django 콜백 (파일 내용 포함)
         update_progress(90, "Sending callback...")
 
@@ -160,22 +172,27 @@ def run_mg_inference(
             'files': files_data,  # 파일 내용 포함
         }
 
-        try:
-            response = httpx.post(resolved_callback_url, json=callback_data, timeout=60.0)
-            response.raise_for_status()
+        # outbox에 먼저 기록 후 전송 - 실패해도 결과는 남아 replay로 재전송
+        callback_start = time.perf_counter()
+        delivered = callback_dispatcher.send_json(job_id, resolved_callback_url, callback_data, model='MG')
+        observe_stage('MG', 'callback_post', time.perf_counter() - callback_start,
+                      'success' if delivered else 'failure')
+        if delivered:
             print(f"  Callback sent successfully with {len(files_data)} files")
-        except Exception as e:
-            print(f"  Warning: Callback failed: {e}")
+        else:
+            logger.warning(f"[MG] Callback not delivered, result kept in outbox: job_id={job_id}")
 
         update_progress(100, "Complete")
         print(f"\n{'='*60}")
         print(f"MG Inference Task Completed Successfully")
+        print(f"  Model metrics: {model_registry.stats().get('MG')}")
         print(f"{'='*60}\n")
 
         return {
             'job_id': job_id,
             'status': 'completed',
             'result': result_data,
+            'callback_delivered': delivered,
         }
 
     except Exception as e:
@@ -197,7 +214,7 @@ def run_mg_inference(
                 'status': 'failed',
                 'error_message': error_msg,
             }
-            httpx.post(resolved_callback_url, json=callback_data, timeout=10.0)
+            callback_dispatcher.send_json(job_id, resolved_callback_url, callback_data, model='MG')
         except Exception:
             pass
 
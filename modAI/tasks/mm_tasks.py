@@ -8,11 +8,12 @@ Multimodal (MRI + Gene + Protein) 추론을 위한 비동기 Celery task
 import os
 import time
 import json
-import httpx
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
-from services.mm_service import MMInferenceService
+from services.model_registry import model_registry
+from utils.metrics import observe_stage, track_stage
+from utils.callback_dispatcher import callback_dispatcher
 
 logger = get_task_logger(__name__)
 
@@ -54,6 +55,7 @@ def run_mm_inference(
     mri_ocs_id: int = None,
     gene_ocs_id: int = None,
     protein_ocs_id: int = None,
+    debug: bool = False,
 ):
     """
     MM 추론 Celery Task
@@ -75,6 +77,7 @@ def run_mm_inference(
         mri_ocs_id: MRI OCS ID (source tracking)
         gene_ocs_id: RNA_SEQ OCS ID (source tracking)
         protein_ocs_id: BIOMARKER OCS ID (source tracking)
+        debug: True면 이 job만 DEBUG 로그 출력 (celery_app의 job log hook에서 사용)
     """
     task_id = self.request.id
     start_time = time.time()
@@ -116,9 +119,10 @@ def run_mm_inference(
         # ============================================================
         # 2. Protein CSV 파싱
         # ============================================================
+        service = model_registry.get('MM')
+
         protein_features = None
         if protein_data:
-            service = MMInferenceService()
             protein_features = service.parse_protein_csv(protein_data)
             logger.info(f"[MM] Protein features parsed: {len(protein_features)}-dim")
 
@@ -130,13 +134,13 @@ def run_mm_inference(
         # ============================================================
         # 3. MM 모델 추론
         # ============================================================
-        service = MMInferenceService()
-        result = service.predict(
-            mri_features=mri_features,
-            gene_features=gene_features,
-            protein_features=protein_features,
-            include_xai=True
-        )
+        with model_registry.track_inference('MM'), track_stage('MM', 'inference'):
+            result = service.predict(
+                mri_features=mri_features,
+                gene_features=gene_features,
+                protein_features=protein_features,
+                include_xai=True
+            )
 
         logger.info(f"[MM] Inference complete: risk_group={result.get('risk_group', {}).get('predicted_class')}")
         logger.info(f"[MM] Survival: risk_score={result.get('survival', {}).get('risk_score', 0):.3f}")
@@ -153,7 +157,8 @@ def run_mm_inference(
         processing_time = (time.time() - start_time) * 1000
         result['processing_time_ms'] = processing_time
 
-        files_data = service.prepare_results_for_callback(result, job_id)
+        with track_stage('MM', 'payload_encode'):
+            files_data = service.prepare_results_for_callback(result, job_id)
         logger.info(f"[MM] Files prepared for callback: {list(files_data.keys())}")
 
         self.update_state(state='PROCESSING', meta={
@@ -187,24 +192,26 @@ def run_mm_inference(
             'files': files_data,
         }
 
-        try:
-            resolved_callback_url = resolve_callback_url(callback_url)
-            response = httpx.post(
-                resolved_callback_url,
-                json=callback_data,
-                timeout=60.0
-            )
-            response.raise_for_status()
+        # outbox에 먼저 기록 후 전송 - 실패해도 결과는 남아 replay로 재전송
+        callback_start = time.perf_counter()
+        delivered = callback_dispatcher.send_json(
+            job_id, resolve_callback_url(callback_url), callback_data, model='MM'
+        )
+        observe_stage('MM', 'callback_post', time.perf_counter() - callback_start,
+                      'success' if delivered else 'failure')
+        if delivered:
             logger.info(f"[MM] Callback sent successfully with {len(files_data)} files")
-        except httpx.HTTPError as e:
-            logger.error(f"[MM] Callback failed: {str(e)}")
+        else:
+            logger.error(f"[MM] Callback not delivered, result kept in outbox: job_id={job_id}")
 
         logger.info(f"[MM] Inference completed: job_id={job_id}, time={processing_time:.1f}ms")
+        logger.info(f"[MM] Model metrics: {model_registry.stats().get('MM')}")
 
         return {
             'status': 'completed',
             'job_id': job_id,
             'processing_time_ms': processing_time,
+            'callback_delivered': delivered,
         }
 
     except Exception as e:
@@ -212,16 +219,11 @@ def run_mm_inference(
 
         # Django에 실패 callback
         try:
-            resolved_callback_url = resolve_callback_url(callback_url)
-            httpx.post(
-                resolved_callback_url,
-                json={
-                    'job_id': job_id,
-                    'status': 'failed',
-                    'error_message': str(e),
-                },
-                timeout=30.0
-            )
+            callback_dispatcher.send_json(job_id, resolve_callback_url(callback_url), {
+                'job_id': job_id,
+                'status': 'failed',
+                'error_message': str(e),
+            }, model='MM')
         except Exception as callback_error:
             logger.error(f"[MM] Failed to send error callback: {str(callback_error)}")
 
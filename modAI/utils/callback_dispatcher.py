@@ -0,0 +1,373 @@
+"""
+Django Callback Dispatcher
+
+추론 결과 callback 전송 (M1/MG/MM 공용)
+- 프로세스당 httpx.Client 1개 (connection pool 재사용)
+- 전송 전에 payload를 outbox(디스크)에 먼저 기록 → Django가 2xx로 응답해야 삭제
+- 연결 오류 / 5xx / 429는 exponential backoff(+jitter)로 재시도, 그 외 4xx는 즉시 중단
+- 재시도 후에도 실패한 항목은 outbox에 남아 replay() / scripts/replay_callbacks.py로 재전송
+  → 전송 실패 때문에 추론을 다시 돌리지 않음
+- 재시도해도 성공할 수 없는 4xx 응답 항목은 dead-letter(.dead/)로 옮겨 replay 대상에서 제외
+
+outbox 구조 (settings.CALLBACK_OUTBOX_DIR, 기본 STORAGE_DIR/.callback_outbox):
+    <entry_id>/meta.json   : job_id, url, kind(multipart/json), form fields, attempts, last_error
+    <entry_id>/body.json   : JSON callback 본문 (kind=json)
+    <entry_id>/files/*     : multipart 파일 파트 (kind=multipart)
+    .dead/<entry_id>/      : non-retryable 4xx 항목 (requeue()로 outbox에 되돌림)
+"""
+import os
+import json
+import time
+import random
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from utils.log import get_logger
+
+logger = get_logger("callback_dispatcher")
+
+META_FILE = "meta.json"
+BODY_FILE = "body.json"
+FILES_DIR = "files"
+LOCK_FILE = ".lock"
+DEAD_LETTER_DIR = ".dead"
+# 다른 프로세스가 잡고 있는 항목이라도 이 시간이 지나면 중단된 것으로 보고 재전송
+STALE_LOCK_SECONDS = 3600
+
+_RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CallbackDispatcher:
+    """outbox 기반 callback 전송기"""
+
+    def __init__(
+        self,
+        outbox_dir: Optional[Path] = None,
+        max_attempts: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+    ):
+        self.outbox_dir = Path(outbox_dir or settings.CALLBACK_OUTBOX_DIR or settings.STORAGE_DIR / ".callback_outbox")
+        self.max_attempts = max_attempts or settings.CALLBACK_MAX_ATTEMPTS
+        self.backoff_base = backoff_base if backoff_base is not None else settings.CALLBACK_BACKOFF_BASE
+        self.backoff_max = backoff_max if backoff_max is not None else settings.CALLBACK_BACKOFF_MAX
+        self._client: Optional[httpx.Client] = None
+        self._client_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # HTTP client
+    # ============================================================
+
+    @property
+    def client(self) -> httpx.Client:
+        """프로세스당 공유 client - prefork 자식 프로세스에서는 새로 생성"""
+        with self._lock:
+            if self._client is None or self._client_pid != os.getpid():
+                self._client = httpx.Client(
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+                    timeout=httpx.Timeout(settings.CALLBACK_TIMEOUT, connect=10.0),
+                )
+                self._client_pid = os.getpid()
+            return self._client
+
+    # ============================================================
+    # Outbox
+    # ============================================================
+
+    def _write_entry(self, meta: Dict[str, Any], body: Optional[bytes], files: Optional[Dict[str, bytes]]) -> Path:
+        """임시 디렉토리에 기록 후 rename - replay가 부분 기록된 항목을 읽지 않도록"""
+        self.outbox_dir.mkdir(parents=True, exist_ok=True)
+        entry_dir = self.outbox_dir / meta["entry_id"]
+        tmp_dir = self.outbox_dir / f".tmp-{meta['entry_id']}"
+        tmp_dir.mkdir()
+        try:
+            if body is not None:
+                (tmp_dir / BODY_FILE).write_bytes(body)
+            if files:
+                (tmp_dir / FILES_DIR).mkdir()
+                for filename, content in files.items():
+                    (tmp_dir / FILES_DIR / Path(filename).name).write_bytes(content)
+            (tmp_dir / META_FILE).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_dir, entry_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return entry_dir
+
+    @staticmethod
+    def _read_meta(entry_dir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((entry_dir / META_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save_meta(entry_dir: Path, meta: Dict[str, Any]) -> None:
+        tmp = entry_dir / f"{META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, entry_dir / META_FILE)
+
+    @staticmethod
+    def _claim(entry_dir: Path) -> bool:
+        """항목 전송 권한 획득 (O_EXCL lock 파일) - 다른 워커/replay와 중복 전송 방지"""
+        lock = entry_dir / LOCK_FILE
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime < STALE_LOCK_SECONDS:
+                    return False
+            except FileNotFoundError:
+                pass
+            lock.unlink(missing_ok=True)
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                return False
+        except FileNotFoundError:
+            # 다른 프로세스가 전송 완료 후 삭제
+            return False
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        return True
+
+    @staticmethod
+    def _release(entry_dir: Path) -> None:
+        (entry_dir / LOCK_FILE).unlink(missing_ok=True)
+
+    def pending(self, job_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """outbox에 남아있는 항목 meta (오래된 순)"""
+        if not self.outbox_dir.exists():
+            return []
+        entries = []
+        for entry_dir in self.outbox_dir.iterdir():
+            if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+                continue
+            meta = self._read_meta(entry_dir)
+            if meta is None or (job_id and meta.get("job_id") != job_id):
+                continue
+            meta["locked"] = (entry_dir / LOCK_FILE).exists()
+            entries.append(meta)
+        return sorted(entries, key=lambda m: m.get("created_at", ""))
+
+    def discard(self, entry_id: str) -> bool:
+        for entry_dir in (self.outbox_dir / entry_id, self.dead_letter_dir / entry_id):
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                return True
+        return False
+
+    # ============================================================
+    # Dead-letter
+    # ============================================================
+
+    @property
+    def dead_letter_dir(self) -> Path:
+        return self.outbox_dir / DEAD_LETTER_DIR
+
+    def _dead_letter(self, entry_dir: Path, meta: Dict[str, Any]) -> None:
+        """재전송해도 성공할 수 없는 항목을 dead-letter로 이동 (pending/replay 대상 제외)"""
+        meta["dead_at"] = datetime.now().isoformat()
+        self._save_meta(entry_dir, meta)
+        self._release(entry_dir)
+        self.dead_letter_dir.mkdir(parents=True, exist_ok=True)
+        os.replace(entry_dir, self.dead_letter_dir / entry_dir.name)
+
+    def dead_letters(self, job_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """dead-letter 항목 meta (오래된 순)"""
+        if not self.dead_letter_dir.exists():
+            return []
+        entries = []
+        for entry_dir in self.dead_letter_dir.iterdir():
+            meta = self._read_meta(entry_dir) if entry_dir.is_dir() else None
+            if meta is None or (job_id and meta.get("job_id") != job_id):
+                continue
+            entries.append(meta)
+        return sorted(entries, key=lambda m: m.get("created_at", ""))
+
+    def requeue(self, entry_id: str) -> bool:
+        """dead-letter 항목을 outbox로 되돌림 (Django 쪽 원인 수정 후 재전송)"""
+        entry_dir = self.dead_letter_dir / entry_id
+        if not entry_dir.exists():
+            return False
+        meta = self._read_meta(entry_dir) or {}
+        meta.pop("dead_at", None)
+        meta["attempts"] = 0
+        self._save_meta(entry_dir, meta)
+        os.replace(entry_dir, self.outbox_dir / entry_id)
+        return True
+
+    # ============================================================
+    # 전송
+    # ============================================================
+
+    def send_json(self, job_id: str, url: str, body: Dict[str, Any], model: str = "") -> bool:
+        """JSON callback (MG/MM 결과, 실패 알림)"""
+        payload = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        return self._dispatch(job_id, url, model, "json", payload=payload)
+
+    def send_multipart(
+        self,
+        job_id: str,
+        url: str,
+        data: Dict[str, str],
+        files: Dict[str, bytes],
+        model: str = "",
+    ) -> bool:
+        """multipart callback - data는 form field, files는 {filename: bytes} (M1 결과)"""
+        return self._dispatch(job_id, url, model, "multipart", data=data, files=files)
+
+    def _dispatch(self, job_id, url, model, kind, payload=None, data=None, files=None) -> bool:
+        meta = {
+            "entry_id": f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}",
+            "job_id": job_id,
+            "model": model,
+            "url": url,
+            "kind": kind,
+            "data": data or {},
+            "attempts": 0,
+            "created_at": datetime.now().isoformat(),
+            "last_error": None,
+        }
+        try:
+            entry_dir = self._write_entry(meta, payload, files)
+        except OSError as e:
+            # outbox에 못 쓰면 durable 보장 없이 바로 전송
+            logger.error("[Callback] Outbox write failed for %s, sending without outbox: %s", job_id, e)
+            return self._send_direct(url, kind, payload, data, files)
+
+        if not self._claim(entry_dir):
+            return False
+        try:
+            return self._deliver(entry_dir, meta, self.max_attempts)
+        finally:
+            self._release(entry_dir)
+
+    def _send_direct(self, url, kind, payload, data, files) -> bool:
+        try:
+            if kind == "json":
+                response = self.client.post(url, content=payload, headers={"Content-Type": "application/json"})
+            else:
+                response = self.client.post(url, data=data, files=[
+                    ("files", (name, content, _content_type(name))) for name, content in files.items()
+                ])
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            logger.error("[Callback] Direct send failed: %s", e)
+            return False
+
+    def _post_entry(self, entry_dir: Path, meta: Dict[str, Any]) -> httpx.Response:
+        if meta["kind"] == "json":
+            return self.client.post(
+                meta["url"],
+                content=(entry_dir / BODY_FILE).read_bytes(),
+                headers={"Content-Type": "application/json"},
+            )
+
+        handles = []
+        try:
+            files = []
+            files_dir = entry_dir / FILES_DIR
+            if files_dir.exists():
+                for path in sorted(files_dir.iterdir()):
+                    handle = open(path, "rb")
+                    handles.append(handle)
+                    files.append(("files", (path.name, handle, _content_type(path.name))))
+            return self.client.post(meta["url"], data=meta.get("data") or {}, files=files)
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def _deliver(self, entry_dir: Path, meta: Dict[str, Any], attempts: int) -> bool:
+        """claim된 항목 전송 - 성공 시 outbox에서 삭제"""
+        for attempt in range(attempts):
+            meta["attempts"] = meta.get("attempts", 0) + 1
+            retryable = True
+            try:
+                response = self._post_entry(entry_dir, meta)
+                if response.is_success:
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                    logger.info("[Callback] Delivered %s (%s, attempt %d)",
+                                meta["job_id"], meta["kind"], meta["attempts"])
+                    return True
+                retryable = response.status_code in _RETRYABLE_STATUS
+                meta["last_error"] = f"HTTP {response.status_code}: {response.text[:200]}"
+            except (httpx.HTTPError, OSError) as e:
+                meta["last_error"] = f"{type(e).__name__}: {e}"
+
+            meta["last_attempt_at"] = datetime.now().isoformat()
+            self._save_meta(entry_dir, meta)
+            logger.warning("[Callback] %s attempt %d failed: %s", meta["job_id"], meta["attempts"], meta["last_error"])
+
+            if not retryable:
+                try:
+                    self._dead_letter(entry_dir, meta)
+                except OSError as e:
+                    logger.error("[Callback] Dead-letter move failed for %s: %s", meta["job_id"], e)
+                else:
+                    logger.error("[Callback] %s moved to dead-letter (non-retryable): %s",
+                                 meta["job_id"], meta["last_error"])
+                    return False
+                break
+            if attempt == attempts - 1:
+                break
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            time.sleep(delay * random.uniform(0.5, 1.0))
+
+        logger.error("[Callback] %s kept in outbox after %d attempt(s): %s",
+                     meta["job_id"], meta["attempts"], entry_dir)
+        return False
+
+    def replay(self, job_id: Optional[str] = None, attempts: int = 1) -> Dict[str, int]:
+        """
+        outbox 항목 재전송
+
+        Args:
+            job_id: 특정 job만 (없으면 전체)
+            attempts: 항목당 시도 횟수 (backoff 포함)
+
+        Returns:
+            {'delivered', 'failed', 'skipped'}
+        """
+        stats = {"delivered": 0, "failed": 0, "skipped": 0}
+        for meta in self.pending(job_id):
+            entry_dir = self.outbox_dir / meta["entry_id"]
+            if not self._claim(entry_dir):
+                stats["skipped"] += 1
+                continue
+            try:
+                meta.pop("locked", None)
+                if self._deliver(entry_dir, meta, attempts):
+                    stats["delivered"] += 1
+                else:
+                    stats["failed"] += 1
+            finally:
+                self._release(entry_dir)
+        if any(stats.values()):
+            logger.info("[Callback] Replay finished: %s", stats)
+        return stats
+
+    def replay_in_background(self) -> None:
+        """워커 기동 시 이전 실패 항목을 백그라운드 스레드에서 재전송"""
+        if not self.pending():
+            return
+        threading.Thread(target=self.replay, name="callback-replay", daemon=True).start()
+
+
+def _content_type(filename: str) -> str:
+    return "application/json" if filename.endswith(".json") else "application/octet-stream"
+
+
+callback_dispatcher = CallbackDispatcher()
@@ -0,0 +1,149 @@
+"""
+modAI Logging
+
+레벨 + lazy formatting 기반 로깅 (services / OrthancClient 공용)
+- 모든 logger는 'modai.*' 아래에 생성, 레벨은 LOG_LEVEL (기본 INFO)
+- 메시지는 %-style 인자로 전달 → 출력되지 않는 레벨이면 문자열 포맷팅 자체가 일어나지 않음
+- 텐서 통계처럼 계산이 필요한 값은 lazy()로 감싸 출력 시점에만 계산 (device sync 방지)
+- job 단위 debug 모드: DEBUG_JOB_IDS에 포함되거나 요청의 debug=True인 job은
+  전역 레벨과 무관하게 처리 중인 동안만 DEBUG 로그 출력
+
+사용법:
+    from utils.log import get_logger, lazy
+    logger = get_logger("m1_service")
+    logger.debug("grade_logits: %s", grade_logits)
+    logger.debug("features: %s", lazy(lambda: tensor_stats(features)))
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+ROOT_LOGGER_NAME = "modai"
+
+_job_id: ContextVar[Optional[str]] = ContextVar("modai_job_id", default=None)
+_job_debug: ContextVar[bool] = ContextVar("modai_job_debug", default=False)
+_configured = False
+
+
+class lazy:
+    """str() 될 때만 fn()을 호출하는 로그 인자"""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], object]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return str(self.fn())
+
+    __repr__ = __str__
+
+
+def tensor_stats(tensor) -> str:
+    """shape/dtype/min/max/mean 요약 (debug 로그 전용 - 호출 시 device sync 발생)"""
+    values = tensor.detach().float()
+    return (f"shape={tuple(tensor.shape)} dtype={tensor.dtype} "
+            f"min={values.min().item():.4f} max={values.max().item():.4f} mean={values.mean().item():.4f}")
+
+
+class JobLogger(logging.LoggerAdapter):
+    """
+    job debug 모드를 반영하는 LoggerAdapter
+
+    - isEnabledFor: 전역 레벨 또는 현재 job의 debug 모드
+    - job 처리 중이면 메시지 앞에 [job=...] 추가
+    """
+
+    def isEnabledFor(self, level: int) -> bool:
+        if _job_debug.get():
+            return True
+        return self.logger.isEnabledFor(level)
+
+    def process(self, msg, kwargs):
+        job_id = _job_id.get()
+        if job_id:
+            msg = f"[job={job_id}] {msg}"
+        return msg, kwargs
+
+    def log(self, level, msg, *args, **kwargs):
+        if self.isEnabledFor(level):
+            msg, kwargs = self.process(msg, kwargs)
+            # logger.log()는 레벨을 다시 검사하므로 job debug 메시지를 위해 _log로 직접 전달
+            self.logger._log(level, msg, args, **kwargs)
+
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """'modai' logger 레벨 설정 - root handler가 없으면 (스크립트 실행 등) 기본 handler 추가"""
+    global _configured
+    if level is None:
+        from config import settings
+        level = settings.LOG_LEVEL
+
+    logging.getLogger(ROOT_LOGGER_NAME).setLevel(level.upper())
+    if not logging.getLogger().handlers:
+        logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    _configured = True
+
+
+def get_logger(name: str) -> JobLogger:
+    if not _configured:
+        configure_logging()
+    return JobLogger(logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}"), {})
+
+
+def _debug_job_ids() -> set:
+    from config import settings
+    return {j.strip() for j in settings.DEBUG_JOB_IDS.split(",") if j.strip()}
+
+
+def set_job(job_id: Optional[str], debug: bool = False) -> tuple:
+    """현재 context에 job 지정 - reset_job()에 넘길 token 반환"""
+    enabled = bool(debug) or (job_id is not None and job_id in _debug_job_ids())
+    return _job_id.set(job_id), _job_debug.set(enabled)
+
+
+def reset_job(tokens: tuple) -> None:
+    id_token, debug_token = tokens
+    _job_id.reset(id_token)
+    _job_debug.reset(debug_token)
+
+
+@contextmanager
+def job_context(job_id: Optional[str], debug: bool = False):
+    tokens = set_job(job_id, debug)
+    try:
+        yield
+    finally:
+        reset_job(tokens)
+
+
+def job_debug_enabled() -> bool:
+    return _job_debug.get()
+
+
+def current_job_id() -> Optional[str]:
+    return _job_id.get()
+
+
+# ============================================================
+# Celery hook
+# ============================================================
+
+_task_tokens = {}
+
+
+def install_celery_hooks() -> None:
+    """task kwargs의 job_id / debug로 job context 설정 (task 실행 thread 기준)"""
+    from celery.signals import task_prerun, task_postrun
+
+    @task_prerun.connect(weak=False)
+    def _on_prerun(task_id=None, kwargs=None, **_):
+        kwargs = kwargs or {}
+        _task_tokens[task_id] = set_job(kwargs.get("job_id"), kwargs.get("debug", False))
+
+    @task_postrun.connect(weak=False)
+    def _on_postrun(task_id=None, **_):
+        tokens = _task_tokens.pop(task_id, None)
+        if tokens is not None:
+            reset_job(tokens)
@@ -0,0 +1,183 @@
+"""
+modAI Prometheus Metrics
+
+단계별 latency histogram (model × stage × outcome) + Celery task histogram
+- FastAPI: GET /metrics (main.py)
+- Celery: task_prerun / task_postrun / task_failure signal hook (celery_app.py)
+- PROMETHEUS_MULTIPROC_DIR이 설정되어 있으면 multiprocess 모드로 워커 프로세스 값까지 합산,
+  아니면 METRICS_WORKER_PORT > 0일 때 워커 프로세스가 자체 HTTP 포트로 노출
+  → multiprocess 디렉토리는 컨테이너 간 공유 불가 (PID 충돌), FastAPI와 Celery가 별도 컨테이너면
+    Celery 워커는 METRICS_WORKER_PORT로 별도 scrape target (docker/docker-compose.fastapi.yml 참고)
+- prometheus_client가 설치되지 않은 환경에서는 모든 기록이 no-op
+
+stage: orthanc_fetch, dicom_decode, resample, crop_resize, resample_crop_resize(fused),
+       preprocess, encoder_forward, segmentation, inference, payload_encode, callback_post
+"""
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from utils.log import get_logger
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest,
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+logger = get_logger("metrics")
+
+# 추론 단계 특성상 ms ~ 수 분 범위
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+if PROMETHEUS_AVAILABLE:
+    STAGE_SECONDS = Histogram(
+        'modai_stage_duration_seconds',
+        'Inference pipeline stage latency',
+        ['model', 'stage', 'outcome'],
+        buckets=_BUCKETS,
+    )
+    TASK_SECONDS = Histogram(
+        'modai_task_duration_seconds',
+        'Celery inference task latency',
+        ['model', 'outcome'],
+        buckets=_BUCKETS,
+    )
+    TASKS_TOTAL = Counter(
+        'modai_tasks_total',
+        'Celery inference tasks finished',
+        ['model', 'outcome'],
+    )
+
+# Timer step 이름 접두어 → stage (M1Preprocessor timing summary 변환용)
+_TIMER_STAGE_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ("Load 4 modalities", "dicom_decode"),
+    ("Fused resample", "resample_crop_resize"),
+    ("Resample to", "resample"),
+    ("Crop & resize", "crop_resize"),
+)
+
+
+def observe_stage(model: str, stage: str, seconds: float, outcome: str = "success") -> None:
+    if PROMETHEUS_AVAILABLE:
+        STAGE_SECONDS.labels(model=model, stage=stage, outcome=outcome).observe(seconds)
+
+
+@contextmanager
+def track_stage(model: str, stage: str):
+    """with 블록 소요 시간 기록 - 예외가 나면 outcome=failure"""
+    start = time.perf_counter()
+    outcome = "success"
+    try:
+        yield
+    except BaseException:
+        outcome = "failure"
+        raise
+    finally:
+        observe_stage(model, stage, time.perf_counter() - start, outcome)
+
+
+def record_timer_summary(model: str, timing: Optional[Dict]) -> None:
+    """Timer.summary() 결과를 stage histogram으로 기록 (preprocess 전체 포함)"""
+    if not timing:
+        return
+    for step_name, seconds in (timing.get("steps") or {}).items():
+        for prefix, stage in _TIMER_STAGE_PREFIXES:
+            if step_name.startswith(prefix):
+                observe_stage(model, stage, seconds)
+                break
+    if timing.get("total_seconds"):
+        observe_stage(model, "preprocess", timing["total_seconds"])
+
+
+def record_stage_timing(model: str, stage_timing: Optional[Dict[str, float]]) -> None:
+    """서비스가 결과에 담은 {'stage': seconds} 기록"""
+    for stage, seconds in (stage_timing or {}).items():
+        observe_stage(model, stage, seconds)
+
+
+# ============================================================
+# Celery hook
+# ============================================================
+
+_task_started: Dict[str, float] = {}
+
+
+def _task_model(task) -> str:
+    """tasks.m1_tasks.run_m1_inference → M1"""
+    name = getattr(task, "name", "") or ""
+    for code in ("m1", "mg", "mm"):
+        if f".{code}_tasks." in name:
+            return code.upper()
+    return "other"
+
+
+def install_celery_hooks() -> None:
+    """Celery signal에 task latency 기록 연결"""
+    from celery.signals import task_prerun, task_postrun, task_failure
+
+    @task_prerun.connect(weak=False)
+    def _on_prerun(task_id=None, **kwargs):
+        _task_started[task_id] = time.perf_counter()
+
+    @task_failure.connect(weak=False)
+    def _on_failure(task_id=None, sender=None, **kwargs):
+        _finish(task_id, sender, "failure")
+
+    @task_postrun.connect(weak=False)
+    def _on_postrun(task_id=None, task=None, state=None, **kwargs):
+        if state != "FAILURE":
+            _finish(task_id, task, "success")
+
+    def _finish(task_id, task, outcome):
+        start = _task_started.pop(task_id, None)
+        if start is None or not PROMETHEUS_AVAILABLE:
+            return
+        model = _task_model(task)
+        TASK_SECONDS.labels(model=model, outcome=outcome).observe(time.perf_counter() - start)
+        TASKS_TOTAL.labels(model=model, outcome=outcome).inc()
+
+
+def start_worker_metrics_server(port: int, max_offset: int = 16) -> None:
+    """
+    워커 프로세스 metrics HTTP 서버 (multiprocess 모드가 아닐 때)
+
+    prefork 자식 프로세스마다 port, port+1, ... 중 비어있는 포트를 사용
+    """
+    if not PROMETHEUS_AVAILABLE or port <= 0 or os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return
+    from prometheus_client import start_http_server
+
+    for candidate in range(port, port + max_offset):
+        try:
+            start_http_server(candidate)
+            logger.info("[Metrics] Worker metrics on :%d/metrics (pid=%d)", candidate, os.getpid())
+            return
+        except OSError:
+            continue
+    logger.warning("[Metrics] No free port in %d-%d, worker metrics disabled", port, port + max_offset - 1)
+
+
+def mark_worker_process_dead() -> None:
+    """multiprocess 모드에서 종료된 워커 프로세스의 gauge 파일 정리"""
+    if PROMETHEUS_AVAILABLE and os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def render_latest() -> Tuple[bytes, str]:
+    """/metrics 응답 본문과 content type"""
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client not installed\n", CONTENT_TYPE_LATEST
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(), CONTENT_TYPE_LATEST
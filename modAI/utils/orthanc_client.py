@@ -3,9 +3,8 @@ Orthanc DICOM Client
 
 Orthanc 서버에서 DICOM 데이터를 fetch하는 클라이언트
 """
-import logging
+import re
 import zipfile
-import io
 import asyncio
 from typing import Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor
@@ -16,8 +15,66 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import settings
+from utils.log import get_logger
 
-logger = logging.getLogger(__name__)
+logger = get_logger("orthanc_client")
+
+M1_MODALITIES = ("T1", "T1CE", "T2", "FLAIR")
+
+
+def _is_dicom_member(name: str) -> bool:
+    """ZIP member 중 DICOM 파일 여부 (.dcm 또는 확장자 없는 파일)"""
+    basename = name.split('/')[-1]
+    return bool(basename) and (name.endswith('.dcm') or '.' not in basename)
+
+
+class ArchiveMember:
+    """ZIP archive 내 DICOM 파일 - 디코더가 open()할 때 압축 해제"""
+
+    __slots__ = ("_zf", "name")
+
+    def __init__(self, zf: zipfile.ZipFile, name: str):
+        self._zf = zf
+        self.name = name
+
+    def open(self):
+        return self._zf.open(self.name)
+
+    def read(self) -> bytes:
+        return self._zf.read(self.name)
+
+
+class DicomArchiveSet(dict):
+    """
+    스트리밍으로 받은 archive(spool 파일)의 모달리티별 member 목록
+
+    {'T1': [ArchiveMember], ...} 형태로 기존 dicom_data dict와 같이 사용하며,
+    with 블록이 끝나면 ZIP/임시 파일을 정리합니다.
+    """
+
+    def __init__(self):
+        super().__init__({mod: [] for mod in M1_MODALITIES})
+        self._handles = []
+
+    def open_archive(self, spool) -> zipfile.ZipFile:
+        zf = zipfile.ZipFile(spool)
+        self._handles.append((zf, spool))
+        return zf
+
+    def close(self) -> None:
+        for zf, spool in self._handles:
+            try:
+                zf.close()
+            finally:
+                spool.close()
+        self._handles = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
 
 
 class OrthancClient:
@@ -45,18 +102,43 @@ class OrthancClient:
             username or settings.ORTHANC_USER,
             password or settings.ORTHANC_PASSWORD,
         )
+        self._client: Optional[httpx.Client] = None
+        # Study index 캐시 (클라이언트 = 작업 1건 단위로 생성되므로 job 단위 캐시)
+        self._study_index: Dict[str, Dict] = {}
+
+    @property
+    def client(self) -> httpx.Client:
+        """연결을 재사용하는 pooled httpx.Client (스레드 간 공유 가능)"""
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                auth=self.auth,
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
 
     def _get(self, path: str) -> httpx.Response:
         """GET 요청"""
-        url = f"{self.base_url}{path}"
-        response = httpx.get(url, auth=self.auth, timeout=60.0)
+        response = self.client.get(path)
         response.raise_for_status()
         return response
 
     def _post(self, path: str, data: str = None, json_data: dict = None) -> httpx.Response:
         """POST 요청"""
-        url = f"{self.base_url}{path}"
-        response = httpx.post(url, auth=self.auth, content=data, json=json_data, timeout=60.0)
+        response = self.client.post(path, content=data, json=json_data)
         response.raise_for_status()
         return response
 
@@ -75,7 +157,7 @@ class OrthancClient:
         # seg 등 제외할 시리즈 먼저 확인
         for kw in self.SKIP_KEYWORDS:
             if kw in desc_lower:
-                logger.info(f"Skipping series (matched '{kw}'): {series_description}")
+                logger.debug("[OrthancClient] Skipping series (matched '%s'): %s", kw, series_description)
                 return None
 
         # T1CE를 먼저 확인 (T1이 포함되어 있으므로)
@@ -91,33 +173,76 @@ class OrthancClient:
 
         return None
 
-    def fetch_study_series(self, study_uid: str) -> List[Dict]:
+    # Orthanc 리소스 ID 형식 (SHA-1 기반 8자리 hex 5그룹)
+    _ORTHANC_ID_PATTERN = re.compile(r'^[0-9a-f]{8}(-[0-9a-f]{8}){4}$')
+
+    def _resolve_study_id(self, study_uid: str) -> str:
+        """Study UID 또는 Orthanc Study ID → Orthanc Study ID"""
+        if self._ORTHANC_ID_PATTERN.match(study_uid):
+            return study_uid
+
+        # Study UID로 검색 (POST 요청)
+        response = self._post("/tools/lookup", data=study_uid)
+        lookup_result = [r for r in response.json() if r.get('Type') in (None, 'Study')]
+
+        if not lookup_result:
+            raise ValueError(f"Study not found: {study_uid}")
+
+        return lookup_result[0]['ID']
+
+    def get_study_index(self, study_uid: str, refresh: bool = False) -> Dict:
         """
-        Study의 모든 Series 정보 조회
+        Study의 Series 메타데이터 인덱스 (UID→ID 변환 1회 + expand 조회 1회)
+
+        모달리티 식별(_identify_modality)과 SEG 탐지가 같은 인덱스를 사용하므로
+        Series마다 /series/{id}를 다시 조회하지 않습니다.
 
         Args:
             study_uid: DICOM Study UID 또는 Orthanc Study ID
+            refresh: True면 캐시 무시
 
         Returns:
-            Series 정보 리스트
+            {'study_id': str, 'series': [expanded series info]}
         """
-        # Study ID로 조회 시도
-        try:
-            response = self._get(f"/studies/{study_uid}/series")
-            return response.json()
-        except httpx.HTTPStatusError:
-            pass
+        if not refresh and study_uid in self._study_index:
+            return self._study_index[study_uid]
 
-        # Study UID로 검색 (POST 요청)
-        response = self._post("/tools/lookup", data=study_uid)
-        lookup_result = response.json()
+        study_id = self._resolve_study_id(study_uid)
+        series = self._get(f"/studies/{study_id}/series?expand").json()
 
-        if not lookup_result:
-            raise ValueError(f"Study not found: {study_uid}")
+        index = {'study_id': study_id, 'series': series}
+        self._study_index[study_uid] = index
+        self._study_index[study_id] = index
+        return index
 
-        study_id = lookup_result[0]['ID']
-        response = self._get(f"/studies/{study_id}/series")
-        return response.json()
+    def fetch_study_series(self, study_uid: str) -> List[Dict]:
+        """
+        Study의 모든 Series 정보 조회
+
+        Args:
+            study_uid: DICOM Study UID 또는 Orthanc Study ID
+
+        Returns:
+            Series 정보 리스트 (expanded - MainDicomTags, Instances 포함)
+        """
+        return self.get_study_index(study_uid)['series']
+
+    @staticmethod
+    def _is_segmentation_series(series_info: Dict) -> bool:
+        """SEG 모달리티 또는 segmentation 관련 키워드가 있는 Series"""
+        main_tags = series_info.get("MainDicomTags", {})
+        desc = main_tags.get("SeriesDescription", "").lower()
+        modality = main_tags.get("Modality", "").upper()
+        return modality == "SEG" or any(
+            kw in desc for kw in ["seg", "segmentation", "mask", "label", "ground", "truth", "gt"]
+        )
+
+    def find_segmentation_series(self, study_uid: str) -> Optional[Dict]:
+        """Study index에서 Segmentation(Ground Truth) Series 메타데이터 조회 (다운로드 없음)"""
+        for info in self.fetch_study_series(study_uid):
+            if self._is_segmentation_series(info) and info.get("Instances"):
+                return info
+        return None
 
     def fetch_study_dicom_bytes(
         self,
@@ -134,39 +259,35 @@ class OrthancClient:
         Returns:
             {'T1': [bytes], 'T1CE': [bytes], 'T2': [bytes], 'FLAIR': [bytes]}
         """
-        print(f"[OrthancClient] Fetching DICOM for study: {study_uid}")
-        print(f"[OrthancClient] Orthanc URL: {self.base_url}")
+        logger.info("[OrthancClient] Fetching DICOM for study: %s (%s)", study_uid, self.base_url)
 
         dicom_data = {"T1": [], "T1CE": [], "T2": [], "FLAIR": []}
 
         if series_ids:
             # 지정된 Series에서 fetch
-            print(f"[OrthancClient] Using provided series IDs: {series_ids}")
+            logger.debug("[OrthancClient] Using provided series IDs: %s", series_ids)
             for series_id in series_ids:
                 self._fetch_series_data(series_id, dicom_data)
         else:
             # Study의 모든 Series에서 자동 식별
-            print("[OrthancClient] Auto-detecting series from study...")
             series_list = self.fetch_study_series(study_uid)
-            print(f"[OrthancClient] Found {len(series_list)} series in study")
+            logger.debug("[OrthancClient] Found %d series in study", len(series_list))
 
-            for i, series_info in enumerate(series_list):
-                series_id = series_info if isinstance(series_info, str) else series_info.get('ID')
-                print(f"[OrthancClient] Processing series {i+1}/{len(series_list)}: {series_id}")
+            for series_info in series_list:
+                series_id = series_info.get('ID')
                 if series_id:
-                    self._fetch_series_data(series_id, dicom_data)
+                    self._fetch_series_data(series_id, dicom_data, series_info=series_info)
 
-        # 결과 확인
-        print("[OrthancClient] DICOM fetch results:")
-        for mod, data in dicom_data.items():
-            print(f"  - {mod}: {len(data)} slices")
+        logger.info("[OrthancClient] DICOM fetch results: %s",
+                    {mod: len(data) for mod, data in dicom_data.items()})
 
         return dicom_data
 
     def _fetch_series_data(
         self,
         series_id: str,
-        dicom_data: Dict[str, List[bytes]]
+        dicom_data: Dict[str, List[bytes]],
+        series_info: Optional[Dict] = None,
     ) -> None:
         """
         단일 Series의 DICOM 데이터 fetch
@@ -174,39 +295,37 @@ class OrthancClient:
         Args:
             series_id: Orthanc Series ID
             dicom_data: 결과를 저장할 dict (수정됨)
+            series_info: Study index의 Series 메타데이터 (없으면 조회)
         """
         try:
             # Series 정보 조회
-            response = self._get(f"/series/{series_id}")
-            series_info = response.json()
+            if series_info is None:
+                series_info = self._get(f"/series/{series_id}").json()
 
             # Series Description에서 모달리티 식별
             main_tags = series_info.get("MainDicomTags", {})
             desc = main_tags.get("SeriesDescription", "")
-            print(f"    Series {series_id}: '{desc}'")
-
             modality = self._identify_modality(desc)
             if not modality:
-                print(f"    -> Skipped (unknown modality)")
+                logger.debug("[OrthancClient] Series %s '%s': skipped (unknown modality)", series_id, desc)
                 return
 
             # 이미 해당 모달리티 데이터가 있으면 skip
             if dicom_data[modality]:
-                print(f"    -> Skipped (duplicate {modality})")
+                logger.debug("[OrthancClient] Series %s '%s': skipped (duplicate %s)", series_id, desc, modality)
                 return
 
             # Instance들의 DICOM 데이터 fetch
             instances = series_info.get("Instances", [])
-            print(f"    -> Identified as {modality}, fetching {len(instances)} instances...")
+            logger.debug("[OrthancClient] Series %s '%s': %s, fetching %d instances",
+                         series_id, desc, modality, len(instances))
 
             for instance_id in instances:
                 dcm_response = self._get(f"/instances/{instance_id}/file")
                 dicom_data[modality].append(dcm_response.content)
 
-            print(f"    -> Fetched {len(instances)} slices for {modality}")
-
         except httpx.HTTPStatusError as e:
-            print(f"    -> ERROR: Failed to fetch series {series_id}: {str(e)}")
+            logger.error("[OrthancClient] Failed to fetch series %s: %s", series_id, e)
 
     def get_series_info(self, series_id: str) -> Dict:
         """Series 상세 정보 조회"""
@@ -234,7 +353,7 @@ class OrthancClient:
         Study에서 Segmentation (Ground Truth) 시리즈 fetch
 
         SEG 또는 segmentation, mask, label 키워드가 포함된 시리즈를 찾아
-        DICOM 바이트 데이터로 반환
+        DICOM 바이트 데이터로 반환 (Series 식별은 study index 사용)
 
         Args:
             study_uid: DICOM Study UID 또는 Orthanc Study ID
@@ -242,53 +361,19 @@ class OrthancClient:
         Returns:
             Segmentation DICOM 바이트 리스트 또는 None (없는 경우)
         """
-        print(f"[OrthancClient] Searching for segmentation series in study: {study_uid}")
-
         try:
-            series_list = self.fetch_study_series(study_uid)
-            print(f"[OrthancClient] Found {len(series_list)} total series")
-
-            for series_info in series_list:
-                series_id = series_info if isinstance(series_info, str) else series_info.get('ID')
-                if not series_id:
-                    continue
-
-                # Series 정보 조회
-                response = self._get(f"/series/{series_id}")
-                info = response.json()
-
-                main_tags = info.get("MainDicomTags", {})
-                desc = main_tags.get("SeriesDescription", "").lower()
-                modality = main_tags.get("Modality", "").upper()
-
-                print(f"    Series {series_id}: '{desc}' (Modality: {modality})")
-
-                # SEG 모달리티이거나 segmentation 관련 키워드가 있으면 fetch
-                is_seg_modality = modality == "SEG"
-                has_seg_keyword = any(kw in desc for kw in ["seg", "segmentation", "mask", "label", "ground", "truth", "gt"])
-
-                if is_seg_modality or has_seg_keyword:
-                    print(f"    -> Found segmentation series!")
-                    instances = info.get("Instances", [])
-
-                    if not instances:
-                        print(f"    -> No instances found, skipping")
-                        continue
-
-                    # Instance들의 DICOM 데이터 fetch
-                    seg_bytes = []
-                    for instance_id in instances:
-                        dcm_response = self._get(f"/instances/{instance_id}/file")
-                        seg_bytes.append(dcm_response.content)
-
-                    print(f"    -> Fetched {len(seg_bytes)} segmentation slices")
-                    return seg_bytes
+            info = self.find_segmentation_series(study_uid)
+            if info is None:
+                logger.info("[OrthancClient] No segmentation series found in study: %s", study_uid)
+                return None
 
-            print("[OrthancClient] No segmentation series found in study")
-            return None
+            series_id = info.get('ID')
+            seg_bytes = self._fetch_series_archive(series_id)
+            logger.info("[OrthancClient] Fetched %d segmentation slices from series %s", len(seg_bytes), series_id)
+            return seg_bytes
 
         except Exception as e:
-            print(f"[OrthancClient] Error fetching segmentation: {str(e)}")
+            logger.error("[OrthancClient] Error fetching segmentation: %s", e)
             return None
 
     # ========================================================================
@@ -313,56 +398,84 @@ class OrthancClient:
         Returns:
             {'T1': [bytes], 'T1CE': [bytes], 'T2': [bytes], 'FLAIR': [bytes]}
         """
-        import time
-        start_time = time.time()
+        series_map = self.resolve_study_modalities(study_uid, series_ids)
+        return self.fetch_modality_archives(series_map)
 
-        print(f"[OrthancClient] Fetching DICOM (FAST mode) for study: {study_uid}")
-        print(f"[OrthancClient] Orthanc URL: {self.base_url}")
+    def resolve_study_modalities(
+        self,
+        study_uid: str,
+        series_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Study에서 M1 입력 모달리티별 Series 식별 (DICOM 다운로드 없음)
 
-        dicom_data = {"T1": [], "T1CE": [], "T2": [], "FLAIR": []}
-        series_to_fetch = []  # (series_id, modality) 튜플 리스트
+        Args:
+            study_uid: DICOM Study UID 또는 Orthanc Study ID
+            series_ids: 특정 Series ID 목록 (없으면 모든 Series에서 자동 식별)
+
+        Returns:
+            {modality: {'series_id', 'instances', 'last_update'}}
+            - instances: Orthanc Instance ID 목록 (SOP Instance UID 기반 해시)
+            - 같은 모달리티가 여러 Series에서 식별되면 마지막 Series 사용
+        """
+        logger.info("[OrthancClient] Resolving M1 series for study: %s (%s)", study_uid, self.base_url)
+
+        series_map = {}
+
+        def _register(series_id: str, info: Dict) -> None:
+            main_tags = info.get("MainDicomTags", {})
+            desc = main_tags.get("SeriesDescription", "")
+
+            modality = self._identify_modality(desc)
+            if modality:
+                instances = info.get("Instances", [])
+                series_map[modality] = {
+                    "series_id": series_id,
+                    "series_uid": main_tags.get("SeriesInstanceUID", ""),
+                    "study_id": info.get("ParentStudy", ""),
+                    "instances": instances,
+                    "last_update": info.get("LastUpdate", ""),
+                }
+                logger.debug("[OrthancClient] Series %s '%s': %s (%d instances)",
+                             series_id, desc, modality, len(instances))
+            else:
+                logger.debug("[OrthancClient] Series %s '%s': skipped", series_id, desc)
 
         if series_ids:
-            print(f"[OrthancClient] Using provided series IDs: {series_ids}")
+            logger.debug("[OrthancClient] Using provided series IDs: %s", series_ids)
             for series_id in series_ids:
-                series_info = self._get(f"/series/{series_id}").json()
-                main_tags = series_info.get("MainDicomTags", {})
-                desc = main_tags.get("SeriesDescription", "")
-                modality = self._identify_modality(desc)
-                if modality and not dicom_data[modality]:
-                    series_to_fetch.append((series_id, modality))
+                _register(series_id, self._get(f"/series/{series_id}").json())
         else:
-            print("[OrthancClient] Auto-detecting series from study...")
             series_list = self.fetch_study_series(study_uid)
-            print(f"[OrthancClient] Found {len(series_list)} series in study")
+            logger.debug("[OrthancClient] Found %d series in study", len(series_list))
 
             for series_info in series_list:
-                series_id = series_info if isinstance(series_info, str) else series_info.get('ID')
+                series_id = series_info.get('ID')
                 if not series_id:
                     continue
+                _register(series_id, series_info)
 
-                info = self._get(f"/series/{series_id}").json()
-                main_tags = info.get("MainDicomTags", {})
-                desc = main_tags.get("SeriesDescription", "")
-                print(f"    Series {series_id}: '{desc}'")
+        return series_map
 
-                modality = self._identify_modality(desc)
-                if modality and not dicom_data[modality]:
-                    instance_count = len(info.get("Instances", []))
-                    series_to_fetch.append((series_id, modality, instance_count))
-                    print(f"    -> Will fetch as {modality} ({instance_count} instances)")
-                else:
-                    print(f"    -> Skipped")
+    def fetch_modality_archives(self, series_map: Dict[str, Dict]) -> Dict[str, List[bytes]]:
+        """
+        resolve_study_modalities() 결과의 Series들을 Archive API로 병렬 다운로드
+
+        Returns:
+            {'T1': [bytes], 'T1CE': [bytes], 'T2': [bytes], 'FLAIR': [bytes]}
+        """
+        import time
+        start_time = time.time()
+
+        dicom_data = {"T1": [], "T1CE": [], "T2": [], "FLAIR": []}
 
         # 병렬로 Series Archive 다운로드
-        print(f"\n[OrthancClient] Downloading {len(series_to_fetch)} series using Archive API...")
+        logger.info("[OrthancClient] Downloading %d series using Archive API", len(series_map))
 
         with ThreadPoolExecutor(max_workers=4) as executor:
             futures = {}
-            for item in series_to_fetch:
-                series_id = item[0]
-                modality = item[1]
-                future = executor.submit(self._fetch_series_archive, series_id)
+            for modality, entry in series_map.items():
+                future = executor.submit(self._fetch_series_archive, entry["series_id"])
                 futures[future] = modality
 
             for future in futures:
@@ -370,17 +483,113 @@ class OrthancClient:
                 try:
                     dcm_bytes_list = future.result()
                     dicom_data[modality] = dcm_bytes_list
-                    print(f"    -> {modality}: {len(dcm_bytes_list)} slices fetched")
                 except Exception as e:
-                    print(f"    -> {modality}: ERROR - {str(e)}")
+                    logger.error("[OrthancClient] %s archive download failed: %s", modality, e)
 
         elapsed = time.time() - start_time
-        print(f"\n[OrthancClient] DICOM fetch completed in {elapsed:.2f}s")
-        for mod, data in dicom_data.items():
-            print(f"  - {mod}: {len(data)} slices")
+        logger.info("[OrthancClient] DICOM fetch completed in %.2fs: %s",
+                    elapsed, {mod: len(data) for mod, data in dicom_data.items()})
 
         return dicom_data
 
+    def _spool_archive(self, path: str):
+        """
+        Archive(ZIP)를 스트리밍으로 받아 spool 파일에 기록
+
+        ORTHANC_ARCHIVE_SPOOL_BYTES 이하는 메모리, 초과 시 임시 파일로 전환되어
+        response 전체를 메모리에 버퍼링하지 않습니다.
+        """
+        import tempfile
+
+        spool = tempfile.SpooledTemporaryFile(max_size=settings.ORTHANC_ARCHIVE_SPOOL_BYTES)
+        try:
+            with self.client.stream("GET", path, timeout=120.0) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes(chunk_size=1024 * 1024):
+                    spool.write(chunk)
+            spool.seek(0)
+            return spool
+        except Exception:
+            spool.close()
+            raise
+
+    def open_modality_archives(self, series_map: Dict[str, Dict]) -> DicomArchiveSet:
+        """
+        모달리티별 Series Archive를 병렬 스트리밍 다운로드 (member는 지연 압축 해제)
+
+        Returns:
+            DicomArchiveSet {'T1': [ArchiveMember], ...} - with 블록에서 사용
+        """
+        import time
+        start_time = time.time()
+
+        archives = DicomArchiveSet()
+        logger.info("[OrthancClient] Streaming %d series archives", len(series_map))
+
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {
+                    executor.submit(self._spool_archive, f"/series/{entry['series_id']}/archive"): modality
+                    for modality, entry in series_map.items()
+                }
+                for future, modality in futures.items():
+                    try:
+                        spool = future.result()
+                    except Exception as e:
+                        logger.error("[OrthancClient] %s archive download failed: %s", modality, e)
+                        continue
+                    zf = archives.open_archive(spool)
+                    archives[modality] = [
+                        ArchiveMember(zf, name) for name in zf.namelist() if _is_dicom_member(name)
+                    ]
+        except Exception:
+            archives.close()
+            raise
+
+        logger.info("[OrthancClient] Archive streaming completed in %.2fs: %s", time.time() - start_time,
+                    {mod: len(members) for mod, members in archives.items()})
+        return archives
+
+    def open_study_archive(self, series_map: Dict[str, Dict]) -> DicomArchiveSet:
+        """
+        /studies/{id}/archive 한 번으로 4개 모달리티를 받아 SeriesInstanceUID로 분류
+
+        Study에 M1 입력 외 Series(SEG 등)가 많으면 open_modality_archives()가 유리합니다.
+        """
+        import time
+        import pydicom
+
+        start_time = time.time()
+        study_ids = {entry.get("study_id") for entry in series_map.values()}
+        if len(study_ids) != 1 or not next(iter(study_ids)):
+            raise ValueError(f"Series do not belong to a single study: {study_ids}")
+        study_id = study_ids.pop()
+
+        uid_to_modality = {entry["series_uid"]: mod for mod, entry in series_map.items()}
+
+        archives = DicomArchiveSet()
+        try:
+            logger.info("[OrthancClient] Streaming study archive: %s", study_id)
+            zf = archives.open_archive(self._spool_archive(f"/studies/{study_id}/archive"))
+
+            for name in zf.namelist():
+                if not _is_dicom_member(name):
+                    continue
+                with zf.open(name) as f:
+                    header = pydicom.dcmread(
+                        f, stop_before_pixels=True, specific_tags=["SeriesInstanceUID"]
+                    )
+                modality = uid_to_modality.get(str(getattr(header, "SeriesInstanceUID", "")))
+                if modality:
+                    archives[modality].append(ArchiveMember(zf, name))
+        except Exception:
+            archives.close()
+            raise
+
+        logger.info("[OrthancClient] Study archive completed in %.2fs: %s", time.time() - start_time,
+                    {mod: len(archives[mod]) for mod in M1_MODALITIES})
+        return archives
+
     def _fetch_series_archive(self, series_id: str) -> List[bytes]:
         """
         Series 전체를 ZIP Archive로 다운로드 후 개별 DICOM bytes로 반환
@@ -391,16 +600,7 @@ class OrthancClient:
         Returns:
             DICOM 파일 bytes 리스트
         """
-        # Archive 다운로드 (ZIP)
-        url = f"{self.base_url}/series/{series_id}/archive"
-        response = httpx.get(url, auth=self.auth, timeout=120.0)
-        response.raise_for_status()
-
-        # ZIP에서 DICOM 파일 추출
-        dcm_bytes_list = []
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-            for name in zf.namelist():
-                if name.endswith('.dcm') or not '.' in name.split('/')[-1]:
-                    dcm_bytes_list.append(zf.read(name))
-
-        return dcm_bytes_list
+        # Archive 스트리밍 다운로드 (ZIP → spool)
+        with self._spool_archive(f"/series/{series_id}/archive") as spool:
+            with zipfile.ZipFile(spool) as zf:
+                return [zf.read(name) for name in zf.namelist() if _is_dicom_member(name)]
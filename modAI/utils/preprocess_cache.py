@@ -0,0 +1,154 @@
+"""
+M1 Preprocessed Tensor Cache
+
+같은 Study 재추론 시 Orthanc fetch / DICOM 디코딩 / 전처리를 생략하기 위한 디스크 캐시
+- 위치: settings.STORAGE_DIR / .cache / m1_preprocess
+- 키: 모달리티별 Orthanc Series ID + Instance ID 목록(SOP Instance UID 기반) + LastUpdate
+      + 전처리 설정(target size/spacing)
+- 값: 전처리 결과 dict (4×128³ image tensor, bbox, original_shape, slice_mapping, timing)
+- 용량 기준 LRU eviction (hit 시 mtime 갱신)
+"""
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import torch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import settings
+from utils.log import get_logger
+
+logger = get_logger("preprocess_cache")
+
+# 전처리 로직이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 1
+
+
+class PreprocessCache:
+    """전처리 결과 디스크 LRU 캐시"""
+
+    SUFFIX = ".pt"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.cache_dir = Path(cache_dir or settings.STORAGE_DIR / ".cache" / "m1_preprocess")
+        self.max_bytes = max_bytes if max_bytes is not None else settings.PREPROCESS_CACHE_MAX_BYTES
+        self.enabled = enabled if enabled is not None else settings.PREPROCESS_CACHE_ENABLED
+
+    @staticmethod
+    def make_key(series_map: Dict[str, Dict], preprocessor=None) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            series_map: OrthancClient.resolve_study_modalities() 결과
+            preprocessor: M1Preprocessor (target size/spacing/fused 설정 반영)
+        """
+        payload = {
+            "version": CACHE_VERSION,
+            "series": {
+                modality: {
+                    "series_id": entry.get("series_id"),
+                    "last_update": entry.get("last_update", ""),
+                    "instances": sorted(entry.get("instances", [])),
+                }
+                for modality, entry in sorted(series_map.items())
+            },
+        }
+        if preprocessor is not None:
+            payload["preprocess"] = {
+                "target_size": list(preprocessor.target_size),
+                "target_spacing": list(preprocessor.target_spacing),
+                "fused_resample": getattr(preprocessor, "fused_resample", False),
+            }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 - 없거나 손상되었으면 None"""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            data = torch.load(path, map_location="cpu", weights_only=False)
+            os.utime(path, None)  # LRU: 최근 사용 시각 갱신
+            logger.info("[PreprocessCache] HIT %s", key[:12])
+            return data
+        except Exception as e:
+            logger.warning("[PreprocessCache] Corrupted entry %s, removing: %s", key[:12], e)
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, preprocessed: Dict[str, Any]) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 rename - 다른 워커가 부분 파일을 읽지 않도록)"""
+        if not self.enabled:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = {k: v for k, v in preprocessed.items() if k != "label"}
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    torch.save(entry, f)
+                os.replace(tmp_path, self._path(key))
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            logger.info("[PreprocessCache] STORE %s", key[:12])
+            self.evict()
+        except Exception as e:
+            # 캐시 실패는 추론에 영향 주지 않음
+            logger.warning("[PreprocessCache] Failed to store %s: %s", key[:12], e)
+
+    def evict(self) -> int:
+        """최근 사용 순으로 max_bytes 이하가 될 때까지 오래된 항목 삭제"""
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info("[PreprocessCache] Evicted %d entries", removed)
+        return removed
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+preprocess_cache = PreprocessCache()